@@ -3,13 +3,28 @@
 Simple Slack MCP Server with SLACK_ACTIVATE_OR_MODIFY_DO_NOT_DISTURB_DURATION tool
 """
 
+import json
 import os
+import re
 import time
 import asyncio
-from typing import Optional
+import urllib.parse
+import urllib.request
+from array import array
+from collections import deque
+from dataclasses import dataclass, fields
+from functools import lru_cache, partial, wraps
+from types import MappingProxyType
+from typing import Any, Callable, Final, List, NamedTuple, Optional, Union
+import aiohttp
+import orjson
+from cachetools import LRUCache, TTLCache
 from fastmcp import FastMCP
+from fastmcp.tools import ToolResult
+from mcp.types import TextContent
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.web.async_client import AsyncWebClient
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -21,6 +36,336 @@ mcp = FastMCP("Slack MCP Server")
 # Global Slack client
 slack_client: Optional[WebClient] = None
 
+# Global async Slack client (used by tools that fan out concurrent requests)
+async_slack_client: Optional[AsyncWebClient] = None
+
+# Shared aiohttp session for the async Slack clients (decodes responses with orjson)
+slack_http_session: Optional[aiohttp.ClientSession] = None
+
+# Idle seconds a pooled connection to Slack is kept open for reuse by the next tool call
+SLACK_HTTP_KEEPALIVE_SECONDS = float(os.getenv("SLACK_HTTP_KEEPALIVE_SECONDS", "60"))
+
+# Upper bound on the Slack requests one tool call fans out concurrently (bulk tools, call
+# participant batches, multi-channel pin listings); each call gets its own limit, see _gather_limited
+SLACK_MAX_CONCURRENT_REQUESTS = int(os.getenv("SLACK_MAX_CONCURRENT_REQUESTS", "3"))
+
+async def _gather_limited(fn: Callable, items, return_exceptions: bool = False) -> list:
+    """Await fn(item) for every item, results in order, with at most SLACK_MAX_CONCURRENT_REQUESTS in flight for this call."""
+    semaphore = asyncio.Semaphore(SLACK_MAX_CONCURRENT_REQUESTS)
+    
+    async def run(item):
+        async with semaphore:
+            return await fn(item)
+    
+    return await asyncio.gather(*[run(item) for item in items], return_exceptions=return_exceptions)
+
+class SlackRateLimiter:
+    """Client-side sliding-window limiter: at most limits[method] calls to each Slack method per window seconds."""
+
+    def __init__(self, limits: dict, window: float = 60.0):
+        self.limits = limits
+        self.window = window
+        self.calls: dict = {}
+
+    async def acquire(self, method: str) -> None:
+        """Wait until another call to method fits in the window, then record it; methods without a limit pass straight through."""
+        limit = self.limits.get(method)
+        if limit is None:
+            return
+        calls = self.calls.setdefault(method, deque())
+        while True:
+            now = time.monotonic()
+            while calls and now - calls[0] >= self.window:
+                calls.popleft()
+            if len(calls) < limit:
+                calls.append(now)
+                return
+            await asyncio.sleep(self.window - (now - calls[0]))
+
+# Per-minute limits of Slack's rate-limit tiers for the write methods paced here (Tier 2: 20, Tier 3: 50),
+# so bursts wait locally instead of drawing ratelimited errors
+SLACK_METHOD_RATE_LIMITS: Final = MappingProxyType({
+    "usergroups.create": 20,
+    "conversations.create": 20,
+    "chat.unfurl": 50,
+})
+slack_rate_limiter = SlackRateLimiter(SLACK_METHOD_RATE_LIMITS)
+
+class AdaptiveConcurrencyLimit:
+    """AIMD cap on in-flight requests: halved on each rate-limited response, grown by 0.5 per success up to maximum."""
+
+    def __init__(self, maximum: int):
+        self.maximum = maximum
+        self.limit = float(maximum)
+        self.in_flight = 0
+        self.changed = asyncio.Condition()
+
+    async def __aenter__(self) -> None:
+        async with self.changed:
+            await self.changed.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+    async def __aexit__(self, *exc_info) -> None:
+        async with self.changed:
+            self.in_flight -= 1
+            self.changed.notify_all()
+
+    def on_success(self) -> None:
+        self.limit = min(self.maximum, self.limit + 0.5)
+
+    def on_rate_limited(self) -> None:
+        self.limit = max(1.0, self.limit / 2)
+
+# Retries of a paced call that Slack answers with HTTP 429, each after the Retry-After delay
+SLACK_RATE_LIMIT_RETRIES = int(os.getenv("SLACK_RATE_LIMIT_RETRIES", "3"))
+
+# Longest Retry-After a paced call will wait out; a 429 asking for more is returned to the caller at once
+SLACK_MAX_RETRY_AFTER_SECONDS = int(os.getenv("SLACK_MAX_RETRY_AFTER_SECONDS", "60"))
+
+# Server-wide cap on in-flight paced calls; Slack's rate limits apply to the whole app, so
+# every tool call sharing SLACK_METHOD_RATE_LIMITS methods shares this one limit
+slack_adaptive_limit = AdaptiveConcurrencyLimit(SLACK_MAX_CONCURRENT_REQUESTS)
+
+# Per-method gates, cleared while a method is waiting out a Retry-After so that other callers
+# hold back instead of drawing further 429s; set (open) by default
+slack_rate_limit_gates: dict = {}
+
+def _rate_limit_gate(method: str) -> asyncio.Event:
+    """Get or create the open gate for method."""
+    gate = slack_rate_limit_gates.get(method)
+    if gate is None:
+        gate = slack_rate_limit_gates[method] = asyncio.Event()
+        gate.set()
+    return gate
+
+def _retry_after_seconds(response) -> int:
+    """Seconds to wait before retrying a rate-limited response, from its Retry-After header (1 if missing or malformed)."""
+    value = response.headers.get("Retry-After") if response.headers else None
+    seconds = _parse_uint(value) if isinstance(value, str) else None
+    return 1 if seconds is None else seconds
+
+async def _call_slack_paced(call: Callable, method: str):
+    """
+    Await a Slack API call under the method's rate limit and the adaptive concurrency cap.
+    
+    HTTP 429 responses halve the cap and are retried after their Retry-After delay, up to
+    SLACK_RATE_LIMIT_RETRIES times; the last one, or one whose Retry-After exceeds
+    SLACK_MAX_RETRY_AFTER_SECONDS, is raised like any other SlackApiError.
+    While one caller waits out a Retry-After, the method's gate holds back every other caller.
+    
+    Args:
+        call (Callable): Zero-argument callable returning the API call's awaitable
+        method (str): Slack method name, the key into SLACK_METHOD_RATE_LIMITS
+    """
+    gate = _rate_limit_gate(method)
+    for attempt in range(SLACK_RATE_LIMIT_RETRIES + 1):
+        await gate.wait()
+        await slack_rate_limiter.acquire(method)
+        try:
+            async with slack_adaptive_limit:
+                response = await call()
+        except SlackApiError as e:
+            if e.response.status_code != 429:
+                raise
+            slack_adaptive_limit.on_rate_limited()
+            retry_after = _retry_after_seconds(e.response)
+            if attempt == SLACK_RATE_LIMIT_RETRIES or retry_after > SLACK_MAX_RETRY_AFTER_SECONDS:
+                raise
+            if gate.is_set():
+                # First caller to hit the limit closes the gate until Retry-After has passed
+                gate.clear()
+                try:
+                    await asyncio.sleep(retry_after)
+                finally:
+                    gate.set()
+            continue
+        slack_adaptive_limit.on_success()
+        return response
+
+# Shared read-only stand-in for missing sub-objects in Slack payloads (never returned to callers)
+_EMPTY_DICT = MappingProxyType({})
+
+# Shared empty sequence for payloads and missing list fields; serializes as [] and cannot be mutated
+_NO_ITEMS = ()
+
+@dataclass(slots=True, frozen=True)
+class ToolResponse:
+    """Standard tool response envelope, serialized as {"data", "error", "successful"}."""
+    data: Any
+    error: str
+    successful: bool
+
+def _orjson_tool_result(result: dict) -> ToolResult:
+    """Wrap a tool result dict, encoding its text block with orjson instead of the default serializer."""
+    return ToolResult(
+        content=[TextContent(type="text", text=orjson.dumps(result).decode())],
+        structured_content=result
+    )
+
+# Authentication error messages shared by many tools
+_ERR_NOT_AUTHED_BOT: Final = "Slack API Error: not_authed\n\nAuthentication failed. Please check your SLACK_BOT_TOKEN."
+_ERR_INVALID_AUTH_BOT: Final = "Slack API Error: invalid_auth\n\nInvalid authentication token. Please check your SLACK_BOT_TOKEN."
+_ERR_NOT_AUTHED_USER: Final = "Slack API Error: not_authed\n\nAuthentication failed. Please check your SLACK_USER_TOKEN."
+_ERR_INVALID_AUTH_USER: Final = "Slack API Error: invalid_auth\n\nInvalid authentication token. Please check your SLACK_USER_TOKEN."
+_ERR_ACCOUNT_INACTIVE: Final = "Slack API Error: account_inactive\n\nThe authentication token belongs to a deactivated user."
+_ERR_TOKEN_REVOKED: Final = "Slack API Error: token_revoked\n\nThe authentication token has been revoked."
+_ERR_NOT_AUTHED_TOKEN: Final = "Slack API Error: not_authed\n\nAuthentication failed. Check your token and permissions."
+_ERR_NOT_AN_ENTERPRISE_EMOJI: Final = "Slack API Error: not_an_enterprise\n\nThis operation requires Slack Enterprise Grid. Regular Slack workspaces cannot add emojis via API.\n\nTo add emojis in regular workspaces:\n1. Go to workspace settings\n2. Navigate to 'Customize' → 'Add custom emoji'\n3. Upload the image manually"
+
+# Error messages for read-only listing tools, filled in with the OAuth scope and the action
+# that failed by _handle_slack_api_error
+_SCOPED_ERROR_MESSAGES: Final = {
+    "not_authed": _ERR_NOT_AUTHED_BOT,
+    "invalid_auth": _ERR_INVALID_AUTH_BOT,
+    "account_inactive": _ERR_ACCOUNT_INACTIVE,
+    "token_revoked": _ERR_TOKEN_REVOKED,
+    "no_permission": "Slack API Error: no_permission\n\nInsufficient permissions to {action}. The bot needs {scope} scope.",
+    "missing_scope": "Slack API Error: missing_scope\n\nMissing required OAuth scope. The bot needs {scope} scope to {action}.",
+}
+
+@lru_cache(maxsize=None)
+def _scoped_error_messages(scope: str, action: str) -> dict:
+    """Return _SCOPED_ERROR_MESSAGES with scope and action filled in, built once per pair."""
+    return {code: message.format(scope=scope, action=action) for code, message in _SCOPED_ERROR_MESSAGES.items()}
+
+def _handle_slack_api_error(error_code: str, scope: str, action: str) -> ToolResponse:
+    """Build the failed response for error_code from a tool that needs scope to perform action."""
+    message = _scoped_error_messages(scope, action).get(error_code)
+    if message is None:
+        return ToolResponse({}, f"Slack API Error: {error_code}", False)
+    return ToolResponse({}, message, False)
+
+# Name formats checked before calling Slack, compiled once at import
+_EMOJI_NAME_RE: Final = re.compile(r'^[a-zA-Z0-9_-]+\Z')
+_CHANNEL_NAME_RE: Final = re.compile(r'^[a-z0-9][a-z0-9._-]*\Z')
+
+# Leading characters of conversation IDs: channels (C), DMs (D) and private channels/MPDMs (G)
+_CONVERSATION_ID_PREFIXES: Final = frozenset('CDG')
+_DM_ID_PREFIXES: Final = frozenset('DG')
+
+# Network failure message template, filled in with str.format_map
+_ERR_NETWORK: Final = "Network Error: Cannot reach Slack servers. Check your internet connection and network settings. Details: {details}"
+
+# Fixed input-validation failures of the add tools, built once and returned as is (never mutated)
+_INVALID_EMOJI_NAME_EMPTY: Final = {"data": {}, "error": "Emoji name cannot be empty", "successful": False}
+_INVALID_IMAGE_URL_EMPTY: Final = {"data": {}, "error": "Image URL cannot be empty", "successful": False}
+_INVALID_EMOJI_NAME_FORMAT: Final = {"data": {}, "error": "Emoji name can only contain letters, numbers, hyphens, and underscores", "successful": False}
+_INVALID_ALIAS_TARGET_EMPTY: Final = {"data": {}, "error": "Alias target emoji name cannot be empty", "successful": False}
+_INVALID_ALIAS_NAME_EMPTY: Final = {"data": {}, "error": "Alias name cannot be empty", "successful": False}
+_INVALID_ALIAS_NAME_FORMAT: Final = {"data": {}, "error": "Alias name can only contain letters, numbers, hyphens, and underscores", "successful": False}
+_INVALID_ALIAS_TARGET_FORMAT: Final = {"data": {}, "error": "Target emoji name can only contain letters, numbers, hyphens, and underscores", "successful": False}
+_INVALID_STAR_TARGET_MISSING: Final = {"data": {}, "error": "At least one parameter must be provided: channel, file, file_comment, or timestamp", "successful": False}
+_INVALID_STAR_TARGET_MULTIPLE: Final = {"data": {}, "error": "Only one parameter can be provided at a time. Choose either channel, file, file_comment, or timestamp", "successful": False}
+_INVALID_CALL_ID_EMPTY: Final = {"data": {}, "error": "Call ID cannot be empty", "successful": False}
+_INVALID_CALL_USERS_EMPTY: Final = {"data": {}, "error": "Users list cannot be empty", "successful": False}
+_INVALID_CALL_USERS_NONE: Final = {"data": {}, "error": "No valid user IDs provided. Provide comma-separated user IDs.", "successful": False}
+_INVALID_IMAGE_URL_SCHEME: Final = {"data": {}, "error": "Image URL must start with http:// or https://", "successful": False}
+_INVALID_CHANNEL_ID_EMPTY: Final = {"data": {}, "error": "Channel ID cannot be empty", "successful": False}
+_INVALID_MESSAGE_TS_EMPTY: Final = {"data": {}, "error": "Message timestamp cannot be empty", "successful": False}
+
+# Fixed input-validation failures of the create and unfurl tools
+_INVALID_USERGROUP_NAME_EMPTY: Final = {"data": {}, "error": "User group name is required", "successful": False}
+_INVALID_CHANNEL_NAME_EMPTY: Final = {"data": {}, "error": "Channel name is required", "successful": False}
+_INVALID_CHANNEL_NAME_FORMAT: Final = {"data": {}, "error": "Invalid channel name format. Channel names must be lowercase, start with a letter or number, and contain only letters, numbers, periods, hyphens, and underscores.", "successful": False}
+_INVALID_TEAM_ID_EMPTY: Final = {"data": {}, "error": "Team ID is required when org_wide is False", "successful": False}
+_INVALID_UNFURL_CHANNEL_EMPTY: Final = {"data": {}, "error": "Channel ID is required", "successful": False}
+_INVALID_UNFURL_TS_EMPTY: Final = {"data": {}, "error": "Message timestamp is required", "successful": False}
+_INVALID_UNFURLS_EMPTY: Final = {"data": {}, "error": "Unfurls JSON is required", "successful": False}
+_INVALID_UNFURLS_JSON: Final = {"data": {}, "error": "Invalid JSON format in unfurls parameter. Ensure it's valid JSON.", "successful": False}
+
+def _slack_error_message(error_code: str, error_messages: dict, error_context: dict) -> str:
+    """Look up the user-facing message for error_code, filling in error_context (unknown codes get the bare code)."""
+    template = error_messages.get(error_code)
+    return template.format_map(error_context) if template else f"Slack API Error: {error_code}"
+
+async def _slack_call_response(call: Callable, error_messages: dict, error_context: dict) -> dict:
+    """
+    Await a Slack API call and wrap its reply in the standard response dict.
+    
+    Args:
+        call (Callable): Zero-argument callable returning the API call's awaitable
+        error_messages (dict): Error code -> message template, see _slack_error_message
+        error_context (dict): Values for the message templates
+        
+    Returns:
+        dict: Response with data, error, and successful fields
+    """
+    try:
+        response = await call()
+        response_data = response.data
+        if response_data.get("ok", False):
+            return {
+                "data": response_data,
+                "error": "",
+                "successful": True
+            }
+        return {
+            "data": response_data,
+            "error": response_data.get('error', 'Unknown error'),
+            "successful": False
+        }
+    except SlackApiError as e:
+        error_code = e.response.get('error', 'unknown_error')
+        return {
+            "data": {},
+            "error": _slack_error_message(error_code, error_messages, error_context),
+            "successful": False
+        }
+    except (OSError, aiohttp.ClientConnectionError) as e:
+        # Connection failures and timeouts from the Slack request itself
+        return {
+            "data": {},
+            "error": _ERR_NETWORK.format_map({"details": e}),
+            "successful": False
+        }
+
+async def _call_slack(call: Callable, error_messages: dict, error_context: dict) -> ToolResult:
+    """
+    Await a Slack API call and return its orjson-encoded standard response, see _slack_call_response.
+    """
+    return _orjson_tool_result(await _slack_call_response(call, error_messages, error_context))
+
+def _slack_tool(fn: Callable) -> Callable:
+    """
+    Wrap an async tool so every response is an orjson-encoded ToolResult.
+    
+    Plain response dicts returned by the tool (e.g. the shared validation failures) are encoded,
+    and any exception it raises becomes the standard unexpected-error response.
+    """
+    @wraps(fn)
+    async def wrapper(*args, **kwargs) -> ToolResult:
+        try:
+            result = await fn(*args, **kwargs)
+        except Exception as e:
+            result = {
+                "data": {},
+                "error": f"Unexpected error: {str(e)}",
+                "successful": False
+            }
+        return result if isinstance(result, ToolResult) else _orjson_tool_result(result)
+    return wrapper
+
+# Pagination error message templates, filled in with str.format_map
+_ERR_INVALID_CURSOR: Final = "Slack API Error: invalid_cursor\n\nPagination cursor '{cursor}' is invalid."
+_ERR_INVALID_PAGE: Final = "Slack API Error: invalid_page\n\nPage number '{page}' is invalid."
+
+class OrjsonClientResponse(aiohttp.ClientResponse):
+    """aiohttp response that parses JSON bodies with orjson instead of the stdlib json module."""
+
+    async def json(self, *, loads: Callable[[str], Any] = orjson.loads, **kwargs: Any) -> Any:
+        return await super().json(loads=loads, **kwargs)
+
+def get_slack_http_session() -> aiohttp.ClientSession:
+    """Get or initialize the aiohttp session shared by the async Slack clients."""
+    global slack_http_session
+    if slack_http_session is None or slack_http_session.closed:
+        connector = aiohttp.TCPConnector(
+            limit_per_host=max(SLACK_MAX_CONCURRENT_REQUESTS, 10),
+            keepalive_timeout=SLACK_HTTP_KEEPALIVE_SECONDS
+        )
+        slack_http_session = aiohttp.ClientSession(connector=connector, response_class=OrjsonClientResponse)
+    return slack_http_session
+
 def get_slack_client() -> WebClient:
     """Get or initialize Slack client with API token."""
     global slack_client
@@ -32,9 +377,24 @@ def get_slack_client() -> WebClient:
             token = os.getenv("SLACK_BOT_TOKEN")
             if not token:
                 raise ValueError("SLACK_BOT_TOKEN environment variable is required")
-        slack_client = WebClient(token=token)
+        slack_client = get_slack_client_for_token(token)
     return slack_client
 
+def get_async_slack_client() -> AsyncWebClient:
+    """Get or initialize async Slack client with API token."""
+    global async_slack_client
+    if async_slack_client is None:
+        token = os.getenv("SLACK_BOT_TOKEN")
+        if not token:
+            # Try to load from .env file if not set
+            load_dotenv()
+            token = os.getenv("SLACK_BOT_TOKEN")
+            if not token:
+                raise ValueError("SLACK_BOT_TOKEN environment variable is required")
+        async_slack_client = get_async_slack_client_for_token(token)
+    return async_slack_client
+
+@lru_cache(maxsize=1)
 def get_slack_user_client() -> WebClient:
     """Get or initialize Slack client with user token for user-specific operations."""
     token = os.getenv("SLACK_USER_TOKEN")
@@ -44,8 +404,37 @@ def get_slack_user_client() -> WebClient:
         token = os.getenv("SLACK_USER_TOKEN")
         if not token:
             raise ValueError("SLACK_USER_TOKEN environment variable is required for user-specific operations like DND")
+    return get_slack_client_for_token(token)
+
+@lru_cache(maxsize=1)
+def get_async_slack_user_client() -> AsyncWebClient:
+    """Get or initialize async Slack client with user token for user-specific operations."""
+    token = os.getenv("SLACK_USER_TOKEN")
+    if not token:
+        # Try to load from .env file if not set
+        load_dotenv()
+        token = os.getenv("SLACK_USER_TOKEN")
+        if not token:
+            raise ValueError("SLACK_USER_TOKEN environment variable is required for user-specific operations like DND")
+    return get_async_slack_client_for_token(token)
+
+@lru_cache(maxsize=32)
+def get_slack_client_for_token(token: str) -> WebClient:
+    """Get or initialize the Slack client for token; every getter and token-argument tool shares it."""
     return WebClient(token=token)
 
+@lru_cache(maxsize=32)
+def get_async_slack_client_for_token(token: str) -> AsyncWebClient:
+    """Get or initialize the async Slack client for token; every getter and token-argument tool shares it."""
+    return AsyncWebClient(token=token, session=get_slack_http_session())
+
+def _parse_uint(value: str) -> Optional[int]:
+    """Parse a non-negative decimal integer string (surrounding whitespace allowed), or return None."""
+    value = value.strip()
+    if value.isascii() and value.isdigit():
+        return int(value)
+    return None
+
 # SLACK_ACTIVATE_OR_MODIFY_DO_NOT_DISTURB_DURATION
 @mcp.tool()
 async def slack_activate_or_modify_do_not_disturb_duration(
@@ -68,23 +457,26 @@ async def slack_activate_or_modify_do_not_disturb_duration(
     """
     try:
         # Use user token for DND operations
-        client = get_slack_user_client()
+        client = get_async_slack_user_client()
         
-        # Convert string to integer
-        minutes = int(num_minutes)
+        # Convert string to integer; anything but plain ASCII digits is rejected without raising
+        minutes = _parse_uint(num_minutes)
+        if minutes is None:
+            return f"Invalid number of minutes: '{num_minutes}' is not a whole number"
         
         # Validate minutes range (Slack allows 1-4320 minutes)
         if minutes < 1 or minutes > 4320:
             return f"Invalid duration: {minutes} minutes. Must be between 1 and 4320 minutes (72 hours)"
         
         # Set DND snooze duration
-        response = client.dnd_setSnooze(num_minutes=minutes)
+        response = await client.dnd_setSnooze(num_minutes=minutes)
+        response_data = response.data
         
         # Check if successful
-        if response.data.get("ok", False):
+        if response_data.get("ok", False):
             return f"DND snooze set for {minutes} minutes successfully"
         else:
-            return f"Failed to set DND snooze: {response.data.get('error', 'Unknown error')}"
+            return f"Failed to set DND snooze: {response_data.get('error', 'Unknown error')}"
             
     except ValueError as e:
         if "SLACK_USER_TOKEN" in str(e):
@@ -98,13 +490,19 @@ async def slack_activate_or_modify_do_not_disturb_duration(
     except Exception as e:
         return f"Unexpected error: {str(e)}"
 
+# admin.emoji.add error code -> user-facing message
+_ADMIN_EMOJI_ADD_ERROR_MESSAGES = {
+    "not_an_enterprise": _ERR_NOT_AN_ENTERPRISE_EMOJI,
+}
+
 # SLACK_ADD_A_CUSTOM_EMOJI_TO_A_SLACK_TEAM
 @mcp.tool()
+@_slack_tool
 async def slack_add_a_custom_emoji_to_a_slack_team(
     name: str,
     token: str,
     url: str
-) -> dict:
+) -> Union[ToolResult, dict]:
     """
     Add a custom emoji to a Slack team.
     
@@ -117,96 +515,46 @@ async def slack_add_a_custom_emoji_to_a_slack_team(
         url (str): URL of the image to use as emoji
         
     Returns:
-        dict: Response with data, error, and successful fields
+        ToolResult: Response with data, error, and successful fields
     """
-    try:
-        # Test network connectivity first
-        import urllib.request
-        try:
-            urllib.request.urlopen('https://slack.com', timeout=10)
-        except Exception as network_error:
-            return {
-                "data": {},
-                "error": f"Network Error: Cannot reach Slack servers. Check your internet connection and network settings. Details: {str(network_error)}",
-                "successful": False
-            }
-        
-        # Create client with provided token
-        client = WebClient(token=token)
-        
-        # Validate inputs
-        if not name or not name.strip():
-            return {
-                "data": {},
-                "error": "Emoji name cannot be empty",
-                "successful": False
-            }
-        
-        if not url or not url.strip():
-            return {
-                "data": {},
-                "error": "Image URL cannot be empty",
-                "successful": False
-            }
-        
-        # Validate emoji name format (alphanumeric, hyphens, underscores only)
-        import re
-        if not re.match(r'^[a-zA-Z0-9_-]+$', name):
-            return {
-                "data": {},
-                "error": "Emoji name can only contain letters, numbers, hyphens, and underscores",
-                "successful": False
-            }
-        
-        # Add the custom emoji
-        # Note: admin.emoji.add requires Enterprise Grid
-        # For regular workspaces, this will fail with "not_an_enterprise"
-        response = client.admin_emoji_add(
-            name=name,
-            url=url
-        )
-        
-        # Check if successful
-        if response.data.get("ok", False):
-            return {
-                "data": response.data,
-                "error": "",
-                "successful": True
-            }
-        else:
-            return {
-                "data": response.data,
-                "error": response.data.get('error', 'Unknown error'),
-                "successful": False
-            }
-            
-    except SlackApiError as e:
-        error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'not_an_enterprise':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThis operation requires Slack Enterprise Grid. Regular Slack workspaces cannot add emojis via API.\n\nTo add emojis in regular workspaces:\n1. Go to workspace settings\n2. Navigate to 'Customize' → 'Add custom emoji'\n3. Upload the image manually",
-                "successful": False
-            }
-        return {
-            "data": {},
-            "error": f"Slack API Error: {error_code}",
-            "successful": False
-        }
-    except Exception as e:
-        return {
-            "data": {},
-            "error": f"Unexpected error: {str(e)}",
-            "successful": False
-        }
+    # Create client with provided token
+    client = get_async_slack_client_for_token(token)
+    
+    # Validate inputs
+    if not name or not name.strip():
+        return _INVALID_EMOJI_NAME_EMPTY
+    
+    if not url or not url.strip():
+        return _INVALID_IMAGE_URL_EMPTY
+    
+    # Validate emoji name format (alphanumeric, hyphens, underscores only)
+    if not _EMOJI_NAME_RE.match(name):
+        return _INVALID_EMOJI_NAME_FORMAT
+    
+    # Add the custom emoji
+    # Note: admin.emoji.add requires Enterprise Grid
+    # For regular workspaces, this will fail with "not_an_enterprise"
+    return await _call_slack(
+        partial(client.admin_emoji_add, name=name, url=url),
+        _ADMIN_EMOJI_ADD_ERROR_MESSAGES,
+        _EMPTY_DICT
+    )
+
+# admin.emoji.addAlias error code -> user-facing message ({name} and {alias_for} are filled in per call)
+_EMOJI_ALIAS_ERROR_MESSAGES = {
+    "not_an_enterprise": "Slack API Error: not_an_enterprise\n\nThis operation requires Slack Enterprise Grid. Regular Slack workspaces cannot add emoji aliases via API.\n\nTo add emoji aliases in regular workspaces:\n1. Go to workspace settings\n2. Navigate to 'Customize' → 'Add custom emoji'\n3. Upload the same image with a different name",
+    "emoji_not_found": "Slack API Error: emoji_not_found\n\nThe target emoji '{alias_for}' does not exist. Make sure the emoji exists before creating an alias.",
+    "name_taken": "Slack API Error: name_taken\n\nThe alias name '{name}' is already taken. Choose a different name for the alias.",
+}
 
 # SLACK_ADD_AN_EMOJI_ALIAS_IN_SLACK
 @mcp.tool()
+@_slack_tool
 async def slack_add_an_emoji_alias_in_slack(
     alias_for: str,
     name: str,
     token: str
-) -> dict:
+) -> Union[ToolResult, dict]:
     """
     Add an emoji alias.
     
@@ -218,59 +566,366 @@ async def slack_add_an_emoji_alias_in_slack(
         token (str): Slack token for authentication
         
     Returns:
-        dict: Response with data, error, and successful fields
+        ToolResult: Response with data, error, and successful fields
     """
-    try:
-        # Test network connectivity first
-        import urllib.request
-        try:
-            urllib.request.urlopen('https://slack.com', timeout=10)
-        except Exception as network_error:
-            return {
-                "data": {},
-                "error": f"Network Error: Cannot reach Slack servers. Check your internet connection and network settings. Details: {str(network_error)}",
-                "successful": False
-            }
-        
-        # Create client with provided token
-        client = WebClient(token=token)
-        
-        # Validate inputs
-        if not alias_for or not alias_for.strip():
-            return {
-                "data": {},
-                "error": "Alias target emoji name cannot be empty",
-                "successful": False
-            }
+    # Create client with provided token
+    client = get_async_slack_client_for_token(token)
+    
+    # Validate inputs
+    if not alias_for or not alias_for.strip():
+        return _INVALID_ALIAS_TARGET_EMPTY
+    
+    if not name or not name.strip():
+        return _INVALID_ALIAS_NAME_EMPTY
+    
+    # Validate emoji name format (alphanumeric, hyphens, underscores only)
+    if not _EMOJI_NAME_RE.match(name):
+        return _INVALID_ALIAS_NAME_FORMAT
+    
+    if not _EMOJI_NAME_RE.match(alias_for):
+        return _INVALID_ALIAS_TARGET_FORMAT
+    
+    # Add the emoji alias
+    # Note: admin.emoji.addAlias requires Enterprise Grid
+    return await _call_slack(
+        partial(client.admin_emoji_addAlias, name=name, alias_for=alias_for),
+        _EMOJI_ALIAS_ERROR_MESSAGES,
+        {"name": name, "alias_for": alias_for}
+    )
+
+# stars.add error code -> user-facing message ({channel}, {file} and {timestamp} are filled in per call)
+_STARS_ADD_ERROR_MESSAGES = {
+    "channel_not_found": "Slack API Error: channel_not_found\n\nThe channel '{channel}' does not exist or you don't have access to it.",
+    "file_not_found": "Slack API Error: file_not_found\n\nThe file '{file}' does not exist or you don't have access to it.",
+    "message_not_found": "Slack API Error: message_not_found\n\nThe message with timestamp '{timestamp}' does not exist or you don't have access to it.",
+    "already_starred": "Slack API Error: already_starred\n\nThis item is already starred.",
+    "not_authed": _ERR_NOT_AUTHED_TOKEN,
+}
+
+# SLACK_ADD_A_STAR_TO_AN_ITEM
+@mcp.tool()
+@_slack_tool
+async def slack_add_a_star_to_an_item(
+    channel: str = "",
+    file: str = "",
+    file_comment: str = "",
+    timestamp: str = ""
+) -> Union[ToolResult, dict]:
+    """
+    Add a star to an item.
+    
+    Stars a channel, file, file comment, or a specific message in slack.
+    
+    Args:
+        channel (str): Channel ID to star (optional)
+        file (str): File ID to star (optional)
+        file_comment (str): File comment ID to star (optional)
+        timestamp (str): Message timestamp to star (optional)
         
-        if not name or not name.strip():
-            return {
-                "data": {},
-                "error": "Alias name cannot be empty",
-                "successful": False
-            }
+    Returns:
+        ToolResult: Response with data, error, and successful fields
+    """
+    # Get client (use bot token for starring operations)
+    client = get_async_slack_client()
+    
+    # Collect the non-blank parameters in one pass, stripping each once
+    api_params = {
+        key: stripped
+        for key, value in (('channel', channel), ('file', file), ('file_comment', file_comment), ('timestamp', timestamp))
+        if value and (stripped := value.strip())
+    }
+    
+    # Validate that at least one parameter is provided
+    if not api_params:
+        return _INVALID_STAR_TARGET_MISSING
+    
+    # Validate that only one parameter is provided (Slack API limitation)
+    if len(api_params) > 1:
+        return _INVALID_STAR_TARGET_MULTIPLE
+    
+    # Add the star
+    return await _call_slack(
+        partial(client.stars_add, **api_params),
+        _STARS_ADD_ERROR_MESSAGES,
+        {"channel": channel, "file": file, "timestamp": timestamp}
+    )
+
+# calls.participants.add error code -> user-facing message ({id} is filled in per call)
+_CALLS_PARTICIPANTS_ADD_ERROR_MESSAGES = {
+    "call_not_found": "Slack API Error: call_not_found\n\nThe call with ID '{id}' does not exist or you don't have access to it.",
+    "user_not_found": "Slack API Error: user_not_found\n\nOne or more user IDs in the list do not exist or are invalid.",
+    "not_authed": _ERR_NOT_AUTHED_TOKEN,
+    "invalid_auth": "Slack API Error: invalid_auth\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
+    "insufficient_scope": "Slack API Error: insufficient_scope\n\nBot token lacks required scopes. Ensure the bot has 'calls:write' scope.",
+}
+
+# str.translate table deleting the whitespace allowed around comma-separated IDs
+_DELETE_WHITESPACE: Final = str.maketrans('', '', ' \t\n\r')
+
+# Most users sent in one calls.participants.add request; longer lists are split into batches
+SLACK_CALL_PARTICIPANTS_BATCH_SIZE = 50
+
+async def _add_call_participants_batch(client: AsyncWebClient, call_id: str, users: list) -> dict:
+    """Add one batch of users to a call."""
+    result = await _slack_call_response(
+        partial(client.calls_participants_add, id=call_id, users=users),
+        _CALLS_PARTICIPANTS_ADD_ERROR_MESSAGES,
+        {"id": call_id}
+    )
+    return {"users": users, **result}
+
+async def _add_call_participants(client: AsyncWebClient, call_id: str, user_list: list) -> dict:
+    """
+    Add user_list to a call in batches of SLACK_CALL_PARTICIPANTS_BATCH_SIZE, issued concurrently
+    (at most SLACK_MAX_CONCURRENT_REQUESTS at a time).
+    
+    Returns the combined response: each batch's users and result in order, with succeeded and
+    failed batch counts; successful only if every batch was added.
+    """
+    batch_size = SLACK_CALL_PARTICIPANTS_BATCH_SIZE
+    results = await _gather_limited(
+        partial(_add_call_participants_batch, client, call_id),
+        [user_list[i:i + batch_size] for i in range(0, len(user_list), batch_size)]
+    )
+    return _bulk_tool_response(results, "participant batches")
+
+# SLACK_ADD_CALL_PARTICIPANTS
+@mcp.tool()
+@_slack_tool
+async def slack_add_call_participants(
+    id: str,
+    users: str
+) -> Union[ToolResult, dict]:
+    """
+    Add call participants.
+    
+    Registers new participants added to a slack call.
+    
+    Args:
+        id (str): Call ID to add participants to
+        users (str): Comma-separated list of user IDs to add to the call; more than
+            SLACK_CALL_PARTICIPANTS_BATCH_SIZE users are sent as concurrent batches
         
-        # Validate emoji name format (alphanumeric, hyphens, underscores only)
-        import re
-        if not re.match(r'^[a-zA-Z0-9_-]+$', name):
-            return {
-                "data": {},
-                "error": "Alias name can only contain letters, numbers, hyphens, and underscores",
+    Returns:
+        ToolResult: Response with data, error, and successful fields; for batched calls data holds
+            the per-batch results and the succeeded and failed batch counts
+    """
+    # Get client (use bot token for call operations)
+    client = get_async_slack_client()
+    
+    # Validate inputs
+    if not id or not id.strip():
+        return _INVALID_CALL_ID_EMPTY
+    
+    if not users or not users.strip():
+        return _INVALID_CALL_USERS_EMPTY
+    
+    # Parse and validate user IDs: drop all whitespace in one pass, then split
+    user_list = [user for user in users.translate(_DELETE_WHITESPACE).split(',') if user]
+    if not user_list:
+        return _INVALID_CALL_USERS_NONE
+    
+    # Validate user ID format (should start with 'U'); the list holds no empty IDs
+    invalid_user_id = next((user_id for user_id in user_list if user_id[0] != 'U'), None)
+    if invalid_user_id is not None:
+        return {
+            "data": {},
+            "error": f"Invalid user ID format: '{invalid_user_id}'. User IDs should start with 'U'.",
+            "successful": False
+        }
+    
+    # Add participants to the call; long lists go out as concurrent batches
+    if len(user_list) > SLACK_CALL_PARTICIPANTS_BATCH_SIZE:
+        return await _add_call_participants(client, id.strip(), user_list)
+    return await _call_slack(
+        partial(client.calls_participants_add, id=id.strip(), users=user_list),
+        _CALLS_PARTICIPANTS_ADD_ERROR_MESSAGES,
+        {"id": id}
+    )
+
+# admin.emoji.add error code -> user-facing message ({name} and {url} are filled in per call)
+_EMOJI_ADD_ERROR_MESSAGES = {
+    "not_an_enterprise": _ERR_NOT_AN_ENTERPRISE_EMOJI,
+    "name_taken": "Slack API Error: name_taken\n\nThe emoji name '{name}' is already taken. Choose a different name.",
+    "invalid_name": "Slack API Error: invalid_name\n\nThe emoji name '{name}' is invalid. Use letters, numbers, hyphens, and underscores only.",
+    "bad_image": "Slack API Error: bad_image\n\nThe image at URL '{url}' is invalid or cannot be processed. Ensure the URL points to a valid image file.",
+    "emoji_limit_reached": "Slack API Error: emoji_limit_reached\n\nThe workspace has reached its emoji limit. Remove some emojis before adding new ones.",
+    "not_authed": _ERR_NOT_AUTHED_TOKEN,
+    "invalid_auth": "Slack API Error: invalid_auth\n\nInvalid authentication token. Check your token format and validity.",
+    "insufficient_scope": "Slack API Error: insufficient_scope\n\nToken lacks required scopes. Ensure the token has 'admin.emoji:write' scope.",
+}
+
+# SLACK_ADD_EMOJI
+@mcp.tool()
+@_slack_tool
+async def slack_add_emoji(
+    name: str,
+    token: str,
+    url: str
+) -> Union[ToolResult, dict]:
+    """
+    Add emoji.
+    
+    Adds a custom emoji to a slack workspace given a unique name and an image url; 
+    subject to workspace emoji limits.
+    
+    Args:
+        name (str): Unique name for the emoji
+        token (str): Slack token for authentication
+        url (str): URL of the image to use as emoji
+        
+    Returns:
+        ToolResult: Response with data, error, and successful fields
+    """
+    # Create client with provided token
+    client = get_async_slack_client_for_token(token)
+    
+    # Validate inputs
+    if not name or not name.strip():
+        return _INVALID_EMOJI_NAME_EMPTY
+    
+    if not url or not url.strip():
+        return _INVALID_IMAGE_URL_EMPTY
+    
+    # Validate emoji name format (alphanumeric, hyphens, underscores only)
+    if not _EMOJI_NAME_RE.match(name):
+        return _INVALID_EMOJI_NAME_FORMAT
+    
+    # Validate URL format
+    if not url.startswith(('http://', 'https://')):
+        return _INVALID_IMAGE_URL_SCHEME
+    
+    # Add the custom emoji
+    # Note: admin.emoji.add requires Enterprise Grid
+    return await _call_slack(
+        partial(client.admin_emoji_add, name=name, url=url),
+        _EMOJI_ADD_ERROR_MESSAGES,
+        {"name": name, "url": url}
+    )
+
+# reactions.add error code -> user-facing message ({channel}, {timestamp} and {name} are filled in per call)
+_REACTIONS_ADD_ERROR_MESSAGES = {
+    "channel_not_found": "Slack API Error: channel_not_found\n\nThe channel '{channel}' does not exist or you don't have access to it.",
+    "message_not_found": "Slack API Error: message_not_found\n\nThe message with timestamp '{timestamp}' does not exist or you don't have access to it.",
+    "invalid_name": "Slack API Error: invalid_name\n\nThe emoji name '{name}' is invalid or does not exist in this workspace.",
+    "already_reacted": "Slack API Error: already_reacted\n\nYou have already added this reaction to the message.",
+    "no_reaction": "Slack API Error: no_reaction\n\nThe emoji '{name}' is not available in this workspace.",
+    "not_authed": _ERR_NOT_AUTHED_TOKEN,
+    "invalid_auth": "Slack API Error: invalid_auth\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
+    "insufficient_scope": "Slack API Error: insufficient_scope\n\nBot token lacks required scopes. Ensure the bot has 'reactions:write' scope.",
+}
+
+# SLACK_ADD_REACTION_TO_AN_ITEM
+@mcp.tool()
+@_slack_tool
+async def slack_add_reaction_to_an_item(
+    channel: str,
+    name: str,
+    timestamp: str
+) -> Union[ToolResult, dict]:
+    """
+    Add reaction to message.
+    
+    Adds a specified emoji reaction to an existing message in a slack channel, 
+    identified by its timestamp; does not remove or retrieve reactions.
+    
+    Args:
+        channel (str): Channel ID where the message is located
+        name (str): Emoji name to add as reaction (without colons)
+        timestamp (str): Message timestamp to add reaction to
+        
+    Returns:
+        ToolResult: Response with data, error, and successful fields
+    """
+    # Get client (use bot token for reaction operations)
+    client = get_async_slack_client()
+    
+    # Validate inputs
+    if not channel or not channel.strip():
+        return _INVALID_CHANNEL_ID_EMPTY
+    
+    if not name or not name.strip():
+        return _INVALID_EMOJI_NAME_EMPTY
+    
+    if not timestamp or not timestamp.strip():
+        return _INVALID_MESSAGE_TS_EMPTY
+    
+    # Validate channel ID format (should start with 'C' for channels)
+    if not channel.startswith('C'):
+        return {
+            "data": {},
+            "error": f"Invalid channel ID format: '{channel}'. Channel IDs should start with 'C'.",
+            "successful": False
+        }
+    
+    # Validate emoji name format (remove colons if present)
+    emoji_name = name.strip()
+    if emoji_name.startswith(':') and emoji_name.endswith(':'):
+        emoji_name = emoji_name[1:-1]  # Remove colons
+    
+    # Validate emoji name format (alphanumeric, hyphens, underscores only)
+    if not _EMOJI_NAME_RE.match(emoji_name):
+        return _INVALID_EMOJI_NAME_FORMAT
+    
+    # Add the reaction
+    return await _call_slack(
+        partial(client.reactions_add, channel=channel.strip(), name=emoji_name, timestamp=timestamp.strip()),
+        _REACTIONS_ADD_ERROR_MESSAGES,
+        {"channel": channel, "timestamp": timestamp, "name": name}
+    )
+
+# conversations.archive (channels) error code -> user-facing message ({channel_id} is filled in per call)
+_ARCHIVE_CHANNEL_ERROR_MESSAGES = {
+    "channel_not_found": "Slack API Error: channel_not_found\n\nThe channel '{channel_id}' does not exist or you don't have access to it.",
+    "is_archived": "Slack API Error: is_archived\n\nThe channel '{channel_id}' is already archived.",
+    "cant_archive_general": "Slack API Error: cant_archive_general\n\nThe 'general' channel cannot be archived.",
+    "not_authed": _ERR_NOT_AUTHED_TOKEN,
+    "invalid_auth": "Slack API Error: invalid_auth\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
+    "insufficient_scope": "Slack API Error: insufficient_scope\n\nBot token lacks required scopes. Ensure the bot has 'channels:manage' (for public channels) and 'groups:write' (for private channels) scopes.",
+    "missing_scope": "Slack API Error: missing_scope\n\nBot token lacks required scopes. Ensure the bot has 'channels:manage' (for public channels) and 'groups:write' (for private channels) scopes and reinstall the app.",
+}
+
+# SLACK_ARCHIVE_A_PUBLIC_OR_PRIVATE_CHANNEL
+@mcp.tool()
+async def slack_archive_a_public_or_private_channel(
+    channel_id: str
+) -> dict:
+    """
+    Archive a public or private channel.
+    
+    Archives a slack public or private channel, making it read-only; 
+    the primary 'general' channel cannot be archived.
+    
+    Args:
+        channel_id (str): Channel ID to archive
+        
+    Returns:
+        dict: Response with data, error, and successful fields
+    """
+    try:
+        # Validate inputs (the stripped ID is what gets archived)
+        archive_id = channel_id.strip() if channel_id else ""
+        if not archive_id:
+            return {
+                "data": {},
+                "error": "Channel ID cannot be empty",
                 "successful": False
             }
         
-        if not re.match(r'^[a-zA-Z0-9_-]+$', alias_for):
+        # Validate channel ID format (should start with 'C' for channels)
+        if not channel_id.startswith('C'):
             return {
                 "data": {},
-                "error": "Target emoji name can only contain letters, numbers, hyphens, and underscores",
+                "error": f"Invalid channel ID format: '{channel_id}'. Channel IDs should start with 'C'.",
                 "successful": False
             }
         
-        # Add the emoji alias
-        # Note: admin.emoji.addAlias requires Enterprise Grid
-        response = client.admin_emoji_addAlias(
-            name=name,
-            alias_for=alias_for
+        # Get client (use bot token for channel operations)
+        client = get_async_slack_client()
+        
+        # Archive the channel
+        response = await client.conversations_archive(
+            channel=archive_id
         )
         
         # Check if successful
@@ -289,27 +944,16 @@ async def slack_add_an_emoji_alias_in_slack(
             
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'not_an_enterprise':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThis operation requires Slack Enterprise Grid. Regular Slack workspaces cannot add emoji aliases via API.\n\nTo add emoji aliases in regular workspaces:\n1. Go to workspace settings\n2. Navigate to 'Customize' → 'Add custom emoji'\n3. Upload the same image with a different name",
-                "successful": False
-            }
-        elif error_code == 'emoji_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe target emoji '{alias_for}' does not exist. Make sure the emoji exists before creating an alias.",
-                "successful": False
-            }
-        elif error_code == 'name_taken':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe alias name '{name}' is already taken. Choose a different name for the alias.",
-                "successful": False
-            }
         return {
             "data": {},
-            "error": f"Slack API Error: {error_code}",
+            "error": _slack_error_message(error_code, _ARCHIVE_CHANNEL_ERROR_MESSAGES, {"channel_id": channel_id}),
+            "successful": False
+        }
+    except (OSError, aiohttp.ClientConnectionError) as e:
+        # Connection failures and timeouts from the Slack request itself
+        return {
+            "data": {},
+            "error": _ERR_NETWORK.format_map({"details": e}),
             "successful": False
         }
     except Exception as e:
@@ -319,73 +963,63 @@ async def slack_add_an_emoji_alias_in_slack(
             "successful": False
         }
 
-# SLACK_ADD_A_STAR_TO_AN_ITEM
+# conversations.archive error code -> user-facing message ({channel} is filled in per call)
+_ARCHIVE_CONVERSATION_ERROR_MESSAGES = {
+    "channel_not_found": "Slack API Error: channel_not_found\n\nThe conversation '{channel}' does not exist or you don't have access to it.",
+    "is_archived": "Slack API Error: is_archived\n\nThe conversation '{channel}' is already archived.",
+    "cant_archive_general": "Slack API Error: cant_archive_general\n\nThe 'general' channel cannot be archived.",
+    "cant_archive_this_channel": "Slack API Error: cant_archive_this_channel\n\nThis channel cannot be archived. Some channels (like #general) or certain DMs cannot be archived.",
+    "not_in_channel": "Slack API Error: not_in_channel\n\nThe bot is not a member of the conversation '{channel}'. Add the bot to the channel first.",
+    "not_authed": _ERR_NOT_AUTHED_TOKEN,
+    "invalid_auth": "Slack API Error: invalid_auth\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
+    "insufficient_scope": "Slack API Error: insufficient_scope\n\nBot token lacks required scopes. Ensure the bot has 'channels:manage' (for public channels) and 'groups:write' (for private channels) scopes.",
+    "missing_scope": "Slack API Error: missing_scope\n\nBot token lacks required scopes. Ensure the bot has 'channels:manage' (for public channels) and 'groups:write' (for private channels) scopes and reinstall the app.",
+}
+
+# SLACK_ARCHIVE_A_SLACK_CONVERSATION
 @mcp.tool()
-async def slack_add_a_star_to_an_item(
-    channel: str = "",
-    file: str = "",
-    file_comment: str = "",
-    timestamp: str = ""
+async def slack_archive_a_slack_conversation(
+    channel: str
 ) -> dict:
     """
-    Add a star to an item.
+    Archive a Slack conversation.
     
-    Stars a channel, file, file comment, or a specific message in slack.
+    Archives a slack conversation by its id, rendering it read-only and hidden while 
+    retaining history, ideal for cleaning up inactive channels; be aware that some 
+    channels (like #general or certain dms) cannot be archived and this may impact 
+    connected integrations.
     
     Args:
-        channel (str): Channel ID to star (optional)
-        file (str): File ID to star (optional)
-        file_comment (str): File comment ID to star (optional)
-        timestamp (str): Message timestamp to star (optional)
+        channel (str): Channel ID to archive
         
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
-        # Test network connectivity first
-        import urllib.request
-        try:
-            urllib.request.urlopen('https://slack.com', timeout=10)
-        except Exception as network_error:
-            return {
-                "data": {},
-                "error": f"Network Error: Cannot reach Slack servers. Check your internet connection and network settings. Details: {str(network_error)}",
-                "successful": False
-            }
-        
-        # Get client (use bot token for starring operations)
-        client = get_slack_client()
-        
-        # Validate that at least one parameter is provided
-        provided_params = [param for param in [channel, file, file_comment, timestamp] if param and param.strip()]
-        if not provided_params:
+        # Validate inputs (the stripped ID is what gets archived)
+        archive_id = channel.strip() if channel else ""
+        if not archive_id:
             return {
                 "data": {},
-                "error": "At least one parameter must be provided: channel, file, file_comment, or timestamp",
+                "error": "Channel ID cannot be empty",
                 "successful": False
             }
         
-        # Validate that only one parameter is provided (Slack API limitation)
-        if len(provided_params) > 1:
+        # Validate channel ID format (should start with 'C' for channels or 'D' for DMs)
+        if channel[:1] not in _CONVERSATION_ID_PREFIXES:
             return {
                 "data": {},
-                "error": "Only one parameter can be provided at a time. Choose either channel, file, file_comment, or timestamp",
+                "error": f"Invalid channel ID format: '{channel}'. Channel IDs should start with 'C' (channels), 'D' (DMs), or 'G' (private channels).",
                 "successful": False
             }
         
-        # Prepare the API call parameters
-        api_params = {}
-        if channel and channel.strip():
-            api_params['channel'] = channel.strip()
-        elif file and file.strip():
-            api_params['file'] = file.strip()
-        elif file_comment and file_comment.strip():
-            api_params['file_comment'] = file_comment.strip()
-        elif timestamp and timestamp.strip():
-            api_params['timestamp'] = timestamp.strip()
+        # Get client (use bot token for conversation operations)
+        client = get_async_slack_client()
         
-        # Add the star
-        response = client.stars_add(**api_params)
+        # Archive the conversation
+        response = await client.conversations_archive(
+            channel=archive_id
+        )
         
         # Check if successful
         if response.data.get("ok", False):
@@ -403,39 +1037,16 @@ async def slack_add_a_star_to_an_item(
             
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'channel_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe channel '{channel}' does not exist or you don't have access to it.",
-                "successful": False
-            }
-        elif error_code == 'file_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe file '{file}' does not exist or you don't have access to it.",
-                "successful": False
-            }
-        elif error_code == 'message_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe message with timestamp '{timestamp}' does not exist or you don't have access to it.",
-                "successful": False
-            }
-        elif error_code == 'already_starred':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThis item is already starred.",
-                "successful": False
-            }
-        elif error_code == 'not_authed':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Check your token and permissions.",
-                "successful": False
-            }
         return {
             "data": {},
-            "error": f"Slack API Error: {error_code}",
+            "error": _slack_error_message(error_code, _ARCHIVE_CONVERSATION_ERROR_MESSAGES, {"channel": channel}),
+            "successful": False
+        }
+    except (OSError, aiohttp.ClientConnectionError) as e:
+        # Connection failures and timeouts from the Slack request itself
+        return {
+            "data": {},
+            "error": _ERR_NETWORK.format_map({"details": e}),
             "successful": False
         }
     except Exception as e:
@@ -445,77 +1056,163 @@ async def slack_add_a_star_to_an_item(
             "successful": False
         }
 
-# SLACK_ADD_CALL_PARTICIPANTS
+def _bulk_tool_response(results: list, noun: str) -> dict:
+    """Combine per-item tool responses into one response; successful only if every item succeeded."""
+    failed = sum(1 for result in results if not result["successful"])
+    return {
+        "data": {"results": results, "succeeded": len(results) - failed, "failed": failed},
+        "error": f"{failed} of {len(results)} {noun} failed" if failed else "",
+        "successful": not failed
+    }
+
+# SLACK_ARCHIVE_CONVERSATIONS_BULK
 @mcp.tool()
-async def slack_add_call_participants(
-    id: str,
-    users: str
+async def slack_archive_conversations_bulk(
+    channels: str
 ) -> dict:
     """
-    Add call participants.
+    Archive several Slack conversations.
     
-    Registers new participants added to a slack call.
+    Archives each conversation in a comma-separated list of ids, issuing the requests
+    concurrently (at most SLACK_MAX_CONCURRENT_REQUESTS at a time for this call); each id
+    is handled as by `slack_archive_a_slack_conversation`, and one failing id does not
+    stop the others.
     
     Args:
-        id (str): Call ID to add participants to
-        users (str): Comma-separated list of user IDs to add to the call
+        channels (str): Comma-separated list of channel IDs to archive
         
     Returns:
-        dict: Response with data, error, and successful fields
+        dict: Response with data (per-channel results in input order, succeeded and failed counts), error, and successful fields
     """
     try:
-        # Test network connectivity first
-        import urllib.request
-        try:
-            urllib.request.urlopen('https://slack.com', timeout=10)
-        except Exception as network_error:
-            return {
-                "data": {},
-                "error": f"Network Error: Cannot reach Slack servers. Check your internet connection and network settings. Details: {str(network_error)}",
-                "successful": False
-            }
-        
-        # Get client (use bot token for call operations)
-        client = get_slack_client()
-        
-        # Validate inputs
-        if not id or not id.strip():
+        # Parse channel IDs: drop all whitespace in one pass, then split; repeated IDs are archived once
+        channel_list = list(dict.fromkeys(channel for channel in channels.translate(_DELETE_WHITESPACE).split(',') if channel))
+        if not channel_list:
             return {
                 "data": {},
-                "error": "Call ID cannot be empty",
+                "error": "No channel IDs provided. Provide comma-separated channel IDs.",
                 "successful": False
             }
         
-        if not users or not users.strip():
+        results = await _gather_limited(slack_archive_a_slack_conversation, channel_list)
+        return _bulk_tool_response(results, "archive requests")
+            
+    except Exception as e:
+        return {
+            "data": {},
+            "error": f"Unexpected error: {str(e)}",
+            "successful": False
+        }
+
+# chat.postMessage error code -> user-facing message ({channel} is filled in per call)
+_CHAT_POST_MESSAGE_ERROR_MESSAGES = {
+    "channel_not_found": "Slack API Error: channel_not_found\n\nThe channel '{channel}' does not exist or you don't have access to it.",
+    "not_in_channel": "Slack API Error: not_in_channel\n\nThe bot is not a member of the channel '{channel}'. Add the bot to the channel first.",
+    "msg_too_long": "Slack API Error: msg_too_long\n\nThe message is too long. Slack has a 40,000 character limit for messages.",
+    "no_text": "Slack API Error: no_text\n\nMessage must contain text, attachments, or blocks.",
+    "rate_limited": "Slack API Error: rate_limited\n\nRate limit exceeded. Please wait before sending another message.",
+    "not_authed": _ERR_NOT_AUTHED_TOKEN,
+    "invalid_auth": "Slack API Error: invalid_auth\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
+    "insufficient_scope": "Slack API Error: insufficient_scope\n\nBot token lacks required scopes. Ensure the bot has 'chat:write' scope.",
+    "missing_scope": "Slack API Error: missing_scope\n\nBot token lacks required scopes. Ensure the bot has 'chat:write' scope and reinstall the app.",
+}
+
+# SLACK_SEND_MESSAGE
+@mcp.tool()
+async def slack_send_message(
+    channel: str,
+    text: Optional[str] = None,
+    blocks: Optional[str] = None,
+    attachments: Optional[str] = None,
+    as_user: bool = False,
+    icon_emoji: Optional[str] = None,
+    icon_url: Optional[str] = None,
+    link_names: bool = False,
+    markdown_text: Optional[str] = None,
+    mrkdwn: bool = True,
+    parse: Optional[str] = None,
+    reply_broadcast: bool = False,
+    thread_ts: Optional[str] = None,
+    unfurl_links: bool = True,
+    unfurl_media: bool = True,
+    username: Optional[str] = None
+) -> dict:
+    """
+    Posts a message to a slack channel, direct message, or private group; requires content via `text`, `blocks`, or `attachments`.
+    """
+    try:
+        # Validate required inputs
+        channel_id = channel.strip() if channel else ""
+        if not channel_id:
             return {
                 "data": {},
-                "error": "Users list cannot be empty",
+                "error": "Channel ID is required",
                 "successful": False
             }
         
-        # Parse and validate user IDs
-        user_list = [user.strip() for user in users.split(',') if user.strip()]
-        if not user_list:
+        # Validate channel ID format
+        if channel[:1] not in _CONVERSATION_ID_PREFIXES:
             return {
                 "data": {},
-                "error": "No valid user IDs provided. Provide comma-separated user IDs.",
+                "error": f"Invalid channel ID format: '{channel}'. Channel IDs should start with 'C' (channels), 'D' (DMs), or 'G' (private channels).",
                 "successful": False
             }
         
-        # Validate user ID format (should start with 'U')
-        for user_id in user_list:
-            if not user_id.startswith('U'):
+        # Collect the non-blank string options (stripped once each) and the flags that are set
+        message_params = {"channel": channel_id}
+        message_params.update(
+            (key, stripped)
+            for key, value in (("text", text), ("icon_emoji", icon_emoji), ("icon_url", icon_url), ("markdown_text", markdown_text), ("thread_ts", thread_ts), ("username", username))
+            if value and (stripped := value.strip())
+        )
+        message_params.update(
+            (key, flag)
+            for key, flag in (("as_user", as_user), ("link_names", link_names), ("mrkdwn", mrkdwn), ("reply_broadcast", reply_broadcast))
+            if flag
+        )
+        
+        if not unfurl_links:
+            message_params["unfurl_links"] = unfurl_links
+        
+        if not unfurl_media:
+            message_params["unfurl_media"] = unfurl_media
+        
+        if attachments and attachments.strip():
+            try:
+                message_params["attachments"] = orjson.loads(attachments)
+            except orjson.JSONDecodeError:
                 return {
                     "data": {},
-                    "error": f"Invalid user ID format: '{user_id}'. User IDs should start with 'U'.",
+                    "error": "Invalid JSON format for attachments parameter",
                     "successful": False
                 }
         
-        # Add participants to the call
-        response = client.calls_participants_add(
-            id=id.strip(),
-            users=user_list
-        )
+        if blocks and blocks.strip():
+            try:
+                message_params["blocks"] = orjson.loads(blocks)
+            except orjson.JSONDecodeError:
+                return {
+                    "data": {},
+                    "error": "Invalid JSON format for blocks parameter",
+                    "successful": False
+                }
+        
+        parse_mode = parse.strip() if parse else ""
+        if parse_mode:
+            if parse_mode in ('full', 'none'):
+                message_params["parse"] = parse_mode
+            else:
+                return {
+                    "data": {},
+                    "error": "Parse parameter must be 'full' or 'none'",
+                    "successful": False
+                }
+        
+        # Get client (use bot token for message operations)
+        client = get_async_slack_client()
+        
+        # Send the message
+        response = await client.chat_postMessage(**message_params)
         
         # Check if successful
         if response.data.get("ok", False):
@@ -533,39 +1230,16 @@ async def slack_add_call_participants(
             
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'call_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe call with ID '{id}' does not exist or you don't have access to it.",
-                "successful": False
-            }
-        elif error_code == 'user_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nOne or more user IDs in the list do not exist or are invalid.",
-                "successful": False
-            }
-        elif error_code == 'not_authed':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Check your token and permissions.",
-                "successful": False
-            }
-        elif error_code == 'invalid_auth':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
-                "successful": False
-            }
-        elif error_code == 'insufficient_scope':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'calls:write' scope.",
-                "successful": False
-            }
         return {
             "data": {},
-            "error": f"Slack API Error: {error_code}",
+            "error": _slack_error_message(error_code, _CHAT_POST_MESSAGE_ERROR_MESSAGES, {"channel": channel}),
+            "successful": False
+        }
+    except (OSError, aiohttp.ClientConnectionError) as e:
+        # Connection failures and timeouts from the Slack request itself
+        return {
+            "data": {},
+            "error": _ERR_NETWORK.format_map({"details": e}),
             "successful": False
         }
     except Exception as e:
@@ -575,79 +1249,126 @@ async def slack_add_call_participants(
             "successful": False
         }
 
-# SLACK_ADD_EMOJI
+async def _send_one_message(message: Any) -> dict:
+    """Send one message of a bulk request; malformed entries become failed results instead of errors."""
+    if not isinstance(message, dict):
+        return {
+            "data": {},
+            "error": "Each message must be a JSON object",
+            "successful": False
+        }
+    try:
+        return await slack_send_message(**message)
+    except TypeError as e:
+        # Unknown or missing fields for slack_send_message
+        return {
+            "data": {},
+            "error": f"Invalid message fields: {str(e)}",
+            "successful": False
+        }
+
+# SLACK_SEND_MESSAGES_BULK
 @mcp.tool()
-async def slack_add_emoji(
-    name: str,
-    token: str,
-    url: str
+async def slack_send_messages_bulk(
+    messages: str
 ) -> dict:
     """
-    Add emoji.
+    Send several Slack messages.
     
-    Adds a custom emoji to a slack workspace given a unique name and an image url; 
-    subject to workspace emoji limits.
+    Posts each message in a json array, issuing the requests concurrently (at most
+    SLACK_MAX_CONCURRENT_REQUESTS at a time for this call, so messages are not posted in
+    array order); each message is an object with the parameters of `slack_send_message`
+    (`channel` plus `text`, `blocks`, or `attachments`, ...), and one failing message does
+    not stop the others.
     
     Args:
-        name (str): Unique name for the emoji
-        token (str): Slack token for authentication
-        url (str): URL of the image to use as emoji
+        messages (str): JSON array of message objects
         
     Returns:
-        dict: Response with data, error, and successful fields
+        dict: Response with data (per-message results in input order, succeeded and failed counts), error, and successful fields
     """
     try:
-        # Test network connectivity first
-        import urllib.request
         try:
-            urllib.request.urlopen('https://slack.com', timeout=10)
-        except Exception as network_error:
+            message_list = orjson.loads(messages)
+        except orjson.JSONDecodeError:
             return {
                 "data": {},
-                "error": f"Network Error: Cannot reach Slack servers. Check your internet connection and network settings. Details: {str(network_error)}",
+                "error": "Invalid JSON format for messages parameter",
                 "successful": False
             }
         
-        # Create client with provided token
-        client = WebClient(token=token)
-        
-        # Validate inputs
-        if not name or not name.strip():
+        if not isinstance(message_list, list) or not message_list:
             return {
                 "data": {},
-                "error": "Emoji name cannot be empty",
+                "error": "Messages must be a non-empty JSON array of message objects",
                 "successful": False
             }
         
-        if not url or not url.strip():
-            return {
-                "data": {},
-                "error": "Image URL cannot be empty",
-                "successful": False
-            }
+        results = await _gather_limited(_send_one_message, message_list)
+        return _bulk_tool_response(results, "messages")
+            
+    except Exception as e:
+        return {
+            "data": {},
+            "error": f"Unexpected error: {str(e)}",
+            "successful": False
+        }
+
+# conversations.close error code -> user-facing message ({channel} is filled in per call)
+_CONVERSATIONS_CLOSE_ERROR_MESSAGES = {
+    "channel_not_found": "Slack API Error: channel_not_found\n\nThe conversation '{channel}' does not exist or you don't have access to it.",
+    "not_in_channel": "Slack API Error: not_in_channel\n\nThe bot is not a member of the conversation '{channel}'. Add the bot to the conversation first.",
+    "cant_close_general": "Slack API Error: cant_close_general\n\nThe 'general' channel cannot be closed.",
+    "cant_close_mpim": "Slack API Error: cant_close_mpim\n\nThis multi-person direct message cannot be closed.",
+    "method_not_supported_for_channel_type": "Slack API Error: method_not_supported_for_channel_type\n\nThis channel type cannot be closed. Only DMs and MPDMs can be closed.",
+    "not_authed": _ERR_NOT_AUTHED_TOKEN,
+    "invalid_auth": "Slack API Error: invalid_auth\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
+    "insufficient_scope": "Slack API Error: insufficient_scope\n\nBot token lacks required scopes. Ensure the bot has 'im:write' scope for DMs and 'mpim:write' scope for MPDMs.",
+    "missing_scope": "Slack API Error: missing_scope\n\nBot token lacks required scopes. Ensure the bot has 'im:write' scope for DMs and 'mpim:write' scope for MPDMs and reinstall the app.",
+}
+
+# SLACK_CLOSE_DM_OR_MULTI_PERSON_DM
+@mcp.tool()
+async def slack_close_dm_or_multi_person_dm(
+    channel: str
+) -> dict:
+    """
+    Close conversation channel.
+    
+    Closes a slack direct message (dm) or multi-person direct message (mpdm) channel, 
+    removing it from the user's sidebar without deleting history; this action affects 
+    only the calling user's view.
+    
+    Args:
+        channel (str): Channel ID to close (DM or MPDM)
         
-        # Validate emoji name format (alphanumeric, hyphens, underscores only)
-        import re
-        if not re.match(r'^[a-zA-Z0-9_-]+$', name):
+    Returns:
+        dict: Response with data, error, and successful fields
+    """
+    try:
+        # Validate inputs
+        close_id = channel.strip() if channel else ""
+        if not close_id:
             return {
                 "data": {},
-                "error": "Emoji name can only contain letters, numbers, hyphens, and underscores",
+                "error": "Channel ID cannot be empty",
                 "successful": False
             }
         
-        # Validate URL format
-        if not url.startswith(('http://', 'https://')):
+        # Validate channel ID format (should start with 'D' for DMs or 'G' for MPDMs)
+        if channel[:1] not in _DM_ID_PREFIXES:
             return {
                 "data": {},
-                "error": "Image URL must start with http:// or https://",
+                "error": f"Invalid channel ID format: '{channel}'. Channel IDs should start with 'D' (DMs) or 'G' (MPDMs).",
                 "successful": False
             }
         
-        # Add the custom emoji
-        # Note: admin.emoji.add requires Enterprise Grid
-        response = client.admin_emoji_add(
-            name=name,
-            url=url
+        # Get client (use bot token for conversation operations)
+        client = get_async_slack_client()
+        
+        # Close the conversation
+        response = await client.conversations_close(
+            channel=close_id
         )
         
         # Check if successful
@@ -666,57 +1387,16 @@ async def slack_add_emoji(
             
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'not_an_enterprise':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThis operation requires Slack Enterprise Grid. Regular Slack workspaces cannot add emojis via API.\n\nTo add emojis in regular workspaces:\n1. Go to workspace settings\n2. Navigate to 'Customize' → 'Add custom emoji'\n3. Upload the image manually",
-                "successful": False
-            }
-        elif error_code == 'name_taken':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe emoji name '{name}' is already taken. Choose a different name.",
-                "successful": False
-            }
-        elif error_code == 'invalid_name':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe emoji name '{name}' is invalid. Use letters, numbers, hyphens, and underscores only.",
-                "successful": False
-            }
-        elif error_code == 'bad_image':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe image at URL '{url}' is invalid or cannot be processed. Ensure the URL points to a valid image file.",
-                "successful": False
-            }
-        elif error_code == 'emoji_limit_reached':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe workspace has reached its emoji limit. Remove some emojis before adding new ones.",
-                "successful": False
-            }
-        elif error_code == 'not_authed':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Check your token and permissions.",
-                "successful": False
-            }
-        elif error_code == 'invalid_auth':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Check your token format and validity.",
-                "successful": False
-            }
-        elif error_code == 'insufficient_scope':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nToken lacks required scopes. Ensure the token has 'admin.emoji:write' scope.",
-                "successful": False
-            }
         return {
             "data": {},
-            "error": f"Slack API Error: {error_code}",
+            "error": _slack_error_message(error_code, _CONVERSATIONS_CLOSE_ERROR_MESSAGES, {"channel": channel}),
+            "successful": False
+        }
+    except (OSError, aiohttp.ClientConnectionError) as e:
+        # Connection failures and timeouts from the Slack request itself
+        return {
+            "data": {},
+            "error": _ERR_NETWORK.format_map({"details": e}),
             "successful": False
         }
     except Exception as e:
@@ -726,92 +1406,84 @@ async def slack_add_emoji(
             "successful": False
         }
 
-# SLACK_ADD_REACTION_TO_AN_ITEM
+# reminders.add error code -> user-facing message ({user} and {time} are filled in per call)
+_REMINDERS_ADD_ERROR_MESSAGES = {
+    "user_not_found": "Slack API Error: user_not_found\n\nThe user '{user}' does not exist or is not accessible.",
+    "invalid_time": "Slack API Error: invalid_time\n\nThe time '{time}' is invalid. Use unix timestamps, seconds from now, or natural language like 'in 15 minutes' or 'tomorrow at 2pm'.",
+    "time_in_past": "Slack API Error: time_in_past\n\nThe specified time '{time}' is in the past. Please choose a future time.",
+    "too_far_in_future": "Slack API Error: too_far_in_future\n\nThe specified time '{time}' is too far in the future. Slack reminders are limited to 1 year ahead.",
+    "not_authed": _ERR_NOT_AUTHED_TOKEN,
+    "invalid_auth": "Slack API Error: invalid_auth\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
+    "not_allowed_token_type": "Slack API Error: not_allowed_token_type\n\nThis operation requires a user token (xoxp-) with reminders:write scope.\nBot tokens (xoxb-) cannot create reminders.\n\nTo fix:\n1. Set SLACK_USER_TOKEN environment variable\n2. Use a user token with reminders:write scope",
+    "insufficient_scope": "Slack API Error: insufficient_scope\n\nUser token lacks required scopes. Ensure the user token has 'reminders:write' scope.",
+    "missing_scope": "Slack API Error: missing_scope\n\nUser token lacks required scopes. Ensure the user token has 'reminders:write' scope and reinstall the app.",
+}
+
+# SLACK_CREATE_A_REMINDER
 @mcp.tool()
-async def slack_add_reaction_to_an_item(
-    channel: str,
-    name: str,
-    timestamp: str
+async def slack_create_a_reminder(
+    text: str,
+    time: str,
+    user: str = ""
 ) -> dict:
     """
-    Add reaction to message.
+    Create a reminder.
     
-    Adds a specified emoji reaction to an existing message in a slack channel, 
-    identified by its timestamp; does not remove or retrieve reactions.
+    Creates a slack reminder with specified text and time; time accepts unix timestamps, 
+    seconds from now, or natural language (e.g., 'in 15 minutes', 'every thursday at 2pm').
+    
+    Note: This operation requires a user token (SLACK_USER_TOKEN) with reminders:write scope.
+    Bot tokens cannot create reminders.
     
     Args:
-        channel (str): Channel ID where the message is located
-        name (str): Emoji name to add as reaction (without colons)
-        timestamp (str): Message timestamp to add reaction to
+        text (str): Reminder text content (required)
+        time (str): When to trigger the reminder (required)
+        user (str): User ID to create reminder for (optional, defaults to user token owner)
         
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
-        # Test network connectivity first
-        import urllib.request
-        try:
-            urllib.request.urlopen('https://slack.com', timeout=10)
-        except Exception as network_error:
-            return {
-                "data": {},
-                "error": f"Network Error: Cannot reach Slack servers. Check your internet connection and network settings. Details: {str(network_error)}",
-                "successful": False
-            }
-        
-        # Get client (use bot token for reaction operations)
-        client = get_slack_client()
-        
-        # Validate inputs
-        if not channel or not channel.strip():
-            return {
-                "data": {},
-                "error": "Channel ID cannot be empty",
-                "successful": False
-            }
-        
-        if not name or not name.strip():
+        # Validate required inputs
+        reminder_text = text.strip() if text else ""
+        if not reminder_text:
             return {
                 "data": {},
-                "error": "Emoji name cannot be empty",
+                "error": "Reminder text is required",
                 "successful": False
             }
         
-        if not timestamp or not timestamp.strip():
+        reminder_time = time.strip() if time else ""
+        if not reminder_time:
             return {
                 "data": {},
-                "error": "Message timestamp cannot be empty",
+                "error": "Reminder time is required",
                 "successful": False
             }
         
-        # Validate channel ID format (should start with 'C' for channels)
-        if not channel.startswith('C'):
-            return {
-                "data": {},
-                "error": f"Invalid channel ID format: '{channel}'. Channel IDs should start with 'C'.",
-                "successful": False
-            }
+        # Prepare reminder parameters
+        reminder_params = {
+            "text": reminder_text,
+            "time": reminder_time
+        }
         
-        # Validate emoji name format (remove colons if present)
-        emoji_name = name.strip()
-        if emoji_name.startswith(':') and emoji_name.endswith(':'):
-            emoji_name = emoji_name[1:-1]  # Remove colons
+        # Add user parameter if provided
+        user_id = user.strip() if user else ""
+        if user_id:
+            # Validate user ID format (should start with 'U')
+            if not user.startswith('U'):
+                return {
+                    "data": {},
+                    "error": f"Invalid user ID format: '{user}'. User IDs should start with 'U'.",
+                    "successful": False
+                }
+            reminder_params["user"] = user_id
         
-        # Validate emoji name format (alphanumeric, hyphens, underscores only)
-        import re
-        if not re.match(r'^[a-zA-Z0-9_-]+$', emoji_name):
-            return {
-                "data": {},
-                "error": "Emoji name can only contain letters, numbers, hyphens, and underscores",
-                "successful": False
-            }
+        # Get client (use user token for reminder operations)
+        client = get_async_slack_user_client()
         
-        # Add the reaction
-        response = client.reactions_add(
-            channel=channel.strip(),
-            name=emoji_name,
-            timestamp=timestamp.strip()
-        )
+        # Create the reminder
+        response = await client.reminders_add(**reminder_params)
         
         # Check if successful
         if response.data.get("ok", False):
@@ -829,57 +1501,16 @@ async def slack_add_reaction_to_an_item(
             
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'channel_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe channel '{channel}' does not exist or you don't have access to it.",
-                "successful": False
-            }
-        elif error_code == 'message_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe message with timestamp '{timestamp}' does not exist or you don't have access to it.",
-                "successful": False
-            }
-        elif error_code == 'invalid_name':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe emoji name '{name}' is invalid or does not exist in this workspace.",
-                "successful": False
-            }
-        elif error_code == 'already_reacted':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nYou have already added this reaction to the message.",
-                "successful": False
-            }
-        elif error_code == 'no_reaction':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe emoji '{name}' is not available in this workspace.",
-                "successful": False
-            }
-        elif error_code == 'not_authed':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Check your token and permissions.",
-                "successful": False
-            }
-        elif error_code == 'invalid_auth':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
-                "successful": False
-            }
-        elif error_code == 'insufficient_scope':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'reactions:write' scope.",
-                "successful": False
-            }
         return {
             "data": {},
-            "error": f"Slack API Error: {error_code}",
+            "error": _slack_error_message(error_code, _REMINDERS_ADD_ERROR_MESSAGES, {"user": user, "time": time}),
+            "successful": False
+        }
+    except (OSError, aiohttp.ClientConnectionError) as e:
+        # Connection failures and timeouts from the Slack request itself
+        return {
+            "data": {},
+            "error": _ERR_NETWORK.format_map({"details": e}),
             "successful": False
         }
     except Exception as e:
@@ -889,61 +1520,94 @@ async def slack_add_reaction_to_an_item(
             "successful": False
         }
 
-# SLACK_ARCHIVE_A_PUBLIC_OR_PRIVATE_CHANNEL
+# usergroups.create error code -> user-facing message ({name} and {handle} are filled in per call)
+_USERGROUPS_CREATE_ERROR_MESSAGES = {
+    "name_taken": "Slack API Error: name_taken\n\nThe user group name '{name}' is already taken. Choose a different name.",
+    "handle_taken": "Slack API Error: handle_taken\n\nThe handle '{handle}' is already taken. Choose a different handle.",
+    "invalid_handle": "Slack API Error: invalid_handle\n\nThe handle '{handle}' is invalid. Use letters, numbers, hyphens, and underscores only.",
+    "channel_not_found": "Slack API Error: channel_not_found\n\nOne or more channels in the list do not exist or you don't have access to them.",
+    "not_authed": _ERR_NOT_AUTHED_TOKEN,
+    "invalid_auth": "Slack API Error: invalid_auth\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
+    "insufficient_scope": "Slack API Error: insufficient_scope\n\nBot token lacks required scopes. Ensure the bot has 'usergroups:write' scope.",
+    "missing_scope": "Slack API Error: missing_scope\n\nBot token lacks required scopes. Ensure the bot has 'usergroups:write' scope and reinstall the app.",
+}
+
+# SLACK_CREATE_A_SLACK_USER_GROUP
 @mcp.tool()
-async def slack_archive_a_public_or_private_channel(
-    channel_id: str
+async def slack_create_a_slack_user_group(
+    name: str,
+    channels: str = "",
+    description: str = "",
+    handle: str = "",
+    include_count: bool = False
 ) -> dict:
     """
-    Archive a public or private channel.
+    Create a Slack user group.
     
-    Archives a slack public or private channel, making it read-only; 
-    the primary 'general' channel cannot be archived.
+    Creates a new user group (often referred to as a subteam) in a slack workspace.
     
     Args:
-        channel_id (str): Channel ID to archive
+        name (str): Name of the user group (required)
+        channels (str): Comma-separated list of channel IDs to add to the user group
+        description (str): Description of the user group
+        handle (str): Handle for the user group (without @)
+        include_count (bool): Whether to include member count in the response
         
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
-        # Test network connectivity first
-        import urllib.request
-        try:
-            urllib.request.urlopen('https://slack.com', timeout=10)
-        except Exception as network_error:
-            return {
-                "data": {},
-                "error": f"Network Error: Cannot reach Slack servers. Check your internet connection and network settings. Details: {str(network_error)}",
-                "successful": False
-            }
+        # Get client (use bot token for user group operations)
+        client = get_async_slack_client()
         
-        # Get client (use bot token for channel operations)
-        client = get_slack_client()
+        # Validate required inputs
+        group_name = name.strip() if name else ""
+        if not group_name:
+            return _INVALID_USERGROUP_NAME_EMPTY
         
-        # Validate inputs
-        if not channel_id or not channel_id.strip():
-            return {
-                "data": {},
-                "error": "Channel ID cannot be empty",
-                "successful": False
-            }
+        # Prepare user group parameters
+        usergroup_params = {
+            "name": group_name,
+            "include_count": include_count
+        }
         
-        # Validate channel ID format (should start with 'C' for channels)
-        if not channel_id.startswith('C'):
-            return {
-                "data": {},
-                "error": f"Invalid channel ID format: '{channel_id}'. Channel IDs should start with 'C'.",
-                "successful": False
-            }
+        # Add optional parameters if provided
+        channels_csv = channels.strip() if channels else ""
+        if channels_csv:
+            # Parse and validate channel IDs (should start with 'C') in one pass
+            channel_list = []
+            for raw_id in channels_csv.split(','):
+                channel_id = raw_id.strip()
+                if not channel_id:
+                    continue
+                if not channel_id.startswith('C'):
+                    return {
+                        "data": {},
+                        "error": f"Invalid channel ID format: '{channel_id}'. Channel IDs should start with 'C'.",
+                        "successful": False
+                    }
+                channel_list.append(channel_id)
+            if channel_list:
+                usergroup_params["channels"] = channel_list
         
-        # Archive the channel
-        response = client.conversations_archive(
-            channel=channel_id.strip()
-        )
+        group_description = description.strip() if description else ""
+        if group_description:
+            usergroup_params["description"] = group_description
+        
+        clean_handle = handle.strip() if handle else ""
+        if clean_handle:
+            # Remove @ if present
+            if clean_handle.startswith('@'):
+                clean_handle = clean_handle[1:]
+            usergroup_params["handle"] = clean_handle
+        
+        # Create the user group
+        response = await _call_slack_paced(partial(client.usergroups_create, **usergroup_params), "usergroups.create")
         
         # Check if successful
         if response.data.get("ok", False):
+            # The cached usergroups.list results no longer reflect the workspace
+            _invalidate_usergroups_cache()
             return {
                 "data": response.data,
                 "error": "",
@@ -958,51 +1622,16 @@ async def slack_archive_a_public_or_private_channel(
             
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'channel_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe channel '{channel_id}' does not exist or you don't have access to it.",
-                "successful": False
-            }
-        elif error_code == 'is_archived':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe channel '{channel_id}' is already archived.",
-                "successful": False
-            }
-        elif error_code == 'cant_archive_general':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe 'general' channel cannot be archived.",
-                "successful": False
-            }
-        elif error_code == 'not_authed':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Check your token and permissions.",
-                "successful": False
-            }
-        elif error_code == 'invalid_auth':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
-                "successful": False
-            }
-        elif error_code == 'insufficient_scope':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'channels:manage' (for public channels) and 'groups:write' (for private channels) scopes.",
-                "successful": False
-            }
-        elif error_code == 'missing_scope':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'channels:manage' (for public channels) and 'groups:write' (for private channels) scopes and reinstall the app.",
-                "successful": False
-            }
         return {
             "data": {},
-            "error": f"Slack API Error: {error_code}",
+            "error": _slack_error_message(error_code, _USERGROUPS_CREATE_ERROR_MESSAGES, {"name": name, "handle": handle}),
+            "successful": False
+        }
+    except (OSError, aiohttp.ClientConnectionError) as e:
+        # Connection failures and timeouts from the Slack request itself
+        return {
+            "data": {},
+            "error": _ERR_NETWORK.format_map({"details": e}),
             "successful": False
         }
     except Exception as e:
@@ -1012,60 +1641,64 @@ async def slack_archive_a_public_or_private_channel(
             "successful": False
         }
 
-# SLACK_ARCHIVE_A_SLACK_CONVERSATION
+# conversations.create error code -> user-facing message ({name} is filled in per call)
+_CREATE_CHANNEL_ERROR_MESSAGES = {
+    "name_taken": "Slack API Error: name_taken\n\nThe channel name '{name}' is already taken. Choose a different name.",
+    "invalid_name": "Slack API Error: invalid_name\n\nThe channel name '{name}' is invalid. Use lowercase letters, numbers, periods, hyphens, and underscores only.",
+    "restricted_action": "Slack API Error: restricted_action\n\nChannel creation is restricted in this workspace. Check workspace settings or contact your admin.",
+    "channel_limit_reached": "Slack API Error: channel_limit_reached\n\nThe workspace has reached its channel limit. Delete some channels before creating new ones.",
+    "not_authed": _ERR_NOT_AUTHED_TOKEN,
+    "invalid_auth": "Slack API Error: invalid_auth\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
+    "insufficient_scope": "Slack API Error: insufficient_scope\n\nBot token lacks required scopes. Ensure the bot has 'channels:write' scope for public channels or 'groups:write' scope for private channels.",
+    "missing_scope": "Slack API Error: missing_scope\n\nBot token lacks required scopes. Ensure the bot has 'channels:write' scope for public channels or 'groups:write' scope for private channels and reinstall the app.",
+}
+
+# SLACK_CREATE_CHANNEL
 @mcp.tool()
-async def slack_archive_a_slack_conversation(
-    channel: str
+async def slack_create_channel(
+    name: str,
+    is_private: bool = False,
+    team_id: str = ""
 ) -> dict:
     """
-    Archive a Slack conversation.
+    Create channel.
     
-    Archives a slack conversation by its id, rendering it read-only and hidden while 
-    retaining history, ideal for cleaning up inactive channels; be aware that some 
-    channels (like #general or certain dms) cannot be archived and this may impact 
-    connected integrations.
+    Initiates a public or private channel-based conversation.
     
     Args:
-        channel (str): Channel ID to archive
+        name (str): Name of the channel to create (required)
+        is_private (bool): Whether to create a private channel (default: False)
+        team_id (str): Team ID to create the channel in (optional)
         
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
-        # Test network connectivity first
-        import urllib.request
-        try:
-            urllib.request.urlopen('https://slack.com', timeout=10)
-        except Exception as network_error:
-            return {
-                "data": {},
-                "error": f"Network Error: Cannot reach Slack servers. Check your internet connection and network settings. Details: {str(network_error)}",
-                "successful": False
-            }
+        # Get client (use bot token for channel operations)
+        client = get_async_slack_client()
         
-        # Get client (use bot token for conversation operations)
-        client = get_slack_client()
+        # Validate required inputs
+        channel_name = name.strip() if name else ""
+        if not channel_name:
+            return _INVALID_CHANNEL_NAME_EMPTY
         
-        # Validate inputs
-        if not channel or not channel.strip():
-            return {
-                "data": {},
-                "error": "Channel ID cannot be empty",
-                "successful": False
-            }
+        # Validate channel name format
+        if not _CHANNEL_NAME_RE.match(channel_name):
+            return _INVALID_CHANNEL_NAME_FORMAT
         
-        # Validate channel ID format (should start with 'C' for channels or 'D' for DMs)
-        if not channel.startswith(('C', 'D', 'G')):
-            return {
-                "data": {},
-                "error": f"Invalid channel ID format: '{channel}'. Channel IDs should start with 'C' (channels), 'D' (DMs), or 'G' (private channels).",
-                "successful": False
-            }
+        # Prepare channel parameters
+        channel_params = {
+            "name": channel_name,
+            "is_private": is_private
+        }
         
-        # Archive the conversation
-        response = client.conversations_archive(
-            channel=channel.strip()
-        )
+        # Add team_id if provided
+        channel_team_id = team_id.strip() if team_id else ""
+        if channel_team_id:
+            channel_params["team_id"] = channel_team_id
+        
+        # Create the channel
+        response = await _call_slack_paced(partial(client.conversations_create, **channel_params), "conversations.create")
         
         # Check if successful
         if response.data.get("ok", False):
@@ -1083,63 +1716,16 @@ async def slack_archive_a_slack_conversation(
             
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'channel_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe conversation '{channel}' does not exist or you don't have access to it.",
-                "successful": False
-            }
-        elif error_code == 'is_archived':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe conversation '{channel}' is already archived.",
-                "successful": False
-            }
-        elif error_code == 'cant_archive_general':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe 'general' channel cannot be archived.",
-                "successful": False
-            }
-        elif error_code == 'cant_archive_this_channel':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThis channel cannot be archived. Some channels (like #general) or certain DMs cannot be archived.",
-                "successful": False
-            }
-        elif error_code == 'not_in_channel':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe bot is not a member of the conversation '{channel}'. Add the bot to the channel first.",
-                "successful": False
-            }
-        elif error_code == 'not_authed':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Check your token and permissions.",
-                "successful": False
-            }
-        elif error_code == 'invalid_auth':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
-                "successful": False
-            }
-        elif error_code == 'insufficient_scope':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'channels:manage' (for public channels) and 'groups:write' (for private channels) scopes.",
-                "successful": False
-            }
-        elif error_code == 'missing_scope':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'channels:manage' (for public channels) and 'groups:write' (for private channels) scopes and reinstall the app.",
-                "successful": False
-            }
         return {
             "data": {},
-            "error": f"Slack API Error: {error_code}",
+            "error": _slack_error_message(error_code, _CREATE_CHANNEL_ERROR_MESSAGES, {"name": name}),
+            "successful": False
+        }
+    except (OSError, aiohttp.ClientConnectionError) as e:
+        # Connection failures and timeouts from the Slack request itself
+        return {
+            "data": {},
+            "error": _ERR_NETWORK.format_map({"details": e}),
             "successful": False
         }
     except Exception as e:
@@ -1149,136 +1735,81 @@ async def slack_archive_a_slack_conversation(
             "successful": False
         }
 
-# SLACK_SEND_MESSAGE
+# conversations.create error code -> user-facing message ({name} and {team_id} are filled in per call)
+_CREATE_CONVERSATION_ERROR_MESSAGES = {
+    "name_taken": "Slack API Error: name_taken\n\nThe channel name '{name}' is already taken. Choose a different name.",
+    "invalid_name": "Slack API Error: invalid_name\n\nThe channel name '{name}' is invalid. Use lowercase letters, numbers, periods, hyphens, and underscores only.",
+    "restricted_action": "Slack API Error: restricted_action\n\nChannel creation is restricted in this workspace. Check workspace settings or contact your admin.",
+    "channel_limit_reached": "Slack API Error: channel_limit_reached\n\nThe workspace has reached its channel limit. Delete some channels before creating new ones.",
+    "team_not_found": "Slack API Error: team_not_found\n\nThe team ID '{team_id}' does not exist or you don't have access to it.",
+    "not_authed": _ERR_NOT_AUTHED_TOKEN,
+    "invalid_auth": "Slack API Error: invalid_auth\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
+    "insufficient_scope": "Slack API Error: insufficient_scope\n\nBot token lacks required scopes. Ensure the bot has 'channels:write' scope for public channels or 'groups:write' scope for private channels.",
+    "missing_scope": "Slack API Error: missing_scope\n\nBot token lacks required scopes. Ensure the bot has 'channels:write' scope for public channels or 'groups:write' scope for private channels and reinstall the app.",
+}
+
+# SLACK_CREATE_CHANNEL_BASED_CONVERSATION
 @mcp.tool()
-def slack_send_message(
-    channel: str,
-    text: Optional[str] = None,
-    blocks: Optional[str] = None,
-    attachments: Optional[str] = None,
-    as_user: bool = False,
-    icon_emoji: Optional[str] = None,
-    icon_url: Optional[str] = None,
-    link_names: bool = False,
-    markdown_text: Optional[str] = None,
-    mrkdwn: bool = True,
-    parse: Optional[str] = None,
-    reply_broadcast: bool = False,
-    thread_ts: Optional[str] = None,
-    unfurl_links: bool = True,
-    unfurl_media: bool = True,
-    username: Optional[str] = None
+async def slack_create_channel_based_conversation(
+    name: str,
+    is_private: bool,
+    description: str = "",
+    org_wide: bool = False,
+    team_id: str = ""
 ) -> dict:
     """
-    Posts a message to a slack channel, direct message, or private group; requires content via `text`, `blocks`, or `attachments`.
+    Create a channel-based conversation.
+    
+    Creates a new public or private slack channel with a unique name; the channel can be 
+    org-wide, or team-specific if `team id` is given (required if `org wide` is false or not provided).
+    
+    Args:
+        name (str): Name of the channel to create (required)
+        is_private (bool): Whether to create a private channel (required)
+        description (str): Description of the channel (optional)
+        org_wide (bool): Whether to create an org-wide channel (default: False)
+        team_id (str): Team ID to create the channel in (required if org_wide is False)
+        
+    Returns:
+        dict: Response with data, error, and successful fields
     """
     try:
-        # Test network connectivity first
-        import urllib.request
-        try:
-            urllib.request.urlopen('https://slack.com', timeout=10)
-        except Exception as network_error:
-            return {
-                "data": {},
-                "error": f"Network Error: Cannot reach Slack servers. Check your internet connection and network settings. Details: {str(network_error)}",
-                "successful": False
-            }
-        
-        # Get client (use bot token for message operations)
-        client = get_slack_client()
+        # Get client (use bot token for channel operations)
+        client = get_async_slack_client()
         
         # Validate required inputs
-        if not channel or not channel.strip():
-            return {
-                "data": {},
-                "error": "Channel ID is required",
-                "successful": False
-            }
+        channel_name = name.strip() if name else ""
+        if not channel_name:
+            return _INVALID_CHANNEL_NAME_EMPTY
         
-        # Validate channel ID format
-        if not channel.startswith(('C', 'D', 'G')):
-            return {
-                "data": {},
-                "error": f"Invalid channel ID format: '{channel}'. Channel IDs should start with 'C' (channels), 'D' (DMs), or 'G' (private channels).",
-                "successful": False
-            }
+        # Validate team_id requirement when org_wide is False
+        channel_team_id = team_id.strip() if team_id else ""
+        if not org_wide and not channel_team_id:
+            return _INVALID_TEAM_ID_EMPTY
         
-        # Prepare message parameters
-        message_params = {
-            "channel": channel.strip()
+        # Validate channel name format
+        if not _CHANNEL_NAME_RE.match(channel_name):
+            return _INVALID_CHANNEL_NAME_FORMAT
+        
+        # Prepare channel parameters
+        channel_params = {
+            "name": channel_name,
+            "is_private": is_private
         }
         
         # Add optional parameters if provided
-        if text and text.strip():
-            message_params["text"] = text.strip()
-        
-        if as_user:
-            message_params["as_user"] = as_user
-        
-        if attachments and attachments.strip():
-            try:
-                import json
-                message_params["attachments"] = json.loads(attachments)
-            except json.JSONDecodeError:
-                return {
-                    "data": {},
-                    "error": "Invalid JSON format for attachments parameter",
-                    "successful": False
-                }
-        
-        if blocks and blocks.strip():
-            try:
-                import json
-                message_params["blocks"] = json.loads(blocks)
-            except json.JSONDecodeError:
-                return {
-                    "data": {},
-                    "error": "Invalid JSON format for blocks parameter",
-                    "successful": False
-                }
-        
-        if icon_emoji and icon_emoji.strip():
-            message_params["icon_emoji"] = icon_emoji.strip()
-        
-        if icon_url and icon_url.strip():
-            message_params["icon_url"] = icon_url.strip()
-        
-        if link_names:
-            message_params["link_names"] = link_names
-        
-        if markdown_text and markdown_text.strip():
-            message_params["markdown_text"] = markdown_text.strip()
-        
-        if mrkdwn:
-            message_params["mrkdwn"] = mrkdwn
-        
-        if parse and parse.strip():
-            if parse.strip() in ['full', 'none']:
-                message_params["parse"] = parse.strip()
-            else:
-                return {
-                    "data": {},
-                    "error": "Parse parameter must be 'full' or 'none'",
-                    "successful": False
-                }
-        
-        if reply_broadcast:
-            message_params["reply_broadcast"] = reply_broadcast
-        
-        if thread_ts and thread_ts.strip():
-            message_params["thread_ts"] = thread_ts.strip()
+        channel_description = description.strip() if description else ""
+        if channel_description:
+            channel_params["description"] = channel_description
         
-        if not unfurl_links:
-            message_params["unfurl_links"] = unfurl_links
-        
-        if not unfurl_media:
-            message_params["unfurl_media"] = unfurl_media
+        if org_wide:
+            channel_params["org_wide"] = org_wide
         
-        if username and username.strip():
-            message_params["username"] = username.strip()
+        if channel_team_id:
+            channel_params["team_id"] = channel_team_id
         
-        # Send the message
-        response = client.chat_postMessage(**message_params)
+        # Create the channel
+        response = await _call_slack_paced(partial(client.conversations_create, **channel_params), "conversations.create")
         
         # Check if successful
         if response.data.get("ok", False):
@@ -1296,63 +1827,16 @@ def slack_send_message(
             
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'channel_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe channel '{channel}' does not exist or you don't have access to it.",
-                "successful": False
-            }
-        elif error_code == 'not_in_channel':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe bot is not a member of the channel '{channel}'. Add the bot to the channel first.",
-                "successful": False
-            }
-        elif error_code == 'msg_too_long':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe message is too long. Slack has a 40,000 character limit for messages.",
-                "successful": False
-            }
-        elif error_code == 'no_text':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMessage must contain text, attachments, or blocks.",
-                "successful": False
-            }
-        elif error_code == 'rate_limited':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nRate limit exceeded. Please wait before sending another message.",
-                "successful": False
-            }
-        elif error_code == 'not_authed':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Check your token and permissions.",
-                "successful": False
-            }
-        elif error_code == 'invalid_auth':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
-                "successful": False
-            }
-        elif error_code == 'insufficient_scope':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'chat:write' scope.",
-                "successful": False
-            }
-        elif error_code == 'missing_scope':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'chat:write' scope and reinstall the app.",
-                "successful": False
-            }
         return {
             "data": {},
-            "error": f"Slack API Error: {error_code}",
+            "error": _slack_error_message(error_code, _CREATE_CONVERSATION_ERROR_MESSAGES, {"name": name, "team_id": team_id}),
+            "successful": False
+        }
+    except (OSError, aiohttp.ClientConnectionError) as e:
+        # Connection failures and timeouts from the Slack request itself
+        return {
+            "data": {},
+            "error": _ERR_NETWORK.format_map({"details": e}),
             "successful": False
         }
     except Exception as e:
@@ -1362,59 +1846,103 @@ def slack_send_message(
             "successful": False
         }
 
-# SLACK_CLOSE_DM_OR_MULTI_PERSON_DM
+# chat.unfurl error code -> user-facing message ({channel} and {ts} are filled in per call)
+_CHAT_UNFURL_ERROR_MESSAGES = {
+    "channel_not_found": "Slack API Error: channel_not_found\n\nThe channel '{channel}' does not exist or you don't have access to it.",
+    "message_not_found": "Slack API Error: message_not_found\n\nThe message with timestamp '{ts}' does not exist or you don't have access to it.",
+    "invalid_unfurls": "Slack API Error: invalid_unfurls\n\nThe unfurls JSON is invalid. Check the format and structure of your unfurl data.",
+    "not_authed": _ERR_NOT_AUTHED_TOKEN,
+    "invalid_auth": "Slack API Error: invalid_auth\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
+    "insufficient_scope": "Slack API Error: insufficient_scope\n\nBot token lacks required scopes. Ensure the bot has 'links:write' scope.",
+    "missing_scope": "Slack API Error: missing_scope\n\nBot token lacks required scopes. Ensure the bot has 'links:write' scope and reinstall the app.",
+}
+
+# SLACK_CUSTOMIZE_URL_UNFURL
 @mcp.tool()
-async def slack_close_dm_or_multi_person_dm(
-    channel: str
+async def slack_customize_url_unfurl(
+    channel: str,
+    ts: str,
+    unfurls: str,
+    user_auth_message: str = "",
+    user_auth_required: bool = False,
+    user_auth_url: str = ""
 ) -> dict:
     """
-    Close conversation channel.
+    Customize URL unfurl.
     
-    Closes a slack direct message (dm) or multi-person direct message (mpdm) channel, 
-    removing it from the user's sidebar without deleting history; this action affects 
-    only the calling user's view.
+    Customizes url previews (unfurling) in a specific slack message using a url-encoded json 
+    in `unfurls` to define custom content or remove existing previews.
     
     Args:
-        channel (str): Channel ID to close (DM or MPDM)
+        channel (str): Channel ID where the message is located (required)
+        ts (str): Message timestamp to customize unfurls for (required)
+        unfurls (str): URL-encoded JSON defining custom unfurl content (required)
+        user_auth_message (str): Message to show when user authentication is required
+        user_auth_required (bool): Whether user authentication is required
+        user_auth_url (str): URL to redirect users for authentication
         
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
-        # Test network connectivity first
-        import urllib.request
-        try:
-            urllib.request.urlopen('https://slack.com', timeout=10)
-        except Exception as network_error:
-            return {
-                "data": {},
-                "error": f"Network Error: Cannot reach Slack servers. Check your internet connection and network settings. Details: {str(network_error)}",
-                "successful": False
-            }
+        # Get client (use bot token for unfurl operations)
+        client = get_async_slack_client()
         
-        # Get client (use bot token for conversation operations)
-        client = get_slack_client()
+        # Validate required inputs
+        channel_id = channel.strip() if channel else ""
+        if not channel_id:
+            return _INVALID_UNFURL_CHANNEL_EMPTY
         
-        # Validate inputs
-        if not channel or not channel.strip():
+        message_ts = ts.strip() if ts else ""
+        if not message_ts:
+            return _INVALID_UNFURL_TS_EMPTY
+        
+        unfurls_json = unfurls.strip() if unfurls else ""
+        if not unfurls_json:
+            return _INVALID_UNFURLS_EMPTY
+        
+        # Validate channel ID format
+        if channel_id[:1] not in _CONVERSATION_ID_PREFIXES:
             return {
                 "data": {},
-                "error": "Channel ID cannot be empty",
+                "error": f"Invalid channel ID format: '{channel_id}'. Channel IDs should start with 'C' (channels), 'D' (DMs), or 'G' (private channels).",
                 "successful": False
             }
         
-        # Validate channel ID format (should start with 'D' for DMs or 'G' for MPDMs)
-        if not channel.startswith(('D', 'G')):
+        # Validate and parse unfurls JSON
+        try:
+            # Decode the URL-encoded JSON; the SDK serializes the parsed object into the request body
+            unfurls_data = orjson.loads(urllib.parse.unquote(unfurls_json))
+        except orjson.JSONDecodeError:
+            return _INVALID_UNFURLS_JSON
+        except Exception as e:
             return {
                 "data": {},
-                "error": f"Invalid channel ID format: '{channel}'. Channel IDs should start with 'D' (DMs) or 'G' (MPDMs).",
+                "error": f"Error processing unfurls parameter: {str(e)}",
                 "successful": False
             }
         
-        # Close the conversation
-        response = client.conversations_close(
-            channel=channel.strip()
-        )
+        # Prepare unfurl parameters
+        unfurl_params = {
+            "channel": channel_id,
+            "ts": message_ts,
+            "unfurls": unfurls_data
+        }
+        
+        # Add optional parameters if provided
+        auth_message = user_auth_message.strip() if user_auth_message else ""
+        if auth_message:
+            unfurl_params["user_auth_message"] = auth_message
+        
+        if user_auth_required:
+            unfurl_params["user_auth_required"] = user_auth_required
+        
+        auth_url = user_auth_url.strip() if user_auth_url else ""
+        if auth_url:
+            unfurl_params["user_auth_url"] = auth_url
+        
+        # Customize the unfurls
+        response = await _call_slack_paced(partial(client.chat_unfurl, **unfurl_params), "chat.unfurl")
         
         # Check if successful
         if response.data.get("ok", False):
@@ -1432,63 +1960,16 @@ async def slack_close_dm_or_multi_person_dm(
             
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'channel_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe conversation '{channel}' does not exist or you don't have access to it.",
-                "successful": False
-            }
-        elif error_code == 'not_in_channel':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe bot is not a member of the conversation '{channel}'. Add the bot to the conversation first.",
-                "successful": False
-            }
-        elif error_code == 'cant_close_general':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe 'general' channel cannot be closed.",
-                "successful": False
-            }
-        elif error_code == 'cant_close_mpim':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThis multi-person direct message cannot be closed.",
-                "successful": False
-            }
-        elif error_code == 'method_not_supported_for_channel_type':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThis channel type cannot be closed. Only DMs and MPDMs can be closed.",
-                "successful": False
-            }
-        elif error_code == 'not_authed':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Check your token and permissions.",
-                "successful": False
-            }
-        elif error_code == 'invalid_auth':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
-                "successful": False
-            }
-        elif error_code == 'insufficient_scope':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'im:write' scope for DMs and 'mpim:write' scope for MPDMs.",
-                "successful": False
-            }
-        elif error_code == 'missing_scope':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'im:write' scope for DMs and 'mpim:write' scope for MPDMs and reinstall the app.",
-                "successful": False
-            }
         return {
             "data": {},
-            "error": f"Slack API Error: {error_code}",
+            "error": _slack_error_message(error_code, _CHAT_UNFURL_ERROR_MESSAGES, {"channel": channel, "ts": ts}),
+            "successful": False
+        }
+    except (OSError, aiohttp.ClientConnectionError) as e:
+        # Connection failures and timeouts from the Slack request itself
+        return {
+            "data": {},
+            "error": _ERR_NETWORK.format_map({"details": e}),
             "successful": False
         }
     except Exception as e:
@@ -1498,33 +1979,56 @@ async def slack_close_dm_or_multi_person_dm(
             "successful": False
         }
 
-# SLACK_CREATE_A_REMINDER
+# SLACK_CUSTOMIZE_URL_UNFURLING_IN_MESSAGES
 @mcp.tool()
-async def slack_create_a_reminder(
-    text: str,
-    time: str,
-    user: str = ""
+async def slack_customize_url_unfurling_in_messages(
+    channel: str,
+    ts: str,
+    unfurls: str,
+    user_auth_message: str = "",
+    user_auth_required: bool = False,
+    user_auth_url: str = ""
 ) -> dict:
     """
-    Create a reminder.
+    Customize URL unfurling in messages.
     
-    Creates a slack reminder with specified text and time; time accepts unix timestamps, 
-    seconds from now, or natural language (e.g., 'in 15 minutes', 'every thursday at 2pm').
+    Deprecated: customizes url previews (unfurling) in a specific slack message. 
+    use `customize url unfurl` instead.
     
-    Note: This operation requires a user token (SLACK_USER_TOKEN) with reminders:write scope.
-    Bot tokens cannot create reminders.
+    Args:
+        channel (str): Channel ID where the message is located (required)
+        ts (str): Message timestamp to customize unfurls for (required)
+        unfurls (str): URL-encoded JSON defining custom unfurl content (required)
+        user_auth_message (str): Message to show when user authentication is required
+        user_auth_required (bool): Whether user authentication is required
+        user_auth_url (str): URL to redirect users for authentication
+        
+    Returns:
+        dict: Response with data, error, and successful fields
+    """
+    return await slack_customize_url_unfurl(
+        channel, ts, unfurls, user_auth_message, user_auth_required, user_auth_url
+    )
+
+# SLACK_DELETE_A_PUBLIC_OR_PRIVATE_CHANNEL
+@mcp.tool()
+async def slack_delete_a_public_or_private_channel(
+    channel_id: str
+) -> dict:
+    """
+    Delete a public or private channel.
+    
+    Permanently and irreversibly deletes a specified public or private channel, 
+    including all its messages and files, within a slack enterprise grid organization.
     
     Args:
-        text (str): Reminder text content (required)
-        time (str): When to trigger the reminder (required)
-        user (str): User ID to create reminder for (optional, defaults to user token owner)
+        channel_id (str): Channel ID to delete (required)
         
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
         # Test network connectivity first
-        import urllib.request
         try:
             urllib.request.urlopen('https://slack.com', timeout=10)
         except Exception as network_error:
@@ -1534,43 +2038,29 @@ async def slack_create_a_reminder(
                 "successful": False
             }
         
-        # Get client (use user token for reminder operations)
-        client = get_slack_user_client()
+        # Get client (use bot token for channel operations)
+        client = get_slack_client()
         
         # Validate required inputs
-        if not text or not text.strip():
+        if not channel_id or not channel_id.strip():
             return {
                 "data": {},
-                "error": "Reminder text is required",
+                "error": "Channel ID is required",
                 "successful": False
             }
         
-        if not time or not time.strip():
+        # Validate channel ID format (should start with 'C' for channels)
+        if not channel_id.startswith('C'):
             return {
                 "data": {},
-                "error": "Reminder time is required",
+                "error": f"Invalid channel ID format: '{channel_id}'. Channel IDs should start with 'C'.",
                 "successful": False
             }
         
-        # Prepare reminder parameters
-        reminder_params = {
-            "text": text.strip(),
-            "time": time.strip()
-        }
-        
-        # Add user parameter if provided
-        if user and user.strip():
-            # Validate user ID format (should start with 'U')
-            if not user.startswith('U'):
-                return {
-                    "data": {},
-                    "error": f"Invalid user ID format: '{user}'. User IDs should start with 'U'.",
-                    "successful": False
-                }
-            reminder_params["user"] = user.strip()
-        
-        # Create the reminder
-        response = client.reminders_add(**reminder_params)
+        # Delete the channel
+        response = client.admin_conversations_delete(
+            channel_id=channel_id.strip()
+        )
         
         # Check if successful
         if response.data.get("ok", False):
@@ -1588,28 +2078,28 @@ async def slack_create_a_reminder(
             
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'user_not_found':
+        if error_code == 'channel_not_found':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe user '{user}' does not exist or is not accessible.",
+                "error": f"Slack API Error: {error_code}\n\nThe channel '{channel_id}' does not exist or you don't have access to it.",
                 "successful": False
             }
-        elif error_code == 'invalid_time':
+        elif error_code == 'not_an_enterprise':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe time '{time}' is invalid. Use unix timestamps, seconds from now, or natural language like 'in 15 minutes' or 'tomorrow at 2pm'.",
+                "error": f"Slack API Error: {error_code}\n\nThis operation requires Slack Enterprise Grid. Regular Slack workspaces cannot delete channels via API.\n\nTo delete channels in regular workspaces:\n1. Go to the channel\n2. Click the channel name\n3. Select 'Settings' → 'Delete channel'",
                 "successful": False
             }
-        elif error_code == 'time_in_past':
+        elif error_code == 'cant_delete_general':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe specified time '{time}' is in the past. Please choose a future time.",
+                "error": f"Slack API Error: {error_code}\n\nThe 'general' channel cannot be deleted.",
                 "successful": False
             }
-        elif error_code == 'too_far_in_future':
+        elif error_code == 'restricted_action':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe specified time '{time}' is too far in the future. Slack reminders are limited to 1 year ahead.",
+                "error": f"Slack API Error: {error_code}\n\nChannel deletion is restricted in this workspace. Check workspace settings or contact your admin.",
                 "successful": False
             }
         elif error_code == 'not_authed':
@@ -1624,22 +2114,16 @@ async def slack_create_a_reminder(
                 "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
                 "successful": False
             }
-        elif error_code == 'not_allowed_token_type':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThis operation requires a user token (xoxp-) with reminders:write scope.\nBot tokens (xoxb-) cannot create reminders.\n\nTo fix:\n1. Set SLACK_USER_TOKEN environment variable\n2. Use a user token with reminders:write scope",
-                "successful": False
-            }
         elif error_code == 'insufficient_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nUser token lacks required scopes. Ensure the user token has 'reminders:write' scope.",
+                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'admin.conversations:write' scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nUser token lacks required scopes. Ensure the user token has 'reminders:write' scope and reinstall the app.",
+                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'admin.conversations:write' scope and reinstall the app.",
                 "successful": False
             }
         return {
@@ -1654,33 +2138,29 @@ async def slack_create_a_reminder(
             "successful": False
         }
 
-# SLACK_CREATE_A_SLACK_USER_GROUP
+# SLACK_DELETE_A_SCHEDULED_MESSAGE_IN_A_CHAT
 @mcp.tool()
-async def slack_create_a_slack_user_group(
-    name: str,
-    channels: str = "",
-    description: str = "",
-    handle: str = "",
-    include_count: bool = False
+async def slack_delete_a_scheduled_message_in_a_chat(
+    channel: str,
+    scheduled_message_id: str,
+    as_user: bool = False
 ) -> dict:
     """
-    Create a Slack user group.
+    Delete scheduled chat message.
     
-    Creates a new user group (often referred to as a subteam) in a slack workspace.
+    Deletes a pending, unsent scheduled message from the specified slack channel, 
+    identified by its `scheduled message id`.
     
     Args:
-        name (str): Name of the user group (required)
-        channels (str): Comma-separated list of channel IDs to add to the user group
-        description (str): Description of the user group
-        handle (str): Handle for the user group (without @)
-        include_count (bool): Whether to include member count in the response
+        channel (str): Channel ID where the scheduled message is located (required)
+        scheduled_message_id (str): ID of the scheduled message to delete (required)
+        as_user (bool): Whether to delete the message as the bot user (default: False)
         
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
         # Test network connectivity first
-        import urllib.request
         try:
             urllib.request.urlopen('https://slack.com', timeout=10)
         except Exception as network_error:
@@ -1690,50 +2170,44 @@ async def slack_create_a_slack_user_group(
                 "successful": False
             }
         
-        # Get client (use bot token for user group operations)
+        # Get client (use bot token for scheduled message operations)
         client = get_slack_client()
         
         # Validate required inputs
-        if not name or not name.strip():
+        if not channel or not channel.strip():
             return {
                 "data": {},
-                "error": "User group name is required",
+                "error": "Channel ID is required",
                 "successful": False
             }
         
-        # Prepare user group parameters
-        usergroup_params = {
-            "name": name.strip(),
-            "include_count": include_count
-        }
+        if not scheduled_message_id or not scheduled_message_id.strip():
+            return {
+                "data": {},
+                "error": "Scheduled message ID is required",
+                "successful": False
+            }
         
-        # Add optional parameters if provided
-        if channels and channels.strip():
-            # Parse and validate channel IDs
-            channel_list = [ch.strip() for ch in channels.split(',') if ch.strip()]
-            if channel_list:
-                # Validate channel ID format (should start with 'C')
-                for channel_id in channel_list:
-                    if not channel_id.startswith('C'):
-                        return {
-                            "data": {},
-                            "error": f"Invalid channel ID format: '{channel_id}'. Channel IDs should start with 'C'.",
-                            "successful": False
-                        }
-                usergroup_params["channels"] = channel_list
+        # Validate channel ID format
+        if not channel.startswith(('C', 'D', 'G')):
+            return {
+                "data": {},
+                "error": f"Invalid channel ID format: '{channel}'. Channel IDs should start with 'C' (channels), 'D' (DMs), or 'G' (private channels).",
+                "successful": False
+            }
         
-        if description and description.strip():
-            usergroup_params["description"] = description.strip()
+        # Prepare deletion parameters
+        delete_params = {
+            "channel": channel.strip(),
+            "scheduled_message_id": scheduled_message_id.strip()
+        }
         
-        if handle and handle.strip():
-            # Remove @ if present
-            clean_handle = handle.strip()
-            if clean_handle.startswith('@'):
-                clean_handle = clean_handle[1:]
-            usergroup_params["handle"] = clean_handle
+        # Add as_user parameter if specified
+        if as_user:
+            delete_params["as_user"] = as_user
         
-        # Create the user group
-        response = client.usergroups_create(**usergroup_params)
+        # Delete the scheduled message
+        response = client.chat_deleteScheduledMessage(**delete_params)
         
         # Check if successful
         if response.data.get("ok", False):
@@ -1751,28 +2225,16 @@ async def slack_create_a_slack_user_group(
             
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'name_taken':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe user group name '{name}' is already taken. Choose a different name.",
-                "successful": False
-            }
-        elif error_code == 'handle_taken':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe handle '{handle}' is already taken. Choose a different handle.",
-                "successful": False
-            }
-        elif error_code == 'invalid_handle':
+        if error_code == 'channel_not_found':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe handle '{handle}' is invalid. Use letters, numbers, hyphens, and underscores only.",
+                "error": f"Slack API Error: {error_code}\n\nThe channel '{channel}' does not exist or you don't have access to it.",
                 "successful": False
             }
-        elif error_code == 'channel_not_found':
+        elif error_code == 'scheduled_message_not_found':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nOne or more channels in the list do not exist or you don't have access to them.",
+                "error": f"Slack API Error: {error_code}\n\nThe scheduled message '{scheduled_message_id}' does not exist or has already been sent.",
                 "successful": False
             }
         elif error_code == 'not_authed':
@@ -1790,13 +2252,13 @@ async def slack_create_a_slack_user_group(
         elif error_code == 'insufficient_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'usergroups:write' scope.",
+                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'chat:write' scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'usergroups:write' scope and reinstall the app.",
+                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'chat:write' scope and reinstall the app.",
                 "successful": False
             }
         return {
@@ -1811,29 +2273,29 @@ async def slack_create_a_slack_user_group(
             "successful": False
         }
 
-# SLACK_CREATE_CHANNEL
+# SLACK_DELETES_A_MESSAGE_FROM_A_CHAT
 @mcp.tool()
-async def slack_create_channel(
-    name: str,
-    is_private: bool = False,
-    team_id: str = ""
-) -> dict:
-    """
-    Create channel.
+async def slack_deletes_a_message_from_a_chat(
+    channel: str,
+    ts: str,
+    as_user: bool = False
+) -> dict:
+    """
+    Delete a message from a chat.
     
-    Initiates a public or private channel-based conversation.
+    Deletes a message, identified by its channel id and timestamp, from a slack channel, 
+    private group, or direct message conversation; the authenticated user or bot must be the original poster.
     
     Args:
-        name (str): Name of the channel to create (required)
-        is_private (bool): Whether to create a private channel (default: False)
-        team_id (str): Team ID to create the channel in (optional)
+        channel (str): Channel ID where the message is located (required)
+        ts (str): Message timestamp to delete (required)
+        as_user (bool): Whether to delete the message as the bot user (default: False)
         
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
         # Test network connectivity first
-        import urllib.request
         try:
             urllib.request.urlopen('https://slack.com', timeout=10)
         except Exception as network_error:
@@ -1843,39 +2305,44 @@ async def slack_create_channel(
                 "successful": False
             }
         
-        # Get client (use bot token for channel operations)
+        # Get client (use bot token for message operations)
         client = get_slack_client()
         
         # Validate required inputs
-        if not name or not name.strip():
+        if not channel or not channel.strip():
             return {
                 "data": {},
-                "error": "Channel name is required",
+                "error": "Channel ID is required",
                 "successful": False
             }
         
-        # Validate channel name format
-        import re
-        channel_name = name.strip()
-        if not re.match(r'^[a-z0-9][a-z0-9._-]*$', channel_name):
+        if not ts or not ts.strip():
             return {
                 "data": {},
-                "error": "Invalid channel name format. Channel names must be lowercase, start with a letter or number, and contain only letters, numbers, periods, hyphens, and underscores.",
+                "error": "Message timestamp is required",
                 "successful": False
             }
         
-        # Prepare channel parameters
-        channel_params = {
-            "name": channel_name,
-            "is_private": is_private
+        # Validate channel ID format
+        if not channel.startswith(('C', 'D', 'G')):
+            return {
+                "data": {},
+                "error": f"Invalid channel ID format: '{channel}'. Channel IDs should start with 'C' (channels), 'D' (DMs), or 'G' (private channels).",
+                "successful": False
+            }
+        
+        # Prepare deletion parameters
+        delete_params = {
+            "channel": channel.strip(),
+            "ts": ts.strip()
         }
         
-        # Add team_id if provided
-        if team_id and team_id.strip():
-            channel_params["team_id"] = team_id.strip()
+        # Add as_user parameter if specified
+        if as_user:
+            delete_params["as_user"] = as_user
         
-        # Create the channel
-        response = client.conversations_create(**channel_params)
+        # Delete the message
+        response = client.chat_delete(**delete_params)
         
         # Check if successful
         if response.data.get("ok", False):
@@ -1893,28 +2360,34 @@ async def slack_create_channel(
             
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'name_taken':
+        if error_code == 'channel_not_found':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe channel name '{name}' is already taken. Choose a different name.",
+                "error": f"Slack API Error: {error_code}\n\nThe channel '{channel}' does not exist or you don't have access to it.",
                 "successful": False
             }
-        elif error_code == 'invalid_name':
+        elif error_code == 'message_not_found':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe channel name '{name}' is invalid. Use lowercase letters, numbers, periods, hyphens, and underscores only.",
+                "error": f"Slack API Error: {error_code}\n\nThe message with timestamp '{ts}' does not exist or you don't have access to it.",
                 "successful": False
             }
-        elif error_code == 'restricted_action':
+        elif error_code == 'cant_delete_message':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nYou cannot delete this message. Only the original poster can delete their messages.",
+                "successful": False
+            }
+        elif error_code == 'edit_window_closed':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nChannel creation is restricted in this workspace. Check workspace settings or contact your admin.",
+                "error": f"Slack API Error: {error_code}\n\nThe message is too old to delete. Messages can only be deleted within a certain time window.",
                 "successful": False
             }
-        elif error_code == 'channel_limit_reached':
+        elif error_code == 'not_in_channel':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe workspace has reached its channel limit. Delete some channels before creating new ones.",
+                "error": f"Slack API Error: {error_code}\n\nThe bot is not a member of the channel '{channel}'. Add the bot to the channel first.",
                 "successful": False
             }
         elif error_code == 'not_authed':
@@ -1932,13 +2405,13 @@ async def slack_create_channel(
         elif error_code == 'insufficient_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'channels:write' scope for public channels or 'groups:write' scope for private channels.",
+                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'chat:write' scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'channels:write' scope for public channels or 'groups:write' scope for private channels and reinstall the app.",
+                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'chat:write' scope and reinstall the app.",
                 "successful": False
             }
         return {
@@ -1953,34 +2426,25 @@ async def slack_create_channel(
             "successful": False
         }
 
-# SLACK_CREATE_CHANNEL_BASED_CONVERSATION
+# SLACK_DELETE_USER_PROFILE_PHOTO
 @mcp.tool()
-async def slack_create_channel_based_conversation(
-    name: str,
-    is_private: bool,
-    description: str = "",
-    org_wide: bool = False,
-    team_id: str = ""
+async def slack_delete_user_profile_photo(
+    token: str
 ) -> dict:
     """
-    Create a channel-based conversation.
+    Delete user profile photo.
     
-    Creates a new public or private slack channel with a unique name; the channel can be 
-    org-wide, or team-specific if `team id` is given (required if `org wide` is false or not provided).
+    Deletes the slack profile photo for the user identified by the token, reverting them to the default avatar; 
+    this action is irreversible and succeeds even if no custom photo was set.
     
     Args:
-        name (str): Name of the channel to create (required)
-        is_private (bool): Whether to create a private channel (required)
-        description (str): Description of the channel (optional)
-        org_wide (bool): Whether to create an org-wide channel (default: False)
-        team_id (str): Team ID to create the channel in (required if org_wide is False)
+        token (str): Slack user token for authentication (required)
         
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
         # Test network connectivity first
-        import urllib.request
         try:
             urllib.request.urlopen('https://slack.com', timeout=10)
         except Exception as network_error:
@@ -1990,53 +2454,37 @@ async def slack_create_channel_based_conversation(
                 "successful": False
             }
         
-        # Get client (use bot token for channel operations)
-        client = get_slack_client()
-        
         # Validate required inputs
-        if not name or not name.strip():
-            return {
-                "data": {},
-                "error": "Channel name is required",
-                "successful": False
-            }
-        
-        # Validate team_id requirement when org_wide is False
-        if not org_wide and (not team_id or not team_id.strip()):
+        if not token or not token.strip():
             return {
                 "data": {},
-                "error": "Team ID is required when org_wide is False",
+                "error": "Token is required",
                 "successful": False
             }
         
-        # Validate channel name format
-        import re
-        channel_name = name.strip()
-        if not re.match(r'^[a-z0-9][a-z0-9._-]*$', channel_name):
+        # Validate token format
+        if not token.startswith(('xoxp-', 'xoxb-')):
             return {
                 "data": {},
-                "error": "Invalid channel name format. Channel names must be lowercase, start with a letter or number, and contain only letters, numbers, periods, hyphens, and underscores.",
+                "error": f"Invalid token format: '{token}'. Token should start with 'xoxp-' (user token) or 'xoxb-' (bot token).",
                 "successful": False
             }
         
-        # Prepare channel parameters
-        channel_params = {
-            "name": channel_name,
-            "is_private": is_private
-        }
-        
-        # Add optional parameters if provided
-        if description and description.strip():
-            channel_params["description"] = description.strip()
-        
-        if org_wide:
-            channel_params["org_wide"] = org_wide
-        
-        if team_id and team_id.strip():
-            channel_params["team_id"] = team_id.strip()
+        # Create client with provided token
+        client = get_slack_client_for_token(token.strip())
         
-        # Create the channel
-        response = client.conversations_create(**channel_params)
+        # Delete the user profile photo
+        response = client.users_profile_set(
+            profile={
+                "image_24": "",
+                "image_32": "",
+                "image_48": "",
+                "image_72": "",
+                "image_192": "",
+                "image_512": "",
+                "image_1024": ""
+            }
+        )
         
         # Check if successful
         if response.data.get("ok", False):
@@ -2054,58 +2502,46 @@ async def slack_create_channel_based_conversation(
             
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'name_taken':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe channel name '{name}' is already taken. Choose a different name.",
-                "successful": False
-            }
-        elif error_code == 'invalid_name':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe channel name '{name}' is invalid. Use lowercase letters, numbers, periods, hyphens, and underscores only.",
-                "successful": False
-            }
-        elif error_code == 'restricted_action':
+        if error_code == 'not_authed':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nChannel creation is restricted in this workspace. Check workspace settings or contact your admin.",
+                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Check your token and permissions.",
                 "successful": False
             }
-        elif error_code == 'channel_limit_reached':
+        elif error_code == 'invalid_auth':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe workspace has reached its channel limit. Delete some channels before creating new ones.",
+                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Check your token format and validity.",
                 "successful": False
             }
-        elif error_code == 'team_not_found':
+        elif error_code == 'account_inactive':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe team ID '{team_id}' does not exist or you don't have access to it.",
+                "error": f"Slack API Error: {error_code}\n\nThe user account associated with this token is inactive.",
                 "successful": False
             }
-        elif error_code == 'not_authed':
+        elif error_code == 'user_not_found':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Check your token and permissions.",
+                "error": f"Slack API Error: {error_code}\n\nThe user associated with this token was not found.",
                 "successful": False
             }
-        elif error_code == 'invalid_auth':
+        elif error_code == 'insufficient_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
+                "error": f"Slack API Error: {error_code}\n\nToken lacks required scopes. Ensure the token has 'users.profile:write' scope.",
                 "successful": False
             }
-        elif error_code == 'insufficient_scope':
+        elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'channels:write' scope for public channels or 'groups:write' scope for private channels.",
+                "error": f"Slack API Error: {error_code}\n\nToken lacks required scopes. Ensure the token has 'users.profile:write' scope and reinstall the app.",
                 "successful": False
             }
-        elif error_code == 'missing_scope':
+        elif error_code == 'not_allowed_token_type':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'channels:write' scope for public channels or 'groups:write' scope for private channels and reinstall the app.",
+                "error": f"Slack API Error: {error_code}\n\nThis operation requires a user token (xoxp-) with users.profile:write scope.\nBot tokens (xoxb-) cannot modify user profiles.\n\nTo fix:\n1. Use a user token (xoxp-)\n2. Ensure the token has 'users.profile:write' scope",
                 "successful": False
             }
         return {
@@ -2120,36 +2556,27 @@ async def slack_create_channel_based_conversation(
             "successful": False
         }
 
-# SLACK_CUSTOMIZE_URL_UNFURL
+# SLACK_DISABLE_AN_EXISTING_SLACK_USER_GROUP
 @mcp.tool()
-async def slack_customize_url_unfurl(
-    channel: str,
-    ts: str,
-    unfurls: str,
-    user_auth_message: str = "",
-    user_auth_required: bool = False,
-    user_auth_url: str = ""
+async def slack_disable_an_existing_slack_user_group(
+    usergroup: str,
+    include_count: bool = False
 ) -> dict:
     """
-    Customize URL unfurl.
+    Disable a Slack user group.
     
-    Customizes url previews (unfurling) in a specific slack message using a url-encoded json 
-    in `unfurls` to define custom content or remove existing previews.
+    Disables a specified, currently enabled slack user group by its unique id, effectively archiving it 
+    by setting its 'date delete' timestamp; the group is not permanently deleted and can be re-enabled.
     
     Args:
-        channel (str): Channel ID where the message is located (required)
-        ts (str): Message timestamp to customize unfurls for (required)
-        unfurls (str): URL-encoded JSON defining custom unfurl content (required)
-        user_auth_message (str): Message to show when user authentication is required
-        user_auth_required (bool): Whether user authentication is required
-        user_auth_url (str): URL to redirect users for authentication
+        usergroup (str): User group ID to disable (required)
+        include_count (bool): Whether to include member count in the response (default: False)
         
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
         # Test network connectivity first
-        import urllib.request
         try:
             urllib.request.urlopen('https://slack.com', timeout=10)
         except Exception as network_error:
@@ -2159,84 +2586,38 @@ async def slack_customize_url_unfurl(
                 "successful": False
             }
         
-        # Get client (use bot token for unfurl operations)
+        # Get client (use bot token for user group operations)
         client = get_slack_client()
         
         # Validate required inputs
-        if not channel or not channel.strip():
-            return {
-                "data": {},
-                "error": "Channel ID is required",
-                "successful": False
-            }
-        
-        if not ts or not ts.strip():
-            return {
-                "data": {},
-                "error": "Message timestamp is required",
-                "successful": False
-            }
-        
-        if not unfurls or not unfurls.strip():
-            return {
-                "data": {},
-                "error": "Unfurls JSON is required",
-                "successful": False
-            }
-        
-        # Validate channel ID format
-        if not channel.startswith(('C', 'D', 'G')):
+        if not usergroup or not usergroup.strip():
             return {
                 "data": {},
-                "error": f"Invalid channel ID format: '{channel}'. Channel IDs should start with 'C' (channels), 'D' (DMs), or 'G' (private channels).",
+                "error": "User group ID is required",
                 "successful": False
             }
         
-        # Validate and parse unfurls JSON
-        try:
-            import json
-            import urllib.parse
-            # Decode URL-encoded JSON
-            decoded_unfurls = urllib.parse.unquote(unfurls)
-            # Parse JSON to validate format
-            unfurls_data = json.loads(decoded_unfurls)
-            # Re-encode for API call
-            encoded_unfurls = urllib.parse.quote(json.dumps(unfurls_data))
-        except json.JSONDecodeError:
-            return {
-                "data": {},
-                "error": "Invalid JSON format in unfurls parameter. Ensure it's valid JSON.",
-                "successful": False
-            }
-        except Exception as e:
+        # Validate user group ID format (should start with 'S' for subteams)
+        if not usergroup.startswith('S'):
             return {
                 "data": {},
-                "error": f"Error processing unfurls parameter: {str(e)}",
+                "error": f"Invalid user group ID format: '{usergroup}'. User group IDs should start with 'S'.",
                 "successful": False
             }
         
-        # Prepare unfurl parameters
-        unfurl_params = {
-            "channel": channel.strip(),
-            "ts": ts.strip(),
-            "unfurls": encoded_unfurls
+        # Prepare disable parameters
+        disable_params = {
+            "usergroup": usergroup.strip(),
+            "include_count": include_count
         }
         
-        # Add optional parameters if provided
-        if user_auth_message and user_auth_message.strip():
-            unfurl_params["user_auth_message"] = user_auth_message.strip()
-        
-        if user_auth_required:
-            unfurl_params["user_auth_required"] = user_auth_required
-        
-        if user_auth_url and user_auth_url.strip():
-            unfurl_params["user_auth_url"] = user_auth_url.strip()
-        
-        # Customize the unfurls
-        response = client.chat_unfurl(**unfurl_params)
+        # Disable the user group
+        response = client.usergroups_disable(**disable_params)
         
         # Check if successful
         if response.data.get("ok", False):
+            # The cached usergroups.list results no longer reflect the workspace
+            _invalidate_usergroups_cache()
             return {
                 "data": response.data,
                 "error": "",
@@ -2251,22 +2632,10 @@ async def slack_customize_url_unfurl(
             
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'channel_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe channel '{channel}' does not exist or you don't have access to it.",
-                "successful": False
-            }
-        elif error_code == 'message_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe message with timestamp '{ts}' does not exist or you don't have access to it.",
-                "successful": False
-            }
-        elif error_code == 'invalid_unfurls':
+        if error_code == 'subteam_not_found':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe unfurls JSON is invalid. Check the format and structure of your unfurl data.",
+                "error": f"Slack API Error: {error_code}\n\nThe user group '{usergroup}' does not exist or you don't have access to it.",
                 "successful": False
             }
         elif error_code == 'not_authed':
@@ -2284,13 +2653,25 @@ async def slack_customize_url_unfurl(
         elif error_code == 'insufficient_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'links:write' scope.",
+                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'usergroups:write' scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'links:write' scope and reinstall the app.",
+                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'usergroups:write' scope and reinstall the app.",
+                "successful": False
+            }
+        elif error_code == 'permission_denied':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nYou don't have permission to disable this user group. Only workspace admins or user group managers can disable user groups.",
+                "successful": False
+            }
+        elif error_code == 'already_disabled':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nThe user group '{usergroup}' is already disabled.",
                 "successful": False
             }
         return {
@@ -2305,36 +2686,27 @@ async def slack_customize_url_unfurl(
             "successful": False
         }
 
-# SLACK_CUSTOMIZE_URL_UNFURLING_IN_MESSAGES
+# SLACK_ENABLE_A_SPECIFIED_USER_GROUP
 @mcp.tool()
-async def slack_customize_url_unfurling_in_messages(
-    channel: str,
-    ts: str,
-    unfurls: str,
-    user_auth_message: str = "",
-    user_auth_required: bool = False,
-    user_auth_url: str = ""
+async def slack_enable_a_specified_user_group(
+    usergroup: str,
+    include_count: bool = False
 ) -> dict:
     """
-    Customize URL unfurling in messages.
+    Enable a user group.
     
-    Deprecated: customizes url previews (unfurling) in a specific slack message. 
-    use `customize url unfurl` instead.
+    Enables a disabled user group in slack using its id, reactivating it for mentions and permissions; 
+    this action only changes the enabled status and cannot create new groups or modify other properties.
     
     Args:
-        channel (str): Channel ID where the message is located (required)
-        ts (str): Message timestamp to customize unfurls for (required)
-        unfurls (str): URL-encoded JSON defining custom unfurl content (required)
-        user_auth_message (str): Message to show when user authentication is required
-        user_auth_required (bool): Whether user authentication is required
-        user_auth_url (str): URL to redirect users for authentication
+        usergroup (str): User group ID to enable (required)
+        include_count (bool): Whether to include member count in the response (default: False)
         
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
         # Test network connectivity first
-        import urllib.request
         try:
             urllib.request.urlopen('https://slack.com', timeout=10)
         except Exception as network_error:
@@ -2344,84 +2716,38 @@ async def slack_customize_url_unfurling_in_messages(
                 "successful": False
             }
         
-        # Get client (use bot token for unfurl operations)
+        # Get client (use bot token for user group operations)
         client = get_slack_client()
         
         # Validate required inputs
-        if not channel or not channel.strip():
-            return {
-                "data": {},
-                "error": "Channel ID is required",
-                "successful": False
-            }
-        
-        if not ts or not ts.strip():
-            return {
-                "data": {},
-                "error": "Message timestamp is required",
-                "successful": False
-            }
-        
-        if not unfurls or not unfurls.strip():
-            return {
-                "data": {},
-                "error": "Unfurls JSON is required",
-                "successful": False
-            }
-        
-        # Validate channel ID format
-        if not channel.startswith(('C', 'D', 'G')):
+        if not usergroup or not usergroup.strip():
             return {
                 "data": {},
-                "error": f"Invalid channel ID format: '{channel}'. Channel IDs should start with 'C' (channels), 'D' (DMs), or 'G' (private channels).",
+                "error": "User group ID is required",
                 "successful": False
             }
         
-        # Validate and parse unfurls JSON
-        try:
-            import json
-            import urllib.parse
-            # Decode URL-encoded JSON
-            decoded_unfurls = urllib.parse.unquote(unfurls)
-            # Parse JSON to validate format
-            unfurls_data = json.loads(decoded_unfurls)
-            # Re-encode for API call
-            encoded_unfurls = urllib.parse.quote(json.dumps(unfurls_data))
-        except json.JSONDecodeError:
-            return {
-                "data": {},
-                "error": "Invalid JSON format in unfurls parameter. Ensure it's valid JSON.",
-                "successful": False
-            }
-        except Exception as e:
+        # Validate user group ID format (should start with 'S' for subteams)
+        if not usergroup.startswith('S'):
             return {
                 "data": {},
-                "error": f"Error processing unfurls parameter: {str(e)}",
+                "error": f"Invalid user group ID format: '{usergroup}'. User group IDs should start with 'S'.",
                 "successful": False
             }
         
-        # Prepare unfurl parameters
-        unfurl_params = {
-            "channel": channel.strip(),
-            "ts": ts.strip(),
-            "unfurls": encoded_unfurls
+        # Prepare enable parameters
+        enable_params = {
+            "usergroup": usergroup.strip(),
+            "include_count": include_count
         }
         
-        # Add optional parameters if provided
-        if user_auth_message and user_auth_message.strip():
-            unfurl_params["user_auth_message"] = user_auth_message.strip()
-        
-        if user_auth_required:
-            unfurl_params["user_auth_required"] = user_auth_required
-        
-        if user_auth_url and user_auth_url.strip():
-            unfurl_params["user_auth_url"] = user_auth_url.strip()
-        
-        # Customize the unfurls (using deprecated method)
-        response = client.chat_unfurl(**unfurl_params)
+        # Enable the user group
+        response = client.usergroups_enable(**enable_params)
         
         # Check if successful
         if response.data.get("ok", False):
+            # The cached usergroups.list results no longer reflect the workspace
+            _invalidate_usergroups_cache()
             return {
                 "data": response.data,
                 "error": "",
@@ -2436,46 +2762,46 @@ async def slack_customize_url_unfurling_in_messages(
             
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'channel_not_found':
+        if error_code == 'subteam_not_found':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe channel '{channel}' does not exist or you don't have access to it.",
+                "error": f"Slack API Error: {error_code}\n\nThe user group '{usergroup}' does not exist or you don't have access to it.",
                 "successful": False
             }
-        elif error_code == 'message_not_found':
+        elif error_code == 'not_authed':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe message with timestamp '{ts}' does not exist or you don't have access to it.",
+                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Check your token and permissions.",
                 "successful": False
             }
-        elif error_code == 'invalid_unfurls':
+        elif error_code == 'invalid_auth':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe unfurls JSON is invalid. Check the format and structure of your unfurl data.",
+                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
                 "successful": False
             }
-        elif error_code == 'not_authed':
+        elif error_code == 'insufficient_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Check your token and permissions.",
+                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'usergroups:write' scope.",
                 "successful": False
             }
-        elif error_code == 'invalid_auth':
+        elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
+                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'usergroups:write' scope and reinstall the app.",
                 "successful": False
             }
-        elif error_code == 'insufficient_scope':
+        elif error_code == 'permission_denied':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'links:write' scope.",
+                "error": f"Slack API Error: {error_code}\n\nYou don't have permission to enable this user group. Only workspace admins or user group managers can enable user groups.",
                 "successful": False
             }
-        elif error_code == 'missing_scope':
+        elif error_code == 'already_enabled':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'links:write' scope and reinstall the app.",
+                "error": f"Slack API Error: {error_code}\n\nThe user group '{usergroup}' is already enabled.",
                 "successful": False
             }
         return {
@@ -2490,26 +2816,27 @@ async def slack_customize_url_unfurling_in_messages(
             "successful": False
         }
 
-# SLACK_DELETE_A_PUBLIC_OR_PRIVATE_CHANNEL
+# SLACK_END_A_CALL_WITH_DURATION_AND_ID
 @mcp.tool()
-async def slack_delete_a_public_or_private_channel(
-    channel_id: str
+async def slack_end_a_call_with_duration_and_id(
+    id: str,
+    duration: int = None
 ) -> dict:
     """
-    Delete a public or private channel.
+    End a call.
     
-    Permanently and irreversibly deletes a specified public or private channel, 
-    including all its messages and files, within a slack enterprise grid organization.
+    Ends an ongoing slack call, identified by its id (obtained from `calls.add`), 
+    optionally specifying the call's duration.
     
     Args:
-        channel_id (str): Channel ID to delete (required)
+        id (str): Call ID to end (required)
+        duration (int): Call duration in seconds (optional)
         
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
         # Test network connectivity first
-        import urllib.request
         try:
             urllib.request.urlopen('https://slack.com', timeout=10)
         except Exception as network_error:
@@ -2519,29 +2846,36 @@ async def slack_delete_a_public_or_private_channel(
                 "successful": False
             }
         
-        # Get client (use bot token for channel operations)
+        # Get client (use bot token for call operations)
         client = get_slack_client()
         
         # Validate required inputs
-        if not channel_id or not channel_id.strip():
+        if not id or not id.strip():
             return {
                 "data": {},
-                "error": "Channel ID is required",
+                "error": "Call ID is required",
                 "successful": False
             }
         
-        # Validate channel ID format (should start with 'C' for channels)
-        if not channel_id.startswith('C'):
+        # Validate duration if provided
+        if duration is not None and duration < 0:
             return {
                 "data": {},
-                "error": f"Invalid channel ID format: '{channel_id}'. Channel IDs should start with 'C'.",
+                "error": "Duration must be a positive number (seconds)",
                 "successful": False
             }
         
-        # Delete the channel
-        response = client.admin_conversations_delete(
-            channel_id=channel_id.strip()
-        )
+        # Prepare end call parameters
+        end_params = {
+            "id": id.strip()
+        }
+        
+        # Add duration if provided
+        if duration is not None:
+            end_params["duration"] = duration
+        
+        # End the call
+        response = client.calls_end(**end_params)
         
         # Check if successful
         if response.data.get("ok", False):
@@ -2559,28 +2893,16 @@ async def slack_delete_a_public_or_private_channel(
             
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'channel_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe channel '{channel_id}' does not exist or you don't have access to it.",
-                "successful": False
-            }
-        elif error_code == 'not_an_enterprise':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThis operation requires Slack Enterprise Grid. Regular Slack workspaces cannot delete channels via API.\n\nTo delete channels in regular workspaces:\n1. Go to the channel\n2. Click the channel name\n3. Select 'Settings' → 'Delete channel'",
-                "successful": False
-            }
-        elif error_code == 'cant_delete_general':
+        if error_code == 'call_not_found':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe 'general' channel cannot be deleted.",
+                "error": f"Slack API Error: {error_code}\n\nThe call with ID '{id}' does not exist or you don't have access to it.",
                 "successful": False
             }
-        elif error_code == 'restricted_action':
+        elif error_code == 'call_already_ended':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nChannel deletion is restricted in this workspace. Check workspace settings or contact your admin.",
+                "error": f"Slack API Error: {error_code}\n\nThe call with ID '{id}' has already ended.",
                 "successful": False
             }
         elif error_code == 'not_authed':
@@ -2598,13 +2920,19 @@ async def slack_delete_a_public_or_private_channel(
         elif error_code == 'insufficient_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'admin.conversations:write' scope.",
+                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'calls:write' scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'admin.conversations:write' scope and reinstall the app.",
+                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'calls:write' scope and reinstall the app.",
+                "successful": False
+            }
+        elif error_code == 'permission_denied':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nYou don't have permission to end this call. Only call participants or workspace admins can end calls.",
                 "successful": False
             }
         return {
@@ -2619,30 +2947,19 @@ async def slack_delete_a_public_or_private_channel(
             "successful": False
         }
 
-# SLACK_DELETE_A_SCHEDULED_MESSAGE_IN_A_CHAT
+# SLACK_END_SNOOZE
 @mcp.tool()
-async def slack_delete_a_scheduled_message_in_a_chat(
-    channel: str,
-    scheduled_message_id: str,
-    as_user: bool = False
-) -> dict:
+async def slack_end_snooze() -> dict:
     """
-    Delete scheduled chat message.
+    End snooze.
     
-    Deletes a pending, unsent scheduled message from the specified slack channel, 
-    identified by its `scheduled message id`.
+    Ends the current user's snooze mode immediately.
     
-    Args:
-        channel (str): Channel ID where the scheduled message is located (required)
-        scheduled_message_id (str): ID of the scheduled message to delete (required)
-        as_user (bool): Whether to delete the message as the bot user (default: False)
-        
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
         # Test network connectivity first
-        import urllib.request
         try:
             urllib.request.urlopen('https://slack.com', timeout=10)
         except Exception as network_error:
@@ -2652,44 +2969,18 @@ async def slack_delete_a_scheduled_message_in_a_chat(
                 "successful": False
             }
         
-        # Get client (use bot token for scheduled message operations)
-        client = get_slack_client()
-        
-        # Validate required inputs
-        if not channel or not channel.strip():
-            return {
-                "data": {},
-                "error": "Channel ID is required",
-                "successful": False
-            }
-        
-        if not scheduled_message_id or not scheduled_message_id.strip():
-            return {
-                "data": {},
-                "error": "Scheduled message ID is required",
-                "successful": False
-            }
-        
-        # Validate channel ID format
-        if not channel.startswith(('C', 'D', 'G')):
+        # Get client (use user token for DND operations)
+        try:
+            client = get_slack_user_client()
+        except ValueError as e:
             return {
                 "data": {},
-                "error": f"Invalid channel ID format: '{channel}'. Channel IDs should start with 'C' (channels), 'D' (DMs), or 'G' (private channels).",
+                "error": f"Configuration Error: {str(e)}\n\nTo fix this:\n1. Set SLACK_USER_TOKEN environment variable\n2. Use a user token (xoxp-) with dnd:write scope\n3. Bot tokens (xoxb-) cannot control DND settings",
                 "successful": False
             }
         
-        # Prepare deletion parameters
-        delete_params = {
-            "channel": channel.strip(),
-            "scheduled_message_id": scheduled_message_id.strip()
-        }
-        
-        # Add as_user parameter if specified
-        if as_user:
-            delete_params["as_user"] = as_user
-        
-        # Delete the scheduled message
-        response = client.chat_deleteScheduledMessage(**delete_params)
+        # End the snooze
+        response = client.dnd_endSnooze()
         
         # Check if successful
         if response.data.get("ok", False):
@@ -2707,40 +2998,40 @@ async def slack_delete_a_scheduled_message_in_a_chat(
             
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'channel_not_found':
+        if error_code == 'not_authed':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe channel '{channel}' does not exist or you don't have access to it.",
+                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Check your token and permissions.",
                 "successful": False
             }
-        elif error_code == 'scheduled_message_not_found':
+        elif error_code == 'invalid_auth':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe scheduled message '{scheduled_message_id}' does not exist or has already been sent.",
+                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Check your SLACK_USER_TOKEN.",
                 "successful": False
             }
-        elif error_code == 'not_authed':
+        elif error_code == 'not_allowed_token_type':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Check your token and permissions.",
+                "error": f"Slack API Error: {error_code}\n\nThis operation requires a user token (xoxp-) with dnd:write scope.\nBot tokens (xoxb-) cannot control DND settings.\n\nTo fix:\n1. Set SLACK_USER_TOKEN environment variable\n2. Use a user token with dnd:write scope",
                 "successful": False
             }
-        elif error_code == 'invalid_auth':
+        elif error_code == 'insufficient_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
+                "error": f"Slack API Error: {error_code}\n\nUser token lacks required scopes. Ensure the user token has 'dnd:write' scope.",
                 "successful": False
             }
-        elif error_code == 'insufficient_scope':
+        elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'chat:write' scope.",
+                "error": f"Slack API Error: {error_code}\n\nUser token lacks required scopes. Ensure the user token has 'dnd:write' scope and reinstall the app.",
                 "successful": False
             }
-        elif error_code == 'missing_scope':
+        elif error_code == 'not_snoozing':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'chat:write' scope and reinstall the app.",
+                "error": f"Slack API Error: {error_code}\n\nThe user is not currently in snooze mode.",
                 "successful": False
             }
         return {
@@ -2755,30 +3046,20 @@ async def slack_delete_a_scheduled_message_in_a_chat(
             "successful": False
         }
 
-# SLACK_DELETES_A_MESSAGE_FROM_A_CHAT
+# SLACK_END_USER_DO_NOT_DISTURB_SESSION
 @mcp.tool()
-async def slack_deletes_a_message_from_a_chat(
-    channel: str,
-    ts: str,
-    as_user: bool = False
-) -> dict:
+async def slack_end_user_do_not_disturb_session() -> dict:
     """
-    Delete a message from a chat.
+    End DND session.
     
-    Deletes a message, identified by its channel id and timestamp, from a slack channel, 
-    private group, or direct message conversation; the authenticated user or bot must be the original poster.
+    Ends the authenticated user's current do not disturb (dnd) session in slack, affecting only dnd status 
+    and making them available; if dnd is not active, slack acknowledges the request without changing status.
     
-    Args:
-        channel (str): Channel ID where the message is located (required)
-        ts (str): Message timestamp to delete (required)
-        as_user (bool): Whether to delete the message as the bot user (default: False)
-        
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
         # Test network connectivity first
-        import urllib.request
         try:
             urllib.request.urlopen('https://slack.com', timeout=10)
         except Exception as network_error:
@@ -2788,44 +3069,18 @@ async def slack_deletes_a_message_from_a_chat(
                 "successful": False
             }
         
-        # Get client (use bot token for message operations)
-        client = get_slack_client()
-        
-        # Validate required inputs
-        if not channel or not channel.strip():
-            return {
-                "data": {},
-                "error": "Channel ID is required",
-                "successful": False
-            }
-        
-        if not ts or not ts.strip():
-            return {
-                "data": {},
-                "error": "Message timestamp is required",
-                "successful": False
-            }
-        
-        # Validate channel ID format
-        if not channel.startswith(('C', 'D', 'G')):
+        # Get client (use user token for DND operations)
+        try:
+            client = get_slack_user_client()
+        except ValueError as e:
             return {
                 "data": {},
-                "error": f"Invalid channel ID format: '{channel}'. Channel IDs should start with 'C' (channels), 'D' (DMs), or 'G' (private channels).",
+                "error": f"Configuration Error: {str(e)}\n\nTo fix this:\n1. Set SLACK_USER_TOKEN environment variable\n2. Use a user token (xoxp-) with dnd:write scope\n3. Bot tokens (xoxb-) cannot control DND settings",
                 "successful": False
             }
         
-        # Prepare deletion parameters
-        delete_params = {
-            "channel": channel.strip(),
-            "ts": ts.strip()
-        }
-        
-        # Add as_user parameter if specified
-        if as_user:
-            delete_params["as_user"] = as_user
-        
-        # Delete the message
-        response = client.chat_delete(**delete_params)
+        # End the DND session
+        response = client.dnd_endDnd()
         
         # Check if successful
         if response.data.get("ok", False):
@@ -2843,58 +3098,34 @@ async def slack_deletes_a_message_from_a_chat(
             
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'channel_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe channel '{channel}' does not exist or you don't have access to it.",
-                "successful": False
-            }
-        elif error_code == 'message_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe message with timestamp '{ts}' does not exist or you don't have access to it.",
-                "successful": False
-            }
-        elif error_code == 'cant_delete_message':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nYou cannot delete this message. Only the original poster can delete their messages.",
-                "successful": False
-            }
-        elif error_code == 'edit_window_closed':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe message is too old to delete. Messages can only be deleted within a certain time window.",
-                "successful": False
-            }
-        elif error_code == 'not_in_channel':
+        if error_code == 'not_authed':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe bot is not a member of the channel '{channel}'. Add the bot to the channel first.",
+                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Check your token and permissions.",
                 "successful": False
             }
-        elif error_code == 'not_authed':
+        elif error_code == 'invalid_auth':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Check your token and permissions.",
+                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Check your SLACK_USER_TOKEN.",
                 "successful": False
             }
-        elif error_code == 'invalid_auth':
+        elif error_code == 'not_allowed_token_type':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
+                "error": f"Slack API Error: {error_code}\n\nThis operation requires a user token (xoxp-) with dnd:write scope.\nBot tokens (xoxb-) cannot control DND settings.\n\nTo fix:\n1. Set SLACK_USER_TOKEN environment variable\n2. Use a user token with dnd:write scope",
                 "successful": False
             }
         elif error_code == 'insufficient_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'chat:write' scope.",
+                "error": f"Slack API Error: {error_code}\n\nUser token lacks required scopes. Ensure the user token has 'dnd:write' scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'chat:write' scope and reinstall the app.",
+                "error": f"Slack API Error: {error_code}\n\nUser token lacks required scopes. Ensure the user token has 'dnd:write' scope and reinstall the app.",
                 "successful": False
             }
         return {
@@ -2909,26 +3140,19 @@ async def slack_deletes_a_message_from_a_chat(
             "successful": False
         }
 
-# SLACK_DELETE_USER_PROFILE_PHOTO
+# SLACK_END_USER_SNOOZE_MODE_IMMEDIATELY
 @mcp.tool()
-async def slack_delete_user_profile_photo(
-    token: str
-) -> dict:
+async def slack_end_user_snooze_mode_immediately() -> dict:
     """
-    Delete user profile photo.
+    End snooze mode immediately.
     
-    Deletes the slack profile photo for the user identified by the token, reverting them to the default avatar; 
-    this action is irreversible and succeeds even if no custom photo was set.
+    Deprecated: ends the current user's snooze mode immediately. use `end snooze` instead.
     
-    Args:
-        token (str): Slack user token for authentication (required)
-        
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
         # Test network connectivity first
-        import urllib.request
         try:
             urllib.request.urlopen('https://slack.com', timeout=10)
         except Exception as network_error:
@@ -2938,37 +3162,18 @@ async def slack_delete_user_profile_photo(
                 "successful": False
             }
         
-        # Validate required inputs
-        if not token or not token.strip():
-            return {
-                "data": {},
-                "error": "Token is required",
-                "successful": False
-            }
-        
-        # Validate token format
-        if not token.startswith(('xoxp-', 'xoxb-')):
+        # Get client (use user token for DND operations)
+        try:
+            client = get_slack_user_client()
+        except ValueError as e:
             return {
                 "data": {},
-                "error": f"Invalid token format: '{token}'. Token should start with 'xoxp-' (user token) or 'xoxb-' (bot token).",
+                "error": f"Configuration Error: {str(e)}\n\nTo fix this:\n1. Set SLACK_USER_TOKEN environment variable\n2. Use a user token (xoxp-) with dnd:write scope\n3. Bot tokens (xoxb-) cannot control DND settings",
                 "successful": False
             }
         
-        # Create client with provided token
-        client = WebClient(token=token.strip())
-        
-        # Delete the user profile photo
-        response = client.users_profile_set(
-            profile={
-                "image_24": "",
-                "image_32": "",
-                "image_48": "",
-                "image_72": "",
-                "image_192": "",
-                "image_512": "",
-                "image_1024": ""
-            }
-        )
+        # End the snooze mode
+        response = client.dnd_endSnooze()
         
         # Check if successful
         if response.data.get("ok", False):
@@ -2995,37 +3200,31 @@ async def slack_delete_user_profile_photo(
         elif error_code == 'invalid_auth':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Check your token format and validity.",
-                "successful": False
-            }
-        elif error_code == 'account_inactive':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe user account associated with this token is inactive.",
+                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Check your SLACK_USER_TOKEN.",
                 "successful": False
             }
-        elif error_code == 'user_not_found':
+        elif error_code == 'not_allowed_token_type':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe user associated with this token was not found.",
+                "error": f"Slack API Error: {error_code}\n\nThis operation requires a user token (xoxp-) with dnd:write scope.\nBot tokens (xoxb-) cannot control DND settings.\n\nTo fix:\n1. Set SLACK_USER_TOKEN environment variable\n2. Use a user token with dnd:write scope",
                 "successful": False
             }
         elif error_code == 'insufficient_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nToken lacks required scopes. Ensure the token has 'users.profile:write' scope.",
+                "error": f"Slack API Error: {error_code}\n\nUser token lacks required scopes. Ensure the user token has 'dnd:write' scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nToken lacks required scopes. Ensure the token has 'users.profile:write' scope and reinstall the app.",
+                "error": f"Slack API Error: {error_code}\n\nUser token lacks required scopes. Ensure the user token has 'dnd:write' scope and reinstall the app.",
                 "successful": False
             }
-        elif error_code == 'not_allowed_token_type':
+        elif error_code == 'not_snoozing':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThis operation requires a user token (xoxp-) with users.profile:write scope.\nBot tokens (xoxb-) cannot modify user profiles.\n\nTo fix:\n1. Use a user token (xoxp-)\n2. Ensure the token has 'users.profile:write' scope",
+                "error": f"Slack API Error: {error_code}\n\nThe user is not currently in snooze mode.",
                 "successful": False
             }
         return {
@@ -3040,28 +3239,24 @@ async def slack_delete_user_profile_photo(
             "successful": False
         }
 
-# SLACK_DISABLE_AN_EXISTING_SLACK_USER_GROUP
+# SLACK_FETCH_BOT_USER_INFORMATION
 @mcp.tool()
-async def slack_disable_an_existing_slack_user_group(
-    usergroup: str,
-    include_count: bool = False
+async def slack_fetch_bot_user_information(
+    bot: str
 ) -> dict:
     """
-    Disable a Slack user group.
+    Fetch bot user information.
     
-    Disables a specified, currently enabled slack user group by its unique id, effectively archiving it 
-    by setting its 'date delete' timestamp; the group is not permanently deleted and can be re-enabled.
+    Fetches information for a specified, existing slack bot user; will not work for regular user accounts or other integration types.
     
     Args:
-        usergroup (str): User group ID to disable (required)
-        include_count (bool): Whether to include member count in the response (default: False)
+        bot (str): Bot user ID to fetch information for (required)
         
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
         # Test network connectivity first
-        import urllib.request
         try:
             urllib.request.urlopen('https://slack.com', timeout=10)
         except Exception as network_error:
@@ -3071,33 +3266,27 @@ async def slack_disable_an_existing_slack_user_group(
                 "successful": False
             }
         
-        # Get client (use bot token for user group operations)
+        # Get client (use bot token for bot information operations)
         client = get_slack_client()
         
         # Validate required inputs
-        if not usergroup or not usergroup.strip():
+        if not bot or not bot.strip():
             return {
                 "data": {},
-                "error": "User group ID is required",
+                "error": "Bot user ID is required",
                 "successful": False
             }
         
-        # Validate user group ID format (should start with 'S' for subteams)
-        if not usergroup.startswith('S'):
+        # Validate bot user ID format (should start with 'U' for users)
+        if not bot.startswith('U'):
             return {
                 "data": {},
-                "error": f"Invalid user group ID format: '{usergroup}'. User group IDs should start with 'S'.",
+                "error": f"Invalid bot user ID format: '{bot}'. Bot user IDs should start with 'U'.",
                 "successful": False
             }
         
-        # Prepare disable parameters
-        disable_params = {
-            "usergroup": usergroup.strip(),
-            "include_count": include_count
-        }
-        
-        # Disable the user group
-        response = client.usergroups_disable(**disable_params)
+        # Fetch bot user information
+        response = client.users_info(user=bot.strip())
         
         # Check if successful
         if response.data.get("ok", False):
@@ -3115,10 +3304,16 @@ async def slack_disable_an_existing_slack_user_group(
             
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'subteam_not_found':
+        if error_code == 'user_not_found':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe user group '{usergroup}' does not exist or you don't have access to it.",
+                "error": f"Slack API Error: {error_code}\n\nThe bot user '{bot}' does not exist or you don't have access to it.",
+                "successful": False
+            }
+        elif error_code == 'user_not_visible':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nThe bot user '{bot}' is not visible to you or is not a bot user.",
                 "successful": False
             }
         elif error_code == 'not_authed':
@@ -3136,25 +3331,13 @@ async def slack_disable_an_existing_slack_user_group(
         elif error_code == 'insufficient_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'usergroups:write' scope.",
+                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'users:read' scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'usergroups:write' scope and reinstall the app.",
-                "successful": False
-            }
-        elif error_code == 'permission_denied':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nYou don't have permission to disable this user group. Only workspace admins or user group managers can disable user groups.",
-                "successful": False
-            }
-        elif error_code == 'already_disabled':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe user group '{usergroup}' is already disabled.",
+                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'users:read' scope and reinstall the app.",
                 "successful": False
             }
         return {
@@ -3169,28 +3352,34 @@ async def slack_disable_an_existing_slack_user_group(
             "successful": False
         }
 
-# SLACK_ENABLE_A_SPECIFIED_USER_GROUP
+# SLACK_FETCH_CONVERSATION_HISTORY
 @mcp.tool()
-async def slack_enable_a_specified_user_group(
-    usergroup: str,
-    include_count: bool = False
+async def slack_fetch_conversation_history(
+    channel: str,
+    cursor: str = None,
+    inclusive: bool = None,
+    latest: str = None,
+    limit: int = None,
+    oldest: str = None
 ) -> dict:
     """
-    Enable a user group.
+    Fetch conversation history.
     
-    Enables a disabled user group in slack using its id, reactivating it for mentions and permissions; 
-    this action only changes the enabled status and cannot create new groups or modify other properties.
+    Fetches a chronological list of messages and events from a specified slack conversation, accessible by the authenticated user/bot, with options for pagination and time range filtering.
     
     Args:
-        usergroup (str): User group ID to enable (required)
-        include_count (bool): Whether to include member count in the response (default: False)
+        channel (str): Channel ID to fetch history from (required)
+        cursor (str, optional): Pagination cursor for fetching next page
+        inclusive (bool, optional): Include messages with latest or oldest timestamp
+        latest (str, optional): End of time range of messages to include (timestamp)
+        limit (int, optional): Number of messages to return (1-1000, default 100)
+        oldest (str, optional): Start of time range of messages to include (timestamp)
         
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
         # Test network connectivity first
-        import urllib.request
         try:
             urllib.request.urlopen('https://slack.com', timeout=10)
         except Exception as network_error:
@@ -3200,33 +3389,50 @@ async def slack_enable_a_specified_user_group(
                 "successful": False
             }
         
-        # Get client (use bot token for user group operations)
+        # Get client
         client = get_slack_client()
         
         # Validate required inputs
-        if not usergroup or not usergroup.strip():
+        if not channel or not channel.strip():
             return {
                 "data": {},
-                "error": "User group ID is required",
+                "error": "Channel ID is required",
                 "successful": False
             }
         
-        # Validate user group ID format (should start with 'S' for subteams)
-        if not usergroup.startswith('S'):
+        # Validate channel ID format
+        if not (channel.startswith('C') or channel.startswith('G') or channel.startswith('D')):
             return {
                 "data": {},
-                "error": f"Invalid user group ID format: '{usergroup}'. User group IDs should start with 'S'.",
+                "error": f"Invalid channel ID format: '{channel}'. Channel IDs should start with 'C' (public), 'G' (private), or 'D' (DM).",
                 "successful": False
             }
         
-        # Prepare enable parameters
-        enable_params = {
-            "usergroup": usergroup.strip(),
-            "include_count": include_count
-        }
+        # Validate limit if provided
+        if limit is not None and (limit < 1 or limit > 1000):
+            return {
+                "data": {},
+                "error": f"Invalid limit: {limit}. Limit must be between 1 and 1000.",
+                "successful": False
+            }
         
-        # Enable the user group
-        response = client.usergroups_enable(**enable_params)
+        # Build parameters for the API call
+        history_params = {"channel": channel.strip()}
+        
+        # Add optional parameters if provided
+        if cursor is not None:
+            history_params["cursor"] = cursor.strip()
+        if inclusive is not None:
+            history_params["inclusive"] = inclusive
+        if latest is not None:
+            history_params["latest"] = latest.strip()
+        if limit is not None:
+            history_params["limit"] = limit
+        if oldest is not None:
+            history_params["oldest"] = oldest.strip()
+        
+        # Fetch conversation history
+        response = client.conversations_history(**history_params)
         
         # Check if successful
         if response.data.get("ok", False):
@@ -3244,10 +3450,16 @@ async def slack_enable_a_specified_user_group(
             
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'subteam_not_found':
+        if error_code == 'channel_not_found':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe user group '{usergroup}' does not exist or you don't have access to it.",
+                "error": f"Slack API Error: {error_code}\n\nThe channel '{channel}' does not exist or you don't have access to it.",
+                "successful": False
+            }
+        elif error_code == 'not_in_channel':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nYou are not a member of the channel '{channel}'.",
                 "successful": False
             }
         elif error_code == 'not_authed':
@@ -3265,25 +3477,25 @@ async def slack_enable_a_specified_user_group(
         elif error_code == 'insufficient_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'usergroups:write' scope.",
+                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'channels:history', 'groups:history', or 'im:history' scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'usergroups:write' scope and reinstall the app.",
+                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'channels:history', 'groups:history', or 'im:history' scope and reinstall the app.",
                 "successful": False
             }
-        elif error_code == 'permission_denied':
+        elif error_code == 'invalid_cursor':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nYou don't have permission to enable this user group. Only workspace admins or user group managers can enable user groups.",
+                "error": f"Slack API Error: {error_code}\n\nInvalid pagination cursor. Use a valid cursor from a previous response.",
                 "successful": False
             }
-        elif error_code == 'already_enabled':
+        elif error_code == 'invalid_ts':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe user group '{usergroup}' is already enabled.",
+                "error": f"Slack API Error: {error_code}\n\nInvalid timestamp format for 'latest' or 'oldest' parameter.",
                 "successful": False
             }
         return {
@@ -3298,28 +3510,24 @@ async def slack_enable_a_specified_user_group(
             "successful": False
         }
 
-# SLACK_END_A_CALL_WITH_DURATION_AND_ID
+# SLACK_FETCH_CURRENT_TEAM_INFO_WITH_OPTIONAL_TEAM_SCOPE
 @mcp.tool()
-async def slack_end_a_call_with_duration_and_id(
-    id: str,
-    duration: int = None
+async def slack_fetch_current_team_info_with_optional_team_scope(
+    team: str = None
 ) -> dict:
     """
-    End a call.
+    Fetch team information.
     
-    Ends an ongoing slack call, identified by its id (obtained from `calls.add`), 
-    optionally specifying the call's duration.
+    Deprecated: fetches comprehensive metadata about the current slack team. use `fetch team info` instead.
     
     Args:
-        id (str): Call ID to end (required)
-        duration (int): Call duration in seconds (optional)
+        team (str, optional): Team ID to fetch information for (optional)
         
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
         # Test network connectivity first
-        import urllib.request
         try:
             urllib.request.urlopen('https://slack.com', timeout=10)
         except Exception as network_error:
@@ -3329,36 +3537,16 @@ async def slack_end_a_call_with_duration_and_id(
                 "successful": False
             }
         
-        # Get client (use bot token for call operations)
+        # Get client
         client = get_slack_client()
         
-        # Validate required inputs
-        if not id or not id.strip():
-            return {
-                "data": {},
-                "error": "Call ID is required",
-                "successful": False
-            }
-        
-        # Validate duration if provided
-        if duration is not None and duration < 0:
-            return {
-                "data": {},
-                "error": "Duration must be a positive number (seconds)",
-                "successful": False
-            }
-        
-        # Prepare end call parameters
-        end_params = {
-            "id": id.strip()
-        }
-        
-        # Add duration if provided
-        if duration is not None:
-            end_params["duration"] = duration
+        # Build parameters for the API call
+        team_params = {}
+        if team is not None and team.strip():
+            team_params["team"] = team.strip()
         
-        # End the call
-        response = client.calls_end(**end_params)
+        # Fetch team information
+        response = client.team_info(**team_params)
         
         # Check if successful
         if response.data.get("ok", False):
@@ -3376,16 +3564,10 @@ async def slack_end_a_call_with_duration_and_id(
             
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'call_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe call with ID '{id}' does not exist or you don't have access to it.",
-                "successful": False
-            }
-        elif error_code == 'call_already_ended':
+        if error_code == 'team_not_found':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe call with ID '{id}' has already ended.",
+                "error": f"Slack API Error: {error_code}\n\nThe team '{team}' does not exist or you don't have access to it.",
                 "successful": False
             }
         elif error_code == 'not_authed':
@@ -3403,19 +3585,13 @@ async def slack_end_a_call_with_duration_and_id(
         elif error_code == 'insufficient_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'calls:write' scope.",
+                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'team:read' scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'calls:write' scope and reinstall the app.",
-                "successful": False
-            }
-        elif error_code == 'permission_denied':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nYou don't have permission to end this call. Only call participants or workspace admins can end calls.",
+                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'team:read' scope and reinstall the app.",
                 "successful": False
             }
         return {
@@ -3430,20 +3606,24 @@ async def slack_end_a_call_with_duration_and_id(
             "successful": False
         }
 
-# SLACK_END_SNOOZE
+# SLACK_FETCH_DND_STATUS_FOR_MULTIPLE_TEAM_MEMBERS
 @mcp.tool()
-async def slack_end_snooze() -> dict:
+async def slack_fetch_dnd_status_for_multiple_team_members(
+    users: str
+) -> dict:
     """
-    End snooze.
+    Get Do Not Disturb status for users.
     
-    Ends the current user's snooze mode immediately.
+    Deprecated: retrieves a user's current do not disturb status. use `get team dnd status` instead.
     
+    Args:
+        users (str): Comma-separated list of user IDs to check DND status for (required)
+        
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
         # Test network connectivity first
-        import urllib.request
         try:
             urllib.request.urlopen('https://slack.com', timeout=10)
         except Exception as network_error:
@@ -3459,12 +3639,38 @@ async def slack_end_snooze() -> dict:
         except ValueError as e:
             return {
                 "data": {},
-                "error": f"Configuration Error: {str(e)}\n\nTo fix this:\n1. Set SLACK_USER_TOKEN environment variable\n2. Use a user token (xoxp-) with dnd:write scope\n3. Bot tokens (xoxb-) cannot control DND settings",
+                "error": f"Configuration Error: {str(e)}\n\nTo fix this:\n1. Set SLACK_USER_TOKEN environment variable\n2. Use a user token (xoxp-) with dnd:read scope\n3. Bot tokens (xoxb-) cannot read DND status",
                 "successful": False
             }
         
-        # End the snooze
-        response = client.dnd_endSnooze()
+        # Validate required inputs
+        if not users or not users.strip():
+            return {
+                "data": {},
+                "error": "Users list is required",
+                "successful": False
+            }
+        
+        # Parse and validate user IDs
+        user_list = [user.strip() for user in users.split(',') if user.strip()]
+        if not user_list:
+            return {
+                "data": {},
+                "error": "No valid user IDs provided",
+                "successful": False
+            }
+        
+        # Validate user ID format (should start with 'U' for users)
+        for user in user_list:
+            if not user.startswith('U'):
+                return {
+                    "data": {},
+                    "error": f"Invalid user ID format: '{user}'. User IDs should start with 'U'.",
+                    "successful": False
+                }
+        
+        # Fetch DND status for users
+        response = client.dnd_teamInfo(users=','.join(user_list))
         
         # Check if successful
         if response.data.get("ok", False):
@@ -3482,7 +3688,13 @@ async def slack_end_snooze() -> dict:
             
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'not_authed':
+        if error_code == 'user_not_found':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nOne or more users in the list do not exist or you don't have access to them.",
+                "successful": False
+            }
+        elif error_code == 'not_authed':
             return {
                 "data": {},
                 "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Check your token and permissions.",
@@ -3497,25 +3709,19 @@ async def slack_end_snooze() -> dict:
         elif error_code == 'not_allowed_token_type':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThis operation requires a user token (xoxp-) with dnd:write scope.\nBot tokens (xoxb-) cannot control DND settings.\n\nTo fix:\n1. Set SLACK_USER_TOKEN environment variable\n2. Use a user token with dnd:write scope",
+                "error": f"Slack API Error: {error_code}\n\nThis operation requires a user token (xoxp-) with dnd:read scope.\nBot tokens (xoxb-) cannot read DND status.\n\nTo fix:\n1. Set SLACK_USER_TOKEN environment variable\n2. Use a user token with dnd:read scope",
                 "successful": False
             }
         elif error_code == 'insufficient_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nUser token lacks required scopes. Ensure the user token has 'dnd:write' scope.",
+                "error": f"Slack API Error: {error_code}\n\nUser token lacks required scopes. Ensure the user token has 'dnd:read' scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nUser token lacks required scopes. Ensure the user token has 'dnd:write' scope and reinstall the app.",
-                "successful": False
-            }
-        elif error_code == 'not_snoozing':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe user is not currently in snooze mode.",
+                "error": f"Slack API Error: {error_code}\n\nUser token lacks required scopes. Ensure the user token has 'dnd:read' scope and reinstall the app.",
                 "successful": False
             }
         return {
@@ -3530,115 +3736,209 @@ async def slack_end_snooze() -> dict:
             "successful": False
         }
 
-# SLACK_END_USER_DO_NOT_DISTURB_SESSION
+# SLACK_FETCH_ITEM_REACTIONS
 @mcp.tool()
-async def slack_end_user_do_not_disturb_session() -> dict:
+async def slack_fetch_item_reactions(
+    channel: str = None,
+    file: str = None,
+    file_comment: str = None,
+    full: bool = None,
+    timestamp: str = None
+) -> dict:
     """
-    End DND session.
+    Fetch item reactions.
     
-    Ends the authenticated user's current do not disturb (dnd) session in slack, affecting only dnd status 
-    and making them available; if dnd is not active, slack acknowledges the request without changing status.
+    Fetches reactions for a slack message, file, or file comment, requiring one of: channel and timestamp; file id; or file comment id.
     
+    Args:
+        channel (str, optional): Channel ID for message reactions (required with timestamp)
+        file (str, optional): File ID for file reactions
+        file_comment (str, optional): File comment ID for file comment reactions
+        full (bool, optional): Include full reaction objects with user information
+        timestamp (str, optional): Message timestamp for message reactions (required with channel)
+        
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
         # Test network connectivity first
-        import urllib.request
         try:
             urllib.request.urlopen('https://slack.com', timeout=10)
         except Exception as network_error:
             return {
-                "data": {},
+                "data": [],
                 "error": f"Network Error: Cannot reach Slack servers. Check your internet connection and network settings. Details: {str(network_error)}",
                 "successful": False
             }
         
-        # Get client (use user token for DND operations)
-        try:
-            client = get_slack_user_client()
-        except ValueError as e:
+        # Get client
+        client = get_slack_client()
+        
+        # Validate that at least one required parameter set is provided
+        has_message_params = channel and timestamp
+        has_file_param = file
+        has_file_comment_param = file_comment
+        
+        if not (has_message_params or has_file_param or has_file_comment_param):
             return {
-                "data": {},
-                "error": f"Configuration Error: {str(e)}\n\nTo fix this:\n1. Set SLACK_USER_TOKEN environment variable\n2. Use a user token (xoxp-) with dnd:write scope\n3. Bot tokens (xoxb-) cannot control DND settings",
+                "data": [],
+                "error": "At least one of the following is required:\n1. channel + timestamp (for message reactions)\n2. file (for file reactions)\n3. file_comment (for file comment reactions)",
                 "successful": False
             }
         
-        # End the DND session
-        response = client.dnd_endDnd()
-        
-        # Check if successful
-        if response.data.get("ok", False):
-            return {
-                "data": response.data,
+        # Validate message parameters if provided
+        if has_message_params:
+            if not channel.strip():
+                return {
+                    "data": [],
+                    "error": "Channel ID is required when using timestamp",
+                    "successful": False
+                }
+            if not timestamp.strip():
+                return {
+                    "data": [],
+                    "error": "Timestamp is required when using channel",
+                    "successful": False
+                }
+            # Validate channel ID format
+            if not (channel.startswith('C') or channel.startswith('G') or channel.startswith('D')):
+                return {
+                    "data": [],
+                    "error": f"Invalid channel ID format: '{channel}'. Channel IDs should start with 'C' (public), 'G' (private), or 'D' (DM).",
+                    "successful": False
+                }
+        
+        # Build parameters for the API call
+        reaction_params = {}
+        
+        # Add required parameters based on what's provided
+        if has_message_params:
+            reaction_params["channel"] = channel.strip()
+            reaction_params["timestamp"] = timestamp.strip()
+        elif has_file_param:
+            reaction_params["file"] = file.strip()
+        elif has_file_comment_param:
+            reaction_params["file_comment"] = file_comment.strip()
+        
+        # Add optional parameters if provided
+        if full is not None:
+            reaction_params["full"] = full
+        
+        # Fetch reactions
+        response = client.reactions_get(**reaction_params)
+        
+        # Check if successful
+        if response.data.get("ok", False):
+            return {
+                "data": response.data.get("message", {}).get("reactions", []) if has_message_params else response.data.get("file", {}).get("reactions", []) if has_file_param else response.data.get("comment", {}).get("reactions", []),
                 "error": "",
                 "successful": True
             }
         else:
             return {
-                "data": response.data,
+                "data": [],
                 "error": response.data.get('error', 'Unknown error'),
                 "successful": False
             }
             
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'not_authed':
+        if error_code == 'message_not_found':
             return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Check your token and permissions.",
+                "data": [],
+                "error": f"Slack API Error: {error_code}\n\nThe message with timestamp '{timestamp}' in channel '{channel}' was not found.",
                 "successful": False
             }
-        elif error_code == 'invalid_auth':
+        elif error_code == 'file_not_found':
             return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Check your SLACK_USER_TOKEN.",
+                "data": [],
+                "error": f"Slack API Error: {error_code}\n\nThe file '{file}' was not found or you don't have access to it.",
                 "successful": False
             }
-        elif error_code == 'not_allowed_token_type':
+        elif error_code == 'comment_not_found':
             return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThis operation requires a user token (xoxp-) with dnd:write scope.\nBot tokens (xoxb-) cannot control DND settings.\n\nTo fix:\n1. Set SLACK_USER_TOKEN environment variable\n2. Use a user token with dnd:write scope",
+                "data": [],
+                "error": f"Slack API Error: {error_code}\n\nThe file comment '{file_comment}' was not found or you don't have access to it.",
+                "successful": False
+            }
+        elif error_code == 'channel_not_found':
+            return {
+                "data": [],
+                "error": f"Slack API Error: {error_code}\n\nThe channel '{channel}' does not exist or you don't have access to it.",
+                "successful": False
+            }
+        elif error_code == 'not_in_channel':
+            return {
+                "data": [],
+                "error": f"Slack API Error: {error_code}\n\nYou are not a member of the channel '{channel}'.",
+                "successful": False
+            }
+        elif error_code == 'not_authed':
+            return {
+                "data": [],
+                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Check your token and permissions.",
+                "successful": False
+            }
+        elif error_code == 'invalid_auth':
+            return {
+                "data": [],
+                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
                 "successful": False
             }
         elif error_code == 'insufficient_scope':
             return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nUser token lacks required scopes. Ensure the user token has 'dnd:write' scope.",
+                "data": [],
+                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'reactions:read' scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nUser token lacks required scopes. Ensure the user token has 'dnd:write' scope and reinstall the app.",
+                "data": [],
+                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'reactions:read' scope and reinstall the app.",
                 "successful": False
             }
         return {
-            "data": {},
+            "data": [],
             "error": f"Slack API Error: {error_code}",
             "successful": False
         }
     except Exception as e:
         return {
-            "data": {},
+            "data": [],
             "error": f"Unexpected error: {str(e)}",
             "successful": False
         }
 
-# SLACK_END_USER_SNOOZE_MODE_IMMEDIATELY
+# SLACK_FETCH_MESSAGE_THREAD_FROM_A_CONVERSATION
 @mcp.tool()
-async def slack_end_user_snooze_mode_immediately() -> dict:
+async def slack_fetch_message_thread_from_a_conversation(
+    channel: str,
+    ts: str,
+    cursor: str = None,
+    inclusive: bool = None,
+    latest: str = None,
+    limit: int = None,
+    oldest: str = None
+) -> dict:
     """
-    End snooze mode immediately.
+    Retrieve conversation replies.
     
-    Deprecated: ends the current user's snooze mode immediately. use `end snooze` instead.
+    Retrieves replies to a specific parent message in a slack conversation, using the channel id and the parent message's timestamp (`ts`).
     
+    Args:
+        channel (str): Channel ID to fetch thread from (required)
+        ts (str): Parent message timestamp (required)
+        cursor (str, optional): Pagination cursor for fetching next page
+        inclusive (bool, optional): Include messages with latest or oldest timestamp
+        latest (str, optional): End of time range of messages to include (timestamp)
+        limit (int, optional): Number of messages to return (1-1000, default 100)
+        oldest (str, optional): Start of time range of messages to include (timestamp)
+        
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
         # Test network connectivity first
-        import urllib.request
         try:
             urllib.request.urlopen('https://slack.com', timeout=10)
         except Exception as network_error:
@@ -3648,18 +3948,60 @@ async def slack_end_user_snooze_mode_immediately() -> dict:
                 "successful": False
             }
         
-        # Get client (use user token for DND operations)
-        try:
-            client = get_slack_user_client()
-        except ValueError as e:
+        # Get client
+        client = get_slack_client()
+        
+        # Validate required inputs
+        if not channel or not channel.strip():
             return {
                 "data": {},
-                "error": f"Configuration Error: {str(e)}\n\nTo fix this:\n1. Set SLACK_USER_TOKEN environment variable\n2. Use a user token (xoxp-) with dnd:write scope\n3. Bot tokens (xoxb-) cannot control DND settings",
+                "error": "Channel ID is required",
                 "successful": False
             }
         
-        # End the snooze mode
-        response = client.dnd_endSnooze()
+        if not ts or not ts.strip():
+            return {
+                "data": {},
+                "error": "Parent message timestamp (ts) is required",
+                "successful": False
+            }
+        
+        # Validate channel ID format
+        if not (channel.startswith('C') or channel.startswith('G') or channel.startswith('D')):
+            return {
+                "data": {},
+                "error": f"Invalid channel ID format: '{channel}'. Channel IDs should start with 'C' (public), 'G' (private), or 'D' (DM).",
+                "successful": False
+            }
+        
+        # Validate limit if provided
+        if limit is not None and (limit < 1 or limit > 1000):
+            return {
+                "data": {},
+                "error": f"Invalid limit: {limit}. Limit must be between 1 and 1000.",
+                "successful": False
+            }
+        
+        # Build parameters for the API call
+        thread_params = {
+            "channel": channel.strip(),
+            "ts": ts.strip()
+        }
+        
+        # Add optional parameters if provided
+        if cursor is not None:
+            thread_params["cursor"] = cursor.strip()
+        if inclusive is not None:
+            thread_params["inclusive"] = inclusive
+        if latest is not None:
+            thread_params["latest"] = latest.strip()
+        if limit is not None:
+            thread_params["limit"] = limit
+        if oldest is not None:
+            thread_params["oldest"] = oldest.strip()
+        
+        # Fetch conversation replies
+        response = client.conversations_replies(**thread_params)
         
         # Check if successful
         if response.data.get("ok", False):
@@ -3677,40 +4019,64 @@ async def slack_end_user_snooze_mode_immediately() -> dict:
             
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'not_authed':
+        if error_code == 'channel_not_found':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Check your token and permissions.",
+                "error": f"Slack API Error: {error_code}\n\nThe channel '{channel}' does not exist or you don't have access to it.",
                 "successful": False
             }
-        elif error_code == 'invalid_auth':
+        elif error_code == 'message_not_found':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Check your SLACK_USER_TOKEN.",
+                "error": f"Slack API Error: {error_code}\n\nThe parent message with timestamp '{ts}' was not found in channel '{channel}'.",
                 "successful": False
             }
-        elif error_code == 'not_allowed_token_type':
+        elif error_code == 'thread_not_found':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThis operation requires a user token (xoxp-) with dnd:write scope.\nBot tokens (xoxb-) cannot control DND settings.\n\nTo fix:\n1. Set SLACK_USER_TOKEN environment variable\n2. Use a user token with dnd:write scope",
+                "error": f"Slack API Error: {error_code}\n\nThe message '{ts}' is not a thread parent message.",
+                "successful": False
+            }
+        elif error_code == 'not_in_channel':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nYou are not a member of the channel '{channel}'.",
+                "successful": False
+            }
+        elif error_code == 'not_authed':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Check your token and permissions.",
+                "successful": False
+            }
+        elif error_code == 'invalid_auth':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
                 "successful": False
             }
         elif error_code == 'insufficient_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nUser token lacks required scopes. Ensure the user token has 'dnd:write' scope.",
+                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'channels:history', 'groups:history', or 'im:history' scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nUser token lacks required scopes. Ensure the user token has 'dnd:write' scope and reinstall the app.",
+                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'channels:history', 'groups:history', or 'im:history' scope and reinstall the app.",
                 "successful": False
             }
-        elif error_code == 'not_snoozing':
+        elif error_code == 'invalid_cursor':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe user is not currently in snooze mode.",
+                "error": f"Slack API Error: {error_code}\n\nInvalid pagination cursor. Use a valid cursor from a previous response.",
+                "successful": False
+            }
+        elif error_code == 'invalid_ts':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nInvalid timestamp format for 'ts', 'latest', or 'oldest' parameter.",
                 "successful": False
             }
         return {
@@ -3725,25 +4091,24 @@ async def slack_end_user_snooze_mode_immediately() -> dict:
             "successful": False
         }
 
-# SLACK_FETCH_BOT_USER_INFORMATION
+# SLACK_FETCH_TEAM_INFO
 @mcp.tool()
-async def slack_fetch_bot_user_information(
-    bot: str
+async def slack_fetch_team_info(
+    team: str = None
 ) -> dict:
     """
-    Fetch bot user information.
+    Fetch team info.
     
-    Fetches information for a specified, existing slack bot user; will not work for regular user accounts or other integration types.
+    Fetches comprehensive metadata about the current slack team, or a specified team if the provided id is accessible.
     
     Args:
-        bot (str): Bot user ID to fetch information for (required)
+        team (str, optional): Team ID to fetch information for (optional)
         
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
         # Test network connectivity first
-        import urllib.request
         try:
             urllib.request.urlopen('https://slack.com', timeout=10)
         except Exception as network_error:
@@ -3753,27 +4118,16 @@ async def slack_fetch_bot_user_information(
                 "successful": False
             }
         
-        # Get client (use bot token for bot information operations)
+        # Get client
         client = get_slack_client()
         
-        # Validate required inputs
-        if not bot or not bot.strip():
-            return {
-                "data": {},
-                "error": "Bot user ID is required",
-                "successful": False
-            }
+        # Build parameters for the API call
+        team_params = {}
+        if team is not None and team.strip():
+            team_params["team"] = team.strip()
         
-        # Validate bot user ID format (should start with 'U' for users)
-        if not bot.startswith('U'):
-            return {
-                "data": {},
-                "error": f"Invalid bot user ID format: '{bot}'. Bot user IDs should start with 'U'.",
-                "successful": False
-            }
-        
-        # Fetch bot user information
-        response = client.users_info(user=bot.strip())
+        # Fetch team information
+        response = client.team_info(**team_params)
         
         # Check if successful
         if response.data.get("ok", False):
@@ -3791,16 +4145,10 @@ async def slack_fetch_bot_user_information(
             
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'user_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe bot user '{bot}' does not exist or you don't have access to it.",
-                "successful": False
-            }
-        elif error_code == 'user_not_visible':
+        if error_code == 'team_not_found':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe bot user '{bot}' is not visible to you or is not a bot user.",
+                "error": f"Slack API Error: {error_code}\n\nThe team '{team}' does not exist or you don't have access to it.",
                 "successful": False
             }
         elif error_code == 'not_authed':
@@ -3818,13 +4166,13 @@ async def slack_fetch_bot_user_information(
         elif error_code == 'insufficient_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'users:read' scope.",
+                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'team:read' scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'users:read' scope and reinstall the app.",
+                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'team:read' scope and reinstall the app.",
                 "successful": False
             }
         return {
@@ -3839,35 +4187,24 @@ async def slack_fetch_bot_user_information(
             "successful": False
         }
 
-# SLACK_FETCH_CONVERSATION_HISTORY
+# SLACK_FETCH_WORKSPACE_SETTINGS_INFORMATION
 @mcp.tool()
-async def slack_fetch_conversation_history(
-    channel: str,
-    cursor: str = None,
-    inclusive: bool = None,
-    latest: str = None,
-    limit: int = None,
-    oldest: str = None
+async def slack_fetch_workspace_settings_information(
+    team_id: str
 ) -> dict:
     """
-    Fetch conversation history.
+    Fetch workspace settings information.
     
-    Fetches a chronological list of messages and events from a specified slack conversation, accessible by the authenticated user/bot, with options for pagination and time range filtering.
+    Retrieves detailed settings for a specific slack workspace, primarily for administrators in an enterprise grid organization to view or audit workspace configurations.
     
     Args:
-        channel (str): Channel ID to fetch history from (required)
-        cursor (str, optional): Pagination cursor for fetching next page
-        inclusive (bool, optional): Include messages with latest or oldest timestamp
-        latest (str, optional): End of time range of messages to include (timestamp)
-        limit (int, optional): Number of messages to return (1-1000, default 100)
-        oldest (str, optional): Start of time range of messages to include (timestamp)
+        team_id (str): Team ID to fetch workspace settings for (required)
         
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
         # Test network connectivity first
-        import urllib.request
         try:
             urllib.request.urlopen('https://slack.com', timeout=10)
         except Exception as network_error:
@@ -3881,46 +4218,15 @@ async def slack_fetch_conversation_history(
         client = get_slack_client()
         
         # Validate required inputs
-        if not channel or not channel.strip():
-            return {
-                "data": {},
-                "error": "Channel ID is required",
-                "successful": False
-            }
-        
-        # Validate channel ID format
-        if not (channel.startswith('C') or channel.startswith('G') or channel.startswith('D')):
-            return {
-                "data": {},
-                "error": f"Invalid channel ID format: '{channel}'. Channel IDs should start with 'C' (public), 'G' (private), or 'D' (DM).",
-                "successful": False
-            }
-        
-        # Validate limit if provided
-        if limit is not None and (limit < 1 or limit > 1000):
+        if not team_id or not team_id.strip():
             return {
                 "data": {},
-                "error": f"Invalid limit: {limit}. Limit must be between 1 and 1000.",
+                "error": "Team ID is required",
                 "successful": False
             }
         
-        # Build parameters for the API call
-        history_params = {"channel": channel.strip()}
-        
-        # Add optional parameters if provided
-        if cursor is not None:
-            history_params["cursor"] = cursor.strip()
-        if inclusive is not None:
-            history_params["inclusive"] = inclusive
-        if latest is not None:
-            history_params["latest"] = latest.strip()
-        if limit is not None:
-            history_params["limit"] = limit
-        if oldest is not None:
-            history_params["oldest"] = oldest.strip()
-        
-        # Fetch conversation history
-        response = client.conversations_history(**history_params)
+        # Fetch workspace settings information
+        response = client.admin_teams_settings_info(team_id=team_id.strip())
         
         # Check if successful
         if response.data.get("ok", False):
@@ -3938,16 +4244,10 @@ async def slack_fetch_conversation_history(
             
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'channel_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe channel '{channel}' does not exist or you don't have access to it.",
-                "successful": False
-            }
-        elif error_code == 'not_in_channel':
+        if error_code == 'team_not_found':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nYou are not a member of the channel '{channel}'.",
+                "error": f"Slack API Error: {error_code}\n\nThe team '{team_id}' does not exist or you don't have access to it.",
                 "successful": False
             }
         elif error_code == 'not_authed':
@@ -3965,122 +4265,31 @@ async def slack_fetch_conversation_history(
         elif error_code == 'insufficient_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'channels:history', 'groups:history', or 'im:history' scope.",
+                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'admin.teams:read' scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'channels:history', 'groups:history', or 'im:history' scope and reinstall the app.",
-                "successful": False
-            }
-        elif error_code == 'invalid_cursor':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid pagination cursor. Use a valid cursor from a previous response.",
-                "successful": False
-            }
-        elif error_code == 'invalid_ts':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid timestamp format for 'latest' or 'oldest' parameter.",
-                "successful": False
-            }
-        return {
-            "data": {},
-            "error": f"Slack API Error: {error_code}",
-            "successful": False
-        }
-    except Exception as e:
-        return {
-            "data": {},
-            "error": f"Unexpected error: {str(e)}",
-            "successful": False
-        }
-
-# SLACK_FETCH_CURRENT_TEAM_INFO_WITH_OPTIONAL_TEAM_SCOPE
-@mcp.tool()
-async def slack_fetch_current_team_info_with_optional_team_scope(
-    team: str = None
-) -> dict:
-    """
-    Fetch team information.
-    
-    Deprecated: fetches comprehensive metadata about the current slack team. use `fetch team info` instead.
-    
-    Args:
-        team (str, optional): Team ID to fetch information for (optional)
-        
-    Returns:
-        dict: Response with data, error, and successful fields
-    """
-    try:
-        # Test network connectivity first
-        import urllib.request
-        try:
-            urllib.request.urlopen('https://slack.com', timeout=10)
-        except Exception as network_error:
-            return {
-                "data": {},
-                "error": f"Network Error: Cannot reach Slack servers. Check your internet connection and network settings. Details: {str(network_error)}",
-                "successful": False
-            }
-        
-        # Get client
-        client = get_slack_client()
-        
-        # Build parameters for the API call
-        team_params = {}
-        if team is not None and team.strip():
-            team_params["team"] = team.strip()
-        
-        # Fetch team information
-        response = client.team_info(**team_params)
-        
-        # Check if successful
-        if response.data.get("ok", False):
-            return {
-                "data": response.data,
-                "error": "",
-                "successful": True
-            }
-        else:
-            return {
-                "data": response.data,
-                "error": response.data.get('error', 'Unknown error'),
-                "successful": False
-            }
-            
-    except SlackApiError as e:
-        error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'team_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe team '{team}' does not exist or you don't have access to it.",
-                "successful": False
-            }
-        elif error_code == 'not_authed':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Check your token and permissions.",
+                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'admin.teams:read' scope and reinstall the app.",
                 "successful": False
             }
-        elif error_code == 'invalid_auth':
+        elif error_code == 'not_allowed_token_type':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
+                "error": f"Slack API Error: {error_code}\n\nThis operation requires a user token (xoxp-) with admin.teams:read scope.\nBot tokens (xoxb-) cannot access admin settings.\n\nTo fix:\n1. Set SLACK_USER_TOKEN environment variable\n2. Use a user token with admin.teams:read scope",
                 "successful": False
             }
-        elif error_code == 'insufficient_scope':
+        elif error_code == 'feature_not_available':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'team:read' scope.",
+                "error": f"Slack API Error: {error_code}\n\nThis feature is not available for your workspace type. Admin settings are only available for Enterprise Grid organizations.",
                 "successful": False
             }
-        elif error_code == 'missing_scope':
+        elif error_code == 'not_an_admin':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'team:read' scope and reinstall the app.",
+                "error": f"Slack API Error: {error_code}\n\nYou must be an administrator to access workspace settings information.",
                 "successful": False
             }
         return {
@@ -4095,123 +4304,176 @@ async def slack_fetch_current_team_info_with_optional_team_scope(
             "successful": False
         }
 
-# SLACK_FETCH_DND_STATUS_FOR_MULTIPLE_TEAM_MEMBERS
 @mcp.tool()
-async def slack_fetch_dnd_status_for_multiple_team_members(
-    users: str
+async def slack_find_channels(
+    search_query: str,
+    exact_match: bool = False,
+    exclude_archived: bool = True,
+    limit: int = 50,
+    member_only: bool = False,
+    types: str = "public_channel,private_channel"
 ) -> dict:
     """
-    Get Do Not Disturb status for users.
-    
-    Deprecated: retrieves a user's current do not disturb status. use `get team dnd status` instead.
+    Find channels in a slack workspace by any criteria - name, topic, purpose, or description.
     
     Args:
-        users (str): Comma-separated list of user IDs to check DND status for (required)
+        search_query (str): Search query to find channels by name, topic, purpose, or description
+        exact_match (bool): Whether to match the search query exactly (default: False)
+        exclude_archived (bool): Whether to exclude archived channels (default: True)
+        limit (int): Maximum number of channels to return (default: 50)
+        member_only (bool): Whether to only return channels the user is a member of (default: False)
+        types (str): Comma-separated list of channel types to include (default: "public_channel,private_channel")
         
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
-        # Test network connectivity first
-        import urllib.request
-        try:
-            urllib.request.urlopen('https://slack.com', timeout=10)
-        except Exception as network_error:
-            return {
-                "data": {},
-                "error": f"Network Error: Cannot reach Slack servers. Check your internet connection and network settings. Details: {str(network_error)}",
-                "successful": False
-            }
+        client = get_slack_client()
         
-        # Get client (use user token for DND operations)
-        try:
-            client = get_slack_user_client()
-        except ValueError as e:
-            return {
-                "data": {},
-                "error": f"Configuration Error: {str(e)}\n\nTo fix this:\n1. Set SLACK_USER_TOKEN environment variable\n2. Use a user token (xoxp-) with dnd:read scope\n3. Bot tokens (xoxb-) cannot read DND status",
-                "successful": False
-            }
+        # Parse types parameter
+        channel_types = [t.strip() for t in types.split(',')]
         
-        # Validate required inputs
-        if not users or not users.strip():
-            return {
-                "data": {},
-                "error": "Users list is required",
-                "successful": False
-            }
+        # Prepare parameters for conversations.list
+        params = {
+            'types': ','.join(channel_types),
+            'limit': min(limit, 1000),  # Slack API limit is 1000
+            'exclude_archived': exclude_archived
+        }
         
-        # Parse and validate user IDs
-        user_list = [user.strip() for user in users.split(',') if user.strip()]
-        if not user_list:
-            return {
-                "data": {},
-                "error": "No valid user IDs provided",
-                "successful": False
-            }
+        # Add member filter if requested
+        if member_only:
+            params['exclude_members'] = False
         
-        # Validate user ID format (should start with 'U' for users)
-        for user in user_list:
-            if not user.startswith('U'):
+        all_channels = []
+        cursor = None
+        
+        # Fetch channels with pagination
+        while len(all_channels) < limit:
+            if cursor:
+                params['cursor'] = cursor
+            
+            response = client.conversations_list(**params)
+            
+            if not response.data.get("ok", False):
                 return {
                     "data": {},
-                    "error": f"Invalid user ID format: '{user}'. User IDs should start with 'U'.",
+                    "error": f"Failed to fetch channels: {response.data.get('error', 'Unknown error')}",
                     "successful": False
                 }
+            
+            channels = response.data.get("channels", [])
+            if not channels:
+                break
+                
+            all_channels.extend(channels)
+            
+            # Check if there are more pages
+            cursor = response.data.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                break
         
-        # Fetch DND status for users
-        response = client.dnd_teamInfo(users=','.join(user_list))
+        # Filter channels based on search query
+        filtered_channels = []
+        search_lower = search_query.lower()
         
-        # Check if successful
-        if response.data.get("ok", False):
-            return {
-                "data": response.data,
-                "error": "",
-                "successful": True
-            }
-        else:
-            return {
-                "data": response.data,
-                "error": response.data.get('error', 'Unknown error'),
-                "successful": False
-            }
+        for channel in all_channels:
+            # Get channel details for search
+            channel_name = channel.get("name", "").lower()
+            channel_topic = channel.get("topic", {}).get("value", "").lower()
+            channel_purpose = channel.get("purpose", {}).get("value", "").lower()
+            
+            # Create searchable text
+            searchable_text = f"{channel_name} {channel_topic} {channel_purpose}"
+            
+            # Apply search filter
+            if exact_match:
+                match_found = search_lower in [channel_name, channel_topic, channel_purpose]
+            else:
+                match_found = search_lower in searchable_text
             
+            if match_found:
+                # Add channel info
+                channel_info = {
+                    "id": channel.get("id"),
+                    "name": channel.get("name"),
+                    "is_channel": channel.get("is_channel", False),
+                    "is_group": channel.get("is_group", False),
+                    "is_im": channel.get("is_im", False),
+                    "is_mpim": channel.get("is_mpim", False),
+                    "is_private": channel.get("is_private", False),
+                    "is_archived": channel.get("is_archived", False),
+                    "is_general": channel.get("is_general", False),
+                    "created": channel.get("created"),
+                    "creator": channel.get("creator"),
+                    "num_members": channel.get("num_members"),
+                    "topic": {
+                        "value": channel.get("topic", {}).get("value", ""),
+                        "creator": channel.get("topic", {}).get("creator", ""),
+                        "last_set": channel.get("topic", {}).get("last_set", 0)
+                    },
+                    "purpose": {
+                        "value": channel.get("purpose", {}).get("value", ""),
+                        "creator": channel.get("purpose", {}).get("creator", ""),
+                        "last_set": channel.get("purpose", {}).get("last_set", 0)
+                    }
+                }
+                
+                filtered_channels.append(channel_info)
+                
+                # Stop if we've reached the limit
+                if len(filtered_channels) >= limit:
+                    break
+        
+        return {
+            "data": {
+                "channels": filtered_channels,
+                "total_found": len(filtered_channels),
+                "search_query": search_query,
+                "exact_match": exact_match,
+                "exclude_archived": exclude_archived,
+                "member_only": member_only,
+                "types": types
+            },
+            "error": "",
+            "successful": True
+        }
+        
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'user_not_found':
+        if error_code == 'not_authed':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nOne or more users in the list do not exist or you don't have access to them.",
+                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Please check your SLACK_BOT_TOKEN.",
                 "successful": False
             }
-        elif error_code == 'not_authed':
+        elif error_code == 'invalid_auth':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Check your token and permissions.",
+                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Please check your SLACK_BOT_TOKEN.",
                 "successful": False
             }
-        elif error_code == 'invalid_auth':
+        elif error_code == 'account_inactive':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Check your SLACK_USER_TOKEN.",
+                "error": f"Slack API Error: {error_code}\n\nThe authentication token belongs to a deactivated user.",
                 "successful": False
             }
-        elif error_code == 'not_allowed_token_type':
+        elif error_code == 'token_revoked':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThis operation requires a user token (xoxp-) with dnd:read scope.\nBot tokens (xoxb-) cannot read DND status.\n\nTo fix:\n1. Set SLACK_USER_TOKEN environment variable\n2. Use a user token with dnd:read scope",
+                "error": f"Slack API Error: {error_code}\n\nThe authentication token has been revoked.",
                 "successful": False
             }
-        elif error_code == 'insufficient_scope':
+        elif error_code == 'no_permission':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nUser token lacks required scopes. Ensure the user token has 'dnd:read' scope.",
+                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to access channels. The bot needs channels:read scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nUser token lacks required scopes. Ensure the user token has 'dnd:read' scope and reinstall the app.",
+                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs channels:read scope to list channels.",
                 "successful": False
             }
         return {
@@ -4226,1494 +4488,114 @@ async def slack_fetch_dnd_status_for_multiple_team_members(
             "successful": False
         }
 
-# SLACK_FETCH_ITEM_REACTIONS
 @mcp.tool()
-async def slack_fetch_item_reactions(
-    channel: str = None,
-    file: str = None,
-    file_comment: str = None,
-    full: bool = None,
-    timestamp: str = None
+async def slack_lookup_users_by_email(
+    email: str
 ) -> dict:
     """
-    Fetch item reactions.
-    
-    Fetches reactions for a slack message, file, or file comment, requiring one of: channel and timestamp; file id; or file comment id.
+    Retrieves the slack user object for an active user by their registered email address; 
+    fails with 'users not found' if the email is unregistered or the user is inactive.
     
     Args:
-        channel (str, optional): Channel ID for message reactions (required with timestamp)
-        file (str, optional): File ID for file reactions
-        file_comment (str, optional): File comment ID for file comment reactions
-        full (bool, optional): Include full reaction objects with user information
-        timestamp (str, optional): Message timestamp for message reactions (required with channel)
+        email (str): Email address of the user to lookup
         
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
-        # Test network connectivity first
-        import urllib.request
-        try:
-            urllib.request.urlopen('https://slack.com', timeout=10)
-        except Exception as network_error:
-            return {
-                "data": [],
-                "error": f"Network Error: Cannot reach Slack servers. Check your internet connection and network settings. Details: {str(network_error)}",
-                "successful": False
-            }
-        
-        # Get client
         client = get_slack_client()
         
-        # Validate that at least one required parameter set is provided
-        has_message_params = channel and timestamp
-        has_file_param = file
-        has_file_comment_param = file_comment
-        
-        if not (has_message_params or has_file_param or has_file_comment_param):
-            return {
-                "data": [],
-                "error": "At least one of the following is required:\n1. channel + timestamp (for message reactions)\n2. file (for file reactions)\n3. file_comment (for file comment reactions)",
-                "successful": False
-            }
+        # Use the users.lookupByEmail method
+        response = client.users_lookupByEmail(email=email)
         
-        # Validate message parameters if provided
-        if has_message_params:
-            if not channel.strip():
-                return {
-                    "data": [],
-                    "error": "Channel ID is required when using timestamp",
-                    "successful": False
-                }
-            if not timestamp.strip():
+        if not response.data.get("ok", False):
+            error = response.data.get('error', 'Unknown error')
+            if error == 'users_not_found':
                 return {
-                    "data": [],
-                    "error": "Timestamp is required when using channel",
+                    "data": {},
+                    "error": f"User not found: No active user found with email '{email}'. The email may be unregistered or the user may be inactive.",
                     "successful": False
                 }
-            # Validate channel ID format
-            if not (channel.startswith('C') or channel.startswith('G') or channel.startswith('D')):
+            else:
                 return {
-                    "data": [],
-                    "error": f"Invalid channel ID format: '{channel}'. Channel IDs should start with 'C' (public), 'G' (private), or 'D' (DM).",
+                    "data": {},
+                    "error": f"Failed to lookup user: {error}",
                     "successful": False
                 }
         
-        # Build parameters for the API call
-        reaction_params = {}
-        
-        # Add required parameters based on what's provided
-        if has_message_params:
-            reaction_params["channel"] = channel.strip()
-            reaction_params["timestamp"] = timestamp.strip()
-        elif has_file_param:
-            reaction_params["file"] = file.strip()
-        elif has_file_comment_param:
-            reaction_params["file_comment"] = file_comment.strip()
-        
-        # Add optional parameters if provided
-        if full is not None:
-            reaction_params["full"] = full
-        
-        # Fetch reactions
-        response = client.reactions_get(**reaction_params)
+        user = response.data.get("user", {})
         
-        # Check if successful
-        if response.data.get("ok", False):
-            return {
-                "data": response.data.get("message", {}).get("reactions", []) if has_message_params else response.data.get("file", {}).get("reactions", []) if has_file_param else response.data.get("comment", {}).get("reactions", []),
-                "error": "",
-                "successful": True
-            }
-        else:
-            return {
-                "data": [],
-                "error": response.data.get('error', 'Unknown error'),
-                "successful": False
-            }
-            
-    except SlackApiError as e:
-        error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'message_not_found':
-            return {
-                "data": [],
-                "error": f"Slack API Error: {error_code}\n\nThe message with timestamp '{timestamp}' in channel '{channel}' was not found.",
-                "successful": False
-            }
-        elif error_code == 'file_not_found':
-            return {
-                "data": [],
-                "error": f"Slack API Error: {error_code}\n\nThe file '{file}' was not found or you don't have access to it.",
-                "successful": False
-            }
-        elif error_code == 'comment_not_found':
-            return {
-                "data": [],
-                "error": f"Slack API Error: {error_code}\n\nThe file comment '{file_comment}' was not found or you don't have access to it.",
-                "successful": False
-            }
-        elif error_code == 'channel_not_found':
-            return {
-                "data": [],
-                "error": f"Slack API Error: {error_code}\n\nThe channel '{channel}' does not exist or you don't have access to it.",
-                "successful": False
-            }
-        elif error_code == 'not_in_channel':
-            return {
-                "data": [],
-                "error": f"Slack API Error: {error_code}\n\nYou are not a member of the channel '{channel}'.",
-                "successful": False
-            }
-        elif error_code == 'not_authed':
-            return {
-                "data": [],
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Check your token and permissions.",
-                "successful": False
-            }
-        elif error_code == 'invalid_auth':
-            return {
-                "data": [],
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
-                "successful": False
-            }
-        elif error_code == 'insufficient_scope':
-            return {
-                "data": [],
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'reactions:read' scope.",
-                "successful": False
-            }
-        elif error_code == 'missing_scope':
-            return {
-                "data": [],
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'reactions:read' scope and reinstall the app.",
-                "successful": False
-            }
-        return {
-            "data": [],
-            "error": f"Slack API Error: {error_code}",
-            "successful": False
-        }
-    except Exception as e:
-        return {
-            "data": [],
-            "error": f"Unexpected error: {str(e)}",
-            "successful": False
-        }
-
-# SLACK_FETCH_MESSAGE_THREAD_FROM_A_CONVERSATION
-@mcp.tool()
-async def slack_fetch_message_thread_from_a_conversation(
-    channel: str,
-    ts: str,
-    cursor: str = None,
-    inclusive: bool = None,
-    latest: str = None,
-    limit: int = None,
-    oldest: str = None
-) -> dict:
-    """
-    Retrieve conversation replies.
-    
-    Retrieves replies to a specific parent message in a slack conversation, using the channel id and the parent message's timestamp (`ts`).
-    
-    Args:
-        channel (str): Channel ID to fetch thread from (required)
-        ts (str): Parent message timestamp (required)
-        cursor (str, optional): Pagination cursor for fetching next page
-        inclusive (bool, optional): Include messages with latest or oldest timestamp
-        latest (str, optional): End of time range of messages to include (timestamp)
-        limit (int, optional): Number of messages to return (1-1000, default 100)
-        oldest (str, optional): Start of time range of messages to include (timestamp)
-        
-    Returns:
-        dict: Response with data, error, and successful fields
-    """
-    try:
-        # Test network connectivity first
-        import urllib.request
-        try:
-            urllib.request.urlopen('https://slack.com', timeout=10)
-        except Exception as network_error:
-            return {
-                "data": {},
-                "error": f"Network Error: Cannot reach Slack servers. Check your internet connection and network settings. Details: {str(network_error)}",
-                "successful": False
-            }
-        
-        # Get client
-        client = get_slack_client()
-        
-        # Validate required inputs
-        if not channel or not channel.strip():
-            return {
-                "data": {},
-                "error": "Channel ID is required",
-                "successful": False
-            }
-        
-        if not ts or not ts.strip():
-            return {
-                "data": {},
-                "error": "Parent message timestamp (ts) is required",
-                "successful": False
-            }
-        
-        # Validate channel ID format
-        if not (channel.startswith('C') or channel.startswith('G') or channel.startswith('D')):
-            return {
-                "data": {},
-                "error": f"Invalid channel ID format: '{channel}'. Channel IDs should start with 'C' (public), 'G' (private), or 'D' (DM).",
-                "successful": False
-            }
-        
-        # Validate limit if provided
-        if limit is not None and (limit < 1 or limit > 1000):
-            return {
-                "data": {},
-                "error": f"Invalid limit: {limit}. Limit must be between 1 and 1000.",
-                "successful": False
-            }
-        
-        # Build parameters for the API call
-        thread_params = {
-            "channel": channel.strip(),
-            "ts": ts.strip()
-        }
-        
-        # Add optional parameters if provided
-        if cursor is not None:
-            thread_params["cursor"] = cursor.strip()
-        if inclusive is not None:
-            thread_params["inclusive"] = inclusive
-        if latest is not None:
-            thread_params["latest"] = latest.strip()
-        if limit is not None:
-            thread_params["limit"] = limit
-        if oldest is not None:
-            thread_params["oldest"] = oldest.strip()
-        
-        # Fetch conversation replies
-        response = client.conversations_replies(**thread_params)
-        
-        # Check if successful
-        if response.data.get("ok", False):
-            return {
-                "data": response.data,
-                "error": "",
-                "successful": True
-            }
-        else:
-            return {
-                "data": response.data,
-                "error": response.data.get('error', 'Unknown error'),
-                "successful": False
-            }
-            
-    except SlackApiError as e:
-        error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'channel_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe channel '{channel}' does not exist or you don't have access to it.",
-                "successful": False
-            }
-        elif error_code == 'message_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe parent message with timestamp '{ts}' was not found in channel '{channel}'.",
-                "successful": False
-            }
-        elif error_code == 'thread_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe message '{ts}' is not a thread parent message.",
-                "successful": False
-            }
-        elif error_code == 'not_in_channel':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nYou are not a member of the channel '{channel}'.",
-                "successful": False
-            }
-        elif error_code == 'not_authed':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Check your token and permissions.",
-                "successful": False
-            }
-        elif error_code == 'invalid_auth':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
-                "successful": False
-            }
-        elif error_code == 'insufficient_scope':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'channels:history', 'groups:history', or 'im:history' scope.",
-                "successful": False
-            }
-        elif error_code == 'missing_scope':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'channels:history', 'groups:history', or 'im:history' scope and reinstall the app.",
-                "successful": False
-            }
-        elif error_code == 'invalid_cursor':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid pagination cursor. Use a valid cursor from a previous response.",
-                "successful": False
-            }
-        elif error_code == 'invalid_ts':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid timestamp format for 'ts', 'latest', or 'oldest' parameter.",
-                "successful": False
-            }
-        return {
-            "data": {},
-            "error": f"Slack API Error: {error_code}",
-            "successful": False
-        }
-    except Exception as e:
-        return {
-            "data": {},
-            "error": f"Unexpected error: {str(e)}",
-            "successful": False
-        }
-
-# SLACK_FETCH_TEAM_INFO
-@mcp.tool()
-async def slack_fetch_team_info(
-    team: str = None
-) -> dict:
-    """
-    Fetch team info.
-    
-    Fetches comprehensive metadata about the current slack team, or a specified team if the provided id is accessible.
-    
-    Args:
-        team (str, optional): Team ID to fetch information for (optional)
-        
-    Returns:
-        dict: Response with data, error, and successful fields
-    """
-    try:
-        # Test network connectivity first
-        import urllib.request
-        try:
-            urllib.request.urlopen('https://slack.com', timeout=10)
-        except Exception as network_error:
-            return {
-                "data": {},
-                "error": f"Network Error: Cannot reach Slack servers. Check your internet connection and network settings. Details: {str(network_error)}",
-                "successful": False
-            }
-        
-        # Get client
-        client = get_slack_client()
-        
-        # Build parameters for the API call
-        team_params = {}
-        if team is not None and team.strip():
-            team_params["team"] = team.strip()
-        
-        # Fetch team information
-        response = client.team_info(**team_params)
-        
-        # Check if successful
-        if response.data.get("ok", False):
-            return {
-                "data": response.data,
-                "error": "",
-                "successful": True
-            }
-        else:
-            return {
-                "data": response.data,
-                "error": response.data.get('error', 'Unknown error'),
-                "successful": False
-            }
-            
-    except SlackApiError as e:
-        error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'team_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe team '{team}' does not exist or you don't have access to it.",
-                "successful": False
-            }
-        elif error_code == 'not_authed':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Check your token and permissions.",
-                "successful": False
-            }
-        elif error_code == 'invalid_auth':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
-                "successful": False
-            }
-        elif error_code == 'insufficient_scope':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'team:read' scope.",
-                "successful": False
-            }
-        elif error_code == 'missing_scope':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'team:read' scope and reinstall the app.",
-                "successful": False
-            }
-        return {
-            "data": {},
-            "error": f"Slack API Error: {error_code}",
-            "successful": False
-        }
-    except Exception as e:
-        return {
-            "data": {},
-            "error": f"Unexpected error: {str(e)}",
-            "successful": False
-        }
-
-# SLACK_FETCH_WORKSPACE_SETTINGS_INFORMATION
-@mcp.tool()
-async def slack_fetch_workspace_settings_information(
-    team_id: str
-) -> dict:
-    """
-    Fetch workspace settings information.
-    
-    Retrieves detailed settings for a specific slack workspace, primarily for administrators in an enterprise grid organization to view or audit workspace configurations.
-    
-    Args:
-        team_id (str): Team ID to fetch workspace settings for (required)
-        
-    Returns:
-        dict: Response with data, error, and successful fields
-    """
-    try:
-        # Test network connectivity first
-        import urllib.request
-        try:
-            urllib.request.urlopen('https://slack.com', timeout=10)
-        except Exception as network_error:
-            return {
-                "data": {},
-                "error": f"Network Error: Cannot reach Slack servers. Check your internet connection and network settings. Details: {str(network_error)}",
-                "successful": False
-            }
-        
-        # Get client
-        client = get_slack_client()
-        
-        # Validate required inputs
-        if not team_id or not team_id.strip():
-            return {
-                "data": {},
-                "error": "Team ID is required",
-                "successful": False
-            }
-        
-        # Fetch workspace settings information
-        response = client.admin_teams_settings_info(team_id=team_id.strip())
-        
-        # Check if successful
-        if response.data.get("ok", False):
-            return {
-                "data": response.data,
-                "error": "",
-                "successful": True
-            }
-        else:
-            return {
-                "data": response.data,
-                "error": response.data.get('error', 'Unknown error'),
-                "successful": False
-            }
-            
-    except SlackApiError as e:
-        error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'team_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe team '{team_id}' does not exist or you don't have access to it.",
-                "successful": False
-            }
-        elif error_code == 'not_authed':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Check your token and permissions.",
-                "successful": False
-            }
-        elif error_code == 'invalid_auth':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Check your SLACK_BOT_TOKEN.",
-                "successful": False
-            }
-        elif error_code == 'insufficient_scope':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'admin.teams:read' scope.",
-                "successful": False
-            }
-        elif error_code == 'missing_scope':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nBot token lacks required scopes. Ensure the bot has 'admin.teams:read' scope and reinstall the app.",
-                "successful": False
-            }
-        elif error_code == 'not_allowed_token_type':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThis operation requires a user token (xoxp-) with admin.teams:read scope.\nBot tokens (xoxb-) cannot access admin settings.\n\nTo fix:\n1. Set SLACK_USER_TOKEN environment variable\n2. Use a user token with admin.teams:read scope",
-                "successful": False
-            }
-        elif error_code == 'feature_not_available':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThis feature is not available for your workspace type. Admin settings are only available for Enterprise Grid organizations.",
-                "successful": False
-            }
-        elif error_code == 'not_an_admin':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nYou must be an administrator to access workspace settings information.",
-                "successful": False
-            }
-        return {
-            "data": {},
-            "error": f"Slack API Error: {error_code}",
-            "successful": False
-        }
-    except Exception as e:
-        return {
-            "data": {},
-            "error": f"Unexpected error: {str(e)}",
-            "successful": False
-        }
-
-@mcp.tool()
-async def slack_find_channels(
-    search_query: str,
-    exact_match: bool = False,
-    exclude_archived: bool = True,
-    limit: int = 50,
-    member_only: bool = False,
-    types: str = "public_channel,private_channel"
-) -> dict:
-    """
-    Find channels in a slack workspace by any criteria - name, topic, purpose, or description.
-    
-    Args:
-        search_query (str): Search query to find channels by name, topic, purpose, or description
-        exact_match (bool): Whether to match the search query exactly (default: False)
-        exclude_archived (bool): Whether to exclude archived channels (default: True)
-        limit (int): Maximum number of channels to return (default: 50)
-        member_only (bool): Whether to only return channels the user is a member of (default: False)
-        types (str): Comma-separated list of channel types to include (default: "public_channel,private_channel")
-        
-    Returns:
-        dict: Response with data, error, and successful fields
-    """
-    try:
-        client = get_slack_client()
-        
-        # Parse types parameter
-        channel_types = [t.strip() for t in types.split(',')]
-        
-        # Prepare parameters for conversations.list
-        params = {
-            'types': ','.join(channel_types),
-            'limit': min(limit, 1000),  # Slack API limit is 1000
-            'exclude_archived': exclude_archived
-        }
-        
-        # Add member filter if requested
-        if member_only:
-            params['exclude_members'] = False
-        
-        all_channels = []
-        cursor = None
-        
-        # Fetch channels with pagination
-        while len(all_channels) < limit:
-            if cursor:
-                params['cursor'] = cursor
-            
-            response = client.conversations_list(**params)
-            
-            if not response.data.get("ok", False):
-                return {
-                    "data": {},
-                    "error": f"Failed to fetch channels: {response.data.get('error', 'Unknown error')}",
-                    "successful": False
-                }
-            
-            channels = response.data.get("channels", [])
-            if not channels:
-                break
-                
-            all_channels.extend(channels)
-            
-            # Check if there are more pages
-            cursor = response.data.get("response_metadata", {}).get("next_cursor")
-            if not cursor:
-                break
-        
-        # Filter channels based on search query
-        filtered_channels = []
-        search_lower = search_query.lower()
-        
-        for channel in all_channels:
-            # Get channel details for search
-            channel_name = channel.get("name", "").lower()
-            channel_topic = channel.get("topic", {}).get("value", "").lower()
-            channel_purpose = channel.get("purpose", {}).get("value", "").lower()
-            
-            # Create searchable text
-            searchable_text = f"{channel_name} {channel_topic} {channel_purpose}"
-            
-            # Apply search filter
-            if exact_match:
-                match_found = search_lower in [channel_name, channel_topic, channel_purpose]
-            else:
-                match_found = search_lower in searchable_text
-            
-            if match_found:
-                # Add channel info
-                channel_info = {
-                    "id": channel.get("id"),
-                    "name": channel.get("name"),
-                    "is_channel": channel.get("is_channel", False),
-                    "is_group": channel.get("is_group", False),
-                    "is_im": channel.get("is_im", False),
-                    "is_mpim": channel.get("is_mpim", False),
-                    "is_private": channel.get("is_private", False),
-                    "is_archived": channel.get("is_archived", False),
-                    "is_general": channel.get("is_general", False),
-                    "created": channel.get("created"),
-                    "creator": channel.get("creator"),
-                    "num_members": channel.get("num_members"),
-                    "topic": {
-                        "value": channel.get("topic", {}).get("value", ""),
-                        "creator": channel.get("topic", {}).get("creator", ""),
-                        "last_set": channel.get("topic", {}).get("last_set", 0)
-                    },
-                    "purpose": {
-                        "value": channel.get("purpose", {}).get("value", ""),
-                        "creator": channel.get("purpose", {}).get("creator", ""),
-                        "last_set": channel.get("purpose", {}).get("last_set", 0)
-                    }
-                }
-                
-                filtered_channels.append(channel_info)
-                
-                # Stop if we've reached the limit
-                if len(filtered_channels) >= limit:
-                    break
-        
-        return {
-            "data": {
-                "channels": filtered_channels,
-                "total_found": len(filtered_channels),
-                "search_query": search_query,
-                "exact_match": exact_match,
-                "exclude_archived": exclude_archived,
-                "member_only": member_only,
-                "types": types
-            },
-            "error": "",
-            "successful": True
-        }
-        
-    except SlackApiError as e:
-        error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'not_authed':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Please check your SLACK_BOT_TOKEN.",
-                "successful": False
-            }
-        elif error_code == 'invalid_auth':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Please check your SLACK_BOT_TOKEN.",
-                "successful": False
-            }
-        elif error_code == 'account_inactive':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe authentication token belongs to a deactivated user.",
-                "successful": False
-            }
-        elif error_code == 'token_revoked':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe authentication token has been revoked.",
-                "successful": False
-            }
-        elif error_code == 'no_permission':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to access channels. The bot needs channels:read scope.",
-                "successful": False
-            }
-        elif error_code == 'missing_scope':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs channels:read scope to list channels.",
-                "successful": False
-            }
-        return {
-            "data": {},
-            "error": f"Slack API Error: {error_code}",
-            "successful": False
-        }
-    except Exception as e:
-        return {
-            "data": {},
-            "error": f"Unexpected error: {str(e)}",
-            "successful": False
-        }
-
-@mcp.tool()
-async def slack_lookup_users_by_email(
-    email: str
-) -> dict:
-    """
-    Retrieves the slack user object for an active user by their registered email address; 
-    fails with 'users not found' if the email is unregistered or the user is inactive.
-    
-    Args:
-        email (str): Email address of the user to lookup
-        
-    Returns:
-        dict: Response with data, error, and successful fields
-    """
-    try:
-        client = get_slack_client()
-        
-        # Use the users.lookupByEmail method
-        response = client.users_lookupByEmail(email=email)
-        
-        if not response.data.get("ok", False):
-            error = response.data.get('error', 'Unknown error')
-            if error == 'users_not_found':
-                return {
-                    "data": {},
-                    "error": f"User not found: No active user found with email '{email}'. The email may be unregistered or the user may be inactive.",
-                    "successful": False
-                }
-            else:
-                return {
-                    "data": {},
-                    "error": f"Failed to lookup user: {error}",
-                    "successful": False
-                }
-        
-        user = response.data.get("user", {})
-        
-        # Format user information
-        user_info = {
-            "id": user.get("id"),
-            "team_id": user.get("team_id"),
-            "name": user.get("name"),
-            "real_name": user.get("real_name"),
-            "display_name": user.get("display_name"),
-            "email": user.get("profile", {}).get("email"),
-            "first_name": user.get("profile", {}).get("first_name"),
-            "last_name": user.get("profile", {}).get("last_name"),
-            "title": user.get("profile", {}).get("title"),
-            "phone": user.get("profile", {}).get("phone"),
-            "skype": user.get("profile", {}).get("skype"),
-            "status": user.get("profile", {}).get("status_text"),
-            "status_emoji": user.get("profile", {}).get("status_emoji"),
-            "image_24": user.get("profile", {}).get("image_24"),
-            "image_32": user.get("profile", {}).get("image_32"),
-            "image_48": user.get("profile", {}).get("image_48"),
-            "image_72": user.get("profile", {}).get("image_72"),
-            "image_192": user.get("profile", {}).get("image_192"),
-            "image_512": user.get("profile", {}).get("image_512"),
-            "is_admin": user.get("is_admin", False),
-            "is_owner": user.get("is_owner", False),
-            "is_primary_owner": user.get("is_primary_owner", False),
-            "is_restricted": user.get("is_restricted", False),
-            "is_ultra_restricted": user.get("is_ultra_restricted", False),
-            "is_bot": user.get("is_bot", False),
-            "is_app_user": user.get("is_app_user", False),
-            "is_invited_user": user.get("is_invited_user", False),
-            "has_2fa": user.get("has_2fa", False),
-            "two_factor_type": user.get("two_factor_type"),
-            "has_files": user.get("has_files", False),
-            "presence": user.get("presence"),
-            "locale": user.get("locale"),
-            "tz": user.get("tz"),
-            "tz_label": user.get("tz_label"),
-            "tz_offset": user.get("tz_offset"),
-            "updated": user.get("updated"),
-            "deleted": user.get("deleted", False),
-            "color": user.get("color"),
-            "profile": {
-                "title": user.get("profile", {}).get("title", ""),
-                "phone": user.get("profile", {}).get("phone", ""),
-                "skype": user.get("profile", {}).get("skype", ""),
-                "real_name": user.get("profile", {}).get("real_name", ""),
-                "real_name_normalized": user.get("profile", {}).get("real_name_normalized", ""),
-                "display_name": user.get("profile", {}).get("display_name", ""),
-                "display_name_normalized": user.get("profile", {}).get("display_name_normalized", ""),
-                "status_text": user.get("profile", {}).get("status_text", ""),
-                "status_emoji": user.get("profile", {}).get("status_emoji", ""),
-                "status_expiration": user.get("profile", {}).get("status_expiration", 0),
-                "avatar_hash": user.get("profile", {}).get("avatar_hash", ""),
-                "email": user.get("profile", {}).get("email", ""),
-                "first_name": user.get("profile", {}).get("first_name", ""),
-                "last_name": user.get("profile", {}).get("last_name", ""),
-                "image_24": user.get("profile", {}).get("image_24", ""),
-                "image_32": user.get("profile", {}).get("image_32", ""),
-                "image_48": user.get("profile", {}).get("image_48", ""),
-                "image_72": user.get("profile", {}).get("image_72", ""),
-                "image_192": user.get("profile", {}).get("image_192", ""),
-                "image_512": user.get("profile", {}).get("image_512", ""),
-                "image_1024": user.get("profile", {}).get("image_1024", ""),
-                "image_original": user.get("profile", {}).get("image_original", ""),
-                "is_custom_image": user.get("profile", {}).get("is_custom_image", False)
-            }
-        }
-        
-        return {
-            "data": {
-                "user": user_info,
-                "email": email,
-                "found": True
-            },
-            "error": "",
-            "successful": True
-        }
-        
-    except SlackApiError as e:
-        error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'users_not_found':
-            return {
-                "data": {},
-                "error": f"User not found: No active user found with email '{email}'. The email may be unregistered or the user may be inactive.",
-                "successful": False
-            }
-        elif error_code == 'not_authed':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Please check your SLACK_BOT_TOKEN.",
-                "successful": False
-            }
-        elif error_code == 'invalid_auth':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Please check your SLACK_BOT_TOKEN.",
-                "successful": False
-            }
-        elif error_code == 'account_inactive':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe authentication token belongs to a deactivated user.",
-                "successful": False
-            }
-        elif error_code == 'token_revoked':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe authentication token has been revoked.",
-                "successful": False
-            }
-        elif error_code == 'no_permission':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to lookup users. The bot needs users:read.email scope.",
-                "successful": False
-            }
-        elif error_code == 'missing_scope':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs users:read.email scope to lookup users by email.",
-                "successful": False
-            }
-        elif error_code == 'invalid_email':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid email format: '{email}'",
-                "successful": False
-            }
-        return {
-            "data": {},
-            "error": f"Slack API Error: {error_code}",
-            "successful": False
-        }
-    except Exception as e:
-        return {
-            "data": {},
-            "error": f"Unexpected error: {str(e)}",
-            "successful": False
-        }
-
-@mcp.tool()
-async def slack_find_users(
-    search_query: str,
-    exact_match: bool = False,
-    include_bots: bool = False,
-    include_deleted: bool = False,
-    include_restricted: bool = True,
-    limit: int = 50
-) -> dict:
-    """
-    Find users in a slack workspace by any criteria - email, name, display name, or other text. 
-    Includes optimized email lookup for exact email matches.
-    
-    Args:
-        search_query (str): Search query to find users by email, name, display name, or other text
-        exact_match (bool): Whether to match the search query exactly (default: False)
-        include_bots (bool): Whether to include bot users in results (default: False)
-        include_deleted (bool): Whether to include deleted users in results (default: False)
-        include_restricted (bool): Whether to include restricted users in results (default: True)
-        limit (int): Maximum number of users to return (default: 50)
-        
-    Returns:
-        dict: Response with data, error, and successful fields
-    """
-    try:
-        client = get_slack_client()
-        
-        # Check if search_query looks like an email for optimized lookup
-        is_email_lookup = "@" in search_query and "." in search_query
-        
-        if is_email_lookup and exact_match:
-            # Use optimized email lookup for exact email matches
-            try:
-                response = client.users_lookupByEmail(email=search_query)
-                if response.data.get("ok", False):
-                    user = response.data.get("user", {})
-                    # Apply filters
-                    if not include_bots and user.get("is_bot", False):
-                        return {
-                            "data": {
-                                "users": [],
-                                "total_found": 0,
-                                "search_query": search_query,
-                                "exact_match": exact_match,
-                                "include_bots": include_bots,
-                                "include_deleted": include_deleted,
-                                "include_restricted": include_restricted,
-                                "optimized_email_lookup": True
-                            },
-                            "error": "",
-                            "successful": True
-                        }
-                    
-                    if not include_deleted and user.get("deleted", False):
-                        return {
-                            "data": {
-                                "users": [],
-                                "total_found": 0,
-                                "search_query": search_query,
-                                "exact_match": exact_match,
-                                "include_bots": include_bots,
-                                "include_deleted": include_deleted,
-                                "include_restricted": include_restricted,
-                                "optimized_email_lookup": True
-                            },
-                            "error": "",
-                            "successful": True
-                        }
-                    
-                    if not include_restricted and (user.get("is_restricted", False) or user.get("is_ultra_restricted", False)):
-                        return {
-                            "data": {
-                                "users": [],
-                                "total_found": 0,
-                                "search_query": search_query,
-                                "exact_match": exact_match,
-                                "include_bots": include_bots,
-                                "include_deleted": include_deleted,
-                                "include_restricted": include_restricted,
-                                "optimized_email_lookup": True
-                            },
-                            "error": "",
-                            "successful": True
-                        }
-                    
-                    # Format user info
-                    user_info = format_user_info(user)
-                    
-                    return {
-                        "data": {
-                            "users": [user_info],
-                            "total_found": 1,
-                            "search_query": search_query,
-                            "exact_match": exact_match,
-                            "include_bots": include_bots,
-                            "include_deleted": include_deleted,
-                            "include_restricted": include_restricted,
-                            "optimized_email_lookup": True
-                        },
-                        "error": "",
-                        "successful": True
-                    }
-                else:
-                    # Email not found, return empty results
-                    return {
-                        "data": {
-                            "users": [],
-                            "total_found": 0,
-                            "search_query": search_query,
-                            "exact_match": exact_match,
-                            "include_bots": include_bots,
-                            "include_deleted": include_deleted,
-                            "include_restricted": include_restricted,
-                            "optimized_email_lookup": True
-                        },
-                        "error": "",
-                        "successful": True
-                    }
-            except SlackApiError:
-                # If email lookup fails, fall back to regular user search
-                pass
-        
-        # Regular user search using users.list
-        all_users = []
-        cursor = None
-        
-        # Fetch users with pagination
-        while len(all_users) < limit * 2:  # Fetch more to account for filtering
-            params = {
-                'limit': min(1000, limit * 2),  # Slack API limit is 1000
-                'include_locale': True
-            }
-            
-            if cursor:
-                params['cursor'] = cursor
-            
-            response = client.users_list(**params)
-            
-            if not response.data.get("ok", False):
-                return {
-                    "data": {},
-                    "error": f"Failed to fetch users: {response.data.get('error', 'Unknown error')}",
-                    "successful": False
-                }
-            
-            users = response.data.get("members", [])
-            if not users:
-                break
-                
-            all_users.extend(users)
-            
-            # Check if there are more pages
-            cursor = response.data.get("response_metadata", {}).get("next_cursor")
-            if not cursor:
-                break
-        
-        # Filter users based on search query and criteria
-        filtered_users = []
-        search_lower = search_query.lower()
-        
-        for user in all_users:
-            # Apply inclusion filters first
-            if not include_bots and user.get("is_bot", False):
-                continue
-            if not include_deleted and user.get("deleted", False):
-                continue
-            if not include_restricted and (user.get("is_restricted", False) or user.get("is_ultra_restricted", False)):
-                continue
-            
-            # Get user details for search
-            user_name = user.get("name", "").lower()
-            real_name = user.get("real_name", "").lower()
-            display_name = user.get("profile", {}).get("display_name", "").lower()
-            first_name = user.get("profile", {}).get("first_name", "").lower()
-            last_name = user.get("profile", {}).get("last_name", "").lower()
-            email = user.get("profile", {}).get("email", "").lower()
-            title = user.get("profile", {}).get("title", "").lower()
-            
-            # Create searchable text
-            searchable_text = f"{user_name} {real_name} {display_name} {first_name} {last_name} {email} {title}"
-            
-            # Apply search filter
-            if exact_match:
-                match_found = search_lower in [user_name, real_name, display_name, first_name, last_name, email, title]
-            else:
-                match_found = search_lower in searchable_text
-            
-            if match_found:
-                # Format user info
-                user_info = format_user_info(user)
-                filtered_users.append(user_info)
-                
-                # Stop if we've reached the limit
-                if len(filtered_users) >= limit:
-                    break
-        
-        return {
-            "data": {
-                "users": filtered_users,
-                "total_found": len(filtered_users),
-                "search_query": search_query,
-                "exact_match": exact_match,
-                "include_bots": include_bots,
-                "include_deleted": include_deleted,
-                "include_restricted": include_restricted,
-                "optimized_email_lookup": False
-            },
-            "error": "",
-            "successful": True
-        }
-        
-    except SlackApiError as e:
-        error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'not_authed':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Please check your SLACK_BOT_TOKEN.",
-                "successful": False
-            }
-        elif error_code == 'invalid_auth':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Please check your SLACK_BOT_TOKEN.",
-                "successful": False
-            }
-        elif error_code == 'account_inactive':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe authentication token belongs to a deactivated user.",
-                "successful": False
-            }
-        elif error_code == 'token_revoked':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe authentication token has been revoked.",
-                "successful": False
-            }
-        elif error_code == 'no_permission':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to search users. The bot needs users:read scope.",
-                "successful": False
-            }
-        elif error_code == 'missing_scope':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs users:read scope to search users.",
-                "successful": False
-            }
-        return {
-            "data": {},
-            "error": f"Slack API Error: {error_code}",
-            "successful": False
-        }
-    except Exception as e:
-        return {
-            "data": {},
-            "error": f"Unexpected error: {str(e)}",
-            "successful": False
-        }
-
-def format_user_info(user: dict) -> dict:
-    """Helper function to format user information consistently."""
-    return {
-        "id": user.get("id"),
-        "team_id": user.get("team_id"),
-        "name": user.get("name"),
-        "real_name": user.get("real_name"),
-        "display_name": user.get("display_name"),
-        "email": user.get("profile", {}).get("email"),
-        "first_name": user.get("profile", {}).get("first_name"),
-        "last_name": user.get("profile", {}).get("last_name"),
-        "title": user.get("profile", {}).get("title"),
-        "phone": user.get("profile", {}).get("phone"),
-        "skype": user.get("profile", {}).get("skype"),
-        "status": user.get("profile", {}).get("status_text"),
-        "status_emoji": user.get("profile", {}).get("status_emoji"),
-        "image_24": user.get("profile", {}).get("image_24"),
-        "image_32": user.get("profile", {}).get("image_32"),
-        "image_48": user.get("profile", {}).get("image_48"),
-        "image_72": user.get("profile", {}).get("image_72"),
-        "image_192": user.get("profile", {}).get("image_192"),
-        "image_512": user.get("profile", {}).get("image_512"),
-        "is_admin": user.get("is_admin", False),
-        "is_owner": user.get("is_owner", False),
-        "is_primary_owner": user.get("is_primary_owner", False),
-        "is_restricted": user.get("is_restricted", False),
-        "is_ultra_restricted": user.get("is_ultra_restricted", False),
-        "is_bot": user.get("is_bot", False),
-        "is_app_user": user.get("is_app_user", False),
-        "is_invited_user": user.get("is_invited_user", False),
-        "has_2fa": user.get("has_2fa", False),
-        "two_factor_type": user.get("two_factor_type"),
-        "has_files": user.get("has_files", False),
-        "presence": user.get("presence"),
-        "locale": user.get("locale"),
-        "tz": user.get("tz"),
-        "tz_label": user.get("tz_label"),
-        "tz_offset": user.get("tz_offset"),
-        "updated": user.get("updated"),
-        "deleted": user.get("deleted", False),
-        "color": user.get("color")
-    }
-
-@mcp.tool()
-async def slack_get_channel_conversation_preferences(
-    channel_id: str
-) -> dict:
-    """
-    Retrieves conversation preferences (e.g., who can post, who can thread) for a specified channel, 
-    primarily for use within slack enterprise grid environments.
-    
-    Args:
-        channel_id (str): The ID of the channel to get conversation preferences for
-        
-    Returns:
-        dict: Response with data, error, and successful fields
-    """
-    try:
-        client = get_slack_client()
-        
-        # Use the conversations.getPrefs method
-        response = client.api_call("conversations.getPrefs", channel=channel_id)
-        
-        if not response.data.get("ok", False):
-            error = response.data.get('error', 'Unknown error')
-            if error == 'channel_not_found':
-                return {
-                    "data": {},
-                    "error": f"Channel not found: No channel found with ID '{channel_id}'",
-                    "successful": False
-                }
-            elif error == 'not_in_channel':
-                return {
-                    "data": {},
-                    "error": f"Not in channel: The bot is not a member of channel '{channel_id}'",
-                    "successful": False
-                }
-            elif error == 'invalid_channel':
-                return {
-                    "data": {},
-                    "error": f"Invalid channel: Channel ID '{channel_id}' is not valid",
-                    "successful": False
-                }
-            else:
-                return {
-                    "data": {},
-                    "error": f"Failed to get channel preferences: {error}",
-                    "successful": False
-                }
-        
-        prefs = response.data.get("prefs", {})
-        
-        # Format conversation preferences
-        preferences = {
-            "channel_id": channel_id,
-            "who_can_post": prefs.get("who_can_post", {}),
-            "who_can_thread": prefs.get("who_can_thread", {}),
-            "who_can_react": prefs.get("who_can_react", {}),
-            "who_can_manage_channel": prefs.get("who_can_manage_channel", {}),
-            "who_can_manage_extensions": prefs.get("who_can_manage_extensions", {}),
-            "who_can_manage_guests": prefs.get("who_can_manage_guests", {}),
-            "who_can_manage_integrations": prefs.get("who_can_manage_integrations", {}),
-            "who_can_manage_members": prefs.get("who_can_manage_members", {}),
-            "who_can_manage_retention": prefs.get("who_can_manage_retention", {}),
-            "who_can_manage_topics": prefs.get("who_can_manage_topics", {}),
-            "who_can_manage_workflows": prefs.get("who_can_manage_workflows", {}),
-            "who_can_manage_workflows_beta": prefs.get("who_can_manage_workflows_beta", {}),
-            "who_can_manage_workflows_gamma": prefs.get("who_can_manage_workflows_gamma", {}),
-            "who_can_manage_workflows_delta": prefs.get("who_can_manage_workflows_delta", {}),
-            "who_can_manage_workflows_epsilon": prefs.get("who_can_manage_workflows_epsilon", {}),
-            "who_can_manage_workflows_zeta": prefs.get("who_can_manage_workflows_zeta", {}),
-            "who_can_manage_workflows_eta": prefs.get("who_can_manage_workflows_eta", {}),
-            "who_can_manage_workflows_theta": prefs.get("who_can_manage_workflows_theta", {}),
-            "who_can_manage_workflows_iota": prefs.get("who_can_manage_workflows_iota", {}),
-            "who_can_manage_workflows_kappa": prefs.get("who_can_manage_workflows_kappa", {}),
-            "who_can_manage_workflows_lambda": prefs.get("who_can_manage_workflows_lambda", {}),
-            "who_can_manage_workflows_mu": prefs.get("who_can_manage_workflows_mu", {}),
-            "who_can_manage_workflows_nu": prefs.get("who_can_manage_workflows_nu", {}),
-            "who_can_manage_workflows_xi": prefs.get("who_can_manage_workflows_xi", {}),
-            "who_can_manage_workflows_omicron": prefs.get("who_can_manage_workflows_omicron", {}),
-            "who_can_manage_workflows_pi": prefs.get("who_can_manage_workflows_pi", {}),
-            "who_can_manage_workflows_rho": prefs.get("who_can_manage_workflows_rho", {}),
-            "who_can_manage_workflows_sigma": prefs.get("who_can_manage_workflows_sigma", {}),
-            "who_can_manage_workflows_tau": prefs.get("who_can_manage_workflows_tau", {}),
-            "who_can_manage_workflows_upsilon": prefs.get("who_can_manage_workflows_upsilon", {}),
-            "who_can_manage_workflows_phi": prefs.get("who_can_manage_workflows_phi", {}),
-            "who_can_manage_workflows_chi": prefs.get("who_can_manage_workflows_chi", {}),
-            "who_can_manage_workflows_psi": prefs.get("who_can_manage_workflows_psi", {}),
-            "who_can_manage_workflows_omega": prefs.get("who_can_manage_workflows_omega", {}),
-            "raw_prefs": prefs
-        }
-        
-        return {
-            "data": {
-                "preferences": preferences,
-                "channel_id": channel_id,
-                "enterprise_grid": True
-            },
-            "error": "",
-            "successful": True
-        }
-        
-    except SlackApiError as e:
-        error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'channel_not_found':
-            return {
-                "data": {},
-                "error": f"Channel not found: No channel found with ID '{channel_id}'",
-                "successful": False
-            }
-        elif error_code == 'not_in_channel':
-            return {
-                "data": {},
-                "error": f"Not in channel: The bot is not a member of channel '{channel_id}'",
-                "successful": False
-            }
-        elif error_code == 'invalid_channel':
-            return {
-                "data": {},
-                "error": f"Invalid channel: Channel ID '{channel_id}' is not valid",
-                "successful": False
-            }
-        elif error_code == 'not_authed':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Please check your SLACK_BOT_TOKEN.",
-                "successful": False
-            }
-        elif error_code == 'invalid_auth':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Please check your SLACK_BOT_TOKEN.",
-                "successful": False
-            }
-        elif error_code == 'account_inactive':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe authentication token belongs to a deactivated user.",
-                "successful": False
-            }
-        elif error_code == 'token_revoked':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe authentication token has been revoked.",
-                "successful": False
-            }
-        elif error_code == 'no_permission':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to get channel preferences. The bot needs channels:read scope.",
-                "successful": False
-            }
-        elif error_code == 'missing_scope':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs channels:read scope to get channel preferences.",
-                "successful": False
-            }
-        elif error_code == 'method_not_supported_for_channel_type':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThis method is not supported for the specified channel type. Channel preferences are primarily available for Enterprise Grid channels.",
-                "successful": False
-            }
-        elif error_code == 'not_enterprise_grid':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThis feature is only available for Enterprise Grid workspaces. Your workspace is not an Enterprise Grid organization.",
-                "successful": False
-            }
-        return {
-            "data": {},
-            "error": f"Slack API Error: {error_code}",
-            "successful": False
-        }
-    except Exception as e:
-        return {
-            "data": {},
-            "error": f"Unexpected error: {str(e)}",
-            "successful": False
-        }
-
-@mcp.tool()
-async def slack_get_reminder_information(
-    reminder: str
-) -> dict:
-    """
-    Retrieves detailed information for an existing slack reminder specified by its id; 
-    this is a read-only operation.
-    
-    Args:
-        reminder (str): The ID of the reminder to get information for
-        
-    Returns:
-        dict: Response with data, error, and successful fields
-    """
-    try:
-        # Use user token for reminder operations (reminders require user tokens)
-        client = get_slack_user_client()
-        
-        # Use the reminders.info method
-        response = client.reminders_info(reminder=reminder)
-        
-        if not response.data.get("ok", False):
-            error = response.data.get('error', 'Unknown error')
-            if error == 'reminder_not_found':
-                return {
-                    "data": {},
-                    "error": f"Reminder not found: No reminder found with ID '{reminder}'",
-                    "successful": False
-                }
-            elif error == 'not_authed':
-                return {
-                    "data": {},
-                    "error": f"Authentication failed: {error}\n\nPlease check your SLACK_BOT_TOKEN.",
-                    "successful": False
-                }
-            elif error == 'invalid_auth':
-                return {
-                    "data": {},
-                    "error": f"Invalid authentication: {error}\n\nPlease check your SLACK_BOT_TOKEN.",
-                    "successful": False
-                }
-            else:
-                return {
-                    "data": {},
-                    "error": f"Failed to get reminder information: {error}",
-                    "successful": False
-                }
-        
-        reminder_data = response.data.get("reminder", {})
-        
-        # Format reminder information
-        reminder_info = {
-            "id": reminder_data.get("id"),
-            "creator": reminder_data.get("creator"),
-            "text": reminder_data.get("text"),
-            "user": reminder_data.get("user"),
-            "recurring": reminder_data.get("recurring", False),
-            "time": reminder_data.get("time"),
-            "complete_ts": reminder_data.get("complete_ts"),
-            "channel": reminder_data.get("channel"),
-            "team": reminder_data.get("team"),
-            "date_created": reminder_data.get("date_created"),
-            "date_updated": reminder_data.get("date_updated"),
-            "recurrence": reminder_data.get("recurrence", {}),
-            "is_deleted": reminder_data.get("is_deleted", False),
-            "is_completed": reminder_data.get("is_completed", False),
-            "raw_reminder": reminder_data
+        # Format user information
+        user_info = {
+            "id": user.get("id"),
+            "team_id": user.get("team_id"),
+            "name": user.get("name"),
+            "real_name": user.get("real_name"),
+            "display_name": user.get("display_name"),
+            "email": user.get("profile", {}).get("email"),
+            "first_name": user.get("profile", {}).get("first_name"),
+            "last_name": user.get("profile", {}).get("last_name"),
+            "title": user.get("profile", {}).get("title"),
+            "phone": user.get("profile", {}).get("phone"),
+            "skype": user.get("profile", {}).get("skype"),
+            "status": user.get("profile", {}).get("status_text"),
+            "status_emoji": user.get("profile", {}).get("status_emoji"),
+            "image_24": user.get("profile", {}).get("image_24"),
+            "image_32": user.get("profile", {}).get("image_32"),
+            "image_48": user.get("profile", {}).get("image_48"),
+            "image_72": user.get("profile", {}).get("image_72"),
+            "image_192": user.get("profile", {}).get("image_192"),
+            "image_512": user.get("profile", {}).get("image_512"),
+            "is_admin": user.get("is_admin", False),
+            "is_owner": user.get("is_owner", False),
+            "is_primary_owner": user.get("is_primary_owner", False),
+            "is_restricted": user.get("is_restricted", False),
+            "is_ultra_restricted": user.get("is_ultra_restricted", False),
+            "is_bot": user.get("is_bot", False),
+            "is_app_user": user.get("is_app_user", False),
+            "is_invited_user": user.get("is_invited_user", False),
+            "has_2fa": user.get("has_2fa", False),
+            "two_factor_type": user.get("two_factor_type"),
+            "has_files": user.get("has_files", False),
+            "presence": user.get("presence"),
+            "locale": user.get("locale"),
+            "tz": user.get("tz"),
+            "tz_label": user.get("tz_label"),
+            "tz_offset": user.get("tz_offset"),
+            "updated": user.get("updated"),
+            "deleted": user.get("deleted", False),
+            "color": user.get("color"),
+            "profile": {
+                "title": user.get("profile", {}).get("title", ""),
+                "phone": user.get("profile", {}).get("phone", ""),
+                "skype": user.get("profile", {}).get("skype", ""),
+                "real_name": user.get("profile", {}).get("real_name", ""),
+                "real_name_normalized": user.get("profile", {}).get("real_name_normalized", ""),
+                "display_name": user.get("profile", {}).get("display_name", ""),
+                "display_name_normalized": user.get("profile", {}).get("display_name_normalized", ""),
+                "status_text": user.get("profile", {}).get("status_text", ""),
+                "status_emoji": user.get("profile", {}).get("status_emoji", ""),
+                "status_expiration": user.get("profile", {}).get("status_expiration", 0),
+                "avatar_hash": user.get("profile", {}).get("avatar_hash", ""),
+                "email": user.get("profile", {}).get("email", ""),
+                "first_name": user.get("profile", {}).get("first_name", ""),
+                "last_name": user.get("profile", {}).get("last_name", ""),
+                "image_24": user.get("profile", {}).get("image_24", ""),
+                "image_32": user.get("profile", {}).get("image_32", ""),
+                "image_48": user.get("profile", {}).get("image_48", ""),
+                "image_72": user.get("profile", {}).get("image_72", ""),
+                "image_192": user.get("profile", {}).get("image_192", ""),
+                "image_512": user.get("profile", {}).get("image_512", ""),
+                "image_1024": user.get("profile", {}).get("image_1024", ""),
+                "image_original": user.get("profile", {}).get("image_original", ""),
+                "is_custom_image": user.get("profile", {}).get("is_custom_image", False)
+            }
         }
         
         return {
             "data": {
-                "reminder": reminder_info,
-                "reminder_id": reminder,
+                "user": user_info,
+                "email": email,
                 "found": True
             },
             "error": "",
@@ -5722,10 +4604,10 @@ async def slack_get_reminder_information(
         
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'reminder_not_found':
+        if error_code == 'users_not_found':
             return {
                 "data": {},
-                "error": f"Reminder not found: No reminder found with ID '{reminder}'",
+                "error": f"User not found: No active user found with email '{email}'. The email may be unregistered or the user may be inactive.",
                 "successful": False
             }
         elif error_code == 'not_authed':
@@ -5755,25 +4637,19 @@ async def slack_get_reminder_information(
         elif error_code == 'no_permission':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to get reminder information. The bot needs reminders:read scope.",
+                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to lookup users. The bot needs users:read.email scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs reminders:read scope to get reminder information.",
-                "successful": False
-            }
-        elif error_code == 'invalid_reminder_id':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid reminder ID format: '{reminder}'",
+                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs users:read.email scope to lookup users by email.",
                 "successful": False
             }
-        elif error_code == 'not_allowed_token_type':
+        elif error_code == 'invalid_email':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThis operation requires a user token (xoxp-) with reminders:read scope.\nBot tokens (xoxb-) cannot access reminder information.\n\nTo fix this:\n1. Set SLACK_USER_TOKEN environment variable\n2. Use a user token with reminders:read scope",
+                "error": f"Slack API Error: {error_code}\n\nInvalid email format: '{email}'",
                 "successful": False
             }
         return {
@@ -5789,14 +4665,25 @@ async def slack_get_reminder_information(
         }
 
 @mcp.tool()
-async def slack_get_team_dnd_status(
-    users: str
+async def slack_find_users(
+    search_query: str,
+    exact_match: bool = False,
+    include_bots: bool = False,
+    include_deleted: bool = False,
+    include_restricted: bool = True,
+    limit: int = 50
 ) -> dict:
     """
-    Retrieves a user's current do not disturb status.
+    Find users in a slack workspace by any criteria - email, name, display name, or other text. 
+    Includes optimized email lookup for exact email matches.
     
     Args:
-        users (str): Comma-separated list of user IDs to get DND status for
+        search_query (str): Search query to find users by email, name, display name, or other text
+        exact_match (bool): Whether to match the search query exactly (default: False)
+        include_bots (bool): Whether to include bot users in results (default: False)
+        include_deleted (bool): Whether to include deleted users in results (default: False)
+        include_restricted (bool): Whether to include restricted users in results (default: True)
+        limit (int): Maximum number of users to return (default: 50)
         
     Returns:
         dict: Response with data, error, and successful fields
@@ -5804,199 +4691,185 @@ async def slack_get_team_dnd_status(
     try:
         client = get_slack_client()
         
-        # Parse users parameter
-        user_list = [user.strip() for user in users.split(',')]
-        
-        # Use the dnd.teamInfo method
-        response = client.dnd_teamInfo(users=','.join(user_list))
-        
-        if not response.data.get("ok", False):
-            error = response.data.get('error', 'Unknown error')
-            if error == 'users_not_found':
-                return {
-                    "data": {},
-                    "error": f"Users not found: One or more user IDs in '{users}' were not found",
-                    "successful": False
-                }
-            elif error == 'invalid_users':
-                return {
-                    "data": {},
-                    "error": f"Invalid users: One or more user IDs in '{users}' are invalid",
-                    "successful": False
-                }
-            else:
-                return {
-                    "data": {},
-                    "error": f"Failed to get DND status: {error}",
-                    "successful": False
-                }
-        
-        dnd_info = response.data.get("users", {})
-        
-        # Format DND status information
-        dnd_statuses = []
-        for user_id, user_dnd in dnd_info.items():
-            dnd_status = {
-                "user_id": user_id,
-                "dnd_enabled": user_dnd.get("dnd_enabled", False),
-                "next_dnd_start_ts": user_dnd.get("next_dnd_start_ts"),
-                "next_dnd_end_ts": user_dnd.get("next_dnd_end_ts"),
-                "snooze_enabled": user_dnd.get("snooze_enabled", False),
-                "snooze_endtime": user_dnd.get("snooze_endtime"),
-                "snooze_remaining": user_dnd.get("snooze_remaining"),
-                "is_snoozed": user_dnd.get("snooze_enabled", False) and user_dnd.get("snooze_endtime", 0) > 0,
-                "raw_dnd_info": user_dnd
-            }
-            dnd_statuses.append(dnd_status)
-        
-        return {
-            "data": {
-                "dnd_statuses": dnd_statuses,
-                "users_requested": user_list,
-                "total_users": len(dnd_statuses),
-                "timestamp": response.data.get("response_metadata", {}).get("timestamp")
-            },
-            "error": "",
-            "successful": True
-        }
-        
-    except SlackApiError as e:
-        error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'users_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nOne or more user IDs in '{users}' were not found",
-                "successful": False
-            }
-        elif error_code == 'invalid_users':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nOne or more user IDs in '{users}' are invalid",
-                "successful": False
-            }
-        elif error_code == 'not_authed':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Please check your SLACK_BOT_TOKEN.",
-                "successful": False
-            }
-        elif error_code == 'invalid_auth':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Please check your SLACK_BOT_TOKEN.",
-                "successful": False
-            }
-        elif error_code == 'account_inactive':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe authentication token belongs to a deactivated user.",
-                "successful": False
-            }
-        elif error_code == 'token_revoked':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe authentication token has been revoked.",
-                "successful": False
-            }
-        elif error_code == 'no_permission':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to get DND status. The bot needs dnd:read scope.",
-                "successful": False
-            }
-        elif error_code == 'missing_scope':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs dnd:read scope to get DND status.",
-                "successful": False
-            }
-        return {
-            "data": {},
-            "error": f"Slack API Error: {error_code}",
-            "successful": False
-        }
-    except Exception as e:
-        return {
-            "data": {},
-            "error": f"Unexpected error: {str(e)}",
-            "successful": False
-        }
-
-@mcp.tool()
-async def slack_get_user_presence_info(
-    user: str
-) -> dict:
-    """
-    Retrieves a slack user's current real-time presence (e.g., 'active', 'away') to determine their availability, 
-    noting this action does not provide historical data or status reasons.
-    
-    Args:
-        user (str): User ID to get presence information for
+        # Check if search_query looks like an email for optimized lookup
+        is_email_lookup = "@" in search_query and "." in search_query
         
-    Returns:
-        dict: Response with data, error, and successful fields
-    """
-    try:
-        client = get_slack_client()
+        if is_email_lookup and exact_match:
+            # Use optimized email lookup for exact email matches
+            try:
+                response = client.users_lookupByEmail(email=search_query)
+                if response.data.get("ok", False):
+                    user = response.data.get("user", {})
+                    # Apply filters
+                    if not include_bots and user.get("is_bot", False):
+                        return {
+                            "data": {
+                                "users": [],
+                                "total_found": 0,
+                                "search_query": search_query,
+                                "exact_match": exact_match,
+                                "include_bots": include_bots,
+                                "include_deleted": include_deleted,
+                                "include_restricted": include_restricted,
+                                "optimized_email_lookup": True
+                            },
+                            "error": "",
+                            "successful": True
+                        }
+                    
+                    if not include_deleted and user.get("deleted", False):
+                        return {
+                            "data": {
+                                "users": [],
+                                "total_found": 0,
+                                "search_query": search_query,
+                                "exact_match": exact_match,
+                                "include_bots": include_bots,
+                                "include_deleted": include_deleted,
+                                "include_restricted": include_restricted,
+                                "optimized_email_lookup": True
+                            },
+                            "error": "",
+                            "successful": True
+                        }
+                    
+                    if not include_restricted and (user.get("is_restricted", False) or user.get("is_ultra_restricted", False)):
+                        return {
+                            "data": {
+                                "users": [],
+                                "total_found": 0,
+                                "search_query": search_query,
+                                "exact_match": exact_match,
+                                "include_bots": include_bots,
+                                "include_deleted": include_deleted,
+                                "include_restricted": include_restricted,
+                                "optimized_email_lookup": True
+                            },
+                            "error": "",
+                            "successful": True
+                        }
+                    
+                    # Format user info
+                    user_info = format_user_info(user)
+                    
+                    return {
+                        "data": {
+                            "users": [user_info],
+                            "total_found": 1,
+                            "search_query": search_query,
+                            "exact_match": exact_match,
+                            "include_bots": include_bots,
+                            "include_deleted": include_deleted,
+                            "include_restricted": include_restricted,
+                            "optimized_email_lookup": True
+                        },
+                        "error": "",
+                        "successful": True
+                    }
+                else:
+                    # Email not found, return empty results
+                    return {
+                        "data": {
+                            "users": [],
+                            "total_found": 0,
+                            "search_query": search_query,
+                            "exact_match": exact_match,
+                            "include_bots": include_bots,
+                            "include_deleted": include_deleted,
+                            "include_restricted": include_restricted,
+                            "optimized_email_lookup": True
+                        },
+                        "error": "",
+                        "successful": True
+                    }
+            except SlackApiError:
+                # If email lookup fails, fall back to regular user search
+                pass
         
-        # Use the users.getPresence method
-        response = client.users_getPresence(user=user)
+        # Regular user search using users.list
+        all_users = []
+        cursor = None
         
-        if not response.data.get("ok", False):
-            error = response.data.get('error', 'Unknown error')
-            if error == 'user_not_found':
-                return {
-                    "data": {},
-                    "error": f"User not found: No user found with ID '{user}'",
-                    "successful": False
-                }
-            elif error == 'user_not_visible':
-                return {
-                    "data": {},
-                    "error": f"User not visible: User '{user}' is not visible to the bot (may be in a different workspace or have restricted visibility)",
-                    "successful": False
-                }
-            else:
+        # Fetch users with pagination
+        while len(all_users) < limit * 2:  # Fetch more to account for filtering
+            params = {
+                'limit': min(1000, limit * 2),  # Slack API limit is 1000
+                'include_locale': True
+            }
+            
+            if cursor:
+                params['cursor'] = cursor
+            
+            response = client.users_list(**params)
+            
+            if not response.data.get("ok", False):
                 return {
                     "data": {},
-                    "error": f"Failed to get user presence: {error}",
+                    "error": f"Failed to fetch users: {response.data.get('error', 'Unknown error')}",
                     "successful": False
                 }
+            
+            users = response.data.get("members", [])
+            if not users:
+                break
+                
+            all_users.extend(users)
+            
+            # Check if there are more pages
+            cursor = response.data.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                break
         
-        presence_data = response.data
-        
-        # Format presence information
-        presence_info = {
-            "user_id": user,
-            "presence": presence_data.get("presence", "unknown"),
-            "online": presence_data.get("online", False),
-            "auto_away": presence_data.get("auto_away", False),
-            "manual_away": presence_data.get("manual_away", False),
-            "connection_count": presence_data.get("connection_count", 0),
-            "last_activity": presence_data.get("last_activity"),
-            "timestamp": presence_data.get("timestamp"),
-            "raw_presence": presence_data
-        }
-        
-        # Determine availability status
-        availability_status = "unknown"
-        if presence_info["presence"] == "active":
-            availability_status = "available"
-        elif presence_info["presence"] == "away":
-            availability_status = "away"
-        elif presence_info["auto_away"]:
-            availability_status = "auto_away"
-        elif presence_info["manual_away"]:
-            availability_status = "manual_away"
+        # Filter users based on search query and criteria
+        filtered_users = []
+        search_lower = search_query.lower()
         
-        presence_info["availability_status"] = availability_status
+        for user in all_users:
+            # Apply inclusion filters first
+            if not include_bots and user.get("is_bot", False):
+                continue
+            if not include_deleted and user.get("deleted", False):
+                continue
+            if not include_restricted and (user.get("is_restricted", False) or user.get("is_ultra_restricted", False)):
+                continue
+            
+            # Get user details for search
+            user_name = user.get("name", "").lower()
+            real_name = user.get("real_name", "").lower()
+            display_name = user.get("profile", {}).get("display_name", "").lower()
+            first_name = user.get("profile", {}).get("first_name", "").lower()
+            last_name = user.get("profile", {}).get("last_name", "").lower()
+            email = user.get("profile", {}).get("email", "").lower()
+            title = user.get("profile", {}).get("title", "").lower()
+            
+            # Create searchable text
+            searchable_text = f"{user_name} {real_name} {display_name} {first_name} {last_name} {email} {title}"
+            
+            # Apply search filter
+            if exact_match:
+                match_found = search_lower in [user_name, real_name, display_name, first_name, last_name, email, title]
+            else:
+                match_found = search_lower in searchable_text
+            
+            if match_found:
+                # Format user info
+                user_info = format_user_info(user)
+                filtered_users.append(user_info)
+                
+                # Stop if we've reached the limit
+                if len(filtered_users) >= limit:
+                    break
         
         return {
             "data": {
-                "presence": presence_info,
-                "user_id": user,
-                "found": True,
-                "note": "This is real-time presence data. Historical data and status reasons are not provided."
+                "users": filtered_users,
+                "total_found": len(filtered_users),
+                "search_query": search_query,
+                "exact_match": exact_match,
+                "include_bots": include_bots,
+                "include_deleted": include_deleted,
+                "include_restricted": include_restricted,
+                "optimized_email_lookup": False
             },
             "error": "",
             "successful": True
@@ -6004,19 +4877,7 @@ async def slack_get_user_presence_info(
         
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'user_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nNo user found with ID '{user}'",
-                "successful": False
-            }
-        elif error_code == 'user_not_visible':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nUser '{user}' is not visible to the bot. The user may be in a different workspace or have restricted visibility.",
-                "successful": False
-            }
-        elif error_code == 'not_authed':
+        if error_code == 'not_authed':
             return {
                 "data": {},
                 "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Please check your SLACK_BOT_TOKEN.",
@@ -6043,19 +4904,13 @@ async def slack_get_user_presence_info(
         elif error_code == 'no_permission':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to get user presence. The bot needs users:read scope.",
+                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to search users. The bot needs users:read scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs users:read scope to get user presence.",
-                "successful": False
-            }
-        elif error_code == 'invalid_user':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid user ID format: '{user}'",
+                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs users:read scope to search users.",
                 "successful": False
             }
         return {
@@ -6070,20 +4925,59 @@ async def slack_get_user_presence_info(
             "successful": False
         }
 
+def format_user_info(user: dict) -> dict:
+    """Helper function to format user information consistently."""
+    return {
+        "id": user.get("id"),
+        "team_id": user.get("team_id"),
+        "name": user.get("name"),
+        "real_name": user.get("real_name"),
+        "display_name": user.get("display_name"),
+        "email": user.get("profile", {}).get("email"),
+        "first_name": user.get("profile", {}).get("first_name"),
+        "last_name": user.get("profile", {}).get("last_name"),
+        "title": user.get("profile", {}).get("title"),
+        "phone": user.get("profile", {}).get("phone"),
+        "skype": user.get("profile", {}).get("skype"),
+        "status": user.get("profile", {}).get("status_text"),
+        "status_emoji": user.get("profile", {}).get("status_emoji"),
+        "image_24": user.get("profile", {}).get("image_24"),
+        "image_32": user.get("profile", {}).get("image_32"),
+        "image_48": user.get("profile", {}).get("image_48"),
+        "image_72": user.get("profile", {}).get("image_72"),
+        "image_192": user.get("profile", {}).get("image_192"),
+        "image_512": user.get("profile", {}).get("image_512"),
+        "is_admin": user.get("is_admin", False),
+        "is_owner": user.get("is_owner", False),
+        "is_primary_owner": user.get("is_primary_owner", False),
+        "is_restricted": user.get("is_restricted", False),
+        "is_ultra_restricted": user.get("is_ultra_restricted", False),
+        "is_bot": user.get("is_bot", False),
+        "is_app_user": user.get("is_app_user", False),
+        "is_invited_user": user.get("is_invited_user", False),
+        "has_2fa": user.get("has_2fa", False),
+        "two_factor_type": user.get("two_factor_type"),
+        "has_files": user.get("has_files", False),
+        "presence": user.get("presence"),
+        "locale": user.get("locale"),
+        "tz": user.get("tz"),
+        "tz_label": user.get("tz_label"),
+        "tz_offset": user.get("tz_offset"),
+        "updated": user.get("updated"),
+        "deleted": user.get("deleted", False),
+        "color": user.get("color")
+    }
+
 @mcp.tool()
-async def slack_initiates_channel_based_conversations(
-    name: str,
-    is_private: bool = False,
-    team_id: str = ""
+async def slack_get_channel_conversation_preferences(
+    channel_id: str
 ) -> dict:
     """
-    Deprecated: initiates a public or private channel-based conversation. 
-    use `create channel` instead.
+    Retrieves conversation preferences (e.g., who can post, who can thread) for a specified channel, 
+    primarily for use within slack enterprise grid environments.
     
     Args:
-        name (str): Name of the channel to create
-        is_private (bool): Whether to create a private channel (default: False)
-        team_id (str): Team ID for the channel (optional)
+        channel_id (str): The ID of the channel to get conversation preferences for
         
     Returns:
         dict: Response with data, error, and successful fields
@@ -6091,88 +4985,83 @@ async def slack_initiates_channel_based_conversations(
     try:
         client = get_slack_client()
         
-        # Prepare parameters for conversations.create
-        params = {
-            'name': name,
-            'is_private': is_private
-        }
-        
-        # Add team_id if provided
-        if team_id:
-            params['team_id'] = team_id
-        
-        # Use the conversations.create method
-        response = client.conversations_create(**params)
+        # Use the conversations.getPrefs method
+        response = client.api_call("conversations.getPrefs", channel=channel_id)
         
         if not response.data.get("ok", False):
             error = response.data.get('error', 'Unknown error')
-            if error == 'name_taken':
-                return {
-                    "data": {},
-                    "error": f"Channel name taken: A channel with the name '{name}' already exists",
-                    "successful": False
-                }
-            elif error == 'restricted_action':
+            if error == 'channel_not_found':
                 return {
                     "data": {},
-                    "error": f"Restricted action: Creating channels is restricted in this workspace",
+                    "error": f"Channel not found: No channel found with ID '{channel_id}'",
                     "successful": False
                 }
-            elif error == 'invalid_name':
+            elif error == 'not_in_channel':
                 return {
                     "data": {},
-                    "error": f"Invalid name: Channel name '{name}' is invalid. Channel names must be lowercase, contain no spaces or special characters except hyphens and underscores.",
+                    "error": f"Not in channel: The bot is not a member of channel '{channel_id}'",
                     "successful": False
                 }
-            elif error == 'invalid_team_id':
+            elif error == 'invalid_channel':
                 return {
                     "data": {},
-                    "error": f"Invalid team ID: Team ID '{team_id}' is invalid",
+                    "error": f"Invalid channel: Channel ID '{channel_id}' is not valid",
                     "successful": False
                 }
             else:
                 return {
                     "data": {},
-                    "error": f"Failed to create channel: {error}",
+                    "error": f"Failed to get channel preferences: {error}",
                     "successful": False
                 }
         
-        channel = response.data.get("channel", {})
+        prefs = response.data.get("prefs", {})
         
-        # Format channel information
-        channel_info = {
-            "id": channel.get("id"),
-            "name": channel.get("name"),
-            "is_channel": channel.get("is_channel", False),
-            "is_group": channel.get("is_group", False),
-            "is_im": channel.get("is_im", False),
-            "is_mpim": channel.get("is_mpim", False),
-            "is_private": channel.get("is_private", False),
-            "is_archived": channel.get("is_archived", False),
-            "is_general": channel.get("is_general", False),
-            "created": channel.get("created"),
-            "creator": channel.get("creator"),
-            "num_members": channel.get("num_members"),
-            "topic": {
-                "value": channel.get("topic", {}).get("value", ""),
-                "creator": channel.get("topic", {}).get("creator", ""),
-                "last_set": channel.get("topic", {}).get("last_set", 0)
-            },
-            "purpose": {
-                "value": channel.get("purpose", {}).get("value", ""),
-                "creator": channel.get("purpose", {}).get("creator", ""),
-                "last_set": channel.get("purpose", {}).get("last_set", 0)
-            }
+        # Format conversation preferences
+        preferences = {
+            "channel_id": channel_id,
+            "who_can_post": prefs.get("who_can_post", {}),
+            "who_can_thread": prefs.get("who_can_thread", {}),
+            "who_can_react": prefs.get("who_can_react", {}),
+            "who_can_manage_channel": prefs.get("who_can_manage_channel", {}),
+            "who_can_manage_extensions": prefs.get("who_can_manage_extensions", {}),
+            "who_can_manage_guests": prefs.get("who_can_manage_guests", {}),
+            "who_can_manage_integrations": prefs.get("who_can_manage_integrations", {}),
+            "who_can_manage_members": prefs.get("who_can_manage_members", {}),
+            "who_can_manage_retention": prefs.get("who_can_manage_retention", {}),
+            "who_can_manage_topics": prefs.get("who_can_manage_topics", {}),
+            "who_can_manage_workflows": prefs.get("who_can_manage_workflows", {}),
+            "who_can_manage_workflows_beta": prefs.get("who_can_manage_workflows_beta", {}),
+            "who_can_manage_workflows_gamma": prefs.get("who_can_manage_workflows_gamma", {}),
+            "who_can_manage_workflows_delta": prefs.get("who_can_manage_workflows_delta", {}),
+            "who_can_manage_workflows_epsilon": prefs.get("who_can_manage_workflows_epsilon", {}),
+            "who_can_manage_workflows_zeta": prefs.get("who_can_manage_workflows_zeta", {}),
+            "who_can_manage_workflows_eta": prefs.get("who_can_manage_workflows_eta", {}),
+            "who_can_manage_workflows_theta": prefs.get("who_can_manage_workflows_theta", {}),
+            "who_can_manage_workflows_iota": prefs.get("who_can_manage_workflows_iota", {}),
+            "who_can_manage_workflows_kappa": prefs.get("who_can_manage_workflows_kappa", {}),
+            "who_can_manage_workflows_lambda": prefs.get("who_can_manage_workflows_lambda", {}),
+            "who_can_manage_workflows_mu": prefs.get("who_can_manage_workflows_mu", {}),
+            "who_can_manage_workflows_nu": prefs.get("who_can_manage_workflows_nu", {}),
+            "who_can_manage_workflows_xi": prefs.get("who_can_manage_workflows_xi", {}),
+            "who_can_manage_workflows_omicron": prefs.get("who_can_manage_workflows_omicron", {}),
+            "who_can_manage_workflows_pi": prefs.get("who_can_manage_workflows_pi", {}),
+            "who_can_manage_workflows_rho": prefs.get("who_can_manage_workflows_rho", {}),
+            "who_can_manage_workflows_sigma": prefs.get("who_can_manage_workflows_sigma", {}),
+            "who_can_manage_workflows_tau": prefs.get("who_can_manage_workflows_tau", {}),
+            "who_can_manage_workflows_upsilon": prefs.get("who_can_manage_workflows_upsilon", {}),
+            "who_can_manage_workflows_phi": prefs.get("who_can_manage_workflows_phi", {}),
+            "who_can_manage_workflows_chi": prefs.get("who_can_manage_workflows_chi", {}),
+            "who_can_manage_workflows_psi": prefs.get("who_can_manage_workflows_psi", {}),
+            "who_can_manage_workflows_omega": prefs.get("who_can_manage_workflows_omega", {}),
+            "raw_prefs": prefs
         }
         
         return {
             "data": {
-                "channel": channel_info,
-                "channel_name": name,
-                "is_private": is_private,
-                "team_id": team_id,
-                "created": True,
-                "deprecation_warning": "This tool is deprecated. Please use 'create channel' instead."
+                "preferences": preferences,
+                "channel_id": channel_id,
+                "enterprise_grid": True
             },
             "error": "",
             "successful": True
@@ -6180,28 +5069,22 @@ async def slack_initiates_channel_based_conversations(
         
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'name_taken':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nA channel with the name '{name}' already exists",
-                "successful": False
-            }
-        elif error_code == 'restricted_action':
+        if error_code == 'channel_not_found':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nCreating channels is restricted in this workspace",
+                "error": f"Channel not found: No channel found with ID '{channel_id}'",
                 "successful": False
             }
-        elif error_code == 'invalid_name':
+        elif error_code == 'not_in_channel':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nChannel name '{name}' is invalid. Channel names must be lowercase, contain no spaces or special characters except hyphens and underscores.",
+                "error": f"Not in channel: The bot is not a member of channel '{channel_id}'",
                 "successful": False
             }
-        elif error_code == 'invalid_team_id':
+        elif error_code == 'invalid_channel':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nTeam ID '{team_id}' is invalid",
+                "error": f"Invalid channel: Channel ID '{channel_id}' is not valid",
                 "successful": False
             }
         elif error_code == 'not_authed':
@@ -6231,13 +5114,25 @@ async def slack_initiates_channel_based_conversations(
         elif error_code == 'no_permission':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to create channels. The bot needs channels:write scope.",
+                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to get channel preferences. The bot needs channels:read scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs channels:write scope to create channels.",
+                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs channels:read scope to get channel preferences.",
+                "successful": False
+            }
+        elif error_code == 'method_not_supported_for_channel_type':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nThis method is not supported for the specified channel type. Channel preferences are primarily available for Enterprise Grid channels.",
+                "successful": False
+            }
+        elif error_code == 'not_enterprise_grid':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nThis feature is only available for Enterprise Grid workspaces. Your workspace is not an Enterprise Grid organization.",
                 "successful": False
             }
         return {
@@ -6253,115 +5148,79 @@ async def slack_initiates_channel_based_conversations(
         }
 
 @mcp.tool()
-async def slack_invite_users_to_a_slack_channel(
-    channel: str,
-    users: str
+async def slack_get_reminder_information(
+    reminder: str
 ) -> dict:
     """
-    Invites users to an existing slack channel using their valid slack user ids.
+    Retrieves detailed information for an existing slack reminder specified by its id; 
+    this is a read-only operation.
     
     Args:
-        channel (str): Channel ID to invite users to
-        users (str): Comma-separated list of user IDs to invite
+        reminder (str): The ID of the reminder to get information for
         
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
-        client = get_slack_client()
-        
-        # Parse users parameter
-        user_list = [user.strip() for user in users.split(',')]
+        # Use user token for reminder operations (reminders require user tokens)
+        client = get_slack_user_client()
         
-        # Use the conversations.invite method
-        response = client.conversations_invite(channel=channel, users=','.join(user_list))
+        # Use the reminders.info method
+        response = client.reminders_info(reminder=reminder)
         
         if not response.data.get("ok", False):
             error = response.data.get('error', 'Unknown error')
-            if error == 'channel_not_found':
-                return {
-                    "data": {},
-                    "error": f"Channel not found: No channel found with ID '{channel}'",
-                    "successful": False
-                }
-            elif error == 'not_in_channel':
-                return {
-                    "data": {},
-                    "error": f"Not in channel: The bot is not a member of channel '{channel}'",
-                    "successful": False
-                }
-            elif error == 'cant_invite_self':
-                return {
-                    "data": {},
-                    "error": f"Cannot invite self: The bot cannot invite itself to the channel",
-                    "successful": False
-                }
-            elif error == 'cant_invite':
-                return {
-                    "data": {},
-                    "error": f"Cannot invite: One or more users cannot be invited to this channel (may already be members or have restricted access)",
-                    "successful": False
-                }
-            elif error == 'invalid_user':
-                return {
-                    "data": {},
-                    "error": f"Invalid user: One or more user IDs in '{users}' are invalid",
-                    "successful": False
-                }
-            elif error == 'users_not_found':
+            if error == 'reminder_not_found':
                 return {
                     "data": {},
-                    "error": f"Users not found: One or more user IDs in '{users}' were not found",
+                    "error": f"Reminder not found: No reminder found with ID '{reminder}'",
                     "successful": False
                 }
-            elif error == 'already_in_channel':
+            elif error == 'not_authed':
                 return {
                     "data": {},
-                    "error": f"Already in channel: One or more users are already members of the channel",
+                    "error": f"Authentication failed: {error}\n\nPlease check your SLACK_BOT_TOKEN.",
                     "successful": False
                 }
-            else:
+            elif error == 'invalid_auth':
                 return {
-                    "data": {},
-                    "error": f"Failed to invite users: {error}",
-                    "successful": False
-                }
-        
-        channel_info = response.data.get("channel", {})
-        
-        # Format channel information
-        channel_data = {
-            "id": channel_info.get("id"),
-            "name": channel_info.get("name"),
-            "is_channel": channel_info.get("is_channel", False),
-            "is_group": channel_info.get("is_group", False),
-            "is_im": channel_info.get("is_im", False),
-            "is_mpim": channel_info.get("is_mpim", False),
-            "is_private": channel_info.get("is_private", False),
-            "is_archived": channel_info.get("is_archived", False),
-            "is_general": channel_info.get("is_general", False),
-            "created": channel_info.get("created"),
-            "creator": channel_info.get("creator"),
-            "num_members": channel_info.get("num_members"),
-            "topic": {
-                "value": channel_info.get("topic", {}).get("value", ""),
-                "creator": channel_info.get("topic", {}).get("creator", ""),
-                "last_set": channel_info.get("topic", {}).get("last_set", 0)
-            },
-            "purpose": {
-                "value": channel_info.get("purpose", {}).get("value", ""),
-                "creator": channel_info.get("purpose", {}).get("creator", ""),
-                "last_set": channel_info.get("purpose", {}).get("last_set", 0)
-            }
+                    "data": {},
+                    "error": f"Invalid authentication: {error}\n\nPlease check your SLACK_BOT_TOKEN.",
+                    "successful": False
+                }
+            else:
+                return {
+                    "data": {},
+                    "error": f"Failed to get reminder information: {error}",
+                    "successful": False
+                }
+        
+        reminder_data = response.data.get("reminder", {})
+        
+        # Format reminder information
+        reminder_info = {
+            "id": reminder_data.get("id"),
+            "creator": reminder_data.get("creator"),
+            "text": reminder_data.get("text"),
+            "user": reminder_data.get("user"),
+            "recurring": reminder_data.get("recurring", False),
+            "time": reminder_data.get("time"),
+            "complete_ts": reminder_data.get("complete_ts"),
+            "channel": reminder_data.get("channel"),
+            "team": reminder_data.get("team"),
+            "date_created": reminder_data.get("date_created"),
+            "date_updated": reminder_data.get("date_updated"),
+            "recurrence": reminder_data.get("recurrence", {}),
+            "is_deleted": reminder_data.get("is_deleted", False),
+            "is_completed": reminder_data.get("is_completed", False),
+            "raw_reminder": reminder_data
         }
         
         return {
             "data": {
-                "channel": channel_data,
-                "users_invited": user_list,
-                "total_invited": len(user_list),
-                "channel_id": channel,
-                "invitation_successful": True
+                "reminder": reminder_info,
+                "reminder_id": reminder,
+                "found": True
             },
             "error": "",
             "successful": True
@@ -6369,46 +5228,10 @@ async def slack_invite_users_to_a_slack_channel(
         
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'channel_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nNo channel found with ID '{channel}'",
-                "successful": False
-            }
-        elif error_code == 'not_in_channel':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe bot is not a member of channel '{channel}'. The bot must be a member to invite others.",
-                "successful": False
-            }
-        elif error_code == 'cant_invite_self':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe bot cannot invite itself to the channel.",
-                "successful": False
-            }
-        elif error_code == 'cant_invite':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nOne or more users cannot be invited to this channel. They may already be members or have restricted access.",
-                "successful": False
-            }
-        elif error_code == 'invalid_user':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nOne or more user IDs in '{users}' are invalid.",
-                "successful": False
-            }
-        elif error_code == 'users_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nOne or more user IDs in '{users}' were not found.",
-                "successful": False
-            }
-        elif error_code == 'already_in_channel':
+        if error_code == 'reminder_not_found':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nOne or more users are already members of the channel.",
+                "error": f"Reminder not found: No reminder found with ID '{reminder}'",
                 "successful": False
             }
         elif error_code == 'not_authed':
@@ -6438,13 +5261,25 @@ async def slack_invite_users_to_a_slack_channel(
         elif error_code == 'no_permission':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to invite users. The bot needs channels:write scope.",
+                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to get reminder information. The bot needs reminders:read scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs channels:write scope to invite users to channels.",
+                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs reminders:read scope to get reminder information.",
+                "successful": False
+            }
+        elif error_code == 'invalid_reminder_id':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nInvalid reminder ID format: '{reminder}'",
+                "successful": False
+            }
+        elif error_code == 'not_allowed_token_type':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nThis operation requires a user token (xoxp-) with reminders:read scope.\nBot tokens (xoxb-) cannot access reminder information.\n\nTo fix this:\n1. Set SLACK_USER_TOKEN environment variable\n2. Use a user token with reminders:read scope",
                 "successful": False
             }
         return {
@@ -6460,17 +5295,14 @@ async def slack_invite_users_to_a_slack_channel(
         }
 
 @mcp.tool()
-async def slack_invite_user_to_channel(
-    channel_id: str,
-    user_ids: str
+async def slack_get_team_dnd_status(
+    users: str
 ) -> dict:
     """
-    Invites users to a specified slack channel; this action is restricted to enterprise grid workspaces 
-    and requires the authenticated user to be a member of the target channel.
+    Retrieves a user's current do not disturb status.
     
     Args:
-        channel_id (str): Channel ID to invite users to
-        user_ids (str): Comma-separated list of user IDs to invite
+        users (str): Comma-separated list of user IDs to get DND status for
         
     Returns:
         dict: Response with data, error, and successful fields
@@ -6478,106 +5310,57 @@ async def slack_invite_user_to_channel(
     try:
         client = get_slack_client()
         
-        # Parse user_ids parameter
-        user_list = [user.strip() for user in user_ids.split(',')]
+        # Parse users parameter
+        user_list = [user.strip() for user in users.split(',')]
         
-        # Use the conversations.invite method for Enterprise Grid
-        response = client.conversations_invite(channel=channel_id, users=','.join(user_list))
+        # Use the dnd.teamInfo method
+        response = client.dnd_teamInfo(users=','.join(user_list))
         
         if not response.data.get("ok", False):
             error = response.data.get('error', 'Unknown error')
-            if error == 'channel_not_found':
-                return {
-                    "data": {},
-                    "error": f"Channel not found: No channel found with ID '{channel_id}'",
-                    "successful": False
-                }
-            elif error == 'not_in_channel':
-                return {
-                    "data": {},
-                    "error": f"Not in channel: The authenticated user is not a member of channel '{channel_id}'. You must be a member to invite others.",
-                    "successful": False
-                }
-            elif error == 'cant_invite_self':
-                return {
-                    "data": {},
-                    "error": f"Cannot invite self: Cannot invite yourself to the channel",
-                    "successful": False
-                }
-            elif error == 'cant_invite':
-                return {
-                    "data": {},
-                    "error": f"Cannot invite: One or more users cannot be invited to this channel (may already be members or have restricted access)",
-                    "successful": False
-                }
-            elif error == 'invalid_user':
-                return {
-                    "data": {},
-                    "error": f"Invalid user: One or more user IDs in '{user_ids}' are invalid",
-                    "successful": False
-                }
-            elif error == 'users_not_found':
-                return {
-                    "data": {},
-                    "error": f"Users not found: One or more user IDs in '{user_ids}' were not found",
-                    "successful": False
-                }
-            elif error == 'already_in_channel':
+            if error == 'users_not_found':
                 return {
                     "data": {},
-                    "error": f"Already in channel: One or more users are already members of the channel",
+                    "error": f"Users not found: One or more user IDs in '{users}' were not found",
                     "successful": False
                 }
-            elif error == 'method_not_supported_for_channel_type':
+            elif error == 'invalid_users':
                 return {
                     "data": {},
-                    "error": f"Method not supported: This method is not supported for the specified channel type",
+                    "error": f"Invalid users: One or more user IDs in '{users}' are invalid",
                     "successful": False
                 }
             else:
                 return {
                     "data": {},
-                    "error": f"Failed to invite users: {error}",
+                    "error": f"Failed to get DND status: {error}",
                     "successful": False
                 }
         
-        channel_info = response.data.get("channel", {})
+        dnd_info = response.data.get("users", {})
         
-        # Format channel information
-        channel_data = {
-            "id": channel_info.get("id"),
-            "name": channel_info.get("name"),
-            "is_channel": channel_info.get("is_channel", False),
-            "is_group": channel_info.get("is_group", False),
-            "is_im": channel_info.get("is_im", False),
-            "is_mpim": channel_info.get("is_mpim", False),
-            "is_private": channel_info.get("is_private", False),
-            "is_archived": channel_info.get("is_archived", False),
-            "is_general": channel_info.get("is_general", False),
-            "created": channel_info.get("created"),
-            "creator": channel_info.get("creator"),
-            "num_members": channel_info.get("num_members"),
-            "team_id": channel_info.get("team_id"),
-            "topic": {
-                "value": channel_info.get("topic", {}).get("value", ""),
-                "creator": channel_info.get("topic", {}).get("creator", ""),
-                "last_set": channel_info.get("topic", {}).get("last_set", 0)
-            },
-            "purpose": {
-                "value": channel_info.get("purpose", {}).get("value", ""),
-                "creator": channel_info.get("purpose", {}).get("creator", ""),
-                "last_set": channel_info.get("purpose", {}).get("last_set", 0)
+        # Format DND status information
+        dnd_statuses = []
+        for user_id, user_dnd in dnd_info.items():
+            dnd_status = {
+                "user_id": user_id,
+                "dnd_enabled": user_dnd.get("dnd_enabled", False),
+                "next_dnd_start_ts": user_dnd.get("next_dnd_start_ts"),
+                "next_dnd_end_ts": user_dnd.get("next_dnd_end_ts"),
+                "snooze_enabled": user_dnd.get("snooze_enabled", False),
+                "snooze_endtime": user_dnd.get("snooze_endtime"),
+                "snooze_remaining": user_dnd.get("snooze_remaining"),
+                "is_snoozed": user_dnd.get("snooze_enabled", False) and user_dnd.get("snooze_endtime", 0) > 0,
+                "raw_dnd_info": user_dnd
             }
-        }
+            dnd_statuses.append(dnd_status)
         
         return {
             "data": {
-                "channel": channel_data,
-                "users_invited": user_list,
-                "total_invited": len(user_list),
-                "channel_id": channel_id,
-                "enterprise_grid": True,
-                "invitation_successful": True
+                "dnd_statuses": dnd_statuses,
+                "users_requested": user_list,
+                "total_users": len(dnd_statuses),
+                "timestamp": response.data.get("response_metadata", {}).get("timestamp")
             },
             "error": "",
             "successful": True
@@ -6585,58 +5368,16 @@ async def slack_invite_user_to_channel(
         
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'channel_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nNo channel found with ID '{channel_id}'",
-                "successful": False
-            }
-        elif error_code == 'not_in_channel':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe authenticated user is not a member of channel '{channel_id}'. You must be a member to invite others.",
-                "successful": False
-            }
-        elif error_code == 'cant_invite_self':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nCannot invite yourself to the channel.",
-                "successful": False
-            }
-        elif error_code == 'cant_invite':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nOne or more users cannot be invited to this channel. They may already be members or have restricted access.",
-                "successful": False
-            }
-        elif error_code == 'invalid_user':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nOne or more user IDs in '{user_ids}' are invalid.",
-                "successful": False
-            }
-        elif error_code == 'users_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nOne or more user IDs in '{user_ids}' were not found.",
-                "successful": False
-            }
-        elif error_code == 'already_in_channel':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nOne or more users are already members of the channel.",
-                "successful": False
-            }
-        elif error_code == 'method_not_supported_for_channel_type':
+        if error_code == 'users_not_found':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThis method is not supported for the specified channel type.",
+                "error": f"Slack API Error: {error_code}\n\nOne or more user IDs in '{users}' were not found",
                 "successful": False
             }
-        elif error_code == 'not_enterprise_grid':
+        elif error_code == 'invalid_users':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThis feature is only available for Enterprise Grid workspaces. Your workspace is not an Enterprise Grid organization.",
+                "error": f"Slack API Error: {error_code}\n\nOne or more user IDs in '{users}' are invalid",
                 "successful": False
             }
         elif error_code == 'not_authed':
@@ -6666,13 +5407,13 @@ async def slack_invite_user_to_channel(
         elif error_code == 'no_permission':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to invite users. The bot needs channels:write scope.",
+                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to get DND status. The bot needs dnd:read scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs channels:write scope to invite users to channels.",
+                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs dnd:read scope to get DND status.",
                 "successful": False
             }
         return {
@@ -6688,31 +5429,15 @@ async def slack_invite_user_to_channel(
         }
 
 @mcp.tool()
-async def slack_invite_user_to_workspace(
-    email: str,
-    channel_ids: str,
-    team_id: str,
-    custom_message: str = "",
-    guest_expiration_ts: str = "",
-    is_restricted: bool = False,
-    is_ultra_restricted: bool = False,
-    real_name: str = "",
-    resend: bool = False
+async def slack_get_user_presence_info(
+    user: str
 ) -> dict:
     """
-    Invites a user to a slack workspace and specified channels by email; 
-    use `resend=true` to re-process an existing invitation for a user not yet signed up.
+    Retrieves a slack user's current real-time presence (e.g., 'active', 'away') to determine their availability, 
+    noting this action does not provide historical data or status reasons.
     
     Args:
-        email (str): Email address of the user to invite
-        channel_ids (str): Comma-separated list of channel IDs to invite user to
-        team_id (str): Team ID for the workspace
-        custom_message (str): Custom message to include with the invitation (optional)
-        guest_expiration_ts (str): Unix timestamp for guest expiration (optional)
-        is_restricted (bool): Whether to create a restricted guest account (default: False)
-        is_ultra_restricted (bool): Whether to create an ultra-restricted guest account (default: False)
-        real_name (str): Real name of the user (optional)
-        resend (bool): Whether to re-send an existing invitation (default: False)
+        user (str): User ID to get presence information for
         
     Returns:
         dict: Response with data, error, and successful fields
@@ -6720,108 +5445,64 @@ async def slack_invite_user_to_workspace(
     try:
         client = get_slack_client()
         
-        # Parse channel_ids parameter
-        channel_list = [channel.strip() for channel in channel_ids.split(',')]
-        
-        # Prepare parameters for admin.users.invite
-        params = {
-            'email': email,
-            'channels': ','.join(channel_list),
-            'team_id': team_id,
-            'resend': resend
-        }
-        
-        # Add optional parameters if provided
-        if custom_message:
-            params['custom_message'] = custom_message
-        if guest_expiration_ts:
-            params['guest_expiration_ts'] = guest_expiration_ts
-        if is_restricted:
-            params['is_restricted'] = is_restricted
-        if is_ultra_restricted:
-            params['is_ultra_restricted'] = is_ultra_restricted
-        if real_name:
-            params['real_name'] = real_name
-        
-        # Use the admin.users.invite method
-        response = client.admin_users_invite(**params)
+        # Use the users.getPresence method
+        response = client.users_getPresence(user=user)
         
         if not response.data.get("ok", False):
             error = response.data.get('error', 'Unknown error')
-            if error == 'invalid_email':
-                return {
-                    "data": {},
-                    "error": f"Invalid email: Email address '{email}' is not valid",
-                    "successful": False
-                }
-            elif error == 'already_in_team':
-                return {
-                    "data": {},
-                    "error": f"Already in team: User with email '{email}' is already a member of the workspace",
-                    "successful": False
-                }
-            elif error == 'already_invited':
-                return {
-                    "data": {},
-                    "error": f"Already invited: User with email '{email}' has already been invited. Use resend=true to re-send the invitation.",
-                    "successful": False
-                }
-            elif error == 'invalid_channels':
-                return {
-                    "data": {},
-                    "error": f"Invalid channels: One or more channel IDs in '{channel_ids}' are invalid",
-                    "successful": False
-                }
-            elif error == 'invalid_team_id':
-                return {
-                    "data": {},
-                    "error": f"Invalid team ID: Team ID '{team_id}' is invalid",
-                    "successful": False
-                }
-            elif error == 'not_an_admin':
+            if error == 'user_not_found':
                 return {
                     "data": {},
-                    "error": f"Not an admin: The authenticated user is not an administrator and cannot invite users",
+                    "error": f"User not found: No user found with ID '{user}'",
                     "successful": False
                 }
-            elif error == 'restricted_action':
+            elif error == 'user_not_visible':
                 return {
                     "data": {},
-                    "error": f"Restricted action: User invitations are restricted in this workspace",
+                    "error": f"User not visible: User '{user}' is not visible to the bot (may be in a different workspace or have restricted visibility)",
                     "successful": False
                 }
             else:
                 return {
                     "data": {},
-                    "error": f"Failed to invite user: {error}",
+                    "error": f"Failed to get user presence: {error}",
                     "successful": False
                 }
         
-        invite_data = response.data
+        presence_data = response.data
         
-        # Format invitation information
-        invitation_info = {
-            "email": email,
-            "channels": channel_list,
-            "team_id": team_id,
-            "custom_message": custom_message,
-            "guest_expiration_ts": guest_expiration_ts,
-            "is_restricted": is_restricted,
-            "is_ultra_restricted": is_ultra_restricted,
-            "real_name": real_name,
-            "resend": resend,
-            "invitation_sent": True,
-            "raw_response": invite_data
+        # Format presence information
+        presence_info = {
+            "user_id": user,
+            "presence": presence_data.get("presence", "unknown"),
+            "online": presence_data.get("online", False),
+            "auto_away": presence_data.get("auto_away", False),
+            "manual_away": presence_data.get("manual_away", False),
+            "connection_count": presence_data.get("connection_count", 0),
+            "last_activity": presence_data.get("last_activity"),
+            "timestamp": presence_data.get("timestamp"),
+            "raw_presence": presence_data
         }
         
+        # Determine availability status
+        availability_status = "unknown"
+        if presence_info["presence"] == "active":
+            availability_status = "available"
+        elif presence_info["presence"] == "away":
+            availability_status = "away"
+        elif presence_info["auto_away"]:
+            availability_status = "auto_away"
+        elif presence_info["manual_away"]:
+            availability_status = "manual_away"
+        
+        presence_info["availability_status"] = availability_status
+        
         return {
             "data": {
-                "invitation": invitation_info,
-                "email": email,
-                "channels_invited_to": channel_list,
-                "total_channels": len(channel_list),
-                "team_id": team_id,
-                "invitation_successful": True
+                "presence": presence_info,
+                "user_id": user,
+                "found": True,
+                "note": "This is real-time presence data. Historical data and status reasons are not provided."
             },
             "error": "",
             "successful": True
@@ -6829,46 +5510,16 @@ async def slack_invite_user_to_workspace(
         
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'invalid_email':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nEmail address '{email}' is not valid.",
-                "successful": False
-            }
-        elif error_code == 'already_in_team':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nUser with email '{email}' is already a member of the workspace.",
-                "successful": False
-            }
-        elif error_code == 'already_invited':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nUser with email '{email}' has already been invited. Use resend=true to re-send the invitation.",
-                "successful": False
-            }
-        elif error_code == 'invalid_channels':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nOne or more channel IDs in '{channel_ids}' are invalid.",
-                "successful": False
-            }
-        elif error_code == 'invalid_team_id':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nTeam ID '{team_id}' is invalid.",
-                "successful": False
-            }
-        elif error_code == 'not_an_admin':
+        if error_code == 'user_not_found':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe authenticated user is not an administrator and cannot invite users.",
+                "error": f"Slack API Error: {error_code}\n\nNo user found with ID '{user}'",
                 "successful": False
             }
-        elif error_code == 'restricted_action':
+        elif error_code == 'user_not_visible':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nUser invitations are restricted in this workspace.",
+                "error": f"Slack API Error: {error_code}\n\nUser '{user}' is not visible to the bot. The user may be in a different workspace or have restricted visibility.",
                 "successful": False
             }
         elif error_code == 'not_authed':
@@ -6898,13 +5549,19 @@ async def slack_invite_user_to_workspace(
         elif error_code == 'no_permission':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to invite users. The bot needs admin.users:write scope.",
+                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to get user presence. The bot needs users:read scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs admin.users:write scope to invite users to the workspace.",
+                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs users:read scope to get user presence.",
+                "successful": False
+            }
+        elif error_code == 'invalid_user':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nInvalid user ID format: '{user}'",
                 "successful": False
             }
         return {
@@ -6920,31 +5577,19 @@ async def slack_invite_user_to_workspace(
         }
 
 @mcp.tool()
-async def slack_invite_user_to_workspace_with_optional_channel_invites(
-    email: str,
-    channel_ids: str,
-    team_id: str,
-    custom_message: str = "",
-    guest_expiration_ts: str = "",
-    is_restricted: bool = False,
-    is_ultra_restricted: bool = False,
-    real_name: str = "",
-    resend: bool = False
+async def slack_initiates_channel_based_conversations(
+    name: str,
+    is_private: bool = False,
+    team_id: str = ""
 ) -> dict:
     """
-    Deprecated: invites a user to a slack workspace and specified channels by email. 
-    use `invite user to workspace` instead.
+    Deprecated: initiates a public or private channel-based conversation. 
+    use `create channel` instead.
     
     Args:
-        email (str): Email address of the user to invite
-        channel_ids (str): Comma-separated list of channel IDs to invite user to
-        team_id (str): Team ID for the workspace
-        custom_message (str): Custom message to include with the invitation (optional)
-        guest_expiration_ts (str): Unix timestamp for guest expiration (optional)
-        is_restricted (bool): Whether to create a restricted guest account (default: False)
-        is_ultra_restricted (bool): Whether to create an ultra-restricted guest account (default: False)
-        real_name (str): Real name of the user (optional)
-        resend (bool): Whether to re-send an existing invitation (default: False)
+        name (str): Name of the channel to create
+        is_private (bool): Whether to create a private channel (default: False)
+        team_id (str): Team ID for the channel (optional)
         
     Returns:
         dict: Response with data, error, and successful fields
@@ -6952,56 +5597,37 @@ async def slack_invite_user_to_workspace_with_optional_channel_invites(
     try:
         client = get_slack_client()
         
-        # Parse channel_ids parameter
-        channel_list = [channel.strip() for channel in channel_ids.split(',')]
-        
-        # Prepare parameters for admin.users.invite
+        # Prepare parameters for conversations.create
         params = {
-            'email': email,
-            'channels': ','.join(channel_list),
-            'team_id': team_id,
-            'resend': resend
+            'name': name,
+            'is_private': is_private
         }
         
-        # Add optional parameters if provided
-        if custom_message:
-            params['custom_message'] = custom_message
-        if guest_expiration_ts:
-            params['guest_expiration_ts'] = guest_expiration_ts
-        if is_restricted:
-            params['is_restricted'] = is_restricted
-        if is_ultra_restricted:
-            params['is_ultra_restricted'] = is_ultra_restricted
-        if real_name:
-            params['real_name'] = real_name
+        # Add team_id if provided
+        if team_id:
+            params['team_id'] = team_id
         
-        # Use the admin.users.invite method
-        response = client.admin_users_invite(**params)
+        # Use the conversations.create method
+        response = client.conversations_create(**params)
         
         if not response.data.get("ok", False):
             error = response.data.get('error', 'Unknown error')
-            if error == 'invalid_email':
-                return {
-                    "data": {},
-                    "error": f"Invalid email: Email address '{email}' is not valid",
-                    "successful": False
-                }
-            elif error == 'already_in_team':
+            if error == 'name_taken':
                 return {
                     "data": {},
-                    "error": f"Already in team: User with email '{email}' is already a member of the workspace",
+                    "error": f"Channel name taken: A channel with the name '{name}' already exists",
                     "successful": False
                 }
-            elif error == 'already_invited':
+            elif error == 'restricted_action':
                 return {
                     "data": {},
-                    "error": f"Already invited: User with email '{email}' has already been invited. Use resend=true to re-send the invitation.",
+                    "error": f"Restricted action: Creating channels is restricted in this workspace",
                     "successful": False
                 }
-            elif error == 'invalid_channels':
+            elif error == 'invalid_name':
                 return {
                     "data": {},
-                    "error": f"Invalid channels: One or more channel IDs in '{channel_ids}' are invalid",
+                    "error": f"Invalid name: Channel name '{name}' is invalid. Channel names must be lowercase, contain no spaces or special characters except hyphens and underscores.",
                     "successful": False
                 }
             elif error == 'invalid_team_id':
@@ -7010,51 +5636,49 @@ async def slack_invite_user_to_workspace_with_optional_channel_invites(
                     "error": f"Invalid team ID: Team ID '{team_id}' is invalid",
                     "successful": False
                 }
-            elif error == 'not_an_admin':
-                return {
-                    "data": {},
-                    "error": f"Not an admin: The authenticated user is not an administrator and cannot invite users",
-                    "successful": False
-                }
-            elif error == 'restricted_action':
-                return {
-                    "data": {},
-                    "error": f"Restricted action: User invitations are restricted in this workspace",
-                    "successful": False
-                }
             else:
                 return {
                     "data": {},
-                    "error": f"Failed to invite user: {error}",
+                    "error": f"Failed to create channel: {error}",
                     "successful": False
                 }
         
-        invite_data = response.data
+        channel = response.data.get("channel", {})
         
-        # Format invitation information
-        invitation_info = {
-            "email": email,
-            "channels": channel_list,
-            "team_id": team_id,
-            "custom_message": custom_message,
-            "guest_expiration_ts": guest_expiration_ts,
-            "is_restricted": is_restricted,
-            "is_ultra_restricted": is_ultra_restricted,
-            "real_name": real_name,
-            "resend": resend,
-            "invitation_sent": True,
-            "raw_response": invite_data
+        # Format channel information
+        channel_info = {
+            "id": channel.get("id"),
+            "name": channel.get("name"),
+            "is_channel": channel.get("is_channel", False),
+            "is_group": channel.get("is_group", False),
+            "is_im": channel.get("is_im", False),
+            "is_mpim": channel.get("is_mpim", False),
+            "is_private": channel.get("is_private", False),
+            "is_archived": channel.get("is_archived", False),
+            "is_general": channel.get("is_general", False),
+            "created": channel.get("created"),
+            "creator": channel.get("creator"),
+            "num_members": channel.get("num_members"),
+            "topic": {
+                "value": channel.get("topic", {}).get("value", ""),
+                "creator": channel.get("topic", {}).get("creator", ""),
+                "last_set": channel.get("topic", {}).get("last_set", 0)
+            },
+            "purpose": {
+                "value": channel.get("purpose", {}).get("value", ""),
+                "creator": channel.get("purpose", {}).get("creator", ""),
+                "last_set": channel.get("purpose", {}).get("last_set", 0)
+            }
         }
         
         return {
             "data": {
-                "invitation": invitation_info,
-                "email": email,
-                "channels_invited_to": channel_list,
-                "total_channels": len(channel_list),
+                "channel": channel_info,
+                "channel_name": name,
+                "is_private": is_private,
                 "team_id": team_id,
-                "invitation_successful": True,
-                "deprecation_warning": "This tool is deprecated. Please use 'invite user to workspace' instead."
+                "created": True,
+                "deprecation_warning": "This tool is deprecated. Please use 'create channel' instead."
             },
             "error": "",
             "successful": True
@@ -7062,46 +5686,28 @@ async def slack_invite_user_to_workspace_with_optional_channel_invites(
         
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'invalid_email':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nEmail address '{email}' is not valid.",
-                "successful": False
-            }
-        elif error_code == 'already_in_team':
+        if error_code == 'name_taken':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nUser with email '{email}' is already a member of the workspace.",
+                "error": f"Slack API Error: {error_code}\n\nA channel with the name '{name}' already exists",
                 "successful": False
             }
-        elif error_code == 'already_invited':
+        elif error_code == 'restricted_action':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nUser with email '{email}' has already been invited. Use resend=true to re-send the invitation.",
+                "error": f"Slack API Error: {error_code}\n\nCreating channels is restricted in this workspace",
                 "successful": False
             }
-        elif error_code == 'invalid_channels':
+        elif error_code == 'invalid_name':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nOne or more channel IDs in '{channel_ids}' are invalid.",
+                "error": f"Slack API Error: {error_code}\n\nChannel name '{name}' is invalid. Channel names must be lowercase, contain no spaces or special characters except hyphens and underscores.",
                 "successful": False
             }
         elif error_code == 'invalid_team_id':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nTeam ID '{team_id}' is invalid.",
-                "successful": False
-            }
-        elif error_code == 'not_an_admin':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe authenticated user is not an administrator and cannot invite users.",
-                "successful": False
-            }
-        elif error_code == 'restricted_action':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nUser invitations are restricted in this workspace.",
+                "error": f"Slack API Error: {error_code}\n\nTeam ID '{team_id}' is invalid",
                 "successful": False
             }
         elif error_code == 'not_authed':
@@ -7131,13 +5737,13 @@ async def slack_invite_user_to_workspace_with_optional_channel_invites(
         elif error_code == 'no_permission':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to invite users. The bot needs admin.users:write scope.",
+                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to create channels. The bot needs channels:write scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs admin.users:write scope to invite users to the workspace.",
+                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs channels:write scope to create channels.",
                 "successful": False
             }
         return {
@@ -7153,15 +5759,16 @@ async def slack_invite_user_to_workspace_with_optional_channel_invites(
         }
 
 @mcp.tool()
-async def slack_join_an_existing_conversation(
-    channel: str
+async def slack_invite_users_to_a_slack_channel(
+    channel: str,
+    users: str
 ) -> dict:
     """
-    Joins an existing slack conversation (public channel, private channel, or multi-person direct message) 
-    by its id, if the authenticated user has permission.
+    Invites users to an existing slack channel using their valid slack user ids.
     
     Args:
-        channel (str): Channel ID to join
+        channel (str): Channel ID to invite users to
+        users (str): Comma-separated list of user IDs to invite
         
     Returns:
         dict: Response with data, error, and successful fields
@@ -7169,8 +5776,11 @@ async def slack_join_an_existing_conversation(
     try:
         client = get_slack_client()
         
-        # Use the conversations.join method
-        response = client.conversations_join(channel=channel)
+        # Parse users parameter
+        user_list = [user.strip() for user in users.split(',')]
+        
+        # Use the conversations.invite method
+        response = client.conversations_invite(channel=channel, users=','.join(user_list))
         
         if not response.data.get("ok", False):
             error = response.data.get('error', 'Unknown error')
@@ -7180,40 +5790,46 @@ async def slack_join_an_existing_conversation(
                     "error": f"Channel not found: No channel found with ID '{channel}'",
                     "successful": False
                 }
-            elif error == 'already_in_channel':
+            elif error == 'not_in_channel':
                 return {
                     "data": {},
-                    "error": f"Already in channel: The bot is already a member of channel '{channel}'",
+                    "error": f"Not in channel: The bot is not a member of channel '{channel}'",
                     "successful": False
                 }
-            elif error == 'cant_join_channel':
+            elif error == 'cant_invite_self':
                 return {
                     "data": {},
-                    "error": f"Cannot join channel: The bot cannot join channel '{channel}' (may be private or restricted)",
+                    "error": f"Cannot invite self: The bot cannot invite itself to the channel",
                     "successful": False
                 }
-            elif error == 'is_archived':
+            elif error == 'cant_invite':
                 return {
                     "data": {},
-                    "error": f"Channel archived: Channel '{channel}' is archived and cannot be joined",
+                    "error": f"Cannot invite: One or more users cannot be invited to this channel (may already be members or have restricted access)",
                     "successful": False
                 }
-            elif error == 'channel_is_private':
+            elif error == 'invalid_user':
                 return {
                     "data": {},
-                    "error": f"Private channel: Channel '{channel}' is private and the bot does not have permission to join",
+                    "error": f"Invalid user: One or more user IDs in '{users}' are invalid",
                     "successful": False
                 }
-            elif error == 'method_not_supported_for_channel_type':
+            elif error == 'users_not_found':
                 return {
                     "data": {},
-                    "error": f"Method not supported: This method is not supported for the specified channel type",
+                    "error": f"Users not found: One or more user IDs in '{users}' were not found",
+                    "successful": False
+                }
+            elif error == 'already_in_channel':
+                return {
+                    "data": {},
+                    "error": f"Already in channel: One or more users are already members of the channel",
                     "successful": False
                 }
             else:
                 return {
                     "data": {},
-                    "error": f"Failed to join channel: {error}",
+                    "error": f"Failed to invite users: {error}",
                     "successful": False
                 }
         
@@ -7248,9 +5864,10 @@ async def slack_join_an_existing_conversation(
         return {
             "data": {
                 "channel": channel_data,
+                "users_invited": user_list,
+                "total_invited": len(user_list),
                 "channel_id": channel,
-                "joined_successfully": True,
-                "membership_status": "joined"
+                "invitation_successful": True
             },
             "error": "",
             "successful": True
@@ -7264,34 +5881,40 @@ async def slack_join_an_existing_conversation(
                 "error": f"Slack API Error: {error_code}\n\nNo channel found with ID '{channel}'",
                 "successful": False
             }
-        elif error_code == 'already_in_channel':
+        elif error_code == 'not_in_channel':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe bot is already a member of channel '{channel}'",
+                "error": f"Slack API Error: {error_code}\n\nThe bot is not a member of channel '{channel}'. The bot must be a member to invite others.",
                 "successful": False
             }
-        elif error_code == 'cant_join_channel':
+        elif error_code == 'cant_invite_self':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe bot cannot join channel '{channel}'. The channel may be private or restricted.",
+                "error": f"Slack API Error: {error_code}\n\nThe bot cannot invite itself to the channel.",
                 "successful": False
             }
-        elif error_code == 'is_archived':
+        elif error_code == 'cant_invite':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nChannel '{channel}' is archived and cannot be joined.",
+                "error": f"Slack API Error: {error_code}\n\nOne or more users cannot be invited to this channel. They may already be members or have restricted access.",
                 "successful": False
             }
-        elif error_code == 'channel_is_private':
+        elif error_code == 'invalid_user':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nChannel '{channel}' is private and the bot does not have permission to join.",
+                "error": f"Slack API Error: {error_code}\n\nOne or more user IDs in '{users}' are invalid.",
                 "successful": False
             }
-        elif error_code == 'method_not_supported_for_channel_type':
+        elif error_code == 'users_not_found':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThis method is not supported for the specified channel type.",
+                "error": f"Slack API Error: {error_code}\n\nOne or more user IDs in '{users}' were not found.",
+                "successful": False
+            }
+        elif error_code == 'already_in_channel':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nOne or more users are already members of the channel.",
                 "successful": False
             }
         elif error_code == 'not_authed':
@@ -7321,13 +5944,13 @@ async def slack_join_an_existing_conversation(
         elif error_code == 'no_permission':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to join channels. The bot needs channels:write scope.",
+                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to invite users. The bot needs channels:write scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs channels:write scope to join channels.",
+                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs channels:write scope to invite users to channels.",
                 "successful": False
             }
         return {
@@ -7343,15 +5966,17 @@ async def slack_join_an_existing_conversation(
         }
 
 @mcp.tool()
-async def slack_leave_a_conversation(
-    channel: str
+async def slack_invite_user_to_channel(
+    channel_id: str,
+    user_ids: str
 ) -> dict:
     """
-    Leaves a slack conversation given its channel id; fails if leaving as the last member of a private channel 
-    or if used on a slack connect channel.
+    Invites users to a specified slack channel; this action is restricted to enterprise grid workspaces 
+    and requires the authenticated user to be a member of the target channel.
     
     Args:
-        channel (str): Channel ID to leave
+        channel_id (str): Channel ID to invite users to
+        user_ids (str): Comma-separated list of user IDs to invite
         
     Returns:
         dict: Response with data, error, and successful fields
@@ -7359,73 +5984,106 @@ async def slack_leave_a_conversation(
     try:
         client = get_slack_client()
         
-        # Use the conversations.leave method
-        response = client.conversations_leave(channel=channel)
+        # Parse user_ids parameter
+        user_list = [user.strip() for user in user_ids.split(',')]
+        
+        # Use the conversations.invite method for Enterprise Grid
+        response = client.conversations_invite(channel=channel_id, users=','.join(user_list))
         
         if not response.data.get("ok", False):
             error = response.data.get('error', 'Unknown error')
             if error == 'channel_not_found':
                 return {
                     "data": {},
-                    "error": f"Channel not found: No channel found with ID '{channel}'",
+                    "error": f"Channel not found: No channel found with ID '{channel_id}'",
                     "successful": False
                 }
             elif error == 'not_in_channel':
                 return {
                     "data": {},
-                    "error": f"Not in channel: The bot is not a member of channel '{channel}'",
+                    "error": f"Not in channel: The authenticated user is not a member of channel '{channel_id}'. You must be a member to invite others.",
                     "successful": False
                 }
-            elif error == 'cant_leave_general':
+            elif error == 'cant_invite_self':
                 return {
                     "data": {},
-                    "error": f"Cannot leave general: Cannot leave the #general channel",
+                    "error": f"Cannot invite self: Cannot invite yourself to the channel",
                     "successful": False
                 }
-            elif error == 'last_member':
+            elif error == 'cant_invite':
                 return {
                     "data": {},
-                    "error": f"Last member: Cannot leave as the last member of a private channel '{channel}'",
+                    "error": f"Cannot invite: One or more users cannot be invited to this channel (may already be members or have restricted access)",
                     "successful": False
                 }
-            elif error == 'is_archived':
+            elif error == 'invalid_user':
                 return {
                     "data": {},
-                    "error": f"Channel archived: Channel '{channel}' is archived and cannot be left",
+                    "error": f"Invalid user: One or more user IDs in '{user_ids}' are invalid",
                     "successful": False
                 }
-            elif error == 'method_not_supported_for_channel_type':
+            elif error == 'users_not_found':
                 return {
                     "data": {},
-                    "error": f"Method not supported: This method is not supported for the specified channel type (may be a Slack Connect channel)",
+                    "error": f"Users not found: One or more user IDs in '{user_ids}' were not found",
                     "successful": False
                 }
-            elif error == 'slack_connect_channel':
+            elif error == 'already_in_channel':
                 return {
                     "data": {},
-                    "error": f"Slack Connect channel: Cannot leave Slack Connect channel '{channel}'",
+                    "error": f"Already in channel: One or more users are already members of the channel",
+                    "successful": False
+                }
+            elif error == 'method_not_supported_for_channel_type':
+                return {
+                    "data": {},
+                    "error": f"Method not supported: This method is not supported for the specified channel type",
                     "successful": False
                 }
             else:
                 return {
                     "data": {},
-                    "error": f"Failed to leave channel: {error}",
+                    "error": f"Failed to invite users: {error}",
                     "successful": False
                 }
         
-        # Format response data
-        leave_data = {
-            "channel_id": channel,
-            "left_successfully": True,
-            "not_in_channel": response.data.get("not_in_channel", False)
+        channel_info = response.data.get("channel", {})
+        
+        # Format channel information
+        channel_data = {
+            "id": channel_info.get("id"),
+            "name": channel_info.get("name"),
+            "is_channel": channel_info.get("is_channel", False),
+            "is_group": channel_info.get("is_group", False),
+            "is_im": channel_info.get("is_im", False),
+            "is_mpim": channel_info.get("is_mpim", False),
+            "is_private": channel_info.get("is_private", False),
+            "is_archived": channel_info.get("is_archived", False),
+            "is_general": channel_info.get("is_general", False),
+            "created": channel_info.get("created"),
+            "creator": channel_info.get("creator"),
+            "num_members": channel_info.get("num_members"),
+            "team_id": channel_info.get("team_id"),
+            "topic": {
+                "value": channel_info.get("topic", {}).get("value", ""),
+                "creator": channel_info.get("topic", {}).get("creator", ""),
+                "last_set": channel_info.get("topic", {}).get("last_set", 0)
+            },
+            "purpose": {
+                "value": channel_info.get("purpose", {}).get("value", ""),
+                "creator": channel_info.get("purpose", {}).get("creator", ""),
+                "last_set": channel_info.get("purpose", {}).get("last_set", 0)
+            }
         }
         
         return {
             "data": {
-                "leave_info": leave_data,
-                "channel_id": channel,
-                "left_successfully": True,
-                "membership_status": "left"
+                "channel": channel_data,
+                "users_invited": user_list,
+                "total_invited": len(user_list),
+                "channel_id": channel_id,
+                "enterprise_grid": True,
+                "invitation_successful": True
             },
             "error": "",
             "successful": True
@@ -7436,43 +6094,55 @@ async def slack_leave_a_conversation(
         if error_code == 'channel_not_found':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nNo channel found with ID '{channel}'",
+                "error": f"Slack API Error: {error_code}\n\nNo channel found with ID '{channel_id}'",
                 "successful": False
             }
         elif error_code == 'not_in_channel':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe bot is not a member of channel '{channel}'",
+                "error": f"Slack API Error: {error_code}\n\nThe authenticated user is not a member of channel '{channel_id}'. You must be a member to invite others.",
                 "successful": False
             }
-        elif error_code == 'cant_leave_general':
+        elif error_code == 'cant_invite_self':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nCannot leave the #general channel.",
+                "error": f"Slack API Error: {error_code}\n\nCannot invite yourself to the channel.",
                 "successful": False
             }
-        elif error_code == 'last_member':
+        elif error_code == 'cant_invite':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nCannot leave as the last member of a private channel '{channel}'.",
+                "error": f"Slack API Error: {error_code}\n\nOne or more users cannot be invited to this channel. They may already be members or have restricted access.",
                 "successful": False
             }
-        elif error_code == 'is_archived':
+        elif error_code == 'invalid_user':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nChannel '{channel}' is archived and cannot be left.",
+                "error": f"Slack API Error: {error_code}\n\nOne or more user IDs in '{user_ids}' are invalid.",
+                "successful": False
+            }
+        elif error_code == 'users_not_found':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nOne or more user IDs in '{user_ids}' were not found.",
+                "successful": False
+            }
+        elif error_code == 'already_in_channel':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nOne or more users are already members of the channel.",
                 "successful": False
             }
         elif error_code == 'method_not_supported_for_channel_type':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThis method is not supported for the specified channel type. This may be a Slack Connect channel.",
+                "error": f"Slack API Error: {error_code}\n\nThis method is not supported for the specified channel type.",
                 "successful": False
             }
-        elif error_code == 'slack_connect_channel':
+        elif error_code == 'not_enterprise_grid':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nCannot leave Slack Connect channel '{channel}'.",
+                "error": f"Slack API Error: {error_code}\n\nThis feature is only available for Enterprise Grid workspaces. Your workspace is not an Enterprise Grid organization.",
                 "successful": False
             }
         elif error_code == 'not_authed':
@@ -7502,13 +6172,13 @@ async def slack_leave_a_conversation(
         elif error_code == 'no_permission':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to leave channels. The bot needs channels:write scope.",
+                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to invite users. The bot needs channels:write scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs channels:write scope to leave channels.",
+                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs channels:write scope to invite users to channels.",
                 "successful": False
             }
         return {
@@ -7524,23 +6194,31 @@ async def slack_leave_a_conversation(
         }
 
 @mcp.tool()
-async def slack_list_accessible_conversations_for_a_user(
-    user: str,
-    cursor: str = "",
-    exclude_archived: bool = True,
-    limit: int = 50,
-    types: str = "public_channel,private_channel,mpim,im"
+async def slack_invite_user_to_workspace(
+    email: str,
+    channel_ids: str,
+    team_id: str,
+    custom_message: str = "",
+    guest_expiration_ts: str = "",
+    is_restricted: bool = False,
+    is_ultra_restricted: bool = False,
+    real_name: str = "",
+    resend: bool = False
 ) -> dict:
     """
-    Deprecated: retrieves conversations accessible to a specified user. 
-    use `list conversations` instead.
+    Invites a user to a slack workspace and specified channels by email; 
+    use `resend=true` to re-process an existing invitation for a user not yet signed up.
     
     Args:
-        user (str): User ID to get accessible conversations for
-        cursor (str): Pagination cursor for fetching additional results (optional)
-        exclude_archived (bool): Whether to exclude archived conversations (default: True)
-        limit (int): Maximum number of conversations to return (default: 50)
-        types (str): Comma-separated list of conversation types to include (default: "public_channel,private_channel,mpim,im")
+        email (str): Email address of the user to invite
+        channel_ids (str): Comma-separated list of channel IDs to invite user to
+        team_id (str): Team ID for the workspace
+        custom_message (str): Custom message to include with the invitation (optional)
+        guest_expiration_ts (str): Unix timestamp for guest expiration (optional)
+        is_restricted (bool): Whether to create a restricted guest account (default: False)
+        is_ultra_restricted (bool): Whether to create an ultra-restricted guest account (default: False)
+        real_name (str): Real name of the user (optional)
+        resend (bool): Whether to re-send an existing invitation (default: False)
         
     Returns:
         dict: Response with data, error, and successful fields
@@ -7548,89 +6226,108 @@ async def slack_list_accessible_conversations_for_a_user(
     try:
         client = get_slack_client()
         
-        # Parse types parameter
-        conversation_types = [t.strip() for t in types.split(',')]
+        # Parse channel_ids parameter
+        channel_list = [channel.strip() for channel in channel_ids.split(',')]
         
-        # Prepare parameters for conversations.list
+        # Prepare parameters for admin.users.invite
         params = {
-            'types': ','.join(conversation_types),
-            'limit': min(limit, 1000),  # Slack API limit is 1000
-            'exclude_archived': exclude_archived
+            'email': email,
+            'channels': ','.join(channel_list),
+            'team_id': team_id,
+            'resend': resend
         }
         
-        # Add cursor if provided
-        if cursor:
-            params['cursor'] = cursor
+        # Add optional parameters if provided
+        if custom_message:
+            params['custom_message'] = custom_message
+        if guest_expiration_ts:
+            params['guest_expiration_ts'] = guest_expiration_ts
+        if is_restricted:
+            params['is_restricted'] = is_restricted
+        if is_ultra_restricted:
+            params['is_ultra_restricted'] = is_ultra_restricted
+        if real_name:
+            params['real_name'] = real_name
         
-        # Use the conversations.list method
-        response = client.conversations_list(**params)
+        # Use the admin.users.invite method
+        response = client.admin_users_invite(**params)
         
         if not response.data.get("ok", False):
             error = response.data.get('error', 'Unknown error')
-            if error == 'user_not_found':
+            if error == 'invalid_email':
                 return {
                     "data": {},
-                    "error": f"User not found: No user found with ID '{user}'",
+                    "error": f"Invalid email: Email address '{email}' is not valid",
                     "successful": False
                 }
-            elif error == 'invalid_user':
+            elif error == 'already_in_team':
                 return {
                     "data": {},
-                    "error": f"Invalid user: User ID '{user}' is invalid",
+                    "error": f"Already in team: User with email '{email}' is already a member of the workspace",
+                    "successful": False
+                }
+            elif error == 'already_invited':
+                return {
+                    "data": {},
+                    "error": f"Already invited: User with email '{email}' has already been invited. Use resend=true to re-send the invitation.",
+                    "successful": False
+                }
+            elif error == 'invalid_channels':
+                return {
+                    "data": {},
+                    "error": f"Invalid channels: One or more channel IDs in '{channel_ids}' are invalid",
+                    "successful": False
+                }
+            elif error == 'invalid_team_id':
+                return {
+                    "data": {},
+                    "error": f"Invalid team ID: Team ID '{team_id}' is invalid",
+                    "successful": False
+                }
+            elif error == 'not_an_admin':
+                return {
+                    "data": {},
+                    "error": f"Not an admin: The authenticated user is not an administrator and cannot invite users",
+                    "successful": False
+                }
+            elif error == 'restricted_action':
+                return {
+                    "data": {},
+                    "error": f"Restricted action: User invitations are restricted in this workspace",
                     "successful": False
                 }
             else:
                 return {
                     "data": {},
-                    "error": f"Failed to list conversations: {error}",
+                    "error": f"Failed to invite user: {error}",
                     "successful": False
                 }
         
-        conversations = response.data.get("channels", [])
-        
-        # Format conversation information
-        conversation_list = []
-        for conv in conversations:
-            conv_info = {
-                "id": conv.get("id"),
-                "name": conv.get("name"),
-                "is_channel": conv.get("is_channel", False),
-                "is_group": conv.get("is_group", False),
-                "is_im": conv.get("is_im", False),
-                "is_mpim": conv.get("is_mpim", False),
-                "is_private": conv.get("is_private", False),
-                "is_archived": conv.get("is_archived", False),
-                "is_general": conv.get("is_general", False),
-                "created": conv.get("created"),
-                "creator": conv.get("creator"),
-                "num_members": conv.get("num_members"),
-                "topic": {
-                    "value": conv.get("topic", {}).get("value", ""),
-                    "creator": conv.get("topic", {}).get("creator", ""),
-                    "last_set": conv.get("topic", {}).get("last_set", 0)
-                },
-                "purpose": {
-                    "value": conv.get("purpose", {}).get("value", ""),
-                    "creator": conv.get("purpose", {}).get("creator", ""),
-                    "last_set": conv.get("purpose", {}).get("last_set", 0)
-                }
-            }
-            conversation_list.append(conv_info)
+        invite_data = response.data
         
-        # Get pagination info
-        response_metadata = response.data.get("response_metadata", {})
-        next_cursor = response_metadata.get("next_cursor", "")
+        # Format invitation information
+        invitation_info = {
+            "email": email,
+            "channels": channel_list,
+            "team_id": team_id,
+            "custom_message": custom_message,
+            "guest_expiration_ts": guest_expiration_ts,
+            "is_restricted": is_restricted,
+            "is_ultra_restricted": is_ultra_restricted,
+            "real_name": real_name,
+            "resend": resend,
+            "invitation_sent": True,
+            "raw_response": invite_data
+        }
         
         return {
             "data": {
-                "conversations": conversation_list,
-                "total_found": len(conversation_list),
-                "user_id": user,
-                "exclude_archived": exclude_archived,
-                "types": types,
-                "next_cursor": next_cursor,
-                "has_more": bool(next_cursor),
-                "deprecation_warning": "This tool is deprecated. Please use 'list conversations' instead."
+                "invitation": invitation_info,
+                "email": email,
+                "channels_invited_to": channel_list,
+                "total_channels": len(channel_list),
+                "team_id": team_id,
+                "invitation_successful": True
             },
             "error": "",
             "successful": True
@@ -7638,16 +6335,46 @@ async def slack_list_accessible_conversations_for_a_user(
         
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'user_not_found':
+        if error_code == 'invalid_email':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nEmail address '{email}' is not valid.",
+                "successful": False
+            }
+        elif error_code == 'already_in_team':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nUser with email '{email}' is already a member of the workspace.",
+                "successful": False
+            }
+        elif error_code == 'already_invited':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nNo user found with ID '{user}'",
+                "error": f"Slack API Error: {error_code}\n\nUser with email '{email}' has already been invited. Use resend=true to re-send the invitation.",
                 "successful": False
             }
-        elif error_code == 'invalid_user':
+        elif error_code == 'invalid_channels':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nUser ID '{user}' is invalid",
+                "error": f"Slack API Error: {error_code}\n\nOne or more channel IDs in '{channel_ids}' are invalid.",
+                "successful": False
+            }
+        elif error_code == 'invalid_team_id':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nTeam ID '{team_id}' is invalid.",
+                "successful": False
+            }
+        elif error_code == 'not_an_admin':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nThe authenticated user is not an administrator and cannot invite users.",
+                "successful": False
+            }
+        elif error_code == 'restricted_action':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nUser invitations are restricted in this workspace.",
                 "successful": False
             }
         elif error_code == 'not_authed':
@@ -7677,13 +6404,13 @@ async def slack_list_accessible_conversations_for_a_user(
         elif error_code == 'no_permission':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to list conversations. The bot needs channels:read scope.",
+                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to invite users. The bot needs admin.users:write scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs channels:read scope to list conversations.",
+                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs admin.users:write scope to invite users to the workspace.",
                 "successful": False
             }
         return {
@@ -7699,22 +6426,31 @@ async def slack_list_accessible_conversations_for_a_user(
         }
 
 @mcp.tool()
-async def slack_list_all_channels(
-    channel_name: str = "",
-    cursor: str = "",
-    exclude_archived: bool = True,
-    limit: int = 1,
-    types: str = "public_channel,private_channel,mpim,im"
+async def slack_invite_user_to_workspace_with_optional_channel_invites(
+    email: str,
+    channel_ids: str,
+    team_id: str,
+    custom_message: str = "",
+    guest_expiration_ts: str = "",
+    is_restricted: bool = False,
+    is_ultra_restricted: bool = False,
+    real_name: str = "",
+    resend: bool = False
 ) -> dict:
     """
-    Lists conversations available to the user with various filters and search options.
+    Deprecated: invites a user to a slack workspace and specified channels by email. 
+    use `invite user to workspace` instead.
     
     Args:
-        channel_name (str): Filter conversations by channel name (optional)
-        cursor (str): Pagination cursor for fetching additional results (optional)
-        exclude_archived (bool): Whether to exclude archived conversations (default: True)
-        limit (int): Maximum number of conversations to return (default: 1)
-        types (str): Comma-separated list of conversation types to include (default: "public_channel,private_channel,mpim,im")
+        email (str): Email address of the user to invite
+        channel_ids (str): Comma-separated list of channel IDs to invite user to
+        team_id (str): Team ID for the workspace
+        custom_message (str): Custom message to include with the invitation (optional)
+        guest_expiration_ts (str): Unix timestamp for guest expiration (optional)
+        is_restricted (bool): Whether to create a restricted guest account (default: False)
+        is_ultra_restricted (bool): Whether to create an ultra-restricted guest account (default: False)
+        real_name (str): Real name of the user (optional)
+        resend (bool): Whether to re-send an existing invitation (default: False)
         
     Returns:
         dict: Response with data, error, and successful fields
@@ -7722,97 +6458,109 @@ async def slack_list_all_channels(
     try:
         client = get_slack_client()
         
-        # Parse types parameter
-        conversation_types = [t.strip() for t in types.split(',')]
+        # Parse channel_ids parameter
+        channel_list = [channel.strip() for channel in channel_ids.split(',')]
         
-        # Prepare parameters for conversations.list
+        # Prepare parameters for admin.users.invite
         params = {
-            'types': ','.join(conversation_types),
-            'limit': min(limit, 1000),  # Slack API limit is 1000
-            'exclude_archived': exclude_archived
+            'email': email,
+            'channels': ','.join(channel_list),
+            'team_id': team_id,
+            'resend': resend
         }
         
-        # Add cursor if provided
-        if cursor:
-            params['cursor'] = cursor
+        # Add optional parameters if provided
+        if custom_message:
+            params['custom_message'] = custom_message
+        if guest_expiration_ts:
+            params['guest_expiration_ts'] = guest_expiration_ts
+        if is_restricted:
+            params['is_restricted'] = is_restricted
+        if is_ultra_restricted:
+            params['is_ultra_restricted'] = is_ultra_restricted
+        if real_name:
+            params['real_name'] = real_name
         
-        # Use the conversations.list method
-        response = client.conversations_list(**params)
+        # Use the admin.users.invite method
+        response = client.admin_users_invite(**params)
         
         if not response.data.get("ok", False):
             error = response.data.get('error', 'Unknown error')
-            if error == 'invalid_cursor':
+            if error == 'invalid_email':
                 return {
                     "data": {},
-                    "error": f"Invalid cursor: Pagination cursor '{cursor}' is invalid",
+                    "error": f"Invalid email: Email address '{email}' is not valid",
                     "successful": False
                 }
-            elif error == 'invalid_types':
+            elif error == 'already_in_team':
                 return {
                     "data": {},
-                    "error": f"Invalid types: One or more conversation types in '{types}' are invalid",
+                    "error": f"Already in team: User with email '{email}' is already a member of the workspace",
+                    "successful": False
+                }
+            elif error == 'already_invited':
+                return {
+                    "data": {},
+                    "error": f"Already invited: User with email '{email}' has already been invited. Use resend=true to re-send the invitation.",
+                    "successful": False
+                }
+            elif error == 'invalid_channels':
+                return {
+                    "data": {},
+                    "error": f"Invalid channels: One or more channel IDs in '{channel_ids}' are invalid",
+                    "successful": False
+                }
+            elif error == 'invalid_team_id':
+                return {
+                    "data": {},
+                    "error": f"Invalid team ID: Team ID '{team_id}' is invalid",
+                    "successful": False
+                }
+            elif error == 'not_an_admin':
+                return {
+                    "data": {},
+                    "error": f"Not an admin: The authenticated user is not an administrator and cannot invite users",
+                    "successful": False
+                }
+            elif error == 'restricted_action':
+                return {
+                    "data": {},
+                    "error": f"Restricted action: User invitations are restricted in this workspace",
                     "successful": False
                 }
             else:
                 return {
                     "data": {},
-                    "error": f"Failed to list conversations: {error}",
+                    "error": f"Failed to invite user: {error}",
                     "successful": False
                 }
         
-        conversations = response.data.get("channels", [])
-        
-        # Filter by channel name if provided
-        if channel_name:
-            channel_name_lower = channel_name.lower()
-            conversations = [
-                conv for conv in conversations 
-                if channel_name_lower in conv.get("name", "").lower()
-            ]
-        
-        # Format conversation information
-        conversation_list = []
-        for conv in conversations:
-            conv_info = {
-                "id": conv.get("id"),
-                "name": conv.get("name"),
-                "is_channel": conv.get("is_channel", False),
-                "is_group": conv.get("is_group", False),
-                "is_im": conv.get("is_im", False),
-                "is_mpim": conv.get("is_mpim", False),
-                "is_private": conv.get("is_private", False),
-                "is_archived": conv.get("is_archived", False),
-                "is_general": conv.get("is_general", False),
-                "created": conv.get("created"),
-                "creator": conv.get("creator"),
-                "num_members": conv.get("num_members"),
-                "topic": {
-                    "value": conv.get("topic", {}).get("value", ""),
-                    "creator": conv.get("topic", {}).get("creator", ""),
-                    "last_set": conv.get("topic", {}).get("last_set", 0)
-                },
-                "purpose": {
-                    "value": conv.get("purpose", {}).get("value", ""),
-                    "creator": conv.get("purpose", {}).get("creator", ""),
-                    "last_set": conv.get("purpose", {}).get("last_set", 0)
-                }
-            }
-            conversation_list.append(conv_info)
+        invite_data = response.data
         
-        # Get pagination info
-        response_metadata = response.data.get("response_metadata", {})
-        next_cursor = response_metadata.get("next_cursor", "")
+        # Format invitation information
+        invitation_info = {
+            "email": email,
+            "channels": channel_list,
+            "team_id": team_id,
+            "custom_message": custom_message,
+            "guest_expiration_ts": guest_expiration_ts,
+            "is_restricted": is_restricted,
+            "is_ultra_restricted": is_ultra_restricted,
+            "real_name": real_name,
+            "resend": resend,
+            "invitation_sent": True,
+            "raw_response": invite_data
+        }
         
         return {
             "data": {
-                "conversations": conversation_list,
-                "total_found": len(conversation_list),
-                "channel_name_filter": channel_name,
-                "exclude_archived": exclude_archived,
-                "types": types,
-                "next_cursor": next_cursor,
-                "has_more": bool(next_cursor),
-                "limit_requested": limit
+                "invitation": invitation_info,
+                "email": email,
+                "channels_invited_to": channel_list,
+                "total_channels": len(channel_list),
+                "team_id": team_id,
+                "invitation_successful": True,
+                "deprecation_warning": "This tool is deprecated. Please use 'invite user to workspace' instead."
             },
             "error": "",
             "successful": True
@@ -7820,16 +6568,46 @@ async def slack_list_all_channels(
         
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'invalid_cursor':
+        if error_code == 'invalid_email':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nPagination cursor '{cursor}' is invalid.",
+                "error": f"Slack API Error: {error_code}\n\nEmail address '{email}' is not valid.",
                 "successful": False
             }
-        elif error_code == 'invalid_types':
+        elif error_code == 'already_in_team':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nOne or more conversation types in '{types}' are invalid.",
+                "error": f"Slack API Error: {error_code}\n\nUser with email '{email}' is already a member of the workspace.",
+                "successful": False
+            }
+        elif error_code == 'already_invited':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nUser with email '{email}' has already been invited. Use resend=true to re-send the invitation.",
+                "successful": False
+            }
+        elif error_code == 'invalid_channels':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nOne or more channel IDs in '{channel_ids}' are invalid.",
+                "successful": False
+            }
+        elif error_code == 'invalid_team_id':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nTeam ID '{team_id}' is invalid.",
+                "successful": False
+            }
+        elif error_code == 'not_an_admin':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nThe authenticated user is not an administrator and cannot invite users.",
+                "successful": False
+            }
+        elif error_code == 'restricted_action':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nUser invitations are restricted in this workspace.",
                 "successful": False
             }
         elif error_code == 'not_authed':
@@ -7859,13 +6637,13 @@ async def slack_list_all_channels(
         elif error_code == 'no_permission':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to list conversations. The bot needs channels:read scope.",
+                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to invite users. The bot needs admin.users:write scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs channels:read scope to list conversations.",
+                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs admin.users:write scope to invite users to the workspace.",
                 "successful": False
             }
         return {
@@ -7881,23 +6659,15 @@ async def slack_list_all_channels(
         }
 
 @mcp.tool()
-async def slack_list_all_slack_team_channels_with_various_filters(
-    channel_name: str = "",
-    cursor: str = "",
-    exclude_archived: bool = True,
-    limit: int = 1,
-    types: str = "public_channel,private_channel,mpim,im"
+async def slack_join_an_existing_conversation(
+    channel: str
 ) -> dict:
     """
-    Deprecated: lists conversations available to the user with various filters and search options. 
-    use `list channels` instead.
+    Joins an existing slack conversation (public channel, private channel, or multi-person direct message) 
+    by its id, if the authenticated user has permission.
     
     Args:
-        channel_name (str): Filter conversations by channel name (optional)
-        cursor (str): Pagination cursor for fetching additional results (optional)
-        exclude_archived (bool): Whether to exclude archived conversations (default: True)
-        limit (int): Maximum number of conversations to return (default: 1)
-        types (str): Comma-separated list of conversation types to include (default: "public_channel,private_channel,mpim,im")
+        channel (str): Channel ID to join
         
     Returns:
         dict: Response with data, error, and successful fields
@@ -7905,98 +6675,88 @@ async def slack_list_all_slack_team_channels_with_various_filters(
     try:
         client = get_slack_client()
         
-        # Parse types parameter
-        conversation_types = [t.strip() for t in types.split(',')]
-        
-        # Prepare parameters for conversations.list
-        params = {
-            'types': ','.join(conversation_types),
-            'limit': min(limit, 1000),  # Slack API limit is 1000
-            'exclude_archived': exclude_archived
-        }
-        
-        # Add cursor if provided
-        if cursor:
-            params['cursor'] = cursor
-        
-        # Use the conversations.list method
-        response = client.conversations_list(**params)
+        # Use the conversations.join method
+        response = client.conversations_join(channel=channel)
         
         if not response.data.get("ok", False):
             error = response.data.get('error', 'Unknown error')
-            if error == 'invalid_cursor':
+            if error == 'channel_not_found':
                 return {
                     "data": {},
-                    "error": f"Invalid cursor: Pagination cursor '{cursor}' is invalid",
+                    "error": f"Channel not found: No channel found with ID '{channel}'",
                     "successful": False
                 }
-            elif error == 'invalid_types':
+            elif error == 'already_in_channel':
                 return {
                     "data": {},
-                    "error": f"Invalid types: One or more conversation types in '{types}' are invalid",
+                    "error": f"Already in channel: The bot is already a member of channel '{channel}'",
+                    "successful": False
+                }
+            elif error == 'cant_join_channel':
+                return {
+                    "data": {},
+                    "error": f"Cannot join channel: The bot cannot join channel '{channel}' (may be private or restricted)",
+                    "successful": False
+                }
+            elif error == 'is_archived':
+                return {
+                    "data": {},
+                    "error": f"Channel archived: Channel '{channel}' is archived and cannot be joined",
+                    "successful": False
+                }
+            elif error == 'channel_is_private':
+                return {
+                    "data": {},
+                    "error": f"Private channel: Channel '{channel}' is private and the bot does not have permission to join",
+                    "successful": False
+                }
+            elif error == 'method_not_supported_for_channel_type':
+                return {
+                    "data": {},
+                    "error": f"Method not supported: This method is not supported for the specified channel type",
                     "successful": False
                 }
             else:
                 return {
                     "data": {},
-                    "error": f"Failed to list conversations: {error}",
+                    "error": f"Failed to join channel: {error}",
                     "successful": False
                 }
         
-        conversations = response.data.get("channels", [])
-        
-        # Filter by channel name if provided
-        if channel_name:
-            channel_name_lower = channel_name.lower()
-            conversations = [
-                conv for conv in conversations 
-                if channel_name_lower in conv.get("name", "").lower()
-            ]
+        channel_info = response.data.get("channel", {})
         
-        # Format conversation information
-        conversation_list = []
-        for conv in conversations:
-            conv_info = {
-                "id": conv.get("id"),
-                "name": conv.get("name"),
-                "is_channel": conv.get("is_channel", False),
-                "is_group": conv.get("is_group", False),
-                "is_im": conv.get("is_im", False),
-                "is_mpim": conv.get("is_mpim", False),
-                "is_private": conv.get("is_private", False),
-                "is_archived": conv.get("is_archived", False),
-                "is_general": conv.get("is_general", False),
-                "created": conv.get("created"),
-                "creator": conv.get("creator"),
-                "num_members": conv.get("num_members"),
-                "topic": {
-                    "value": conv.get("topic", {}).get("value", ""),
-                    "creator": conv.get("topic", {}).get("creator", ""),
-                    "last_set": conv.get("topic", {}).get("last_set", 0)
-                },
-                "purpose": {
-                    "value": conv.get("purpose", {}).get("value", ""),
-                    "creator": conv.get("purpose", {}).get("creator", ""),
-                    "last_set": conv.get("purpose", {}).get("last_set", 0)
-                }
+        # Format channel information
+        channel_data = {
+            "id": channel_info.get("id"),
+            "name": channel_info.get("name"),
+            "is_channel": channel_info.get("is_channel", False),
+            "is_group": channel_info.get("is_group", False),
+            "is_im": channel_info.get("is_im", False),
+            "is_mpim": channel_info.get("is_mpim", False),
+            "is_private": channel_info.get("is_private", False),
+            "is_archived": channel_info.get("is_archived", False),
+            "is_general": channel_info.get("is_general", False),
+            "created": channel_info.get("created"),
+            "creator": channel_info.get("creator"),
+            "num_members": channel_info.get("num_members"),
+            "topic": {
+                "value": channel_info.get("topic", {}).get("value", ""),
+                "creator": channel_info.get("topic", {}).get("creator", ""),
+                "last_set": channel_info.get("topic", {}).get("last_set", 0)
+            },
+            "purpose": {
+                "value": channel_info.get("purpose", {}).get("value", ""),
+                "creator": channel_info.get("purpose", {}).get("creator", ""),
+                "last_set": channel_info.get("purpose", {}).get("last_set", 0)
             }
-            conversation_list.append(conv_info)
-        
-        # Get pagination info
-        response_metadata = response.data.get("response_metadata", {})
-        next_cursor = response_metadata.get("next_cursor", "")
+        }
         
         return {
             "data": {
-                "conversations": conversation_list,
-                "total_found": len(conversation_list),
-                "channel_name_filter": channel_name,
-                "exclude_archived": exclude_archived,
-                "types": types,
-                "next_cursor": next_cursor,
-                "has_more": bool(next_cursor),
-                "limit_requested": limit,
-                "deprecation_warning": "This tool is deprecated. Please use 'list channels' instead."
+                "channel": channel_data,
+                "channel_id": channel,
+                "joined_successfully": True,
+                "membership_status": "joined"
             },
             "error": "",
             "successful": True
@@ -8004,16 +6764,40 @@ async def slack_list_all_slack_team_channels_with_various_filters(
         
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'invalid_cursor':
+        if error_code == 'channel_not_found':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nPagination cursor '{cursor}' is invalid.",
+                "error": f"Slack API Error: {error_code}\n\nNo channel found with ID '{channel}'",
                 "successful": False
             }
-        elif error_code == 'invalid_types':
+        elif error_code == 'already_in_channel':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nOne or more conversation types in '{types}' are invalid.",
+                "error": f"Slack API Error: {error_code}\n\nThe bot is already a member of channel '{channel}'",
+                "successful": False
+            }
+        elif error_code == 'cant_join_channel':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nThe bot cannot join channel '{channel}'. The channel may be private or restricted.",
+                "successful": False
+            }
+        elif error_code == 'is_archived':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nChannel '{channel}' is archived and cannot be joined.",
+                "successful": False
+            }
+        elif error_code == 'channel_is_private':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nChannel '{channel}' is private and the bot does not have permission to join.",
+                "successful": False
+            }
+        elif error_code == 'method_not_supported_for_channel_type':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nThis method is not supported for the specified channel type.",
                 "successful": False
             }
         elif error_code == 'not_authed':
@@ -8043,13 +6827,13 @@ async def slack_list_all_slack_team_channels_with_various_filters(
         elif error_code == 'no_permission':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to list conversations. The bot needs channels:read scope.",
+                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to join channels. The bot needs channels:write scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs channels:read scope to list conversations.",
+                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs channels:write scope to join channels.",
                 "successful": False
             }
         return {
@@ -8065,19 +6849,15 @@ async def slack_list_all_slack_team_channels_with_various_filters(
         }
 
 @mcp.tool()
-async def slack_list_all_slack_team_users_with_pagination(
-    cursor: str = "",
-    include_locale: bool = False,
-    limit: int = 1
+async def slack_leave_a_conversation(
+    channel: str
 ) -> dict:
     """
-    Deprecated: retrieves a paginated list of all users in a slack workspace. 
-    use `list all users` instead.
+    Leaves a slack conversation given its channel id; fails if leaving as the last member of a private channel 
+    or if used on a slack connect channel.
     
     Args:
-        cursor (str): Pagination cursor for fetching additional results (optional)
-        include_locale (bool): Whether to include locale information (default: False)
-        limit (int): Maximum number of users to return (default: 1)
+        channel (str): Channel ID to leave
         
     Returns:
         dict: Response with data, error, and successful fields
@@ -8085,94 +6865,73 @@ async def slack_list_all_slack_team_users_with_pagination(
     try:
         client = get_slack_client()
         
-        # Prepare parameters for users.list
-        params = {
-            'limit': min(limit, 1000),  # Slack API limit is 1000
-            'include_locale': include_locale
-        }
-        
-        # Add cursor if provided
-        if cursor:
-            params['cursor'] = cursor
-        
-        # Use the users.list method
-        response = client.users_list(**params)
+        # Use the conversations.leave method
+        response = client.conversations_leave(channel=channel)
         
         if not response.data.get("ok", False):
             error = response.data.get('error', 'Unknown error')
-            if error == 'invalid_cursor':
+            if error == 'channel_not_found':
                 return {
                     "data": {},
-                    "error": f"Invalid cursor: Pagination cursor '{cursor}' is invalid",
+                    "error": f"Channel not found: No channel found with ID '{channel}'",
                     "successful": False
                 }
-            else:
+            elif error == 'not_in_channel':
                 return {
                     "data": {},
-                    "error": f"Failed to list users: {error}",
+                    "error": f"Not in channel: The bot is not a member of channel '{channel}'",
+                    "successful": False
+                }
+            elif error == 'cant_leave_general':
+                return {
+                    "data": {},
+                    "error": f"Cannot leave general: Cannot leave the #general channel",
+                    "successful": False
+                }
+            elif error == 'last_member':
+                return {
+                    "data": {},
+                    "error": f"Last member: Cannot leave as the last member of a private channel '{channel}'",
+                    "successful": False
+                }
+            elif error == 'is_archived':
+                return {
+                    "data": {},
+                    "error": f"Channel archived: Channel '{channel}' is archived and cannot be left",
+                    "successful": False
+                }
+            elif error == 'method_not_supported_for_channel_type':
+                return {
+                    "data": {},
+                    "error": f"Method not supported: This method is not supported for the specified channel type (may be a Slack Connect channel)",
+                    "successful": False
+                }
+            elif error == 'slack_connect_channel':
+                return {
+                    "data": {},
+                    "error": f"Slack Connect channel: Cannot leave Slack Connect channel '{channel}'",
+                    "successful": False
+                }
+            else:
+                return {
+                    "data": {},
+                    "error": f"Failed to leave channel: {error}",
                     "successful": False
                 }
         
-        users = response.data.get("members", [])
-        
-        # Format user information
-        user_list = []
-        for user in users:
-            user_info = {
-                "id": user.get("id"),
-                "team_id": user.get("team_id"),
-                "name": user.get("name"),
-                "real_name": user.get("real_name"),
-                "display_name": user.get("display_name"),
-                "email": user.get("profile", {}).get("email"),
-                "first_name": user.get("profile", {}).get("first_name"),
-                "last_name": user.get("profile", {}).get("last_name"),
-                "title": user.get("profile", {}).get("title"),
-                "phone": user.get("profile", {}).get("phone"),
-                "skype": user.get("profile", {}).get("skype"),
-                "status": user.get("profile", {}).get("status_text"),
-                "status_emoji": user.get("profile", {}).get("status_emoji"),
-                "image_24": user.get("profile", {}).get("image_24"),
-                "image_32": user.get("profile", {}).get("image_32"),
-                "image_48": user.get("profile", {}).get("image_48"),
-                "image_72": user.get("profile", {}).get("image_72"),
-                "image_192": user.get("profile", {}).get("image_192"),
-                "image_512": user.get("profile", {}).get("image_512"),
-                "is_admin": user.get("is_admin", False),
-                "is_owner": user.get("is_owner", False),
-                "is_primary_owner": user.get("is_primary_owner", False),
-                "is_restricted": user.get("is_restricted", False),
-                "is_ultra_restricted": user.get("is_ultra_restricted", False),
-                "is_bot": user.get("is_bot", False),
-                "is_app_user": user.get("is_app_user", False),
-                "is_invited_user": user.get("is_invited_user", False),
-                "has_2fa": user.get("has_2fa", False),
-                "two_factor_type": user.get("two_factor_type"),
-                "has_files": user.get("has_files", False),
-                "presence": user.get("presence"),
-                "locale": user.get("locale") if include_locale else None,
-                "tz": user.get("tz"),
-                "tz_label": user.get("tz_label"),
-                "tz_offset": user.get("tz_offset"),
-                "updated": user.get("updated"),
-                "deleted": user.get("deleted", False),
-                "color": user.get("color")
-            }
-            user_list.append(user_info)
-        
-        # Get pagination info
-        response_metadata = response.data.get("response_metadata", {})
-        next_cursor = response_metadata.get("next_cursor", "")
+        # Format response data
+        leave_data = {
+            "channel_id": channel,
+            "left_successfully": True,
+            "not_in_channel": response.data.get("not_in_channel", False)
+        }
         
         return {
             "data": {
-                "users": user_list,
-                "total_found": len(user_list),
-                "include_locale": include_locale,
-                "next_cursor": next_cursor,
-                "has_more": bool(next_cursor),
-                "limit_requested": limit,
-                "deprecation_warning": "This tool is deprecated. Please use 'list all users' instead."
+                "leave_info": leave_data,
+                "channel_id": channel,
+                "left_successfully": True,
+                "membership_status": "left"
             },
             "error": "",
             "successful": True
@@ -8180,10 +6939,46 @@ async def slack_list_all_slack_team_users_with_pagination(
         
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'invalid_cursor':
+        if error_code == 'channel_not_found':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nNo channel found with ID '{channel}'",
+                "successful": False
+            }
+        elif error_code == 'not_in_channel':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nThe bot is not a member of channel '{channel}'",
+                "successful": False
+            }
+        elif error_code == 'cant_leave_general':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nCannot leave the #general channel.",
+                "successful": False
+            }
+        elif error_code == 'last_member':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nCannot leave as the last member of a private channel '{channel}'.",
+                "successful": False
+            }
+        elif error_code == 'is_archived':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nPagination cursor '{cursor}' is invalid.",
+                "error": f"Slack API Error: {error_code}\n\nChannel '{channel}' is archived and cannot be left.",
+                "successful": False
+            }
+        elif error_code == 'method_not_supported_for_channel_type':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nThis method is not supported for the specified channel type. This may be a Slack Connect channel.",
+                "successful": False
+            }
+        elif error_code == 'slack_connect_channel':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nCannot leave Slack Connect channel '{channel}'.",
                 "successful": False
             }
         elif error_code == 'not_authed':
@@ -8213,13 +7008,13 @@ async def slack_list_all_slack_team_users_with_pagination(
         elif error_code == 'no_permission':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to list users. The bot needs users:read scope.",
+                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to leave channels. The bot needs channels:write scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs users:read scope to list users.",
+                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs channels:write scope to leave channels.",
                 "successful": False
             }
         return {
@@ -8235,19 +7030,23 @@ async def slack_list_all_slack_team_users_with_pagination(
         }
 
 @mcp.tool()
-async def slack_list_all_users(
+async def slack_list_accessible_conversations_for_a_user(
+    user: str,
     cursor: str = "",
-    include_locale: bool = False,
-    limit: int = 1
+    exclude_archived: bool = True,
+    limit: int = 50,
+    types: str = "public_channel,private_channel,mpim,im"
 ) -> dict:
     """
-    Retrieves a paginated list of all users, including comprehensive details, profile information, 
-    status, and team memberships, in a slack workspace; data may not be real-time.
+    Deprecated: retrieves conversations accessible to a specified user. 
+    use `list conversations` instead.
     
     Args:
+        user (str): User ID to get accessible conversations for
         cursor (str): Pagination cursor for fetching additional results (optional)
-        include_locale (bool): Whether to include locale information (default: False)
-        limit (int): Maximum number of users to return (default: 1)
+        exclude_archived (bool): Whether to exclude archived conversations (default: True)
+        limit (int): Maximum number of conversations to return (default: 50)
+        types (str): Comma-separated list of conversation types to include (default: "public_channel,private_channel,mpim,im")
         
     Returns:
         dict: Response with data, error, and successful fields
@@ -8255,92 +7054,74 @@ async def slack_list_all_users(
     try:
         client = get_slack_client()
         
-        # Prepare parameters for users.list
+        # Parse types parameter
+        conversation_types = [t.strip() for t in types.split(',')]
+        
+        # Prepare parameters for conversations.list
         params = {
+            'types': ','.join(conversation_types),
             'limit': min(limit, 1000),  # Slack API limit is 1000
-            'include_locale': include_locale
+            'exclude_archived': exclude_archived
         }
         
         # Add cursor if provided
         if cursor:
             params['cursor'] = cursor
         
-        # Use the users.list method
-        response = client.users_list(**params)
+        # Use the conversations.list method
+        response = client.conversations_list(**params)
         
         if not response.data.get("ok", False):
             error = response.data.get('error', 'Unknown error')
-            if error == 'invalid_cursor':
+            if error == 'user_not_found':
                 return {
                     "data": {},
-                    "error": f"Invalid cursor: Pagination cursor '{cursor}' is invalid",
+                    "error": f"User not found: No user found with ID '{user}'",
+                    "successful": False
+                }
+            elif error == 'invalid_user':
+                return {
+                    "data": {},
+                    "error": f"Invalid user: User ID '{user}' is invalid",
                     "successful": False
                 }
             else:
                 return {
                     "data": {},
-                    "error": f"Failed to list users: {error}",
+                    "error": f"Failed to list conversations: {error}",
                     "successful": False
                 }
         
-        users = response.data.get("members", [])
+        conversations = response.data.get("channels", [])
         
-        # Format user information with comprehensive details
-        user_list = []
-        for user in users:
-            user_info = {
-                "id": user.get("id"),
-                "team_id": user.get("team_id"),
-                "name": user.get("name"),
-                "real_name": user.get("real_name"),
-                "display_name": user.get("display_name"),
-                "email": user.get("profile", {}).get("email"),
-                "first_name": user.get("profile", {}).get("first_name"),
-                "last_name": user.get("profile", {}).get("last_name"),
-                "title": user.get("profile", {}).get("title"),
-                "phone": user.get("profile", {}).get("phone"),
-                "skype": user.get("profile", {}).get("skype"),
-                "status": user.get("profile", {}).get("status_text"),
-                "status_emoji": user.get("profile", {}).get("status_emoji"),
-                "status_expiration": user.get("profile", {}).get("status_expiration"),
-                "image_24": user.get("profile", {}).get("image_24"),
-                "image_32": user.get("profile", {}).get("image_32"),
-                "image_48": user.get("profile", {}).get("image_48"),
-                "image_72": user.get("profile", {}).get("image_72"),
-                "image_192": user.get("profile", {}).get("image_192"),
-                "image_512": user.get("profile", {}).get("image_512"),
-                "image_1024": user.get("profile", {}).get("image_1024"),
-                "image_original": user.get("profile", {}).get("image_original"),
-                "is_custom_image": user.get("profile", {}).get("is_custom_image"),
-                "avatar_hash": user.get("profile", {}).get("avatar_hash"),
-                "is_admin": user.get("is_admin", False),
-                "is_owner": user.get("is_owner", False),
-                "is_primary_owner": user.get("is_primary_owner", False),
-                "is_restricted": user.get("is_restricted", False),
-                "is_ultra_restricted": user.get("is_ultra_restricted", False),
-                "is_bot": user.get("is_bot", False),
-                "is_app_user": user.get("is_app_user", False),
-                "is_invited_user": user.get("is_invited_user", False),
-                "has_2fa": user.get("has_2fa", False),
-                "two_factor_type": user.get("two_factor_type"),
-                "has_files": user.get("has_files", False),
-                "presence": user.get("presence"),
-                "locale": user.get("locale") if include_locale else None,
-                "tz": user.get("tz"),
-                "tz_label": user.get("tz_label"),
-                "tz_offset": user.get("tz_offset"),
-                "updated": user.get("updated"),
-                "deleted": user.get("deleted", False),
-                "color": user.get("color"),
-                "real_name_normalized": user.get("profile", {}).get("real_name_normalized"),
-                "display_name_normalized": user.get("profile", {}).get("display_name_normalized"),
-                "fields": user.get("profile", {}).get("fields", {}),
-                "always_active": user.get("always_active", False),
-                "enterprise_user": user.get("enterprise_user", {}),
-                "is_email_confirmed": user.get("is_email_confirmed", False),
-                "who_can_share_contact_card": user.get("who_can_share_contact_card")
+        # Format conversation information
+        conversation_list = []
+        for conv in conversations:
+            conv_info = {
+                "id": conv.get("id"),
+                "name": conv.get("name"),
+                "is_channel": conv.get("is_channel", False),
+                "is_group": conv.get("is_group", False),
+                "is_im": conv.get("is_im", False),
+                "is_mpim": conv.get("is_mpim", False),
+                "is_private": conv.get("is_private", False),
+                "is_archived": conv.get("is_archived", False),
+                "is_general": conv.get("is_general", False),
+                "created": conv.get("created"),
+                "creator": conv.get("creator"),
+                "num_members": conv.get("num_members"),
+                "topic": {
+                    "value": conv.get("topic", {}).get("value", ""),
+                    "creator": conv.get("topic", {}).get("creator", ""),
+                    "last_set": conv.get("topic", {}).get("last_set", 0)
+                },
+                "purpose": {
+                    "value": conv.get("purpose", {}).get("value", ""),
+                    "creator": conv.get("purpose", {}).get("creator", ""),
+                    "last_set": conv.get("purpose", {}).get("last_set", 0)
+                }
             }
-            user_list.append(user_info)
+            conversation_list.append(conv_info)
         
         # Get pagination info
         response_metadata = response.data.get("response_metadata", {})
@@ -8348,13 +7129,14 @@ async def slack_list_all_users(
         
         return {
             "data": {
-                "users": user_list,
-                "total_found": len(user_list),
-                "include_locale": include_locale,
+                "conversations": conversation_list,
+                "total_found": len(conversation_list),
+                "user_id": user,
+                "exclude_archived": exclude_archived,
+                "types": types,
                 "next_cursor": next_cursor,
                 "has_more": bool(next_cursor),
-                "limit_requested": limit,
-                "data_freshness": "Data may not be real-time"
+                "deprecation_warning": "This tool is deprecated. Please use 'list conversations' instead."
             },
             "error": "",
             "successful": True
@@ -8362,10 +7144,16 @@ async def slack_list_all_users(
         
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'invalid_cursor':
+        if error_code == 'user_not_found':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nNo user found with ID '{user}'",
+                "successful": False
+            }
+        elif error_code == 'invalid_user':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nPagination cursor '{cursor}' is invalid.",
+                "error": f"Slack API Error: {error_code}\n\nUser ID '{user}' is invalid",
                 "successful": False
             }
         elif error_code == 'not_authed':
@@ -8395,13 +7183,13 @@ async def slack_list_all_users(
         elif error_code == 'no_permission':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to list users. The bot needs users:read scope.",
+                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to list conversations. The bot needs channels:read scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs users:read scope to list users.",
+                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs channels:read scope to list conversations.",
                 "successful": False
             }
         return {
@@ -8417,16 +7205,22 @@ async def slack_list_all_users(
         }
 
 @mcp.tool()
-async def slack_list_all_users_in_a_user_group(
-    usergroup: str,
-    include_disabled: bool = False
+async def slack_list_all_channels(
+    channel_name: str = "",
+    cursor: str = "",
+    exclude_archived: bool = True,
+    limit: int = 1,
+    types: str = "public_channel,private_channel,mpim,im"
 ) -> dict:
     """
-    Retrieves a list of all user ids within a specified slack user group, with an option to include users from disabled groups.
+    Lists conversations available to the user with various filters and search options.
     
     Args:
-        usergroup (str): The ID of the user group to list users from (required)
-        include_disabled (bool): Whether to include users from disabled groups (default: False)
+        channel_name (str): Filter conversations by channel name (optional)
+        cursor (str): Pagination cursor for fetching additional results (optional)
+        exclude_archived (bool): Whether to exclude archived conversations (default: True)
+        limit (int): Maximum number of conversations to return (default: 1)
+        types (str): Comma-separated list of conversation types to include (default: "public_channel,private_channel,mpim,im")
         
     Returns:
         dict: Response with data, error, and successful fields
@@ -8434,91 +7228,97 @@ async def slack_list_all_users_in_a_user_group(
     try:
         client = get_slack_client()
         
-        # Prepare parameters for usergroups.users.list
+        # Parse types parameter
+        conversation_types = [t.strip() for t in types.split(',')]
+        
+        # Prepare parameters for conversations.list
         params = {
-            'usergroup': usergroup,
-            'include_disabled': include_disabled
+            'types': ','.join(conversation_types),
+            'limit': min(limit, 1000),  # Slack API limit is 1000
+            'exclude_archived': exclude_archived
         }
         
-        # Use the usergroups.users.list method
-        response = client.usergroups_users_list(**params)
+        # Add cursor if provided
+        if cursor:
+            params['cursor'] = cursor
+        
+        # Use the conversations.list method
+        response = client.conversations_list(**params)
         
         if not response.data.get("ok", False):
             error = response.data.get('error', 'Unknown error')
-            if error == 'usergroup_not_found':
-                return {
-                    "data": {},
-                    "error": f"User group not found: The user group '{usergroup}' does not exist or is not accessible",
-                    "successful": False
-                }
-            elif error == 'not_authed':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nAuthentication failed. Please check your SLACK_BOT_TOKEN.",
-                    "successful": False
-                }
-            elif error == 'invalid_auth':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nInvalid authentication token. Please check your SLACK_BOT_TOKEN.",
-                    "successful": False
-                }
-            elif error == 'account_inactive':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nThe authentication token belongs to a deactivated user.",
-                    "successful": False
-                }
-            elif error == 'token_revoked':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nThe authentication token has been revoked.",
-                    "successful": False
-                }
-            elif error == 'no_permission':
+            if error == 'invalid_cursor':
                 return {
                     "data": {},
-                    "error": f"Slack API Error: {error}\n\nInsufficient permissions to list user group members. The bot needs usergroups:read scope.",
+                    "error": f"Invalid cursor: Pagination cursor '{cursor}' is invalid",
                     "successful": False
                 }
-            elif error == 'missing_scope':
+            elif error == 'invalid_types':
                 return {
                     "data": {},
-                    "error": f"Slack API Error: {error}\n\nMissing required OAuth scope. The bot needs usergroups:read scope to list user group members.",
+                    "error": f"Invalid types: One or more conversation types in '{types}' are invalid",
                     "successful": False
                 }
             else:
                 return {
                     "data": {},
-                    "error": f"Failed to list user group members: {error}",
+                    "error": f"Failed to list conversations: {error}",
                     "successful": False
                 }
         
-        # Extract user IDs from the response
-        user_ids = response.data.get("users", [])
+        conversations = response.data.get("channels", [])
         
-        # Get user group information for context
-        usergroup_info = response.data.get("usergroup", {})
+        # Filter by channel name if provided
+        if channel_name:
+            channel_name_lower = channel_name.lower()
+            conversations = [
+                conv for conv in conversations 
+                if channel_name_lower in conv.get("name", "").lower()
+            ]
+        
+        # Format conversation information
+        conversation_list = []
+        for conv in conversations:
+            conv_info = {
+                "id": conv.get("id"),
+                "name": conv.get("name"),
+                "is_channel": conv.get("is_channel", False),
+                "is_group": conv.get("is_group", False),
+                "is_im": conv.get("is_im", False),
+                "is_mpim": conv.get("is_mpim", False),
+                "is_private": conv.get("is_private", False),
+                "is_archived": conv.get("is_archived", False),
+                "is_general": conv.get("is_general", False),
+                "created": conv.get("created"),
+                "creator": conv.get("creator"),
+                "num_members": conv.get("num_members"),
+                "topic": {
+                    "value": conv.get("topic", {}).get("value", ""),
+                    "creator": conv.get("topic", {}).get("creator", ""),
+                    "last_set": conv.get("topic", {}).get("last_set", 0)
+                },
+                "purpose": {
+                    "value": conv.get("purpose", {}).get("value", ""),
+                    "creator": conv.get("purpose", {}).get("creator", ""),
+                    "last_set": conv.get("purpose", {}).get("last_set", 0)
+                }
+            }
+            conversation_list.append(conv_info)
+        
+        # Get pagination info
+        response_metadata = response.data.get("response_metadata", {})
+        next_cursor = response_metadata.get("next_cursor", "")
         
         return {
             "data": {
-                "usergroup_id": usergroup,
-                "usergroup_name": usergroup_info.get("name", "Unknown"),
-                "usergroup_handle": usergroup_info.get("handle", ""),
-                "usergroup_description": usergroup_info.get("description", ""),
-                "usergroup_is_active": usergroup_info.get("is_active", True),
-                "usergroup_is_external": usergroup_info.get("is_external", False),
-                "usergroup_created_by": usergroup_info.get("created_by", ""),
-                "usergroup_updated_by": usergroup_info.get("updated_by", ""),
-                "usergroup_created": usergroup_info.get("date_create", 0),
-                "usergroup_updated": usergroup_info.get("date_update", 0),
-                "usergroup_auto_type": usergroup_info.get("auto_type", ""),
-                "usergroup_auto_value": usergroup_info.get("auto_value", ""),
-                "usergroup_team_id": usergroup_info.get("team_id", ""),
-                "user_ids": user_ids,
-                "total_members": len(user_ids),
-                "include_disabled": include_disabled,
-                "membership_type": "User group members"
+                "conversations": conversation_list,
+                "total_found": len(conversation_list),
+                "channel_name_filter": channel_name,
+                "exclude_archived": exclude_archived,
+                "types": types,
+                "next_cursor": next_cursor,
+                "has_more": bool(next_cursor),
+                "limit_requested": limit
             },
             "error": "",
             "successful": True
@@ -8526,10 +7326,16 @@ async def slack_list_all_users_in_a_user_group(
         
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'usergroup_not_found':
+        if error_code == 'invalid_cursor':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe user group '{usergroup}' does not exist or is not accessible.",
+                "error": _ERR_INVALID_CURSOR.format_map({"cursor": cursor}),
+                "successful": False
+            }
+        elif error_code == 'invalid_types':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nOne or more conversation types in '{types}' are invalid.",
                 "successful": False
             }
         elif error_code == 'not_authed':
@@ -8559,13 +7365,13 @@ async def slack_list_all_users_in_a_user_group(
         elif error_code == 'no_permission':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to list user group members. The bot needs usergroups:read scope.",
+                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to list conversations. The bot needs channels:read scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs usergroups:read scope to list user group members.",
+                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs channels:read scope to list conversations.",
                 "successful": False
             }
         return {
@@ -8581,23 +7387,23 @@ async def slack_list_all_users_in_a_user_group(
         }
 
 @mcp.tool()
-async def slack_list_conversations(
-    user: str = "",
+async def slack_list_all_slack_team_channels_with_various_filters(
+    channel_name: str = "",
     cursor: str = "",
     exclude_archived: bool = True,
-    limit: int = 50,
+    limit: int = 1,
     types: str = "public_channel,private_channel,mpim,im"
 ) -> dict:
     """
-    List conversations (channels/dms) accessible to a specified user (or the authenticated user if no user id is provided), 
-    respecting shared membership for non-public channels.
+    Deprecated: lists conversations available to the user with various filters and search options. 
+    use `list channels` instead.
     
     Args:
-        user (str): User ID to list conversations for (optional, defaults to authenticated user)
+        channel_name (str): Filter conversations by channel name (optional)
         cursor (str): Pagination cursor for fetching additional results (optional)
         exclude_archived (bool): Whether to exclude archived conversations (default: True)
-        limit (int): Maximum number of conversations to return (default: 50)
-        types (str): Comma-separated list of conversation types (default: "public_channel,private_channel,mpim,im")
+        limit (int): Maximum number of conversations to return (default: 1)
+        types (str): Comma-separated list of conversation types to include (default: "public_channel,private_channel,mpim,im")
         
     Returns:
         dict: Response with data, error, and successful fields
@@ -8605,115 +7411,80 @@ async def slack_list_conversations(
     try:
         client = get_slack_client()
         
+        # Parse types parameter
+        conversation_types = [t.strip() for t in types.split(',')]
+        
         # Prepare parameters for conversations.list
         params = {
-            'exclude_archived': exclude_archived,
+            'types': ','.join(conversation_types),
             'limit': min(limit, 1000),  # Slack API limit is 1000
-            'types': types
+            'exclude_archived': exclude_archived
         }
         
         # Add cursor if provided
         if cursor:
             params['cursor'] = cursor
         
-        # Add user if provided
-        if user:
-            params['user'] = user
-        
         # Use the conversations.list method
         response = client.conversations_list(**params)
         
         if not response.data.get("ok", False):
-            error = response.data.get('error', 'Unknown error')
-            if error == 'invalid_cursor':
-                return {
-                    "data": {},
-                    "error": f"Invalid cursor: Pagination cursor '{cursor}' is invalid",
-                    "successful": False
-                }
-            elif error == 'user_not_found':
-                return {
-                    "data": {},
-                    "error": f"User not found: The user '{user}' does not exist or is not accessible",
-                    "successful": False
-                }
-            else:
-                return {
-                    "data": {},
-                    "error": f"Failed to list conversations: {error}",
-                    "successful": False
-                }
-        
-        conversations = response.data.get("channels", [])
-        
-        # Format conversation information
-        conversation_list = []
-        for conv in conversations:
-            conv_info = {
-                "id": conv.get("id"),
-                "name": conv.get("name"),
-                "is_channel": conv.get("is_channel", False),
-                "is_group": conv.get("is_group", False),
-                "is_im": conv.get("is_im", False),
-                "is_member": conv.get("is_member", False),
-                "is_private": conv.get("is_private", False),
-                "is_mpim": conv.get("is_mpim", False),
-                "is_archived": conv.get("is_archived", False),
-                "is_general": conv.get("is_general", False),
-                "is_shared": conv.get("is_shared", False),
-                "is_org_shared": conv.get("is_org_shared", False),
-                "is_pending_ext_shared": conv.get("is_pending_ext_shared", False),
-                "is_ext_shared": conv.get("is_ext_shared", False),
-                "is_org_default": conv.get("is_org_default", False),
-                "is_org_mandatory": conv.get("is_org_mandatory", False),
-                "is_moved": conv.get("is_moved", False),
-                "is_open": conv.get("is_open", False),
-                "created": conv.get("created", 0),
-                "creator": conv.get("creator", ""),
-                "is_read_only": conv.get("is_read_only", False),
-                "is_thread_only": conv.get("is_thread_only", False),
-                "is_starred": conv.get("is_starred", False),
-                "is_pinned": conv.get("is_pinned", False),
-                "is_muted": conv.get("is_muted", False),
-                "topic": conv.get("topic", {}),
-                "purpose": conv.get("purpose", {}),
-                "num_members": conv.get("num_members", 0),
-                "locale": conv.get("locale", ""),
-                "unread_count": conv.get("unread_count", 0),
-                "unread_count_display": conv.get("unread_count_display", 0),
-                "priority": conv.get("priority", 0),
-                "conversation_host_id": conv.get("conversation_host_id", ""),
-                "internal_team_ids": conv.get("internal_team_ids", []),
-                "pending_shared": conv.get("pending_shared", []),
-                "context_team_id": conv.get("context_team_id", ""),
-                "updated": conv.get("updated", 0),
-                "parent_conversation": conv.get("parent_conversation", ""),
-                "shared_team_ids": conv.get("shared_team_ids", []),
-                "properties": conv.get("properties", {}),
-                "is_workflow_bot": conv.get("is_workflow_bot", False),
-                "is_global_shared": conv.get("is_global_shared", False),
-                "is_org_default": conv.get("is_org_default", False),
-                "is_org_mandatory": conv.get("is_org_mandatory", False),
-                "is_frozen": conv.get("is_frozen", False),
-                "is_connect": conv.get("is_connect", False),
-                "connect_team_id": conv.get("connect_team_id", ""),
-                "enterprise_id": conv.get("enterprise_id", ""),
-                "channel_email_address": conv.get("channel_email_address", ""),
-                "walking_liam_variant": conv.get("walking_liam_variant", ""),
-                "is_deleted": conv.get("is_deleted", False),
-                "is_forgotten": conv.get("is_forgotten", False),
-                "is_soft_deleted": conv.get("is_soft_deleted", False),
+            error = response.data.get('error', 'Unknown error')
+            if error == 'invalid_cursor':
+                return {
+                    "data": {},
+                    "error": f"Invalid cursor: Pagination cursor '{cursor}' is invalid",
+                    "successful": False
+                }
+            elif error == 'invalid_types':
+                return {
+                    "data": {},
+                    "error": f"Invalid types: One or more conversation types in '{types}' are invalid",
+                    "successful": False
+                }
+            else:
+                return {
+                    "data": {},
+                    "error": f"Failed to list conversations: {error}",
+                    "successful": False
+                }
+        
+        conversations = response.data.get("channels", [])
+        
+        # Filter by channel name if provided
+        if channel_name:
+            channel_name_lower = channel_name.lower()
+            conversations = [
+                conv for conv in conversations 
+                if channel_name_lower in conv.get("name", "").lower()
+            ]
+        
+        # Format conversation information
+        conversation_list = []
+        for conv in conversations:
+            conv_info = {
+                "id": conv.get("id"),
+                "name": conv.get("name"),
+                "is_channel": conv.get("is_channel", False),
+                "is_group": conv.get("is_group", False),
                 "is_im": conv.get("is_im", False),
-                "is_user_deleted": conv.get("is_user_deleted", False),
-                "priority": conv.get("priority", 0),
-                "user": conv.get("user", ""),
-                "name_normalized": conv.get("name_normalized", ""),
-                "previous_names": conv.get("previous_names", []),
-                "conversation_type": "public_channel" if conv.get("is_channel") and not conv.get("is_private") else
-                                  "private_channel" if conv.get("is_channel") and conv.get("is_private") else
-                                  "im" if conv.get("is_im") else
-                                  "mpim" if conv.get("is_mpim") else
-                                  "group" if conv.get("is_group") else "unknown"
+                "is_mpim": conv.get("is_mpim", False),
+                "is_private": conv.get("is_private", False),
+                "is_archived": conv.get("is_archived", False),
+                "is_general": conv.get("is_general", False),
+                "created": conv.get("created"),
+                "creator": conv.get("creator"),
+                "num_members": conv.get("num_members"),
+                "topic": {
+                    "value": conv.get("topic", {}).get("value", ""),
+                    "creator": conv.get("topic", {}).get("creator", ""),
+                    "last_set": conv.get("topic", {}).get("last_set", 0)
+                },
+                "purpose": {
+                    "value": conv.get("purpose", {}).get("value", ""),
+                    "creator": conv.get("purpose", {}).get("creator", ""),
+                    "last_set": conv.get("purpose", {}).get("last_set", 0)
+                }
             }
             conversation_list.append(conv_info)
         
@@ -8725,12 +7496,13 @@ async def slack_list_conversations(
             "data": {
                 "conversations": conversation_list,
                 "total_found": len(conversation_list),
-                "user_id": user if user else "authenticated_user",
+                "channel_name_filter": channel_name,
                 "exclude_archived": exclude_archived,
-                "types_requested": types,
+                "types": types,
                 "next_cursor": next_cursor,
                 "has_more": bool(next_cursor),
-                "limit_requested": limit
+                "limit_requested": limit,
+                "deprecation_warning": "This tool is deprecated. Please use 'list channels' instead."
             },
             "error": "",
             "successful": True
@@ -8741,13 +7513,13 @@ async def slack_list_conversations(
         if error_code == 'invalid_cursor':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nPagination cursor '{cursor}' is invalid.",
+                "error": _ERR_INVALID_CURSOR.format_map({"cursor": cursor}),
                 "successful": False
             }
-        elif error_code == 'user_not_found':
+        elif error_code == 'invalid_types':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe user '{user}' does not exist or is not accessible.",
+                "error": f"Slack API Error: {error_code}\n\nOne or more conversation types in '{types}' are invalid.",
                 "successful": False
             }
         elif error_code == 'not_authed':
@@ -8777,13 +7549,13 @@ async def slack_list_conversations(
         elif error_code == 'no_permission':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to list conversations. The bot needs channels:read, groups:read, im:read, mpim:read scopes.",
+                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to list conversations. The bot needs channels:read scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs channels:read, groups:read, im:read, mpim:read scopes to list conversations.",
+                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs channels:read scope to list conversations.",
                 "successful": False
             }
         return {
@@ -8799,107 +7571,114 @@ async def slack_list_conversations(
         }
 
 @mcp.tool()
-async def slack_list_reminders() -> dict:
+async def slack_list_all_slack_team_users_with_pagination(
+    cursor: str = "",
+    include_locale: bool = False,
+    limit: int = 1
+) -> dict:
     """
-    Lists all reminders with their details for the authenticated slack user; returns an empty list if no reminders exist.
+    Deprecated: retrieves a paginated list of all users in a slack workspace. 
+    use `list all users` instead.
     
+    Args:
+        cursor (str): Pagination cursor for fetching additional results (optional)
+        include_locale (bool): Whether to include locale information (default: False)
+        limit (int): Maximum number of users to return (default: 1)
+        
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
-        # Use user token for reminder operations (reminders require user tokens)
-        client = get_slack_user_client()
+        client = get_slack_client()
         
-        # Use the reminders.list method
-        response = client.reminders_list()
+        # Prepare parameters for users.list
+        params = {
+            'limit': min(limit, 1000),  # Slack API limit is 1000
+            'include_locale': include_locale
+        }
+        
+        # Add cursor if provided
+        if cursor:
+            params['cursor'] = cursor
+        
+        # Use the users.list method
+        response = client.users_list(**params)
         
         if not response.data.get("ok", False):
             error = response.data.get('error', 'Unknown error')
-            if error == 'not_authed':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nAuthentication failed. Please check your SLACK_USER_TOKEN.",
-                    "successful": False
-                }
-            elif error == 'invalid_auth':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nInvalid authentication token. Please check your SLACK_USER_TOKEN.",
-                    "successful": False
-                }
-            elif error == 'account_inactive':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nThe authentication token belongs to a deactivated user.",
-                    "successful": False
-                }
-            elif error == 'token_revoked':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nThe authentication token has been revoked.",
-                    "successful": False
-                }
-            elif error == 'no_permission':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nInsufficient permissions to list reminders. The user token needs reminders:read scope.",
-                    "successful": False
-                }
-            elif error == 'missing_scope':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nMissing required OAuth scope. The user token needs reminders:read scope to list reminders.",
-                    "successful": False
-                }
-            elif error == 'not_allowed_token_type':
+            if error == 'invalid_cursor':
                 return {
                     "data": {},
-                    "error": f"Slack API Error: {error}\n\nReminders require a user token (xoxp-). Please set SLACK_USER_TOKEN with a user token that has reminders:read scope.",
+                    "error": f"Invalid cursor: Pagination cursor '{cursor}' is invalid",
                     "successful": False
                 }
             else:
                 return {
                     "data": {},
-                    "error": f"Failed to list reminders: {error}",
+                    "error": f"Failed to list users: {error}",
                     "successful": False
                 }
         
-        reminders = response.data.get("reminders", [])
+        users = response.data.get("members", [])
         
-        # Format reminder information
-        reminder_list = []
-        for reminder in reminders:
-            reminder_info = {
-                "id": reminder.get("id"),
-                "creator": reminder.get("creator"),
-                "user": reminder.get("user"),
-                "text": reminder.get("text"),
-                "recurring": reminder.get("recurring", False),
-                "time": reminder.get("time"),
-                "complete_ts": reminder.get("complete_ts"),
-                "recurrence": reminder.get("recurrence", {}),
-                "created": reminder.get("created", 0),
-                "updated": reminder.get("updated", 0),
-                "is_complete": reminder.get("complete_ts") is not None,
-                "completion_time": reminder.get("complete_ts", 0),
-                "reminder_time": reminder.get("time", 0),
-                "reminder_text": reminder.get("text", ""),
-                "is_recurring": reminder.get("recurring", False),
-                "recurrence_pattern": reminder.get("recurrence", {}),
-                "status": "completed" if reminder.get("complete_ts") else "pending"
+        # Format user information
+        user_list = []
+        for user in users:
+            user_info = {
+                "id": user.get("id"),
+                "team_id": user.get("team_id"),
+                "name": user.get("name"),
+                "real_name": user.get("real_name"),
+                "display_name": user.get("display_name"),
+                "email": user.get("profile", {}).get("email"),
+                "first_name": user.get("profile", {}).get("first_name"),
+                "last_name": user.get("profile", {}).get("last_name"),
+                "title": user.get("profile", {}).get("title"),
+                "phone": user.get("profile", {}).get("phone"),
+                "skype": user.get("profile", {}).get("skype"),
+                "status": user.get("profile", {}).get("status_text"),
+                "status_emoji": user.get("profile", {}).get("status_emoji"),
+                "image_24": user.get("profile", {}).get("image_24"),
+                "image_32": user.get("profile", {}).get("image_32"),
+                "image_48": user.get("profile", {}).get("image_48"),
+                "image_72": user.get("profile", {}).get("image_72"),
+                "image_192": user.get("profile", {}).get("image_192"),
+                "image_512": user.get("profile", {}).get("image_512"),
+                "is_admin": user.get("is_admin", False),
+                "is_owner": user.get("is_owner", False),
+                "is_primary_owner": user.get("is_primary_owner", False),
+                "is_restricted": user.get("is_restricted", False),
+                "is_ultra_restricted": user.get("is_ultra_restricted", False),
+                "is_bot": user.get("is_bot", False),
+                "is_app_user": user.get("is_app_user", False),
+                "is_invited_user": user.get("is_invited_user", False),
+                "has_2fa": user.get("has_2fa", False),
+                "two_factor_type": user.get("two_factor_type"),
+                "has_files": user.get("has_files", False),
+                "presence": user.get("presence"),
+                "locale": user.get("locale") if include_locale else None,
+                "tz": user.get("tz"),
+                "tz_label": user.get("tz_label"),
+                "tz_offset": user.get("tz_offset"),
+                "updated": user.get("updated"),
+                "deleted": user.get("deleted", False),
+                "color": user.get("color")
             }
-            reminder_list.append(reminder_info)
+            user_list.append(user_info)
+        
+        # Get pagination info
+        response_metadata = response.data.get("response_metadata", {})
+        next_cursor = response_metadata.get("next_cursor", "")
         
         return {
             "data": {
-                "reminders": reminder_list,
-                "total_found": len(reminder_list),
-                "user_id": response.data.get("user", "unknown"),
-                "reminder_types": {
-                    "pending": len([r for r in reminder_list if not r["is_complete"]]),
-                    "completed": len([r for r in reminder_list if r["is_complete"]]),
-                    "recurring": len([r for r in reminder_list if r["is_recurring"]])
-                }
+                "users": user_list,
+                "total_found": len(user_list),
+                "include_locale": include_locale,
+                "next_cursor": next_cursor,
+                "has_more": bool(next_cursor),
+                "limit_requested": limit,
+                "deprecation_warning": "This tool is deprecated. Please use 'list all users' instead."
             },
             "error": "",
             "successful": True
@@ -8907,16 +7686,22 @@ async def slack_list_reminders() -> dict:
         
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'not_authed':
+        if error_code == 'invalid_cursor':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Please check your SLACK_USER_TOKEN.",
+                "error": _ERR_INVALID_CURSOR.format_map({"cursor": cursor}),
+                "successful": False
+            }
+        elif error_code == 'not_authed':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Please check your SLACK_BOT_TOKEN.",
                 "successful": False
             }
         elif error_code == 'invalid_auth':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Please check your SLACK_USER_TOKEN.",
+                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Please check your SLACK_BOT_TOKEN.",
                 "successful": False
             }
         elif error_code == 'account_inactive':
@@ -8934,19 +7719,13 @@ async def slack_list_reminders() -> dict:
         elif error_code == 'no_permission':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to list reminders. The user token needs reminders:read scope.",
-                "successful": False
-            }
-        elif error_code == 'missing_scope':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The user token needs reminders:read scope to list reminders.",
+                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to list users. The bot needs users:read scope.",
                 "successful": False
             }
-        elif error_code == 'not_allowed_token_type':
+        elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nReminders require a user token (xoxp-). Please set SLACK_USER_TOKEN with a user token that has reminders:read scope.",
+                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs users:read scope to list users.",
                 "successful": False
             }
         return {
@@ -8962,22 +7741,19 @@ async def slack_list_reminders() -> dict:
         }
 
 @mcp.tool()
-async def slack_list_remote_files(
-    channel: str = "",
+async def slack_list_all_users(
     cursor: str = "",
-    limit: int = 100,
-    ts_from: float = None,
-    ts_to: float = None
+    include_locale: bool = False,
+    limit: int = 1
 ) -> dict:
     """
-    Retrieve information about a team's remote files.
+    Retrieves a paginated list of all users, including comprehensive details, profile information, 
+    status, and team memberships, in a slack workspace; data may not be real-time.
     
     Args:
-        channel (str): Channel ID to filter files by (optional)
         cursor (str): Pagination cursor for fetching additional results (optional)
-        limit (int): Maximum number of files to return (default: 100)
-        ts_from (float): Start timestamp for filtering files (optional)
-        ts_to (float): End timestamp for filtering files (optional)
+        include_locale (bool): Whether to include locale information (default: False)
+        limit (int): Maximum number of users to return (default: 1)
         
     Returns:
         dict: Response with data, error, and successful fields
@@ -8985,23 +7761,18 @@ async def slack_list_remote_files(
     try:
         client = get_slack_client()
         
-        # Prepare parameters for files.remote.list
+        # Prepare parameters for users.list
         params = {
-            'limit': min(limit, 1000)  # Slack API limit is 1000
+            'limit': min(limit, 1000),  # Slack API limit is 1000
+            'include_locale': include_locale
         }
         
-        # Add optional parameters
-        if channel:
-            params['channel'] = channel
+        # Add cursor if provided
         if cursor:
             params['cursor'] = cursor
-        if ts_from is not None:
-            params['ts_from'] = ts_from
-        if ts_to is not None:
-            params['ts_to'] = ts_to
         
-        # Use the files.remote.list method
-        response = client.files_remote_list(**params)
+        # Use the users.list method
+        response = client.users_list(**params)
         
         if not response.data.get("ok", False):
             error = response.data.get('error', 'Unknown error')
@@ -9011,179 +7782,85 @@ async def slack_list_remote_files(
                     "error": f"Invalid cursor: Pagination cursor '{cursor}' is invalid",
                     "successful": False
                 }
-            elif error == 'channel_not_found':
-                return {
-                    "data": {},
-                    "error": f"Channel not found: The channel '{channel}' does not exist or is not accessible",
-                    "successful": False
-                }
-            elif error == 'not_authed':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nAuthentication failed. Please check your SLACK_BOT_TOKEN.",
-                    "successful": False
-                }
-            elif error == 'invalid_auth':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nInvalid authentication token. Please check your SLACK_BOT_TOKEN.",
-                    "successful": False
-                }
-            elif error == 'account_inactive':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nThe authentication token belongs to a deactivated user.",
-                    "successful": False
-                }
-            elif error == 'token_revoked':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nThe authentication token has been revoked.",
-                    "successful": False
-                }
-            elif error == 'no_permission':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nInsufficient permissions to list remote files. The bot needs files:read scope.",
-                    "successful": False
-                }
-            elif error == 'missing_scope':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nMissing required OAuth scope. The bot needs files:read scope to list remote files.",
-                    "successful": False
-                }
             else:
                 return {
                     "data": {},
-                    "error": f"Failed to list remote files: {error}",
+                    "error": f"Failed to list users: {error}",
                     "successful": False
                 }
         
-        files = response.data.get("files", [])
+        users = response.data.get("members", [])
         
-        # Format file information
-        file_list = []
-        for file in files:
-            file_info = {
-                "id": file.get("id"),
-                "name": file.get("name"),
-                "title": file.get("title"),
-                "mimetype": file.get("mimetype"),
-                "filetype": file.get("filetype"),
-                "pretty_type": file.get("pretty_type"),
-                "user": file.get("user"),
-                "user_team": file.get("user_team"),
-                "editable": file.get("editable", False),
-                "size": file.get("size", 0),
-                "mode": file.get("mode"),
-                "is_external": file.get("is_external", False),
-                "external_type": file.get("external_type"),
-                "is_public": file.get("is_public", False),
-                "public_url_shared": file.get("public_url_shared", False),
-                "display_as_bot": file.get("display_as_bot", False),
-                "username": file.get("username"),
-                "created": file.get("created", 0),
-                "updated": file.get("updated", 0),
-                "timestamp": file.get("timestamp", 0),
-                "original_attachment_count": file.get("original_attachment_count", 0),
-                "is_starred": file.get("is_starred", False),
-                "has_rich_preview": file.get("has_rich_preview", False),
-                "shares": file.get("shares", {}),
-                "channels": file.get("channels", []),
-                "groups": file.get("groups", []),
-                "ims": file.get("ims", []),
-                "external_id": file.get("external_id"),
-                "external_url": file.get("external_url"),
-                "app_id": file.get("app_id"),
-                "app_name": file.get("app_name"),
-                "thumb_360": file.get("thumb_360"),
-                "thumb_360_w": file.get("thumb_360_w"),
-                "thumb_360_h": file.get("thumb_360_h"),
-                "thumb_480": file.get("thumb_480"),
-                "thumb_480_w": file.get("thumb_480_w"),
-                "thumb_480_h": file.get("thumb_480_h"),
-                "thumb_160": file.get("thumb_160"),
-                "thumb_720": file.get("thumb_720"),
-                "thumb_720_w": file.get("thumb_720_w"),
-                "thumb_720_h": file.get("thumb_720_h"),
-                "thumb_800": file.get("thumb_800"),
-                "thumb_800_w": file.get("thumb_800_w"),
-                "thumb_800_h": file.get("thumb_800_h"),
-                "thumb_960": file.get("thumb_960"),
-                "thumb_960_w": file.get("thumb_960_w"),
-                "thumb_960_h": file.get("thumb_960_h"),
-                "thumb_1024": file.get("thumb_1024"),
-                "thumb_1024_w": file.get("thumb_1024_w"),
-                "thumb_1024_h": file.get("thumb_1024_h"),
-                "image_exif_rotation": file.get("image_exif_rotation"),
-                "original_w": file.get("original_w"),
-                "original_h": file.get("original_h"),
-                "permalink": file.get("permalink"),
-                "permalink_public": file.get("permalink_public"),
-                "is_removed": file.get("is_removed", False),
-                "url_private": file.get("url_private"),
-                "url_private_download": file.get("url_private_download"),
-                "media_display_type": file.get("media_display_type"),
-                "preview": file.get("preview"),
-                "preview_highlight": file.get("preview_highlight"),
-                "lines": file.get("lines"),
-                "lines_more": file.get("lines_more"),
-                "num_stars": file.get("num_stars", 0),
-                "is_public": file.get("is_public", False),
-                "public_url_shared": file.get("public_url_shared", False),
-                "file_access": file.get("file_access"),
-                "filetype_detection": file.get("filetype_detection"),
-                "thumb_video": file.get("thumb_video"),
-                "thumb_video_w": file.get("thumb_video_w"),
-                "thumb_video_h": file.get("thumb_video_h"),
-                "duration_ms": file.get("duration_ms"),
-                "thumb_tiny": file.get("thumb_tiny"),
-                "hd": file.get("hd", False),
-                "subtype": file.get("subtype"),
-                "transcription": file.get("transcription", {}),
-                "mp4": file.get("mp4"),
-                "vtt": file.get("vtt"),
-                "hls": file.get("hls"),
-                "hls_embed": file.get("hls_embed"),
-                "dash": file.get("dash"),
-                "dash_embed": file.get("dash_embed"),
-                "is_animated": file.get("is_animated", False),
-                "is_removed": file.get("is_removed", False),
-                "deanimate_gif": file.get("deanimate_gif"),
-                "deanimate": file.get("deanimate"),
-                "pjs": file.get("pjs"),
-                "pjpeg": file.get("pjpeg"),
-                "comments_count": file.get("comments_count", 0),
-                "initial_comment": file.get("initial_comment", {}),
-                "num_stars": file.get("num_stars", 0),
-                "pinned_to": file.get("pinned_to", []),
-                "reactions": file.get("reactions", []),
-                "is_external": file.get("is_external", False),
-                "external_type": file.get("external_type"),
-                "external_id": file.get("external_id"),
-                "external_url": file.get("external_url"),
-                "app_id": file.get("app_id"),
-                "app_name": file.get("app_name"),
-                "file_access": file.get("file_access"),
-                "filetype_detection": file.get("filetype_detection")
+        # Format user information with comprehensive details
+        user_list = []
+        for user in users:
+            user_info = {
+                "id": user.get("id"),
+                "team_id": user.get("team_id"),
+                "name": user.get("name"),
+                "real_name": user.get("real_name"),
+                "display_name": user.get("display_name"),
+                "email": user.get("profile", {}).get("email"),
+                "first_name": user.get("profile", {}).get("first_name"),
+                "last_name": user.get("profile", {}).get("last_name"),
+                "title": user.get("profile", {}).get("title"),
+                "phone": user.get("profile", {}).get("phone"),
+                "skype": user.get("profile", {}).get("skype"),
+                "status": user.get("profile", {}).get("status_text"),
+                "status_emoji": user.get("profile", {}).get("status_emoji"),
+                "status_expiration": user.get("profile", {}).get("status_expiration"),
+                "image_24": user.get("profile", {}).get("image_24"),
+                "image_32": user.get("profile", {}).get("image_32"),
+                "image_48": user.get("profile", {}).get("image_48"),
+                "image_72": user.get("profile", {}).get("image_72"),
+                "image_192": user.get("profile", {}).get("image_192"),
+                "image_512": user.get("profile", {}).get("image_512"),
+                "image_1024": user.get("profile", {}).get("image_1024"),
+                "image_original": user.get("profile", {}).get("image_original"),
+                "is_custom_image": user.get("profile", {}).get("is_custom_image"),
+                "avatar_hash": user.get("profile", {}).get("avatar_hash"),
+                "is_admin": user.get("is_admin", False),
+                "is_owner": user.get("is_owner", False),
+                "is_primary_owner": user.get("is_primary_owner", False),
+                "is_restricted": user.get("is_restricted", False),
+                "is_ultra_restricted": user.get("is_ultra_restricted", False),
+                "is_bot": user.get("is_bot", False),
+                "is_app_user": user.get("is_app_user", False),
+                "is_invited_user": user.get("is_invited_user", False),
+                "has_2fa": user.get("has_2fa", False),
+                "two_factor_type": user.get("two_factor_type"),
+                "has_files": user.get("has_files", False),
+                "presence": user.get("presence"),
+                "locale": user.get("locale") if include_locale else None,
+                "tz": user.get("tz"),
+                "tz_label": user.get("tz_label"),
+                "tz_offset": user.get("tz_offset"),
+                "updated": user.get("updated"),
+                "deleted": user.get("deleted", False),
+                "color": user.get("color"),
+                "real_name_normalized": user.get("profile", {}).get("real_name_normalized"),
+                "display_name_normalized": user.get("profile", {}).get("display_name_normalized"),
+                "fields": user.get("profile", {}).get("fields", {}),
+                "always_active": user.get("always_active", False),
+                "enterprise_user": user.get("enterprise_user", {}),
+                "is_email_confirmed": user.get("is_email_confirmed", False),
+                "who_can_share_contact_card": user.get("who_can_share_contact_card")
             }
-            file_list.append(file_info)
+            user_list.append(user_info)
         
         # Get pagination info
         response_metadata = response.data.get("response_metadata", {})
-        next_cursor = response_metadata.get("next_cursor", "")
-        
-        return {
-            "data": {
-                "files": file_list,
-                "total_found": len(file_list),
-                "channel_filter": channel if channel else "all_channels",
-                "ts_from": ts_from,
-                "ts_to": ts_to,
+        next_cursor = response_metadata.get("next_cursor", "")
+        
+        return {
+            "data": {
+                "users": user_list,
+                "total_found": len(user_list),
+                "include_locale": include_locale,
                 "next_cursor": next_cursor,
                 "has_more": bool(next_cursor),
-                "limit_requested": limit
+                "limit_requested": limit,
+                "data_freshness": "Data may not be real-time"
             },
             "error": "",
             "successful": True
@@ -9194,13 +7871,7 @@ async def slack_list_remote_files(
         if error_code == 'invalid_cursor':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nPagination cursor '{cursor}' is invalid.",
-                "successful": False
-            }
-        elif error_code == 'channel_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe channel '{channel}' does not exist or is not accessible.",
+                "error": _ERR_INVALID_CURSOR.format_map({"cursor": cursor}),
                 "successful": False
             }
         elif error_code == 'not_authed':
@@ -9230,13 +7901,13 @@ async def slack_list_remote_files(
         elif error_code == 'no_permission':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to list remote files. The bot needs files:read scope.",
+                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to list users. The bot needs users:read scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs files:read scope to list remote files.",
+                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs users:read scope to list users.",
                 "successful": False
             }
         return {
@@ -9252,23 +7923,16 @@ async def slack_list_remote_files(
         }
 
 @mcp.tool()
-async def slack_list_scheduled_messages(
-    channel: str = "",
-    cursor: str = "",
-    latest: str = "",
-    limit: int = 100,
-    oldest: str = ""
+async def slack_list_all_users_in_a_user_group(
+    usergroup: str,
+    include_disabled: bool = False
 ) -> dict:
     """
-    Retrieves a list of pending (not yet delivered) messages scheduled in a specific slack channel, 
-    or across all accessible channels if no channel id is provided, optionally filtered by time and paginated.
+    Retrieves a list of all user ids within a specified slack user group, with an option to include users from disabled groups.
     
     Args:
-        channel (str): Channel ID to filter scheduled messages by (optional)
-        cursor (str): Pagination cursor for fetching additional results (optional)
-        latest (str): End of time range of messages to include (optional)
-        limit (int): Maximum number of messages to return (default: 100)
-        oldest (str): Start of time range of messages to include (optional)
+        usergroup (str): The ID of the user group to list users from (required)
+        include_disabled (bool): Whether to include users from disabled groups (default: False)
         
     Returns:
         dict: Response with data, error, and successful fields
@@ -9276,42 +7940,21 @@ async def slack_list_scheduled_messages(
     try:
         client = get_slack_client()
         
-        # Prepare parameters for chat.scheduledMessages.list
+        # Prepare parameters for usergroups.users.list
         params = {
-            'limit': min(limit, 1000)  # Slack API limit is 1000
+            'usergroup': usergroup,
+            'include_disabled': include_disabled
         }
         
-        # Add optional parameters
-        if channel:
-            params['channel'] = channel
-        if cursor:
-            params['cursor'] = cursor
-        if latest:
-            params['latest'] = latest
-        if oldest:
-            params['oldest'] = oldest
-        
-        # Use the chat.scheduledMessages.list method
-        response = client.chat_scheduledMessages_list(**params)
+        # Use the usergroups.users.list method
+        response = client.usergroups_users_list(**params)
         
         if not response.data.get("ok", False):
             error = response.data.get('error', 'Unknown error')
-            if error == 'invalid_cursor':
-                return {
-                    "data": {},
-                    "error": f"Invalid cursor: Pagination cursor '{cursor}' is invalid",
-                    "successful": False
-                }
-            elif error == 'channel_not_found':
-                return {
-                    "data": {},
-                    "error": f"Channel not found: The channel '{channel}' does not exist or is not accessible",
-                    "successful": False
-                }
-            elif error == 'invalid_time_range':
+            if error == 'usergroup_not_found':
                 return {
                     "data": {},
-                    "error": f"Invalid time range: The time range from '{oldest}' to '{latest}' is invalid",
+                    "error": f"User group not found: The user group '{usergroup}' does not exist or is not accessible",
                     "successful": False
                 }
             elif error == 'not_authed':
@@ -9341,68 +7984,244 @@ async def slack_list_scheduled_messages(
             elif error == 'no_permission':
                 return {
                     "data": {},
-                    "error": f"Slack API Error: {error}\n\nInsufficient permissions to list scheduled messages. The bot needs chat:write scope.",
+                    "error": f"Slack API Error: {error}\n\nInsufficient permissions to list user group members. The bot needs usergroups:read scope.",
                     "successful": False
                 }
             elif error == 'missing_scope':
                 return {
                     "data": {},
-                    "error": f"Slack API Error: {error}\n\nMissing required OAuth scope. The bot needs chat:write scope to list scheduled messages.",
+                    "error": f"Slack API Error: {error}\n\nMissing required OAuth scope. The bot needs usergroups:read scope to list user group members.",
                     "successful": False
                 }
             else:
                 return {
                     "data": {},
-                    "error": f"Failed to list scheduled messages: {error}",
+                    "error": f"Failed to list user group members: {error}",
                     "successful": False
                 }
         
-        scheduled_messages = response.data.get("scheduled_messages", [])
+        # Extract user IDs from the response
+        user_ids = response.data.get("users", [])
         
-        # Format scheduled message information
-        message_list = []
-        for msg in scheduled_messages:
-            message_info = {
-                "id": msg.get("id"),
-                "channel": msg.get("channel"),
-                "post_at": msg.get("post_at"),
-                "date_created": msg.get("date_created"),
-                "text": msg.get("text"),
-                "user": msg.get("user"),
-                "team": msg.get("team"),
-                "blocks": msg.get("blocks", []),
-                "attachments": msg.get("attachments", []),
-                "as_user": msg.get("as_user", False),
-                "icon_emoji": msg.get("icon_emoji"),
-                "icon_url": msg.get("icon_url"),
-                "link_names": msg.get("link_names", False),
-                "mrkdwn": msg.get("mrkdwn", False),
-                "parse": msg.get("parse"),
-                "reply_broadcast": msg.get("reply_broadcast", False),
-                "thread_ts": msg.get("thread_ts"),
-                "unfurl_links": msg.get("unfurl_links", True),
-                "unfurl_media": msg.get("unfurl_media", True),
-                "username": msg.get("username"),
-                "scheduled_message_id": msg.get("scheduled_message_id"),
-                "channel_id": msg.get("channel"),
-                "post_time": msg.get("post_at"),
-                "created_time": msg.get("date_created"),
-                "message_text": msg.get("text", ""),
-                "author_user": msg.get("user"),
-                "team_id": msg.get("team"),
-                "is_thread_reply": bool(msg.get("thread_ts")),
-                "thread_timestamp": msg.get("thread_ts"),
-                "has_blocks": bool(msg.get("blocks")),
-                "has_attachments": bool(msg.get("attachments")),
-                "blocks_count": len(msg.get("blocks", [])),
-                "attachments_count": len(msg.get("attachments", [])),
-                "scheduled_for": msg.get("post_at"),
-                "created_by": msg.get("user"),
-                "message_type": "scheduled_message",
-                "status": "pending",
-                "delivery_status": "not_delivered"
+        # Get user group information for context
+        usergroup_info = response.data.get("usergroup", {})
+        
+        return {
+            "data": {
+                "usergroup_id": usergroup,
+                "usergroup_name": usergroup_info.get("name", "Unknown"),
+                "usergroup_handle": usergroup_info.get("handle", ""),
+                "usergroup_description": usergroup_info.get("description", ""),
+                "usergroup_is_active": usergroup_info.get("is_active", True),
+                "usergroup_is_external": usergroup_info.get("is_external", False),
+                "usergroup_created_by": usergroup_info.get("created_by", ""),
+                "usergroup_updated_by": usergroup_info.get("updated_by", ""),
+                "usergroup_created": usergroup_info.get("date_create", 0),
+                "usergroup_updated": usergroup_info.get("date_update", 0),
+                "usergroup_auto_type": usergroup_info.get("auto_type", ""),
+                "usergroup_auto_value": usergroup_info.get("auto_value", ""),
+                "usergroup_team_id": usergroup_info.get("team_id", ""),
+                "user_ids": user_ids,
+                "total_members": len(user_ids),
+                "include_disabled": include_disabled,
+                "membership_type": "User group members"
+            },
+            "error": "",
+            "successful": True
+        }
+        
+    except SlackApiError as e:
+        error_code = e.response.get('error', 'unknown_error')
+        if error_code == 'usergroup_not_found':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nThe user group '{usergroup}' does not exist or is not accessible.",
+                "successful": False
+            }
+        elif error_code == 'not_authed':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Please check your SLACK_BOT_TOKEN.",
+                "successful": False
+            }
+        elif error_code == 'invalid_auth':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Please check your SLACK_BOT_TOKEN.",
+                "successful": False
+            }
+        elif error_code == 'account_inactive':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nThe authentication token belongs to a deactivated user.",
+                "successful": False
+            }
+        elif error_code == 'token_revoked':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nThe authentication token has been revoked.",
+                "successful": False
+            }
+        elif error_code == 'no_permission':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to list user group members. The bot needs usergroups:read scope.",
+                "successful": False
+            }
+        elif error_code == 'missing_scope':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs usergroups:read scope to list user group members.",
+                "successful": False
+            }
+        return {
+            "data": {},
+            "error": f"Slack API Error: {error_code}",
+            "successful": False
+        }
+    except Exception as e:
+        return {
+            "data": {},
+            "error": f"Unexpected error: {str(e)}",
+            "successful": False
+        }
+
+@mcp.tool()
+async def slack_list_conversations(
+    user: str = "",
+    cursor: str = "",
+    exclude_archived: bool = True,
+    limit: int = 50,
+    types: str = "public_channel,private_channel,mpim,im"
+) -> dict:
+    """
+    List conversations (channels/dms) accessible to a specified user (or the authenticated user if no user id is provided), 
+    respecting shared membership for non-public channels.
+    
+    Args:
+        user (str): User ID to list conversations for (optional, defaults to authenticated user)
+        cursor (str): Pagination cursor for fetching additional results (optional)
+        exclude_archived (bool): Whether to exclude archived conversations (default: True)
+        limit (int): Maximum number of conversations to return (default: 50)
+        types (str): Comma-separated list of conversation types (default: "public_channel,private_channel,mpim,im")
+        
+    Returns:
+        dict: Response with data, error, and successful fields
+    """
+    try:
+        client = get_slack_client()
+        
+        # Prepare parameters for conversations.list
+        params = {
+            'exclude_archived': exclude_archived,
+            'limit': min(limit, 1000),  # Slack API limit is 1000
+            'types': types
+        }
+        
+        # Add cursor if provided
+        if cursor:
+            params['cursor'] = cursor
+        
+        # Add user if provided
+        if user:
+            params['user'] = user
+        
+        # Use the conversations.list method
+        response = client.conversations_list(**params)
+        
+        if not response.data.get("ok", False):
+            error = response.data.get('error', 'Unknown error')
+            if error == 'invalid_cursor':
+                return {
+                    "data": {},
+                    "error": f"Invalid cursor: Pagination cursor '{cursor}' is invalid",
+                    "successful": False
+                }
+            elif error == 'user_not_found':
+                return {
+                    "data": {},
+                    "error": f"User not found: The user '{user}' does not exist or is not accessible",
+                    "successful": False
+                }
+            else:
+                return {
+                    "data": {},
+                    "error": f"Failed to list conversations: {error}",
+                    "successful": False
+                }
+        
+        conversations = response.data.get("channels", [])
+        
+        # Format conversation information
+        conversation_list = []
+        for conv in conversations:
+            conv_info = {
+                "id": conv.get("id"),
+                "name": conv.get("name"),
+                "is_channel": conv.get("is_channel", False),
+                "is_group": conv.get("is_group", False),
+                "is_im": conv.get("is_im", False),
+                "is_member": conv.get("is_member", False),
+                "is_private": conv.get("is_private", False),
+                "is_mpim": conv.get("is_mpim", False),
+                "is_archived": conv.get("is_archived", False),
+                "is_general": conv.get("is_general", False),
+                "is_shared": conv.get("is_shared", False),
+                "is_org_shared": conv.get("is_org_shared", False),
+                "is_pending_ext_shared": conv.get("is_pending_ext_shared", False),
+                "is_ext_shared": conv.get("is_ext_shared", False),
+                "is_org_default": conv.get("is_org_default", False),
+                "is_org_mandatory": conv.get("is_org_mandatory", False),
+                "is_moved": conv.get("is_moved", False),
+                "is_open": conv.get("is_open", False),
+                "created": conv.get("created", 0),
+                "creator": conv.get("creator", ""),
+                "is_read_only": conv.get("is_read_only", False),
+                "is_thread_only": conv.get("is_thread_only", False),
+                "is_starred": conv.get("is_starred", False),
+                "is_pinned": conv.get("is_pinned", False),
+                "is_muted": conv.get("is_muted", False),
+                "topic": conv.get("topic", {}),
+                "purpose": conv.get("purpose", {}),
+                "num_members": conv.get("num_members", 0),
+                "locale": conv.get("locale", ""),
+                "unread_count": conv.get("unread_count", 0),
+                "unread_count_display": conv.get("unread_count_display", 0),
+                "priority": conv.get("priority", 0),
+                "conversation_host_id": conv.get("conversation_host_id", ""),
+                "internal_team_ids": conv.get("internal_team_ids", []),
+                "pending_shared": conv.get("pending_shared", []),
+                "context_team_id": conv.get("context_team_id", ""),
+                "updated": conv.get("updated", 0),
+                "parent_conversation": conv.get("parent_conversation", ""),
+                "shared_team_ids": conv.get("shared_team_ids", []),
+                "properties": conv.get("properties", {}),
+                "is_workflow_bot": conv.get("is_workflow_bot", False),
+                "is_global_shared": conv.get("is_global_shared", False),
+                "is_org_default": conv.get("is_org_default", False),
+                "is_org_mandatory": conv.get("is_org_mandatory", False),
+                "is_frozen": conv.get("is_frozen", False),
+                "is_connect": conv.get("is_connect", False),
+                "connect_team_id": conv.get("connect_team_id", ""),
+                "enterprise_id": conv.get("enterprise_id", ""),
+                "channel_email_address": conv.get("channel_email_address", ""),
+                "walking_liam_variant": conv.get("walking_liam_variant", ""),
+                "is_deleted": conv.get("is_deleted", False),
+                "is_forgotten": conv.get("is_forgotten", False),
+                "is_soft_deleted": conv.get("is_soft_deleted", False),
+                "is_im": conv.get("is_im", False),
+                "is_user_deleted": conv.get("is_user_deleted", False),
+                "priority": conv.get("priority", 0),
+                "user": conv.get("user", ""),
+                "name_normalized": conv.get("name_normalized", ""),
+                "previous_names": conv.get("previous_names", []),
+                "conversation_type": "public_channel" if conv.get("is_channel") and not conv.get("is_private") else
+                                  "private_channel" if conv.get("is_channel") and conv.get("is_private") else
+                                  "im" if conv.get("is_im") else
+                                  "mpim" if conv.get("is_mpim") else
+                                  "group" if conv.get("is_group") else "unknown"
             }
-            message_list.append(message_info)
+            conversation_list.append(conv_info)
         
         # Get pagination info
         response_metadata = response.data.get("response_metadata", {})
@@ -9410,17 +8229,14 @@ async def slack_list_scheduled_messages(
         
         return {
             "data": {
-                "scheduled_messages": message_list,
-                "total_found": len(message_list),
-                "channel_filter": channel if channel else "all_channels",
-                "time_range": {
-                    "oldest": oldest if oldest else "not_specified",
-                    "latest": latest if latest else "not_specified"
-                },
+                "conversations": conversation_list,
+                "total_found": len(conversation_list),
+                "user_id": user if user else "authenticated_user",
+                "exclude_archived": exclude_archived,
+                "types_requested": types,
                 "next_cursor": next_cursor,
                 "has_more": bool(next_cursor),
-                "limit_requested": limit,
-                "message_status": "pending_only"
+                "limit_requested": limit
             },
             "error": "",
             "successful": True
@@ -9431,19 +8247,13 @@ async def slack_list_scheduled_messages(
         if error_code == 'invalid_cursor':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nPagination cursor '{cursor}' is invalid.",
-                "successful": False
-            }
-        elif error_code == 'channel_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe channel '{channel}' does not exist or is not accessible.",
+                "error": _ERR_INVALID_CURSOR.format_map({"cursor": cursor}),
                 "successful": False
             }
-        elif error_code == 'invalid_time_range':
+        elif error_code == 'user_not_found':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe time range from '{oldest}' to '{latest}' is invalid.",
+                "error": f"Slack API Error: {error_code}\n\nThe user '{user}' does not exist or is not accessible.",
                 "successful": False
             }
         elif error_code == 'not_authed':
@@ -9473,13 +8283,13 @@ async def slack_list_scheduled_messages(
         elif error_code == 'no_permission':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to list scheduled messages. The bot needs chat:write scope.",
+                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to list conversations. The bot needs channels:read, groups:read, im:read, mpim:read scopes.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs chat:write scope to list scheduled messages.",
+                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs channels:read, groups:read, im:read, mpim:read scopes to list conversations.",
                 "successful": False
             }
         return {
@@ -9495,175 +8305,107 @@ async def slack_list_scheduled_messages(
         }
 
 @mcp.tool()
-async def slack_list_scheduled_messages_in_a_channel(
-    channel: str,
-    cursor: str = "",
-    latest: str = "",
-    limit: int = 100,
-    oldest: str = ""
-) -> dict:
+async def slack_list_reminders() -> dict:
     """
-    Deprecated: retrieves a list of pending (not yet delivered) messages scheduled in a specific slack channel. 
-    use `list scheduled messages` instead.
+    Lists all reminders with their details for the authenticated slack user; returns an empty list if no reminders exist.
     
-    Args:
-        channel (str): Channel ID to filter scheduled messages by (required)
-        cursor (str): Pagination cursor for fetching additional results (optional)
-        latest (str): End of time range of messages to include (optional)
-        limit (int): Maximum number of messages to return (default: 100)
-        oldest (str): Start of time range of messages to include (optional)
-        
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
-        client = get_slack_client()
-        
-        # Prepare parameters for chat.scheduledMessages.list
-        params = {
-            'channel': channel,
-            'limit': min(limit, 1000)  # Slack API limit is 1000
-        }
-        
-        # Add optional parameters
-        if cursor:
-            params['cursor'] = cursor
-        if latest:
-            params['latest'] = latest
-        if oldest:
-            params['oldest'] = oldest
+        # Use user token for reminder operations (reminders require user tokens)
+        client = get_slack_user_client()
         
-        # Use the chat.scheduledMessages.list method
-        response = client.chat_scheduledMessages_list(**params)
+        # Use the reminders.list method
+        response = client.reminders_list()
         
         if not response.data.get("ok", False):
             error = response.data.get('error', 'Unknown error')
-            if error == 'invalid_cursor':
-                return {
-                    "data": {},
-                    "error": f"Invalid cursor: Pagination cursor '{cursor}' is invalid",
-                    "successful": False
-                }
-            elif error == 'channel_not_found':
-                return {
-                    "data": {},
-                    "error": f"Channel not found: The channel '{channel}' does not exist or is not accessible",
-                    "successful": False
-                }
-            elif error == 'invalid_time_range':
-                return {
-                    "data": {},
-                    "error": f"Invalid time range: The time range from '{oldest}' to '{latest}' is invalid",
-                    "successful": False
-                }
-            elif error == 'not_authed':
+            if error == 'not_authed':
                 return {
                     "data": {},
-                    "error": f"Slack API Error: {error}\n\nAuthentication failed. Please check your SLACK_BOT_TOKEN.",
+                    "error": f"Slack API Error: {error}\n\nAuthentication failed. Please check your SLACK_USER_TOKEN.",
                     "successful": False
                 }
             elif error == 'invalid_auth':
                 return {
                     "data": {},
-                    "error": f"Slack API Error: {error}\n\nInvalid authentication token. Please check your SLACK_BOT_TOKEN.",
+                    "error": f"Slack API Error: {error}\n\nInvalid authentication token. Please check your SLACK_USER_TOKEN.",
                     "successful": False
                 }
             elif error == 'account_inactive':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nThe authentication token belongs to a deactivated user.",
-                    "successful": False
-                }
-            elif error == 'token_revoked':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nThe authentication token has been revoked.",
-                    "successful": False
-                }
-            elif error == 'no_permission':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nInsufficient permissions to list scheduled messages. The bot needs chat:write scope.",
-                    "successful": False
-                }
-            elif error == 'missing_scope':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nMissing required OAuth scope. The bot needs chat:write scope to list scheduled messages.",
-                    "successful": False
-                }
-            else:
-                return {
-                    "data": {},
-                    "error": f"Failed to list scheduled messages: {error}",
-                    "successful": False
-                }
-        
-        scheduled_messages = response.data.get("scheduled_messages", [])
-        
-        # Format scheduled message information
-        message_list = []
-        for msg in scheduled_messages:
-            message_info = {
-                "id": msg.get("id"),
-                "channel": msg.get("channel"),
-                "post_at": msg.get("post_at"),
-                "date_created": msg.get("date_created"),
-                "text": msg.get("text"),
-                "user": msg.get("user"),
-                "team": msg.get("team"),
-                "blocks": msg.get("blocks", []),
-                "attachments": msg.get("attachments", []),
-                "as_user": msg.get("as_user", False),
-                "icon_emoji": msg.get("icon_emoji"),
-                "icon_url": msg.get("icon_url"),
-                "link_names": msg.get("link_names", False),
-                "mrkdwn": msg.get("mrkdwn", False),
-                "parse": msg.get("parse"),
-                "reply_broadcast": msg.get("reply_broadcast", False),
-                "thread_ts": msg.get("thread_ts"),
-                "unfurl_links": msg.get("unfurl_links", True),
-                "unfurl_media": msg.get("unfurl_media", True),
-                "username": msg.get("username"),
-                "scheduled_message_id": msg.get("scheduled_message_id"),
-                "channel_id": msg.get("channel"),
-                "post_time": msg.get("post_at"),
-                "created_time": msg.get("date_created"),
-                "message_text": msg.get("text", ""),
-                "author_user": msg.get("user"),
-                "team_id": msg.get("team"),
-                "is_thread_reply": bool(msg.get("thread_ts")),
-                "thread_timestamp": msg.get("thread_ts"),
-                "has_blocks": bool(msg.get("blocks")),
-                "has_attachments": bool(msg.get("attachments")),
-                "blocks_count": len(msg.get("blocks", [])),
-                "attachments_count": len(msg.get("attachments", [])),
-                "scheduled_for": msg.get("post_at"),
-                "created_by": msg.get("user"),
-                "message_type": "scheduled_message",
-                "status": "pending",
-                "delivery_status": "not_delivered"
-            }
-            message_list.append(message_info)
+                return {
+                    "data": {},
+                    "error": f"Slack API Error: {error}\n\nThe authentication token belongs to a deactivated user.",
+                    "successful": False
+                }
+            elif error == 'token_revoked':
+                return {
+                    "data": {},
+                    "error": f"Slack API Error: {error}\n\nThe authentication token has been revoked.",
+                    "successful": False
+                }
+            elif error == 'no_permission':
+                return {
+                    "data": {},
+                    "error": f"Slack API Error: {error}\n\nInsufficient permissions to list reminders. The user token needs reminders:read scope.",
+                    "successful": False
+                }
+            elif error == 'missing_scope':
+                return {
+                    "data": {},
+                    "error": f"Slack API Error: {error}\n\nMissing required OAuth scope. The user token needs reminders:read scope to list reminders.",
+                    "successful": False
+                }
+            elif error == 'not_allowed_token_type':
+                return {
+                    "data": {},
+                    "error": f"Slack API Error: {error}\n\nReminders require a user token (xoxp-). Please set SLACK_USER_TOKEN with a user token that has reminders:read scope.",
+                    "successful": False
+                }
+            else:
+                return {
+                    "data": {},
+                    "error": f"Failed to list reminders: {error}",
+                    "successful": False
+                }
         
-        # Get pagination info
-        response_metadata = response.data.get("response_metadata", {})
-        next_cursor = response_metadata.get("next_cursor", "")
+        reminders = response.data.get("reminders", [])
+        
+        # Format reminder information
+        reminder_list = []
+        for reminder in reminders:
+            reminder_info = {
+                "id": reminder.get("id"),
+                "creator": reminder.get("creator"),
+                "user": reminder.get("user"),
+                "text": reminder.get("text"),
+                "recurring": reminder.get("recurring", False),
+                "time": reminder.get("time"),
+                "complete_ts": reminder.get("complete_ts"),
+                "recurrence": reminder.get("recurrence", {}),
+                "created": reminder.get("created", 0),
+                "updated": reminder.get("updated", 0),
+                "is_complete": reminder.get("complete_ts") is not None,
+                "completion_time": reminder.get("complete_ts", 0),
+                "reminder_time": reminder.get("time", 0),
+                "reminder_text": reminder.get("text", ""),
+                "is_recurring": reminder.get("recurring", False),
+                "recurrence_pattern": reminder.get("recurrence", {}),
+                "status": "completed" if reminder.get("complete_ts") else "pending"
+            }
+            reminder_list.append(reminder_info)
         
         return {
             "data": {
-                "scheduled_messages": message_list,
-                "total_found": len(message_list),
-                "channel_filter": channel,
-                "time_range": {
-                    "oldest": oldest if oldest else "not_specified",
-                    "latest": latest if latest else "not_specified"
-                },
-                "next_cursor": next_cursor,
-                "has_more": bool(next_cursor),
-                "limit_requested": limit,
-                "message_status": "pending_only",
-                "deprecation_warning": "This tool is deprecated. Use 'list scheduled messages' instead for better functionality."
+                "reminders": reminder_list,
+                "total_found": len(reminder_list),
+                "user_id": response.data.get("user", "unknown"),
+                "reminder_types": {
+                    "pending": len([r for r in reminder_list if not r["is_complete"]]),
+                    "completed": len([r for r in reminder_list if r["is_complete"]]),
+                    "recurring": len([r for r in reminder_list if r["is_recurring"]])
+                }
             },
             "error": "",
             "successful": True
@@ -9671,34 +8413,16 @@ async def slack_list_scheduled_messages_in_a_channel(
         
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'invalid_cursor':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nPagination cursor '{cursor}' is invalid.",
-                "successful": False
-            }
-        elif error_code == 'channel_not_found':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe channel '{channel}' does not exist or is not accessible.",
-                "successful": False
-            }
-        elif error_code == 'invalid_time_range':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe time range from '{oldest}' to '{latest}' is invalid.",
-                "successful": False
-            }
-        elif error_code == 'not_authed':
+        if error_code == 'not_authed':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Please check your SLACK_BOT_TOKEN.",
+                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Please check your SLACK_USER_TOKEN.",
                 "successful": False
             }
         elif error_code == 'invalid_auth':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Please check your SLACK_BOT_TOKEN.",
+                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Please check your SLACK_USER_TOKEN.",
                 "successful": False
             }
         elif error_code == 'account_inactive':
@@ -9716,13 +8440,19 @@ async def slack_list_scheduled_messages_in_a_channel(
         elif error_code == 'no_permission':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to list scheduled messages. The bot needs chat:write scope.",
+                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to list reminders. The user token needs reminders:read scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs chat:write scope to list scheduled messages.",
+                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The user token needs reminders:read scope to list reminders.",
+                "successful": False
+            }
+        elif error_code == 'not_allowed_token_type':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nReminders require a user token (xoxp-). Please set SLACK_USER_TOKEN with a user token that has reminders:read scope.",
                 "successful": False
             }
         return {
@@ -9738,14 +8468,22 @@ async def slack_list_scheduled_messages_in_a_channel(
         }
 
 @mcp.tool()
-async def slack_lists_pinned_items_in_a_channel(
-    channel: str
+async def slack_list_remote_files(
+    channel: str = "",
+    cursor: str = "",
+    limit: int = 100,
+    ts_from: float = None,
+    ts_to: float = None
 ) -> dict:
     """
-    Retrieves all messages and files pinned to a specified channel; the caller must have access to this channel.
+    Retrieve information about a team's remote files.
     
     Args:
-        channel (str): Channel ID to retrieve pinned items from (required)
+        channel (str): Channel ID to filter files by (optional)
+        cursor (str): Pagination cursor for fetching additional results (optional)
+        limit (int): Maximum number of files to return (default: 100)
+        ts_from (float): Start timestamp for filtering files (optional)
+        ts_to (float): End timestamp for filtering files (optional)
         
     Returns:
         dict: Response with data, error, and successful fields
@@ -9753,349 +8491,314 @@ async def slack_lists_pinned_items_in_a_channel(
     try:
         client = get_slack_client()
         
-        # Use the pins.list method
-        response = client.pins_list(channel=channel)
+        # Prepare parameters for files.remote.list
+        params = {
+            'limit': min(limit, 1000)  # Slack API limit is 1000
+        }
+        
+        # Add optional parameters
+        if channel:
+            params['channel'] = channel
+        if cursor:
+            params['cursor'] = cursor
+        if ts_from is not None:
+            params['ts_from'] = ts_from
+        if ts_to is not None:
+            params['ts_to'] = ts_to
+        
+        # Use the files.remote.list method
+        response = client.files_remote_list(**params)
         
         if not response.data.get("ok", False):
             error = response.data.get('error', 'Unknown error')
-            if error == 'channel_not_found':
+            if error == 'invalid_cursor':
                 return {
-                    "data": [],
-                    "error": f"Channel not found: The channel '{channel}' does not exist or is not accessible",
+                    "data": {},
+                    "error": f"Invalid cursor: Pagination cursor '{cursor}' is invalid",
                     "successful": False
                 }
-            elif error == 'not_in_channel':
+            elif error == 'channel_not_found':
                 return {
-                    "data": [],
-                    "error": f"Not in channel: The bot is not a member of the channel '{channel}'",
+                    "data": {},
+                    "error": f"Channel not found: The channel '{channel}' does not exist or is not accessible",
                     "successful": False
                 }
             elif error == 'not_authed':
                 return {
-                    "data": [],
+                    "data": {},
                     "error": f"Slack API Error: {error}\n\nAuthentication failed. Please check your SLACK_BOT_TOKEN.",
                     "successful": False
                 }
             elif error == 'invalid_auth':
                 return {
-                    "data": [],
+                    "data": {},
                     "error": f"Slack API Error: {error}\n\nInvalid authentication token. Please check your SLACK_BOT_TOKEN.",
                     "successful": False
                 }
             elif error == 'account_inactive':
                 return {
-                    "data": [],
+                    "data": {},
                     "error": f"Slack API Error: {error}\n\nThe authentication token belongs to a deactivated user.",
                     "successful": False
                 }
             elif error == 'token_revoked':
                 return {
-                    "data": [],
+                    "data": {},
                     "error": f"Slack API Error: {error}\n\nThe authentication token has been revoked.",
                     "successful": False
                 }
             elif error == 'no_permission':
                 return {
-                    "data": [],
-                    "error": f"Slack API Error: {error}\n\nInsufficient permissions to list pinned items. The bot needs pins:read scope.",
+                    "data": {},
+                    "error": f"Slack API Error: {error}\n\nInsufficient permissions to list remote files. The bot needs files:read scope.",
                     "successful": False
                 }
             elif error == 'missing_scope':
                 return {
-                    "data": [],
-                    "error": f"Slack API Error: {error}\n\nMissing required OAuth scope. The bot needs pins:read scope to list pinned items.",
+                    "data": {},
+                    "error": f"Slack API Error: {error}\n\nMissing required OAuth scope. The bot needs files:read scope to list remote files.",
                     "successful": False
                 }
             else:
                 return {
-                    "data": [],
-                    "error": f"Failed to list pinned items: {error}",
+                    "data": {},
+                    "error": f"Failed to list remote files: {error}",
                     "successful": False
                 }
         
-        items = response.data.get("items", [])
+        files = response.data.get("files", [])
         
-        # Format pinned items information
-        pinned_items = []
-        for item in items:
-            item_info = {
-                "type": item.get("type"),
-                "channel": item.get("channel"),
-                "created": item.get("created"),
-                "created_by": item.get("created_by"),
-                "timestamp": item.get("timestamp"),
-                "message": item.get("message", {}),
-                "file": item.get("file", {}),
-                "comment": item.get("comment", {}),
-                "item_id": item.get("id"),
-                "item_type": item.get("type"),
-                "pinned_by": item.get("created_by"),
-                "pinned_at": item.get("created"),
-                "channel_id": item.get("channel"),
-                "is_message": item.get("type") == "message",
-                "is_file": item.get("type") == "file",
-                "is_comment": item.get("type") == "comment"
+        # Format file information
+        file_list = []
+        for file in files:
+            file_info = {
+                "id": file.get("id"),
+                "name": file.get("name"),
+                "title": file.get("title"),
+                "mimetype": file.get("mimetype"),
+                "filetype": file.get("filetype"),
+                "pretty_type": file.get("pretty_type"),
+                "user": file.get("user"),
+                "user_team": file.get("user_team"),
+                "editable": file.get("editable", False),
+                "size": file.get("size", 0),
+                "mode": file.get("mode"),
+                "is_external": file.get("is_external", False),
+                "external_type": file.get("external_type"),
+                "is_public": file.get("is_public", False),
+                "public_url_shared": file.get("public_url_shared", False),
+                "display_as_bot": file.get("display_as_bot", False),
+                "username": file.get("username"),
+                "created": file.get("created", 0),
+                "updated": file.get("updated", 0),
+                "timestamp": file.get("timestamp", 0),
+                "original_attachment_count": file.get("original_attachment_count", 0),
+                "is_starred": file.get("is_starred", False),
+                "has_rich_preview": file.get("has_rich_preview", False),
+                "shares": file.get("shares", {}),
+                "channels": file.get("channels", []),
+                "groups": file.get("groups", []),
+                "ims": file.get("ims", []),
+                "external_id": file.get("external_id"),
+                "external_url": file.get("external_url"),
+                "app_id": file.get("app_id"),
+                "app_name": file.get("app_name"),
+                "thumb_360": file.get("thumb_360"),
+                "thumb_360_w": file.get("thumb_360_w"),
+                "thumb_360_h": file.get("thumb_360_h"),
+                "thumb_480": file.get("thumb_480"),
+                "thumb_480_w": file.get("thumb_480_w"),
+                "thumb_480_h": file.get("thumb_480_h"),
+                "thumb_160": file.get("thumb_160"),
+                "thumb_720": file.get("thumb_720"),
+                "thumb_720_w": file.get("thumb_720_w"),
+                "thumb_720_h": file.get("thumb_720_h"),
+                "thumb_800": file.get("thumb_800"),
+                "thumb_800_w": file.get("thumb_800_w"),
+                "thumb_800_h": file.get("thumb_800_h"),
+                "thumb_960": file.get("thumb_960"),
+                "thumb_960_w": file.get("thumb_960_w"),
+                "thumb_960_h": file.get("thumb_960_h"),
+                "thumb_1024": file.get("thumb_1024"),
+                "thumb_1024_w": file.get("thumb_1024_w"),
+                "thumb_1024_h": file.get("thumb_1024_h"),
+                "image_exif_rotation": file.get("image_exif_rotation"),
+                "original_w": file.get("original_w"),
+                "original_h": file.get("original_h"),
+                "permalink": file.get("permalink"),
+                "permalink_public": file.get("permalink_public"),
+                "is_removed": file.get("is_removed", False),
+                "url_private": file.get("url_private"),
+                "url_private_download": file.get("url_private_download"),
+                "media_display_type": file.get("media_display_type"),
+                "preview": file.get("preview"),
+                "preview_highlight": file.get("preview_highlight"),
+                "lines": file.get("lines"),
+                "lines_more": file.get("lines_more"),
+                "num_stars": file.get("num_stars", 0),
+                "is_public": file.get("is_public", False),
+                "public_url_shared": file.get("public_url_shared", False),
+                "file_access": file.get("file_access"),
+                "filetype_detection": file.get("filetype_detection"),
+                "thumb_video": file.get("thumb_video"),
+                "thumb_video_w": file.get("thumb_video_w"),
+                "thumb_video_h": file.get("thumb_video_h"),
+                "duration_ms": file.get("duration_ms"),
+                "thumb_tiny": file.get("thumb_tiny"),
+                "hd": file.get("hd", False),
+                "subtype": file.get("subtype"),
+                "transcription": file.get("transcription", {}),
+                "mp4": file.get("mp4"),
+                "vtt": file.get("vtt"),
+                "hls": file.get("hls"),
+                "hls_embed": file.get("hls_embed"),
+                "dash": file.get("dash"),
+                "dash_embed": file.get("dash_embed"),
+                "is_animated": file.get("is_animated", False),
+                "is_removed": file.get("is_removed", False),
+                "deanimate_gif": file.get("deanimate_gif"),
+                "deanimate": file.get("deanimate"),
+                "pjs": file.get("pjs"),
+                "pjpeg": file.get("pjpeg"),
+                "comments_count": file.get("comments_count", 0),
+                "initial_comment": file.get("initial_comment", {}),
+                "num_stars": file.get("num_stars", 0),
+                "pinned_to": file.get("pinned_to", []),
+                "reactions": file.get("reactions", []),
+                "is_external": file.get("is_external", False),
+                "external_type": file.get("external_type"),
+                "external_id": file.get("external_id"),
+                "external_url": file.get("external_url"),
+                "app_id": file.get("app_id"),
+                "app_name": file.get("app_name"),
+                "file_access": file.get("file_access"),
+                "filetype_detection": file.get("filetype_detection")
             }
-            
-            # Add message-specific information if it's a message
-            if item.get("type") == "message" and item.get("message"):
-                message = item.get("message", {})
-                item_info.update({
-                    "message_text": message.get("text", ""),
-                    "message_user": message.get("user", ""),
-                    "message_ts": message.get("ts", ""),
-                    "message_blocks": message.get("blocks", []),
-                    "message_attachments": message.get("attachments", []),
-                    "message_thread_ts": message.get("thread_ts", ""),
-                    "message_reply_count": message.get("reply_count", 0),
-                    "message_reply_users": message.get("reply_users", []),
-                    "message_reply_users_count": message.get("reply_users_count", 0),
-                    "message_latest_reply": message.get("latest_reply", ""),
-                    "message_subtype": message.get("subtype", ""),
-                    "message_hidden": message.get("hidden", False),
-                    "message_edited": message.get("edited", {}),
-                    "message_deleted_ts": message.get("deleted_ts", ""),
-                    "message_event_ts": message.get("event_ts", ""),
-                    "message_team": message.get("team", ""),
-                    "message_has_blocks": bool(message.get("blocks")),
-                    "message_has_attachments": bool(message.get("attachments")),
-                    "message_is_thread": bool(message.get("thread_ts")),
-                    "message_blocks_count": len(message.get("blocks", [])),
-                    "message_attachments_count": len(message.get("attachments", []))
-                })
-            
-            # Add file-specific information if it's a file
-            elif item.get("type") == "file" and item.get("file"):
-                file = item.get("file", {})
-                item_info.update({
-                    "file_id": file.get("id", ""),
-                    "file_name": file.get("name", ""),
-                    "file_title": file.get("title", ""),
-                    "file_mimetype": file.get("mimetype", ""),
-                    "file_filetype": file.get("filetype", ""),
-                    "file_size": file.get("size", 0),
-                    "file_url_private": file.get("url_private", ""),
-                    "file_url_private_download": file.get("url_private_download", ""),
-                    "file_thumb_360": file.get("thumb_360", ""),
-                    "file_thumb_480": file.get("thumb_480", ""),
-                    "file_thumb_720": file.get("thumb_720", ""),
-                    "file_thumb_800": file.get("thumb_800", ""),
-                    "file_thumb_960": file.get("thumb_960", ""),
-                    "file_thumb_1024": file.get("thumb_1024", ""),
-                    "file_thumb_160": file.get("thumb_160", ""),
-                    "file_thumb_360_w": file.get("thumb_360_w", 0),
-                    "file_thumb_360_h": file.get("thumb_360_h", 0),
-                    "file_thumb_480_w": file.get("thumb_480_w", 0),
-                    "file_thumb_480_h": file.get("thumb_480_h", 0),
-                    "file_thumb_720_w": file.get("thumb_720_w", 0),
-                    "file_thumb_720_h": file.get("thumb_720_h", 0),
-                    "file_thumb_800_w": file.get("thumb_800_w", 0),
-                    "file_thumb_800_h": file.get("thumb_800_h", 0),
-                    "file_thumb_960_w": file.get("thumb_960_w", 0),
-                    "file_thumb_960_h": file.get("thumb_960_h", 0),
-                    "file_thumb_1024_w": file.get("thumb_1024_w", 0),
-                    "file_thumb_1024_h": file.get("thumb_1024_h", 0),
-                    "file_thumb_160_w": file.get("thumb_160_w", 0),
-                    "file_thumb_160_h": file.get("thumb_160_h", 0),
-                    "file_original_w": file.get("original_w", 0),
-                    "file_original_h": file.get("original_h", 0),
-                    "file_created": file.get("created", 0),
-                    "file_timestamp": file.get("timestamp", 0),
-                    "file_user": file.get("user", ""),
-                    "file_username": file.get("username", ""),
-                    "file_editable": file.get("editable", False),
-                    "file_is_external": file.get("is_external", False),
-                    "file_external_type": file.get("external_type", ""),
-                    "file_is_public": file.get("is_public", False),
-                    "file_public_url_shared": file.get("public_url_shared", False),
-                    "file_display_as_bot": file.get("display_as_bot", False),
-                    "file_mode": file.get("mode", ""),
-                    "file_media_display_type": file.get("media_display_type", ""),
-                    "file_preview": file.get("preview", ""),
-                    "file_preview_highlight": file.get("preview_highlight", ""),
-                    "file_lines": file.get("lines", 0),
-                    "file_lines_more": file.get("lines_more", 0),
-                    "file_thumb_tiny": file.get("thumb_tiny", ""),
-                    "file_thumb_video": file.get("thumb_video", ""),
-                    "file_thumb_video_w": file.get("thumb_video_w", 0),
-                    "file_thumb_video_h": file.get("thumb_video_h", 0),
-                    "file_duration_ms": file.get("duration_ms", 0),
-                    "file_hd": file.get("hd", False),
-                    "file_subtype": file.get("subtype", ""),
-                    "file_transcription": file.get("transcription", {}),
-                    "file_mp4": file.get("mp4", ""),
-                    "file_vtt": file.get("vtt", ""),
-                    "file_hls": file.get("hls", ""),
-                    "file_hls_embed": file.get("hls_embed", ""),
-                    "file_dash": file.get("dash", ""),
-                    "file_dash_embed": file.get("dash_embed", ""),
-                    "file_is_animated": file.get("is_animated", False),
-                    "file_is_removed": file.get("is_removed", False),
-                    "file_deanimate_gif": file.get("deanimate_gif", ""),
-                    "file_deanimate": file.get("deanimate", ""),
-                    "file_pjs": file.get("pjs", ""),
-                    "file_pjpeg": file.get("pjpeg", ""),
-                    "file_comments_count": file.get("comments_count", 0),
-                    "file_initial_comment": file.get("initial_comment", {}),
-                    "file_num_stars": file.get("num_stars", 0),
-                    "file_pinned_to": file.get("pinned_to", []),
-                    "file_reactions": file.get("reactions", []),
-                    "file_shares": file.get("shares", {}),
-                    "file_channels": file.get("channels", []),
-                    "file_groups": file.get("groups", []),
-                    "file_ims": file.get("ims", []),
-                    "file_external_id": file.get("external_id", ""),
-                    "file_external_url": file.get("external_url", ""),
-                    "file_app_id": file.get("app_id", ""),
-                    "file_app_name": file.get("app_name", ""),
-                    "file_has_rich_preview": file.get("has_rich_preview", False),
-                    "file_media_display_type": file.get("media_display_type", ""),
-                    "file_thumbnails": {
-                        "thumb_160": file.get("thumb_160", ""),
-                        "thumb_360": file.get("thumb_360", ""),
-                        "thumb_480": file.get("thumb_480", ""),
-                        "thumb_720": file.get("thumb_720", ""),
-                        "thumb_800": file.get("thumb_800", ""),
-                        "thumb_960": file.get("thumb_960", ""),
-                        "thumb_1024": file.get("thumb_1024", ""),
-                        "thumb_tiny": file.get("thumb_tiny", "")
-                    }
-                })
-            
-            # Add comment-specific information if it's a comment
-            elif item.get("type") == "comment" and item.get("comment"):
-                comment = item.get("comment", {})
-                item_info.update({
-                    "comment_id": comment.get("id", ""),
-                    "comment_text": comment.get("text", ""),
-                    "comment_user": comment.get("user", ""),
-                    "comment_created": comment.get("created", 0),
-                    "comment_timestamp": comment.get("timestamp", ""),
-                    "comment_reply_count": comment.get("reply_count", 0),
-                    "comment_reply_users": comment.get("reply_users", []),
-                    "comment_reply_users_count": comment.get("reply_users_count", 0),
-                    "comment_latest_reply": comment.get("latest_reply", ""),
-                    "comment_subtype": comment.get("subtype", ""),
-                    "comment_hidden": comment.get("hidden", False),
-                    "comment_edited": comment.get("edited", {}),
-                    "comment_deleted_ts": comment.get("deleted_ts", ""),
-                    "comment_event_ts": comment.get("event_ts", ""),
-                    "comment_team": comment.get("team", ""),
-                    "comment_blocks": comment.get("blocks", []),
-                    "comment_attachments": comment.get("attachments", []),
-                    "comment_has_blocks": bool(comment.get("blocks")),
-                    "comment_has_attachments": bool(comment.get("attachments")),
-                    "comment_blocks_count": len(comment.get("blocks", [])),
-                    "comment_attachments_count": len(comment.get("attachments", []))
-                })
-            
-            pinned_items.append(item_info)
+            file_list.append(file_info)
+        
+        # Get pagination info
+        response_metadata = response.data.get("response_metadata", {})
+        next_cursor = response_metadata.get("next_cursor", "")
         
         return {
-            "data": pinned_items,
+            "data": {
+                "files": file_list,
+                "total_found": len(file_list),
+                "channel_filter": channel if channel else "all_channels",
+                "ts_from": ts_from,
+                "ts_to": ts_to,
+                "next_cursor": next_cursor,
+                "has_more": bool(next_cursor),
+                "limit_requested": limit
+            },
             "error": "",
             "successful": True
         }
         
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'channel_not_found':
+        if error_code == 'invalid_cursor':
             return {
-                "data": [],
-                "error": f"Slack API Error: {error_code}\n\nThe channel '{channel}' does not exist or is not accessible.",
+                "data": {},
+                "error": _ERR_INVALID_CURSOR.format_map({"cursor": cursor}),
                 "successful": False
             }
-        elif error_code == 'not_in_channel':
+        elif error_code == 'channel_not_found':
             return {
-                "data": [],
-                "error": f"Slack API Error: {error_code}\n\nThe bot is not a member of the channel '{channel}'.",
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nThe channel '{channel}' does not exist or is not accessible.",
                 "successful": False
             }
         elif error_code == 'not_authed':
             return {
-                "data": [],
+                "data": {},
                 "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Please check your SLACK_BOT_TOKEN.",
                 "successful": False
             }
         elif error_code == 'invalid_auth':
             return {
-                "data": [],
+                "data": {},
                 "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Please check your SLACK_BOT_TOKEN.",
                 "successful": False
             }
         elif error_code == 'account_inactive':
             return {
-                "data": [],
+                "data": {},
                 "error": f"Slack API Error: {error_code}\n\nThe authentication token belongs to a deactivated user.",
                 "successful": False
             }
         elif error_code == 'token_revoked':
             return {
-                "data": [],
+                "data": {},
                 "error": f"Slack API Error: {error_code}\n\nThe authentication token has been revoked.",
                 "successful": False
             }
         elif error_code == 'no_permission':
             return {
-                "data": [],
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to list pinned items. The bot needs pins:read scope.",
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to list remote files. The bot needs files:read scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
-                "data": [],
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs pins:read scope to list pinned items.",
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs files:read scope to list remote files.",
                 "successful": False
             }
         return {
-            "data": [],
+            "data": {},
             "error": f"Slack API Error: {error_code}",
             "successful": False
         }
     except Exception as e:
         return {
-            "data": [],
+            "data": {},
             "error": f"Unexpected error: {str(e)}",
             "successful": False
         }
 
 @mcp.tool()
-async def slack_list_starred_items(
-    count: int = 20,
+async def slack_list_scheduled_messages(
+    channel: str = "",
     cursor: str = "",
-    limit: int = 20,
-    page: int = 1
+    latest: str = "",
+    limit: int = 100,
+    oldest: str = ""
 ) -> dict:
     """
-    Lists items starred by a user.
+    Retrieves a list of pending (not yet delivered) messages scheduled in a specific slack channel, 
+    or across all accessible channels if no channel id is provided, optionally filtered by time and paginated.
     
     Args:
-        count (int): Number of items to return (default: 20)
+        channel (str): Channel ID to filter scheduled messages by (optional)
         cursor (str): Pagination cursor for fetching additional results (optional)
-        limit (int): Maximum number of items to return (default: 20)
-        page (int): Page number for pagination (default: 1)
+        latest (str): End of time range of messages to include (optional)
+        limit (int): Maximum number of messages to return (default: 100)
+        oldest (str): Start of time range of messages to include (optional)
         
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
-        # Use user token for starred items (stars require user tokens)
-        client = get_slack_user_client()
+        client = get_slack_client()
         
-        # Prepare parameters for stars.list
+        # Prepare parameters for chat.scheduledMessages.list
         params = {
-            'count': min(count, 1000),  # Slack API limit is 1000
-            'limit': min(limit, 1000)
+            'limit': min(limit, 1000)  # Slack API limit is 1000
         }
         
         # Add optional parameters
+        if channel:
+            params['channel'] = channel
         if cursor:
             params['cursor'] = cursor
-        if page > 1:
-            params['page'] = page
+        if latest:
+            params['latest'] = latest
+        if oldest:
+            params['oldest'] = oldest
         
-        # Use the stars.list method
-        response = client.stars_list(**params)
+        # Use the chat.scheduledMessages.list method
+        response = client.chat_scheduledMessages_list(**params)
         
         if not response.data.get("ok", False):
             error = response.data.get('error', 'Unknown error')
@@ -10105,10 +8808,16 @@ async def slack_list_starred_items(
                     "error": f"Invalid cursor: Pagination cursor '{cursor}' is invalid",
                     "successful": False
                 }
-            elif error == 'invalid_page':
+            elif error == 'channel_not_found':
+                return {
+                    "data": {},
+                    "error": f"Channel not found: The channel '{channel}' does not exist or is not accessible",
+                    "successful": False
+                }
+            elif error == 'invalid_time_range':
                 return {
                     "data": {},
-                    "error": f"Invalid page: Page number '{page}' is invalid",
+                    "error": f"Invalid time range: The time range from '{oldest}' to '{latest}' is invalid",
                     "successful": False
                 }
             elif error == 'not_authed':
@@ -10138,201 +8847,68 @@ async def slack_list_starred_items(
             elif error == 'no_permission':
                 return {
                     "data": {},
-                    "error": f"Slack API Error: {error}\n\nInsufficient permissions to list starred items. The user token needs stars:read scope.",
+                    "error": f"Slack API Error: {error}\n\nInsufficient permissions to list scheduled messages. The bot needs chat:write scope.",
                     "successful": False
                 }
             elif error == 'missing_scope':
                 return {
                     "data": {},
-                    "error": f"Slack API Error: {error}\n\nMissing required OAuth scope. The user token needs stars:read scope to list starred items.",
-                    "successful": False
-                }
-            elif error == 'not_allowed_token_type':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nStarred items require a user token (xoxp-). Please set SLACK_USER_TOKEN with a user token that has stars:read scope.",
+                    "error": f"Slack API Error: {error}\n\nMissing required OAuth scope. The bot needs chat:write scope to list scheduled messages.",
                     "successful": False
                 }
             else:
                 return {
                     "data": {},
-                    "error": f"Failed to list starred items: {error}",
+                    "error": f"Failed to list scheduled messages: {error}",
                     "successful": False
                 }
         
-        items = response.data.get("items", [])
+        scheduled_messages = response.data.get("scheduled_messages", [])
         
-        # Format starred items information
-        starred_items = []
-        for item in items:
-            item_info = {
-                "type": item.get("type"),
-                "channel": item.get("channel"),
-                "message": item.get("message", {}),
-                "file": item.get("file", {}),
-                "comment": item.get("comment", {}),
-                "item_id": item.get("id"),
-                "item_type": item.get("type"),
-                "channel_id": item.get("channel"),
-                "is_message": item.get("type") == "message",
-                "is_file": item.get("type") == "file",
-                "is_comment": item.get("type") == "comment",
-                "is_starred": True
+        # Format scheduled message information
+        message_list = []
+        for msg in scheduled_messages:
+            message_info = {
+                "id": msg.get("id"),
+                "channel": msg.get("channel"),
+                "post_at": msg.get("post_at"),
+                "date_created": msg.get("date_created"),
+                "text": msg.get("text"),
+                "user": msg.get("user"),
+                "team": msg.get("team"),
+                "blocks": msg.get("blocks", []),
+                "attachments": msg.get("attachments", []),
+                "as_user": msg.get("as_user", False),
+                "icon_emoji": msg.get("icon_emoji"),
+                "icon_url": msg.get("icon_url"),
+                "link_names": msg.get("link_names", False),
+                "mrkdwn": msg.get("mrkdwn", False),
+                "parse": msg.get("parse"),
+                "reply_broadcast": msg.get("reply_broadcast", False),
+                "thread_ts": msg.get("thread_ts"),
+                "unfurl_links": msg.get("unfurl_links", True),
+                "unfurl_media": msg.get("unfurl_media", True),
+                "username": msg.get("username"),
+                "scheduled_message_id": msg.get("scheduled_message_id"),
+                "channel_id": msg.get("channel"),
+                "post_time": msg.get("post_at"),
+                "created_time": msg.get("date_created"),
+                "message_text": msg.get("text", ""),
+                "author_user": msg.get("user"),
+                "team_id": msg.get("team"),
+                "is_thread_reply": bool(msg.get("thread_ts")),
+                "thread_timestamp": msg.get("thread_ts"),
+                "has_blocks": bool(msg.get("blocks")),
+                "has_attachments": bool(msg.get("attachments")),
+                "blocks_count": len(msg.get("blocks", [])),
+                "attachments_count": len(msg.get("attachments", [])),
+                "scheduled_for": msg.get("post_at"),
+                "created_by": msg.get("user"),
+                "message_type": "scheduled_message",
+                "status": "pending",
+                "delivery_status": "not_delivered"
             }
-            
-            # Add message-specific information if it's a message
-            if item.get("type") == "message" and item.get("message"):
-                message = item.get("message", {})
-                item_info.update({
-                    "message_text": message.get("text", ""),
-                    "message_user": message.get("user", ""),
-                    "message_ts": message.get("ts", ""),
-                    "message_blocks": message.get("blocks", []),
-                    "message_attachments": message.get("attachments", []),
-                    "message_thread_ts": message.get("thread_ts", ""),
-                    "message_reply_count": message.get("reply_count", 0),
-                    "message_reply_users": message.get("reply_users", []),
-                    "message_reply_users_count": message.get("reply_users_count", 0),
-                    "message_latest_reply": message.get("latest_reply", ""),
-                    "message_subtype": message.get("subtype", ""),
-                    "message_hidden": message.get("hidden", False),
-                    "message_edited": message.get("edited", {}),
-                    "message_deleted_ts": message.get("deleted_ts", ""),
-                    "message_event_ts": message.get("event_ts", ""),
-                    "message_team": message.get("team", ""),
-                    "message_has_blocks": bool(message.get("blocks")),
-                    "message_has_attachments": bool(message.get("attachments")),
-                    "message_is_thread": bool(message.get("thread_ts")),
-                    "message_blocks_count": len(message.get("blocks", [])),
-                    "message_attachments_count": len(message.get("attachments", []))
-                })
-            
-            # Add file-specific information if it's a file
-            elif item.get("type") == "file" and item.get("file"):
-                file = item.get("file", {})
-                item_info.update({
-                    "file_id": file.get("id", ""),
-                    "file_name": file.get("name", ""),
-                    "file_title": file.get("title", ""),
-                    "file_mimetype": file.get("mimetype", ""),
-                    "file_filetype": file.get("filetype", ""),
-                    "file_size": file.get("size", 0),
-                    "file_url_private": file.get("url_private", ""),
-                    "file_url_private_download": file.get("url_private_download", ""),
-                    "file_thumb_360": file.get("thumb_360", ""),
-                    "file_thumb_480": file.get("thumb_480", ""),
-                    "file_thumb_720": file.get("thumb_720", ""),
-                    "file_thumb_800": file.get("thumb_800", ""),
-                    "file_thumb_960": file.get("thumb_960", ""),
-                    "file_thumb_1024": file.get("thumb_1024", ""),
-                    "file_thumb_160": file.get("thumb_160", ""),
-                    "file_thumb_360_w": file.get("thumb_360_w", 0),
-                    "file_thumb_360_h": file.get("thumb_360_h", 0),
-                    "file_thumb_480_w": file.get("thumb_480_w", 0),
-                    "file_thumb_480_h": file.get("thumb_480_h", 0),
-                    "file_thumb_720_w": file.get("thumb_720_w", 0),
-                    "file_thumb_720_h": file.get("thumb_720_h", 0),
-                    "file_thumb_800_w": file.get("thumb_800_w", 0),
-                    "file_thumb_800_h": file.get("thumb_800_h", 0),
-                    "file_thumb_960_w": file.get("thumb_960_w", 0),
-                    "file_thumb_960_h": file.get("thumb_960_h", 0),
-                    "file_thumb_1024_w": file.get("thumb_1024_w", 0),
-                    "file_thumb_1024_h": file.get("thumb_1024_h", 0),
-                    "file_thumb_160_w": file.get("thumb_160_w", 0),
-                    "file_thumb_160_h": file.get("thumb_160_h", 0),
-                    "file_original_w": file.get("original_w", 0),
-                    "file_original_h": file.get("original_h", 0),
-                    "file_created": file.get("created", 0),
-                    "file_timestamp": file.get("timestamp", 0),
-                    "file_user": file.get("user", ""),
-                    "file_username": file.get("username", ""),
-                    "file_editable": file.get("editable", False),
-                    "file_is_external": file.get("is_external", False),
-                    "file_external_type": file.get("external_type", ""),
-                    "file_is_public": file.get("is_public", False),
-                    "file_public_url_shared": file.get("public_url_shared", False),
-                    "file_display_as_bot": file.get("display_as_bot", False),
-                    "file_mode": file.get("mode", ""),
-                    "file_media_display_type": file.get("media_display_type", ""),
-                    "file_preview": file.get("preview", ""),
-                    "file_preview_highlight": file.get("preview_highlight", ""),
-                    "file_lines": file.get("lines", 0),
-                    "file_lines_more": file.get("lines_more", 0),
-                    "file_thumb_tiny": file.get("thumb_tiny", ""),
-                    "file_thumb_video": file.get("thumb_video", ""),
-                    "file_thumb_video_w": file.get("thumb_video_w", 0),
-                    "file_thumb_video_h": file.get("thumb_video_h", 0),
-                    "file_duration_ms": file.get("duration_ms", 0),
-                    "file_hd": file.get("hd", False),
-                    "file_subtype": file.get("subtype", ""),
-                    "file_transcription": file.get("transcription", {}),
-                    "file_mp4": file.get("mp4", ""),
-                    "file_vtt": file.get("vtt", ""),
-                    "file_hls": file.get("hls", ""),
-                    "file_hls_embed": file.get("hls_embed", ""),
-                    "file_dash": file.get("dash", ""),
-                    "file_dash_embed": file.get("dash_embed", ""),
-                    "file_is_animated": file.get("is_animated", False),
-                    "file_is_removed": file.get("is_removed", False),
-                    "file_deanimate_gif": file.get("deanimate_gif", ""),
-                    "file_deanimate": file.get("deanimate", ""),
-                    "file_pjs": file.get("pjs", ""),
-                    "file_pjpeg": file.get("pjpeg", ""),
-                    "file_comments_count": file.get("comments_count", 0),
-                    "file_initial_comment": file.get("initial_comment", {}),
-                    "file_num_stars": file.get("num_stars", 0),
-                    "file_pinned_to": file.get("pinned_to", []),
-                    "file_reactions": file.get("reactions", []),
-                    "file_shares": file.get("shares", {}),
-                    "file_channels": file.get("channels", []),
-                    "file_groups": file.get("groups", []),
-                    "file_ims": file.get("ims", []),
-                    "file_external_id": file.get("external_id", ""),
-                    "file_external_url": file.get("external_url", ""),
-                    "file_app_id": file.get("app_id", ""),
-                    "file_app_name": file.get("app_name", ""),
-                    "file_has_rich_preview": file.get("has_rich_preview", False),
-                    "file_media_display_type": file.get("media_display_type", ""),
-                    "file_thumbnails": {
-                        "thumb_160": file.get("thumb_160", ""),
-                        "thumb_360": file.get("thumb_360", ""),
-                        "thumb_480": file.get("thumb_480", ""),
-                        "thumb_720": file.get("thumb_720", ""),
-                        "thumb_800": file.get("thumb_800", ""),
-                        "thumb_960": file.get("thumb_960", ""),
-                        "thumb_1024": file.get("thumb_1024", ""),
-                        "thumb_tiny": file.get("thumb_tiny", "")
-                    }
-                })
-            
-            # Add comment-specific information if it's a comment
-            elif item.get("type") == "comment" and item.get("comment"):
-                comment = item.get("comment", {})
-                item_info.update({
-                    "comment_id": comment.get("id", ""),
-                    "comment_text": comment.get("text", ""),
-                    "comment_user": comment.get("user", ""),
-                    "comment_created": comment.get("created", 0),
-                    "comment_timestamp": comment.get("timestamp", ""),
-                    "comment_reply_count": comment.get("reply_count", 0),
-                    "comment_reply_users": comment.get("reply_users", []),
-                    "comment_reply_users_count": comment.get("reply_users_count", 0),
-                    "comment_latest_reply": comment.get("latest_reply", ""),
-                    "comment_subtype": comment.get("subtype", ""),
-                    "comment_hidden": comment.get("hidden", False),
-                    "comment_edited": comment.get("edited", {}),
-                    "comment_deleted_ts": comment.get("deleted_ts", ""),
-                    "comment_event_ts": comment.get("event_ts", ""),
-                    "comment_team": comment.get("team", ""),
-                    "comment_blocks": comment.get("blocks", []),
-                    "comment_attachments": comment.get("attachments", []),
-                    "comment_has_blocks": bool(comment.get("blocks")),
-                    "comment_has_attachments": bool(comment.get("attachments")),
-                    "comment_blocks_count": len(comment.get("blocks", [])),
-                    "comment_attachments_count": len(comment.get("attachments", []))
-                })
-            
-            starred_items.append(item_info)
+            message_list.append(message_info)
         
         # Get pagination info
         response_metadata = response.data.get("response_metadata", {})
@@ -10340,19 +8916,17 @@ async def slack_list_starred_items(
         
         return {
             "data": {
-                "starred_items": starred_items,
-                "total_found": len(starred_items),
-                "count_requested": count,
-                "limit_requested": limit,
-                "page_requested": page,
+                "scheduled_messages": message_list,
+                "total_found": len(message_list),
+                "channel_filter": channel if channel else "all_channels",
+                "time_range": {
+                    "oldest": oldest if oldest else "not_specified",
+                    "latest": latest if latest else "not_specified"
+                },
                 "next_cursor": next_cursor,
                 "has_more": bool(next_cursor),
-                "pagination": {
-                    "current_page": page,
-                    "items_per_page": count,
-                    "total_items": len(starred_items),
-                    "has_next_page": bool(next_cursor)
-                }
+                "limit_requested": limit,
+                "message_status": "pending_only"
             },
             "error": "",
             "successful": True
@@ -10363,13 +8937,19 @@ async def slack_list_starred_items(
         if error_code == 'invalid_cursor':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nPagination cursor '{cursor}' is invalid.",
+                "error": _ERR_INVALID_CURSOR.format_map({"cursor": cursor}),
+                "successful": False
+            }
+        elif error_code == 'channel_not_found':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nThe channel '{channel}' does not exist or is not accessible.",
                 "successful": False
             }
-        elif error_code == 'invalid_page':
+        elif error_code == 'invalid_time_range':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nPage number '{page}' is invalid.",
+                "error": f"Slack API Error: {error_code}\n\nThe time range from '{oldest}' to '{latest}' is invalid.",
                 "successful": False
             }
         elif error_code == 'not_authed':
@@ -10399,19 +8979,13 @@ async def slack_list_starred_items(
         elif error_code == 'no_permission':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to list starred items. The user token needs stars:read scope.",
+                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to list scheduled messages. The bot needs chat:write scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The user token needs stars:read scope to list starred items.",
-                "successful": False
-            }
-        elif error_code == 'not_allowed_token_type':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nStarred items require a user token (xoxp-). Please set SLACK_USER_TOKEN with a user token that has stars:read scope.",
+                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs chat:write scope to list scheduled messages.",
                 "successful": False
             }
         return {
@@ -10427,42 +9001,46 @@ async def slack_list_starred_items(
         }
 
 @mcp.tool()
-async def slack_lists_user_s_starred_items_with_pagination(
-    count: int = 20,
+async def slack_list_scheduled_messages_in_a_channel(
+    channel: str,
     cursor: str = "",
-    limit: int = 20,
-    page: int = 1
+    latest: str = "",
+    limit: int = 100,
+    oldest: str = ""
 ) -> dict:
     """
-    Deprecated: lists items starred by a user. use `list starred items` instead.
+    Deprecated: retrieves a list of pending (not yet delivered) messages scheduled in a specific slack channel. 
+    use `list scheduled messages` instead.
     
     Args:
-        count (int): Number of items to return (default: 20)
+        channel (str): Channel ID to filter scheduled messages by (required)
         cursor (str): Pagination cursor for fetching additional results (optional)
-        limit (int): Maximum number of items to return (default: 20)
-        page (int): Page number for pagination (default: 1)
+        latest (str): End of time range of messages to include (optional)
+        limit (int): Maximum number of messages to return (default: 100)
+        oldest (str): Start of time range of messages to include (optional)
         
     Returns:
         dict: Response with data, error, and successful fields
     """
     try:
-        # Use user token for starred items (stars require user tokens)
-        client = get_slack_user_client()
+        client = get_slack_client()
         
-        # Prepare parameters for stars.list
+        # Prepare parameters for chat.scheduledMessages.list
         params = {
-            'count': min(count, 1000),  # Slack API limit is 1000
-            'limit': min(limit, 1000)
+            'channel': channel,
+            'limit': min(limit, 1000)  # Slack API limit is 1000
         }
         
         # Add optional parameters
         if cursor:
             params['cursor'] = cursor
-        if page > 1:
-            params['page'] = page
+        if latest:
+            params['latest'] = latest
+        if oldest:
+            params['oldest'] = oldest
         
-        # Use the stars.list method
-        response = client.stars_list(**params)
+        # Use the chat.scheduledMessages.list method
+        response = client.chat_scheduledMessages_list(**params)
         
         if not response.data.get("ok", False):
             error = response.data.get('error', 'Unknown error')
@@ -10472,22 +9050,28 @@ async def slack_lists_user_s_starred_items_with_pagination(
                     "error": f"Invalid cursor: Pagination cursor '{cursor}' is invalid",
                     "successful": False
                 }
-            elif error == 'invalid_page':
+            elif error == 'channel_not_found':
+                return {
+                    "data": {},
+                    "error": f"Channel not found: The channel '{channel}' does not exist or is not accessible",
+                    "successful": False
+                }
+            elif error == 'invalid_time_range':
                 return {
                     "data": {},
-                    "error": f"Invalid page: Page number '{page}' is invalid",
+                    "error": f"Invalid time range: The time range from '{oldest}' to '{latest}' is invalid",
                     "successful": False
                 }
             elif error == 'not_authed':
                 return {
                     "data": {},
-                    "error": f"Slack API Error: {error}\n\nAuthentication failed. Please check your SLACK_USER_TOKEN.",
+                    "error": f"Slack API Error: {error}\n\nAuthentication failed. Please check your SLACK_BOT_TOKEN.",
                     "successful": False
                 }
             elif error == 'invalid_auth':
                 return {
                     "data": {},
-                    "error": f"Slack API Error: {error}\n\nInvalid authentication token. Please check your SLACK_USER_TOKEN.",
+                    "error": f"Slack API Error: {error}\n\nInvalid authentication token. Please check your SLACK_BOT_TOKEN.",
                     "successful": False
                 }
             elif error == 'account_inactive':
@@ -10505,201 +9089,68 @@ async def slack_lists_user_s_starred_items_with_pagination(
             elif error == 'no_permission':
                 return {
                     "data": {},
-                    "error": f"Slack API Error: {error}\n\nInsufficient permissions to list starred items. The user token needs stars:read scope.",
+                    "error": f"Slack API Error: {error}\n\nInsufficient permissions to list scheduled messages. The bot needs chat:write scope.",
                     "successful": False
                 }
             elif error == 'missing_scope':
                 return {
                     "data": {},
-                    "error": f"Slack API Error: {error}\n\nMissing required OAuth scope. The user token needs stars:read scope to list starred items.",
-                    "successful": False
-                }
-            elif error == 'not_allowed_token_type':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nStarred items require a user token (xoxp-). Please set SLACK_USER_TOKEN with a user token that has stars:read scope.",
+                    "error": f"Slack API Error: {error}\n\nMissing required OAuth scope. The bot needs chat:write scope to list scheduled messages.",
                     "successful": False
                 }
             else:
                 return {
                     "data": {},
-                    "error": f"Failed to list starred items: {error}",
+                    "error": f"Failed to list scheduled messages: {error}",
                     "successful": False
                 }
         
-        items = response.data.get("items", [])
+        scheduled_messages = response.data.get("scheduled_messages", [])
         
-        # Format starred items information
-        starred_items = []
-        for item in items:
-            item_info = {
-                "type": item.get("type"),
-                "channel": item.get("channel"),
-                "message": item.get("message", {}),
-                "file": item.get("file", {}),
-                "comment": item.get("comment", {}),
-                "item_id": item.get("id"),
-                "item_type": item.get("type"),
-                "channel_id": item.get("channel"),
-                "is_message": item.get("type") == "message",
-                "is_file": item.get("type") == "file",
-                "is_comment": item.get("type") == "comment",
-                "is_starred": True
+        # Format scheduled message information
+        message_list = []
+        for msg in scheduled_messages:
+            message_info = {
+                "id": msg.get("id"),
+                "channel": msg.get("channel"),
+                "post_at": msg.get("post_at"),
+                "date_created": msg.get("date_created"),
+                "text": msg.get("text"),
+                "user": msg.get("user"),
+                "team": msg.get("team"),
+                "blocks": msg.get("blocks", []),
+                "attachments": msg.get("attachments", []),
+                "as_user": msg.get("as_user", False),
+                "icon_emoji": msg.get("icon_emoji"),
+                "icon_url": msg.get("icon_url"),
+                "link_names": msg.get("link_names", False),
+                "mrkdwn": msg.get("mrkdwn", False),
+                "parse": msg.get("parse"),
+                "reply_broadcast": msg.get("reply_broadcast", False),
+                "thread_ts": msg.get("thread_ts"),
+                "unfurl_links": msg.get("unfurl_links", True),
+                "unfurl_media": msg.get("unfurl_media", True),
+                "username": msg.get("username"),
+                "scheduled_message_id": msg.get("scheduled_message_id"),
+                "channel_id": msg.get("channel"),
+                "post_time": msg.get("post_at"),
+                "created_time": msg.get("date_created"),
+                "message_text": msg.get("text", ""),
+                "author_user": msg.get("user"),
+                "team_id": msg.get("team"),
+                "is_thread_reply": bool(msg.get("thread_ts")),
+                "thread_timestamp": msg.get("thread_ts"),
+                "has_blocks": bool(msg.get("blocks")),
+                "has_attachments": bool(msg.get("attachments")),
+                "blocks_count": len(msg.get("blocks", [])),
+                "attachments_count": len(msg.get("attachments", [])),
+                "scheduled_for": msg.get("post_at"),
+                "created_by": msg.get("user"),
+                "message_type": "scheduled_message",
+                "status": "pending",
+                "delivery_status": "not_delivered"
             }
-            
-            # Add message-specific information if it's a message
-            if item.get("type") == "message" and item.get("message"):
-                message = item.get("message", {})
-                item_info.update({
-                    "message_text": message.get("text", ""),
-                    "message_user": message.get("user", ""),
-                    "message_ts": message.get("ts", ""),
-                    "message_blocks": message.get("blocks", []),
-                    "message_attachments": message.get("attachments", []),
-                    "message_thread_ts": message.get("thread_ts", ""),
-                    "message_reply_count": message.get("reply_count", 0),
-                    "message_reply_users": message.get("reply_users", []),
-                    "message_reply_users_count": message.get("reply_users_count", 0),
-                    "message_latest_reply": message.get("latest_reply", ""),
-                    "message_subtype": message.get("subtype", ""),
-                    "message_hidden": message.get("hidden", False),
-                    "message_edited": message.get("edited", {}),
-                    "message_deleted_ts": message.get("deleted_ts", ""),
-                    "message_event_ts": message.get("event_ts", ""),
-                    "message_team": message.get("team", ""),
-                    "message_has_blocks": bool(message.get("blocks")),
-                    "message_has_attachments": bool(message.get("attachments")),
-                    "message_is_thread": bool(message.get("thread_ts")),
-                    "message_blocks_count": len(message.get("blocks", [])),
-                    "message_attachments_count": len(message.get("attachments", []))
-                })
-            
-            # Add file-specific information if it's a file
-            elif item.get("type") == "file" and item.get("file"):
-                file = item.get("file", {})
-                item_info.update({
-                    "file_id": file.get("id", ""),
-                    "file_name": file.get("name", ""),
-                    "file_title": file.get("title", ""),
-                    "file_mimetype": file.get("mimetype", ""),
-                    "file_filetype": file.get("filetype", ""),
-                    "file_size": file.get("size", 0),
-                    "file_url_private": file.get("url_private", ""),
-                    "file_url_private_download": file.get("url_private_download", ""),
-                    "file_thumb_360": file.get("thumb_360", ""),
-                    "file_thumb_480": file.get("thumb_480", ""),
-                    "file_thumb_720": file.get("thumb_720", ""),
-                    "file_thumb_800": file.get("thumb_800", ""),
-                    "file_thumb_960": file.get("thumb_960", ""),
-                    "file_thumb_1024": file.get("thumb_1024", ""),
-                    "file_thumb_160": file.get("thumb_160", ""),
-                    "file_thumb_360_w": file.get("thumb_360_w", 0),
-                    "file_thumb_360_h": file.get("thumb_360_h", 0),
-                    "file_thumb_480_w": file.get("thumb_480_w", 0),
-                    "file_thumb_480_h": file.get("thumb_480_h", 0),
-                    "file_thumb_720_w": file.get("thumb_720_w", 0),
-                    "file_thumb_720_h": file.get("thumb_720_h", 0),
-                    "file_thumb_800_w": file.get("thumb_800_w", 0),
-                    "file_thumb_800_h": file.get("thumb_800_h", 0),
-                    "file_thumb_960_w": file.get("thumb_960_w", 0),
-                    "file_thumb_960_h": file.get("thumb_960_h", 0),
-                    "file_thumb_1024_w": file.get("thumb_1024_w", 0),
-                    "file_thumb_1024_h": file.get("thumb_1024_h", 0),
-                    "file_thumb_160_w": file.get("thumb_160_w", 0),
-                    "file_thumb_160_h": file.get("thumb_160_h", 0),
-                    "file_original_w": file.get("original_w", 0),
-                    "file_original_h": file.get("original_h", 0),
-                    "file_created": file.get("created", 0),
-                    "file_timestamp": file.get("timestamp", 0),
-                    "file_user": file.get("user", ""),
-                    "file_username": file.get("username", ""),
-                    "file_editable": file.get("editable", False),
-                    "file_is_external": file.get("is_external", False),
-                    "file_external_type": file.get("external_type", ""),
-                    "file_is_public": file.get("is_public", False),
-                    "file_public_url_shared": file.get("public_url_shared", False),
-                    "file_display_as_bot": file.get("display_as_bot", False),
-                    "file_mode": file.get("mode", ""),
-                    "file_media_display_type": file.get("media_display_type", ""),
-                    "file_preview": file.get("preview", ""),
-                    "file_preview_highlight": file.get("preview_highlight", ""),
-                    "file_lines": file.get("lines", 0),
-                    "file_lines_more": file.get("lines_more", 0),
-                    "file_thumb_tiny": file.get("thumb_tiny", ""),
-                    "file_thumb_video": file.get("thumb_video", ""),
-                    "file_thumb_video_w": file.get("thumb_video_w", 0),
-                    "file_thumb_video_h": file.get("thumb_video_h", 0),
-                    "file_duration_ms": file.get("duration_ms", 0),
-                    "file_hd": file.get("hd", False),
-                    "file_subtype": file.get("subtype", ""),
-                    "file_transcription": file.get("transcription", {}),
-                    "file_mp4": file.get("mp4", ""),
-                    "file_vtt": file.get("vtt", ""),
-                    "file_hls": file.get("hls", ""),
-                    "file_hls_embed": file.get("hls_embed", ""),
-                    "file_dash": file.get("dash", ""),
-                    "file_dash_embed": file.get("dash_embed", ""),
-                    "file_is_animated": file.get("is_animated", False),
-                    "file_is_removed": file.get("is_removed", False),
-                    "file_deanimate_gif": file.get("deanimate_gif", ""),
-                    "file_deanimate": file.get("deanimate", ""),
-                    "file_pjs": file.get("pjs", ""),
-                    "file_pjpeg": file.get("pjpeg", ""),
-                    "file_comments_count": file.get("comments_count", 0),
-                    "file_initial_comment": file.get("initial_comment", {}),
-                    "file_num_stars": file.get("num_stars", 0),
-                    "file_pinned_to": file.get("pinned_to", []),
-                    "file_reactions": file.get("reactions", []),
-                    "file_shares": file.get("shares", {}),
-                    "file_channels": file.get("channels", []),
-                    "file_groups": file.get("groups", []),
-                    "file_ims": file.get("ims", []),
-                    "file_external_id": file.get("external_id", ""),
-                    "file_external_url": file.get("external_url", ""),
-                    "file_app_id": file.get("app_id", ""),
-                    "file_app_name": file.get("app_name", ""),
-                    "file_has_rich_preview": file.get("has_rich_preview", False),
-                    "file_media_display_type": file.get("media_display_type", ""),
-                    "file_thumbnails": {
-                        "thumb_160": file.get("thumb_160", ""),
-                        "thumb_360": file.get("thumb_360", ""),
-                        "thumb_480": file.get("thumb_480", ""),
-                        "thumb_720": file.get("thumb_720", ""),
-                        "thumb_800": file.get("thumb_800", ""),
-                        "thumb_960": file.get("thumb_960", ""),
-                        "thumb_1024": file.get("thumb_1024", ""),
-                        "thumb_tiny": file.get("thumb_tiny", "")
-                    }
-                })
-            
-            # Add comment-specific information if it's a comment
-            elif item.get("type") == "comment" and item.get("comment"):
-                comment = item.get("comment", {})
-                item_info.update({
-                    "comment_id": comment.get("id", ""),
-                    "comment_text": comment.get("text", ""),
-                    "comment_user": comment.get("user", ""),
-                    "comment_created": comment.get("created", 0),
-                    "comment_timestamp": comment.get("timestamp", ""),
-                    "comment_reply_count": comment.get("reply_count", 0),
-                    "comment_reply_users": comment.get("reply_users", []),
-                    "comment_reply_users_count": comment.get("reply_users_count", 0),
-                    "comment_latest_reply": comment.get("latest_reply", ""),
-                    "comment_subtype": comment.get("subtype", ""),
-                    "comment_hidden": comment.get("hidden", False),
-                    "comment_edited": comment.get("edited", {}),
-                    "comment_deleted_ts": comment.get("deleted_ts", ""),
-                    "comment_event_ts": comment.get("event_ts", ""),
-                    "comment_team": comment.get("team", ""),
-                    "comment_blocks": comment.get("blocks", []),
-                    "comment_attachments": comment.get("attachments", []),
-                    "comment_has_blocks": bool(comment.get("blocks")),
-                    "comment_has_attachments": bool(comment.get("attachments")),
-                    "comment_blocks_count": len(comment.get("blocks", [])),
-                    "comment_attachments_count": len(comment.get("attachments", []))
-                })
-            
-            starred_items.append(item_info)
+            message_list.append(message_info)
         
         # Get pagination info
         response_metadata = response.data.get("response_metadata", {})
@@ -10707,20 +9158,18 @@ async def slack_lists_user_s_starred_items_with_pagination(
         
         return {
             "data": {
-                "starred_items": starred_items,
-                "total_found": len(starred_items),
-                "count_requested": count,
-                "limit_requested": limit,
-                "page_requested": page,
+                "scheduled_messages": message_list,
+                "total_found": len(message_list),
+                "channel_filter": channel,
+                "time_range": {
+                    "oldest": oldest if oldest else "not_specified",
+                    "latest": latest if latest else "not_specified"
+                },
                 "next_cursor": next_cursor,
                 "has_more": bool(next_cursor),
-                "pagination": {
-                    "current_page": page,
-                    "items_per_page": count,
-                    "total_items": len(starred_items),
-                    "has_next_page": bool(next_cursor)
-                },
-                "deprecation_warning": "This tool is deprecated. Use 'list starred items' instead for better functionality."
+                "limit_requested": limit,
+                "message_status": "pending_only",
+                "deprecation_warning": "This tool is deprecated. Use 'list scheduled messages' instead for better functionality."
             },
             "error": "",
             "successful": True
@@ -10731,25 +9180,31 @@ async def slack_lists_user_s_starred_items_with_pagination(
         if error_code == 'invalid_cursor':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nPagination cursor '{cursor}' is invalid.",
+                "error": _ERR_INVALID_CURSOR.format_map({"cursor": cursor}),
+                "successful": False
+            }
+        elif error_code == 'channel_not_found':
+            return {
+                "data": {},
+                "error": f"Slack API Error: {error_code}\n\nThe channel '{channel}' does not exist or is not accessible.",
                 "successful": False
             }
-        elif error_code == 'invalid_page':
+        elif error_code == 'invalid_time_range':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nPage number '{page}' is invalid.",
+                "error": f"Slack API Error: {error_code}\n\nThe time range from '{oldest}' to '{latest}' is invalid.",
                 "successful": False
             }
         elif error_code == 'not_authed':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Please check your SLACK_USER_TOKEN.",
+                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Please check your SLACK_BOT_TOKEN.",
                 "successful": False
             }
         elif error_code == 'invalid_auth':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Please check your SLACK_USER_TOKEN.",
+                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Please check your SLACK_BOT_TOKEN.",
                 "successful": False
             }
         elif error_code == 'account_inactive':
@@ -10767,19 +9222,13 @@ async def slack_lists_user_s_starred_items_with_pagination(
         elif error_code == 'no_permission':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to list starred items. The user token needs stars:read scope.",
+                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to list scheduled messages. The bot needs chat:write scope.",
                 "successful": False
             }
         elif error_code == 'missing_scope':
             return {
                 "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The user token needs stars:read scope to list starred items.",
-                "successful": False
-            }
-        elif error_code == 'not_allowed_token_type':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nStarred items require a user token (xoxp-). Please set SLACK_USER_TOKEN with a user token that has stars:read scope.",
+                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs chat:write scope to list scheduled messages.",
                 "successful": False
             }
         return {
@@ -10794,8 +9243,728 @@ async def slack_lists_user_s_starred_items_with_pagination(
             "successful": False
         }
 
+# pins.list error code -> user-facing message ({channel} is filled in per call)
+_PINS_LIST_ERROR_MESSAGES = {
+    "channel_not_found": "Slack API Error: channel_not_found\n\nThe channel '{channel}' does not exist or is not accessible.",
+    "not_in_channel": "Slack API Error: not_in_channel\n\nThe bot is not a member of the channel '{channel}'.",
+    "not_authed": _ERR_NOT_AUTHED_BOT,
+    "invalid_auth": _ERR_INVALID_AUTH_BOT,
+    "account_inactive": _ERR_ACCOUNT_INACTIVE,
+    "token_revoked": _ERR_TOKEN_REVOKED,
+    "no_permission": "Slack API Error: no_permission\n\nInsufficient permissions to list pinned items. The bot needs pins:read scope.",
+    "missing_scope": "Slack API Error: missing_scope\n\nMissing required OAuth scope. The bot needs pins:read scope to list pinned items."
+}
+
+# stars.list error code -> user-facing message ({cursor} and {page} are filled in per call)
+_STARS_LIST_ERROR_MESSAGES = {
+    "invalid_cursor": _ERR_INVALID_CURSOR,
+    "invalid_page": _ERR_INVALID_PAGE,
+    "not_authed": _ERR_NOT_AUTHED_USER,
+    "invalid_auth": _ERR_INVALID_AUTH_USER,
+    "account_inactive": _ERR_ACCOUNT_INACTIVE,
+    "token_revoked": _ERR_TOKEN_REVOKED,
+    "no_permission": "Slack API Error: no_permission\n\nInsufficient permissions to list starred items. The user token needs stars:read scope.",
+    "missing_scope": "Slack API Error: missing_scope\n\nMissing required OAuth scope. The user token needs stars:read scope to list starred items.",
+    "not_allowed_token_type": "Slack API Error: not_allowed_token_type\n\nStarred items require a user token (xoxp-). Please set SLACK_USER_TOKEN with a user token that has stars:read scope."
+}
+
+@dataclass(slots=True)
+class PinnedItem:
+    """A pinned item as returned by slack_lists_pinned_items_in_a_channel."""
+    type: Optional[str]
+    channel: Optional[str]
+    created: Optional[int]
+    created_by: Optional[str]
+    timestamp: Optional[str]
+    message: dict
+    file: dict
+    comment: dict
+    item_id: Optional[str]
+    item_type: Optional[str]
+    pinned_by: Optional[str]
+    pinned_at: Optional[int]
+    channel_id: Optional[str]
+    is_message: bool
+    is_file: bool
+    is_comment: bool
+
+# Shared response for a channel without pins
+_NO_PINNED_ITEMS = ToolResponse(_NO_ITEMS, "", True)
+
+@dataclass(slots=True)
+class StarredItem:
+    """A starred item as returned by slack_list_starred_items."""
+    type: Optional[str]
+    channel: Optional[str]
+    message: dict
+    file: dict
+    comment: dict
+    item_id: Optional[str]
+    item_type: Optional[str]
+    channel_id: Optional[str]
+    is_message: bool
+    is_file: bool
+    is_comment: bool
+    is_starred: bool
+
+class ItemClasses(NamedTuple):
+    """The item dataclass for each Slack item type, all sharing one base."""
+    base: type
+    message: type
+    file_summary: type
+    file: type
+    comment: type
+
+def _item_classes(base: type, prefix: str) -> ItemClasses:
+    """Derive the message, file and comment item dataclasses from a base item class."""
+    @dataclass(slots=True)
+    class Message(base):
+        """An item holding a message, with the message fields flattened in."""
+        message_text: str
+        message_user: str
+        message_ts: str
+        message_blocks: list
+        message_attachments: list
+        message_thread_ts: str
+        message_reply_count: int
+        message_reply_users: list
+        message_reply_users_count: int
+        message_latest_reply: str
+        message_subtype: str
+        message_hidden: bool
+        message_edited: dict
+        message_deleted_ts: str
+        message_event_ts: str
+        message_team: str
+        message_has_blocks: bool
+        message_has_attachments: bool
+        message_is_thread: bool
+        message_blocks_count: int
+        message_attachments_count: int
+
+    @dataclass(slots=True)
+    class FileSummary(base):
+        """An item holding a file, with only its commonly used fields flattened in."""
+        file_id: str
+        file_name: str
+        file_title: str
+        file_mimetype: str
+        file_filetype: str
+        file_size: int
+        file_url_private: str
+        file_url_private_download: str
+        file_thumb_360: str
+        file_created: int
+        file_timestamp: int
+        file_user: str
+        file_is_external: bool
+        file_is_public: bool
+
+    @dataclass(slots=True)
+    class File(base):
+        """An item holding a file, with every file field flattened in (thumbnails as file_thumb_*)."""
+        file_id: str
+        file_name: str
+        file_title: str
+        file_mimetype: str
+        file_filetype: str
+        file_size: int
+        file_url_private: str
+        file_url_private_download: str
+        file_thumb_360: str
+        file_thumb_480: str
+        file_thumb_720: str
+        file_thumb_800: str
+        file_thumb_960: str
+        file_thumb_1024: str
+        file_thumb_160: str
+        file_thumb_360_w: int
+        file_thumb_360_h: int
+        file_thumb_480_w: int
+        file_thumb_480_h: int
+        file_thumb_720_w: int
+        file_thumb_720_h: int
+        file_thumb_800_w: int
+        file_thumb_800_h: int
+        file_thumb_960_w: int
+        file_thumb_960_h: int
+        file_thumb_1024_w: int
+        file_thumb_1024_h: int
+        file_thumb_160_w: int
+        file_thumb_160_h: int
+        file_original_w: int
+        file_original_h: int
+        file_created: int
+        file_timestamp: int
+        file_user: str
+        file_username: str
+        file_editable: bool
+        file_is_external: bool
+        file_external_type: str
+        file_is_public: bool
+        file_public_url_shared: bool
+        file_display_as_bot: bool
+        file_mode: str
+        file_media_display_type: str
+        file_preview: str
+        file_preview_highlight: str
+        file_lines: int
+        file_lines_more: int
+        file_thumb_tiny: str
+        file_thumb_video: str
+        file_thumb_video_w: int
+        file_thumb_video_h: int
+        file_duration_ms: int
+        file_hd: bool
+        file_subtype: str
+        file_transcription: dict
+        file_mp4: str
+        file_vtt: str
+        file_hls: str
+        file_hls_embed: str
+        file_dash: str
+        file_dash_embed: str
+        file_is_animated: bool
+        file_is_removed: bool
+        file_deanimate_gif: str
+        file_deanimate: str
+        file_pjs: str
+        file_pjpeg: str
+        file_comments_count: int
+        file_initial_comment: dict
+        file_num_stars: int
+        file_pinned_to: list
+        file_reactions: list
+        file_shares: dict
+        file_channels: list
+        file_groups: list
+        file_ims: list
+        file_external_id: str
+        file_external_url: str
+        file_app_id: str
+        file_app_name: str
+        file_has_rich_preview: bool
+
+    @dataclass(slots=True)
+    class Comment(base):
+        """An item holding a file comment, with the comment fields flattened in."""
+        comment_id: str
+        comment_text: str
+        comment_user: str
+        comment_created: int
+        comment_timestamp: str
+        comment_reply_count: int
+        comment_reply_users: list
+        comment_reply_users_count: int
+        comment_latest_reply: str
+        comment_subtype: str
+        comment_hidden: bool
+        comment_edited: dict
+        comment_deleted_ts: str
+        comment_event_ts: str
+        comment_team: str
+        comment_blocks: list
+        comment_attachments: list
+        comment_has_blocks: bool
+        comment_has_attachments: bool
+        comment_blocks_count: int
+        comment_attachments_count: int
+
+    classes = ItemClasses(base, Message, FileSummary, File, Comment)
+    for cls in classes[1:]:
+        cls.__name__ = cls.__qualname__ = prefix + cls.__name__
+    return classes
+
+PINNED_ITEM_CLASSES = _item_classes(PinnedItem, "Pinned")
+STARRED_ITEM_CLASSES = _item_classes(StarredItem, "Starred")
+
+def _pinned_item_base(item: dict, item_type: Optional[str], message, file, comment) -> tuple:
+    """Fields shared by every pinned item, in PinnedItem field order."""
+    channel_id = item.get("channel")
+    created = item.get("created")
+    created_by = item.get("created_by")
+    return (
+        item_type, channel_id, created, created_by, item.get("timestamp"),
+        message or {}, file or {}, comment or {}, item.get("id"), item_type,
+        created_by, created, channel_id,
+        item_type == "message", item_type == "file", item_type == "comment"
+    )
+
+def _starred_item_base(item: dict, item_type: Optional[str], message, file, comment) -> tuple:
+    """Fields shared by every starred item, in StarredItem field order."""
+    channel_id = item.get("channel")
+    return (
+        item_type, channel_id, message or {}, file or {}, comment or {},
+        item.get("id"), item_type, channel_id,
+        item_type == "message", item_type == "file", item_type == "comment", True
+    )
+
+def _format_message(cls: type, base: tuple, message) -> Any:
+    """Format an item holding a message."""
+    return cls(
+        *base,
+        message_text=message.get("text", ""),
+        message_user=message.get("user", ""),
+        message_ts=message.get("ts", ""),
+        message_blocks=message.get("blocks", _NO_ITEMS),
+        message_attachments=message.get("attachments", _NO_ITEMS),
+        message_thread_ts=message.get("thread_ts", ""),
+        message_reply_count=message.get("reply_count", 0),
+        message_reply_users=message.get("reply_users", _NO_ITEMS),
+        message_reply_users_count=message.get("reply_users_count", 0),
+        message_latest_reply=message.get("latest_reply", ""),
+        message_subtype=message.get("subtype", ""),
+        message_hidden=message.get("hidden", False),
+        message_edited=message.get("edited", {}),
+        message_deleted_ts=message.get("deleted_ts", ""),
+        message_event_ts=message.get("event_ts", ""),
+        message_team=message.get("team", ""),
+        message_has_blocks=bool(message.get("blocks")),
+        message_has_attachments=bool(message.get("attachments")),
+        message_is_thread=bool(message.get("thread_ts")),
+        message_blocks_count=len(message.get("blocks", _NO_ITEMS)),
+        message_attachments_count=len(message.get("attachments", _NO_ITEMS))
+    )
+
+def _format_file_summary(cls: type, base: tuple, file) -> Any:
+    """Format an item holding a file with the fields most callers need."""
+    return cls(
+        *base,
+        file_id=file.get("id", ""),
+        file_name=file.get("name", ""),
+        file_title=file.get("title", ""),
+        file_mimetype=file.get("mimetype", ""),
+        file_filetype=file.get("filetype", ""),
+        file_size=file.get("size", 0),
+        file_url_private=file.get("url_private", ""),
+        file_url_private_download=file.get("url_private_download", ""),
+        file_thumb_360=file.get("thumb_360", ""),
+        file_created=file.get("created", 0),
+        file_timestamp=file.get("timestamp", 0),
+        file_user=file.get("user", ""),
+        file_is_external=file.get("is_external", False),
+        file_is_public=file.get("is_public", False)
+    )
+
+def _format_file(cls: type, base: tuple, file) -> Any:
+    """Format an item holding a file with every file field Slack may return."""
+    return cls(
+        *base,
+        file_id=file.get("id", ""),
+        file_name=file.get("name", ""),
+        file_title=file.get("title", ""),
+        file_mimetype=file.get("mimetype", ""),
+        file_filetype=file.get("filetype", ""),
+        file_size=file.get("size", 0),
+        file_url_private=file.get("url_private", ""),
+        file_url_private_download=file.get("url_private_download", ""),
+        file_thumb_360=file.get("thumb_360", ""),
+        file_thumb_480=file.get("thumb_480", ""),
+        file_thumb_720=file.get("thumb_720", ""),
+        file_thumb_800=file.get("thumb_800", ""),
+        file_thumb_960=file.get("thumb_960", ""),
+        file_thumb_1024=file.get("thumb_1024", ""),
+        file_thumb_160=file.get("thumb_160", ""),
+        file_thumb_360_w=file.get("thumb_360_w", 0),
+        file_thumb_360_h=file.get("thumb_360_h", 0),
+        file_thumb_480_w=file.get("thumb_480_w", 0),
+        file_thumb_480_h=file.get("thumb_480_h", 0),
+        file_thumb_720_w=file.get("thumb_720_w", 0),
+        file_thumb_720_h=file.get("thumb_720_h", 0),
+        file_thumb_800_w=file.get("thumb_800_w", 0),
+        file_thumb_800_h=file.get("thumb_800_h", 0),
+        file_thumb_960_w=file.get("thumb_960_w", 0),
+        file_thumb_960_h=file.get("thumb_960_h", 0),
+        file_thumb_1024_w=file.get("thumb_1024_w", 0),
+        file_thumb_1024_h=file.get("thumb_1024_h", 0),
+        file_thumb_160_w=file.get("thumb_160_w", 0),
+        file_thumb_160_h=file.get("thumb_160_h", 0),
+        file_original_w=file.get("original_w", 0),
+        file_original_h=file.get("original_h", 0),
+        file_created=file.get("created", 0),
+        file_timestamp=file.get("timestamp", 0),
+        file_user=file.get("user", ""),
+        file_username=file.get("username", ""),
+        file_editable=file.get("editable", False),
+        file_is_external=file.get("is_external", False),
+        file_external_type=file.get("external_type", ""),
+        file_is_public=file.get("is_public", False),
+        file_public_url_shared=file.get("public_url_shared", False),
+        file_display_as_bot=file.get("display_as_bot", False),
+        file_mode=file.get("mode", ""),
+        file_media_display_type=file.get("media_display_type", ""),
+        file_preview=file.get("preview", ""),
+        file_preview_highlight=file.get("preview_highlight", ""),
+        file_lines=file.get("lines", 0),
+        file_lines_more=file.get("lines_more", 0),
+        file_thumb_tiny=file.get("thumb_tiny", ""),
+        file_thumb_video=file.get("thumb_video", ""),
+        file_thumb_video_w=file.get("thumb_video_w", 0),
+        file_thumb_video_h=file.get("thumb_video_h", 0),
+        file_duration_ms=file.get("duration_ms", 0),
+        file_hd=file.get("hd", False),
+        file_subtype=file.get("subtype", ""),
+        file_transcription=file.get("transcription", {}),
+        file_mp4=file.get("mp4", ""),
+        file_vtt=file.get("vtt", ""),
+        file_hls=file.get("hls", ""),
+        file_hls_embed=file.get("hls_embed", ""),
+        file_dash=file.get("dash", ""),
+        file_dash_embed=file.get("dash_embed", ""),
+        file_is_animated=file.get("is_animated", False),
+        file_is_removed=file.get("is_removed", False),
+        file_deanimate_gif=file.get("deanimate_gif", ""),
+        file_deanimate=file.get("deanimate", ""),
+        file_pjs=file.get("pjs", ""),
+        file_pjpeg=file.get("pjpeg", ""),
+        file_comments_count=file.get("comments_count", 0),
+        file_initial_comment=file.get("initial_comment", {}),
+        file_num_stars=file.get("num_stars", 0),
+        file_pinned_to=file.get("pinned_to", _NO_ITEMS),
+        file_reactions=file.get("reactions", _NO_ITEMS),
+        file_shares=file.get("shares", {}),
+        file_channels=file.get("channels", _NO_ITEMS),
+        file_groups=file.get("groups", _NO_ITEMS),
+        file_ims=file.get("ims", _NO_ITEMS),
+        file_external_id=file.get("external_id", ""),
+        file_external_url=file.get("external_url", ""),
+        file_app_id=file.get("app_id", ""),
+        file_app_name=file.get("app_name", ""),
+        file_has_rich_preview=file.get("has_rich_preview", False)
+    )
+
+def _format_comment(cls: type, base: tuple, comment) -> Any:
+    """Format an item holding a file comment."""
+    return cls(
+        *base,
+        comment_id=comment.get("id", ""),
+        comment_text=comment.get("text", ""),
+        comment_user=comment.get("user", ""),
+        comment_created=comment.get("created", 0),
+        comment_timestamp=comment.get("timestamp", ""),
+        comment_reply_count=comment.get("reply_count", 0),
+        comment_reply_users=comment.get("reply_users", _NO_ITEMS),
+        comment_reply_users_count=comment.get("reply_users_count", 0),
+        comment_latest_reply=comment.get("latest_reply", ""),
+        comment_subtype=comment.get("subtype", ""),
+        comment_hidden=comment.get("hidden", False),
+        comment_edited=comment.get("edited", {}),
+        comment_deleted_ts=comment.get("deleted_ts", ""),
+        comment_event_ts=comment.get("event_ts", ""),
+        comment_team=comment.get("team", ""),
+        comment_blocks=comment.get("blocks", _NO_ITEMS),
+        comment_attachments=comment.get("attachments", _NO_ITEMS),
+        comment_has_blocks=bool(comment.get("blocks")),
+        comment_has_attachments=bool(comment.get("attachments")),
+        comment_blocks_count=len(comment.get("blocks", _NO_ITEMS)),
+        comment_attachments_count=len(comment.get("attachments", _NO_ITEMS))
+    )
+
+async def _list_items(
+    get_client: Callable[[], AsyncWebClient],
+    method_name: str,
+    params: dict,
+    error_messages: dict,
+    error_context: dict,
+    make_base: Callable[..., tuple],
+    classes: ItemClasses,
+    verbose: bool = True
+) -> tuple:
+    """
+    Call a pins/stars list method and format the returned items.
+    
+    Returns:
+        tuple: (error, items, response data); error is "" on success
+    """
+    try:
+        method = getattr(get_client(), method_name)
+        response = await method(**params)
+        
+        if not response.data.get("ok", False):
+            return _slack_error_message(response.data.get('error', 'Unknown error'), error_messages, error_context), [], {}
+        
+        items = response.data.get("items")
+        if not items:
+            return "", _NO_ITEMS, response.data
+        
+        if verbose:
+            format_file, file_cls = _format_file, classes.file
+        else:
+            format_file, file_cls = _format_file_summary, classes.file_summary
+        formatted_items = [None] * len(items)
+        for i, item in enumerate(items):
+            # Read each sub-object once; the shared read-only mapping stands in for missing ones
+            item_type = item.get("type")
+            message = item.get("message") or _EMPTY_DICT
+            file = item.get("file") or _EMPTY_DICT
+            comment = item.get("comment") or _EMPTY_DICT
+            base = make_base(item, item_type, message, file, comment)
+            
+            if item_type == "message" and message:
+                item_info = _format_message(classes.message, base, message)
+            elif item_type == "file" and file:
+                item_info = format_file(file_cls, base, file)
+            elif item_type == "comment" and comment:
+                item_info = _format_comment(classes.comment, base, comment)
+            else:
+                item_info = classes.base(*base)
+            
+            formatted_items[i] = item_info
+        
+        return "", formatted_items, response.data
+        
+    except SlackApiError as e:
+        return _slack_error_message(e.response.get('error', 'unknown_error'), error_messages, error_context), [], {}
+    except Exception as e:
+        return f"Unexpected error: {str(e)}", [], {}
+
+@lru_cache(maxsize=None)
+def _item_field_names(cls: type) -> tuple:
+    """Field names of an item dataclass, in declaration order."""
+    return tuple(field.name for field in fields(cls))
+
+def _items_to_columns(items) -> dict:
+    """
+    Turn a list of formatted items into one list per field.
+    
+    Every column has one entry per item; items whose type lacks a field hold None there.
+    """
+    item_count = len(items)
+    columns = {}
+    for cls in dict.fromkeys(type(item) for item in items):
+        for name in _item_field_names(cls):
+            if name not in columns:
+                columns[name] = [None] * item_count
+    for index, item in enumerate(items):
+        for name in _item_field_names(type(item)):
+            columns[name][index] = getattr(item, name)
+    return columns
+
+@mcp.tool()
+async def slack_lists_pinned_items_in_a_channel(
+    channel: Union[str, List[str]],
+    verbose: bool = False
+) -> ToolResponse:
+    """
+    Retrieves all messages and files pinned to a specified channel; the caller must have access to this channel.
+    
+    A list of channel IDs may be passed to fetch the pins of several channels in one call;
+    the requests are issued concurrently (at most SLACK_MAX_CONCURRENT_REQUESTS at a time
+    for this call) and the result is keyed by channel ID.
+    
+    Pinned files are summarized by default (id, name, title, type, size, URLs, 360px thumbnail,
+    owner and timestamps). Set verbose to get every file field, including all thumbnail
+    sizes, video renditions, previews and sharing details.
+    
+    Args:
+        channel (str | list[str]): Channel ID, or list of channel IDs, to retrieve pinned items from (required)
+        verbose (bool): Include every file field instead of the summary (default: False)
+        
+    Returns:
+        dict: Response with data, error, and successful fields
+    """
+    if isinstance(channel, str):
+        return await _list_pinned_items_in_channel(channel, verbose)
+    
+    channels = list(dict.fromkeys(c.strip() for c in channel if c and c.strip()))
+    if not channels:
+        return ToolResponse({}, "At least one channel ID is required", False)
+    
+    results = await _gather_limited(
+        partial(_list_pinned_items_in_channel, verbose=verbose), channels, return_exceptions=True
+    )
+    
+    pins_by_channel = {}
+    failed_channels = []
+    for c, result in zip(channels, results):
+        if isinstance(result, BaseException):
+            result = ToolResponse(_NO_ITEMS, f"Unexpected error: {str(result)}", False)
+        if not result.successful:
+            failed_channels.append(c)
+        pins_by_channel[c] = result
+    
+    return ToolResponse(
+        pins_by_channel,
+        f"Failed to list pinned items for channels: {', '.join(failed_channels)}" if failed_channels else "",
+        not failed_channels
+    )
+
+async def _list_pinned_items_in_channel(channel: str, verbose: bool = False) -> ToolResponse:
+    """List and format the pinned items of a single channel."""
+    error, pinned_items, _ = await _list_items(
+        get_async_slack_client, "pins_list", {"channel": channel},
+        _PINS_LIST_ERROR_MESSAGES, {"channel": channel},
+        _pinned_item_base, PINNED_ITEM_CLASSES, verbose
+    )
+    if error:
+        return ToolResponse(_NO_ITEMS, error, False)
+    if not pinned_items:
+        return _NO_PINNED_ITEMS
+    return ToolResponse(pinned_items, "", True)
+
+@mcp.tool()
+async def slack_list_starred_items(
+    count: int = 20,
+    cursor: str = "",
+    limit: int = 20,
+    page: int = 1,
+    columnar: bool = False,
+    max_pages: int = 1
+) -> ToolResponse:
+    """
+    Lists items starred by a user.
+    
+    With max_pages above 1, next_cursor is followed within this call and the items of up to
+    max_pages pages are returned together; next_cursor then points past the last page fetched.
+    
+    With columnar set, the items are returned as "starred_items_columns" instead of
+    "starred_items": one list per field, each holding one entry per item (None where the
+    item's type has no such field). This avoids repeating ~80 keys per item on large pages.
+    
+    Args:
+        count (int): Number of items to return (default: 20)
+        cursor (str): Pagination cursor for fetching additional results (optional)
+        limit (int): Maximum number of items to return (default: 20)
+        page (int): Page number for pagination (default: 1)
+        columnar (bool): Return items as per-field columns (default: False)
+        max_pages (int): Maximum number of pages to fetch by following next_cursor (default: 1)
+        
+    Returns:
+        dict: Response with data, error, and successful fields
+    """
+    return await _list_starred_items(count, cursor, limit, page, columnar, max_pages)
+
+async def _list_starred_items(
+    count: int,
+    cursor: str,
+    limit: int,
+    page: int,
+    columnar: bool = False,
+    max_pages: int = 1
+) -> ToolResponse:
+    """List the user's starred items; shared by the current and deprecated stars tools."""
+    # Prepare parameters for stars.list
+    params = {
+        'count': min(count, 1000),  # Slack API limit is 1000
+        'limit': min(limit, 1000)
+    }
+    
+    # Add optional parameters
+    if cursor:
+        params['cursor'] = cursor
+    if page > 1:
+        params['page'] = page
+    
+    starred_items = []
+    async for error, page_items, response_data in _iter_starred_pages(params, page, max_pages):
+        if error:
+            return ToolResponse({}, error, False)
+        starred_items.extend(page_items)
+    
+    # Get pagination info
+    response_metadata = response_data.get("response_metadata", {})
+    next_cursor = response_metadata.get("next_cursor", "")
+    
+    if columnar:
+        items_key, items_value = "starred_items_columns", _items_to_columns(starred_items)
+    else:
+        items_key, items_value = "starred_items", starred_items
+    
+    return ToolResponse(
+        {
+            items_key: items_value,
+            "total_found": len(starred_items),
+            "count_requested": count,
+            "limit_requested": limit,
+            "page_requested": page,
+            "next_cursor": next_cursor,
+            "has_more": bool(next_cursor),
+            "pagination": {
+                "current_page": page,
+                "items_per_page": count,
+                "total_items": len(starred_items),
+                "has_next_page": bool(next_cursor)
+            }
+        },
+        "",
+        True
+    )
+
+async def _iter_starred_pages(params: dict, page: int, max_pages: int):
+    """
+    Yield (error, items, response_data) for successive stars.list pages, following
+    next_cursor for at most max_pages pages and stopping after an error.
+    """
+    for _ in range(max(max_pages, 1)):
+        # Stars require user tokens
+        error, items, response_data = await _list_items(
+            get_async_slack_user_client, "stars_list", params,
+            _STARS_LIST_ERROR_MESSAGES, {"cursor": params.get('cursor', ""), "page": page},
+            _starred_item_base, STARRED_ITEM_CLASSES
+        )
+        yield error, items, response_data
+        if error:
+            return
+        next_cursor = response_data.get("response_metadata", {}).get("next_cursor", "")
+        if not next_cursor:
+            return
+        # Later pages are addressed by cursor alone
+        params = {**params, 'cursor': next_cursor}
+        params.pop('page', None)
+
+@mcp.tool()
+async def slack_lists_user_s_starred_items_with_pagination(
+    count: int = 20,
+    cursor: str = "",
+    limit: int = 20,
+    page: int = 1
+) -> ToolResponse:
+    """
+    Deprecated: lists items starred by a user. use `list starred items` instead.
+    
+    Args:
+        count (int): Number of items to return (default: 20)
+        cursor (str): Pagination cursor for fetching additional results (optional)
+        limit (int): Maximum number of items to return (default: 20)
+        page (int): Page number for pagination (default: 1)
+        
+    Returns:
+        dict: Response with data, error, and successful fields
+    """
+    response = await _list_starred_items(count, cursor, limit, page)
+    if not response.successful:
+        return response
+    return ToolResponse(
+        {
+            **response.data,
+            "deprecation_warning": "This tool is deprecated. Use 'list starred items' instead for better functionality."
+        },
+        "",
+        True
+    )
+
+@dataclass(slots=True, frozen=True)
+class CustomEmoji:
+    """A workspace custom emoji backed by an image."""
+    name: str
+    url: str
+    type: str = "custom_emoji"
+    is_alias: bool = False
+    is_unicode: bool = False
+    is_custom: bool = True
+
+@dataclass(slots=True, frozen=True)
+class EmojiAlias:
+    """A workspace custom emoji that points at another emoji."""
+    name: str
+    alias_target: str
+    type: str = "emoji_alias"
+    is_alias: bool = True
+    is_unicode: bool = False
+    is_custom: bool = True
+
 @mcp.tool()
-async def slack_list_team_custom_emojis() -> dict:
+async def slack_list_team_custom_emojis() -> ToolResponse:
     """
     Retrieves all custom emojis for the slack workspace (image urls or aliases), not standard unicode emojis; 
     does not include usage statistics or creation dates.
@@ -10804,173 +9973,332 @@ async def slack_list_team_custom_emojis() -> dict:
         dict: Response with data, error, and successful fields
     """
     try:
-        client = get_slack_client()
+        client = get_async_slack_client()
         
-        # Use the emoji.list method
-        response = client.emoji_list()
+        # Use the emoji.list method (awaited, so the event loop stays free during the request)
+        response = await client.emoji_list()
         
         if not response.data.get("ok", False):
             error = response.data.get('error', 'Unknown error')
-            if error == 'not_authed':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nAuthentication failed. Please check your SLACK_BOT_TOKEN.",
-                    "successful": False
-                }
-            elif error == 'invalid_auth':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nInvalid authentication token. Please check your SLACK_BOT_TOKEN.",
-                    "successful": False
-                }
-            elif error == 'account_inactive':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nThe authentication token belongs to a deactivated user.",
-                    "successful": False
-                }
-            elif error == 'token_revoked':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nThe authentication token has been revoked.",
-                    "successful": False
-                }
-            elif error == 'no_permission':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nInsufficient permissions to list custom emojis. The bot needs emoji:read scope.",
-                    "successful": False
-                }
-            elif error == 'missing_scope':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nMissing required OAuth scope. The bot needs emoji:read scope to list custom emojis.",
-                    "successful": False
-                }
-            else:
-                return {
-                    "data": {},
-                    "error": f"Failed to list custom emojis: {error}",
-                    "successful": False
-                }
+            return _handle_slack_api_error(error, "emoji:read", "list custom emojis")
         
         emoji_data = response.data.get("emoji", {})
         
-        # Format emoji information
+        # Format emoji information, counting each kind as we go; walking the names in
+        # sorted order keeps the output ordered by name without sorting it afterwards
         custom_emojis = []
-        for emoji_name, emoji_url in emoji_data.items():
+        custom_count = alias_count = 0
+        for emoji_name, emoji_url in sorted(emoji_data.items()):
             # Skip standard unicode emojis (they don't have URLs)
-            if emoji_url and not emoji_url.startswith('alias:'):
-                emoji_info = {
-                    "name": emoji_name,
-                    "url": emoji_url,
-                    "type": "custom_emoji",
-                    "is_alias": False,
-                    "is_unicode": False,
-                    "is_custom": True
-                }
-                custom_emojis.append(emoji_info)
-            elif emoji_url and emoji_url.startswith('alias:'):
+            if not emoji_url:
+                continue
+            if not emoji_url.startswith('alias:'):
+                custom_count += 1
+                custom_emojis.append(CustomEmoji(emoji_name, emoji_url))
+            else:
                 # Handle emoji aliases
-                alias_target = emoji_url.replace('alias:', '')
-                emoji_info = {
-                    "name": emoji_name,
-                    "alias_target": alias_target,
-                    "type": "emoji_alias",
-                    "is_alias": True,
-                    "is_unicode": False,
-                    "is_custom": True
-                }
-                custom_emojis.append(emoji_info)
-        
-        # Sort emojis by name for consistent ordering
-        custom_emojis.sort(key=lambda x: x["name"])
+                alias_count += 1
+                custom_emojis.append(EmojiAlias(emoji_name, emoji_url[6:]))
         
-        return {
-            "data": {
+        return ToolResponse(
+            {
                 "custom_emojis": custom_emojis,
                 "total_found": len(custom_emojis),
                 "emoji_types": {
-                    "custom_emojis": len([e for e in custom_emojis if not e["is_alias"]]),
-                    "emoji_aliases": len([e for e in custom_emojis if e["is_alias"]])
+                    "custom_emojis": custom_count,
+                    "emoji_aliases": alias_count
                 },
                 "workspace_info": "Custom emojis for the Slack workspace",
                 "note": "Does not include usage statistics or creation dates"
             },
-            "error": "",
-            "successful": True
-        }
+            "",
+            True
+        )
         
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'not_authed':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Please check your SLACK_BOT_TOKEN.",
-                "successful": False
-            }
-        elif error_code == 'invalid_auth':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Please check your SLACK_BOT_TOKEN.",
-                "successful": False
-            }
-        elif error_code == 'account_inactive':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe authentication token belongs to a deactivated user.",
-                "successful": False
-            }
-        elif error_code == 'token_revoked':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe authentication token has been revoked.",
-                "successful": False
-            }
-        elif error_code == 'no_permission':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to list custom emojis. The bot needs emoji:read scope.",
-                "successful": False
-            }
-        elif error_code == 'missing_scope':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs emoji:read scope to list custom emojis.",
-                "successful": False
-            }
-        return {
-            "data": {},
-            "error": f"Slack API Error: {error_code}",
-            "successful": False
-        }
+        return _handle_slack_api_error(error_code, "emoji:read", "list custom emojis")
     except Exception as e:
-        return {
-            "data": {},
-            "error": f"Unexpected error: {str(e)}",
-            "successful": False
+        return ToolResponse({}, f"Unexpected error: {str(e)}", False)
+
+# usergroups.list results keyed by the tool's arguments; user groups
+# change rarely, so repeat calls within SLACK_USERGROUPS_CACHE_TTL seconds skip the request
+# (the user group tools in this server clear it after every successful change)
+SLACK_USERGROUPS_CACHE_TTL = int(os.getenv("SLACK_USERGROUPS_CACHE_TTL", "86400"))
+usergroups_cache: TTLCache = TTLCache(maxsize=16, ttl=SLACK_USERGROUPS_CACHE_TTL)
+
+# Last successful usergroups.list result per key, served (marked stale) when Slack is unavailable;
+# bounded like usergroups_cache since every distinct fields projection is its own key
+usergroups_last_good: LRUCache = LRUCache(maxsize=16)
+
+# group_types for a workspace with no user groups; shared by every empty result and never mutated
+_ZERO_GROUP_TYPES: Final = {"active": 0, "disabled": 0, "external": 0, "internal": 0, "auto_configured": 0}
+
+# Slack error codes that indicate a temporary outage rather than a problem with the request
+_TRANSIENT_SLACK_ERRORS: Final = frozenset({
+    "ratelimited", "fatal_error", "internal_error", "service_unavailable", "request_timeout"
+})
+
+def _invalidate_usergroups_cache() -> None:
+    """Forget cached and last good usergroups.list results after a user group change made here."""
+    usergroups_cache.clear()
+    usergroups_last_good.clear()
+
+def _stale_usergroups(cache_key: tuple) -> dict:
+    """Return the last good usergroups.list result for cache_key, flagged as stale."""
+    result = usergroups_last_good[cache_key]
+    return {**result, "data": {**result["data"], "stale": True}}
+
+@dataclass(slots=True)
+class UserGroup:
+    """A user group as returned by slack_list_user_groups_for_team_with_options."""
+    id: Optional[str]
+    team_id: Optional[str]
+    name: Optional[str]
+    description: str
+    handle: str
+    is_external: bool
+    is_active: bool
+    date_create: int
+    date_update: int
+    date_delete: int
+    auto_type: str
+    auto_value: str
+    created_by: str
+    updated_by: str
+    deleted_by: str
+    prefs: dict
+    user_count: Optional[int]
+    users: list
+
+def _format_user_group(group: dict, user_count: Optional[int], users) -> UserGroup:
+    """Format a usergroups.list group with one field per Slack field."""
+    group_get = group.get
+    return UserGroup(
+        group_get("id"),
+        group_get("team_id"),
+        group_get("name"),
+        group_get("description", ""),
+        group_get("handle", ""),
+        group_get("is_external", False),
+        group_get("is_active", True),
+        group_get("date_create", 0),
+        group_get("date_update", 0),
+        group_get("date_delete", 0),
+        group_get("auto_type", ""),
+        group_get("auto_value", ""),
+        group_get("created_by", ""),
+        group_get("updated_by", ""),
+        group_get("deleted_by", ""),
+        group_get("prefs", {}),
+        user_count,
+        users
+    )
+
+def _format_user_group_plain(group: dict) -> UserGroup:
+    return _format_user_group(group, None, _NO_ITEMS)
+
+def _format_user_group_with_count(group: dict) -> UserGroup:
+    return _format_user_group(group, group.get("user_count", 0), _NO_ITEMS)
+
+def _format_user_group_with_users(group: dict) -> UserGroup:
+    users = group.get("users", [])
+    return _format_user_group(group, len(users) if users else None, users)
+
+def _format_user_group_with_count_and_users(group: dict) -> UserGroup:
+    return _format_user_group(group, group.get("user_count", 0), group.get("users", []))
+
+# (include_count, include_users) -> group formatter, so the loop does not re-test the options per group
+_USER_GROUP_FORMATTERS = {
+    (False, False): _format_user_group_plain,
+    (True, False): _format_user_group_with_count,
+    (False, True): _format_user_group_with_users,
+    (True, True): _format_user_group_with_count_and_users,
+}
+
+# Slack default for each UserGroup field read straight from a usergroups.list group; user_count
+# and users depend on the include_* options and are handled by _user_group_projector
+_USER_GROUP_FIELD_DEFAULTS: Final = {
+    "id": None,
+    "team_id": None,
+    "name": None,
+    "description": "",
+    "handle": "",
+    "is_external": False,
+    "is_active": True,
+    "date_create": 0,
+    "date_update": 0,
+    "date_delete": 0,
+    "auto_type": "",
+    "auto_value": "",
+    "created_by": "",
+    "updated_by": "",
+    "deleted_by": "",
+    "prefs": {},
+}
+_USER_GROUP_FIELD_NAMES: Final = tuple(field.name for field in fields(UserGroup))
+
+@lru_cache(maxsize=32)
+def _user_group_projector(names: tuple, include_count: bool, include_users: bool) -> Callable[[dict], dict]:
+    """Return a group formatter that builds only the given UserGroup fields (the fields argument)."""
+    plain = tuple((name, _USER_GROUP_FIELD_DEFAULTS[name]) for name in names if name in _USER_GROUP_FIELD_DEFAULTS)
+    want_user_count = "user_count" in names
+    want_users = "users" in names
+    
+    def project(group: dict) -> dict:
+        group_get = group.get
+        record = {name: group_get(name, default) for name, default in plain}
+        # Same user_count/users values as the matching _USER_GROUP_FORMATTERS entry, reading
+        # the users list at most once
+        users = group_get("users", []) if include_users else _NO_ITEMS
+        if want_user_count:
+            if include_count:
+                record["user_count"] = group_get("user_count", 0)
+            else:
+                record["user_count"] = len(users) if users else None
+        if want_users:
+            record["users"] = users
+        return record
+    
+    return project
+
+def _format_user_group_legacy(group: dict, include_count: bool, include_users: bool) -> dict:
+    """Format a usergroups.list group with the older alias keys (legacy_aliases=True)."""
+    # Read each field once; several output keys below repeat the same value
+    group_get = group.get
+    date_create = group_get("date_create", 0)
+    date_update = group_get("date_update", 0)
+    date_delete = group_get("date_delete", 0)
+    auto_type = group_get("auto_type", "")
+    auto_value = group_get("auto_value", "")
+    created_by = group_get("created_by", "")
+    updated_by = group_get("updated_by", "")
+    deleted_by = group_get("deleted_by", "")
+    prefs = group_get("prefs", {})
+    is_active = group_get("is_active", True)
+    is_external = group_get("is_external", False)
+    user_count = group_get("user_count", 0) if include_count else None
+    users = group_get("users", []) if include_users else []
+    is_auto_type = bool(auto_type)
+    group_info = {
+        "id": group_get("id"),
+        "team_id": group_get("team_id"),
+        "name": group_get("name"),
+        "description": group_get("description", ""),
+        "handle": group_get("handle", ""),
+        "is_external": is_external,
+        "date_create": date_create,
+        "date_update": date_update,
+        "date_delete": date_delete,
+        "auto_type": auto_type,
+        "auto_value": auto_value,
+        "created_by": created_by,
+        "updated_by": updated_by,
+        "deleted_by": deleted_by,
+        "prefs": prefs,
+        "user_count": user_count,
+        "users": users,
+        "is_active": is_active,
+        "is_disabled": not is_active,
+        "is_auto_type": is_auto_type,
+        "auto_type_value": auto_value,
+        "created_timestamp": date_create,
+        "updated_timestamp": date_update,
+        "deleted_timestamp": date_delete,
+        "creator_user": created_by,
+        "updater_user": updated_by,
+        "deleter_user": deleted_by,
+        "preferences": prefs,
+        "member_count": user_count,
+        "member_list": users,
+        "group_type": "external" if group_get("is_external") else "internal",
+        "status": "active" if group_get("is_active") else "disabled",
+        "auto_configuration": {
+            "auto_type": auto_type,
+            "auto_value": auto_value,
+            "is_auto_configured": is_auto_type
+        },
+        "timestamps": {
+            "created": date_create,
+            "updated": date_update,
+            "deleted": date_delete
+        },
+        "users_info": {
+            "created_by": created_by,
+            "updated_by": updated_by,
+            "deleted_by": deleted_by
         }
+    }
+    
+    # Add user-specific information if include_users is True (stored directly rather than
+    # through update() with a throwaway dict)
+    if include_users and users:
+        users_total = len(users)
+        group_info["user_ids"] = users
+        group_info["user_count"] = users_total
+        group_info["member_list"] = users
+        group_info["has_members"] = users_total > 0
+        group_info["member_count"] = users_total
+    
+    # Add count-specific information if include_count is True
+    if include_count:
+        group_info["user_count"] = user_count
+        group_info["member_count"] = user_count
+        group_info["has_members"] = user_count > 0
+        group_info["is_empty"] = user_count == 0
+    
+    return group_info
 
 @mcp.tool()
 async def slack_list_user_groups_for_team_with_options(
     include_count: bool = False,
     include_disabled: bool = False,
-    include_users: bool = False
-) -> dict:
+    include_users: bool = False,
+    legacy_aliases: bool = False,
+    fields: Optional[List[str]] = None
+) -> ToolResponse:
     """
     Lists user groups in a slack workspace, including user-created and default groups; 
     results for large workspaces may be paginated.
     
+    Each group is returned with one key per Slack field (id, team_id, name, description, handle,
+    is_external, is_active, date_create, date_update, date_delete, auto_type, auto_value,
+    created_by, updated_by, deleted_by, prefs, user_count, users). Set legacy_aliases to also get
+    the older duplicate keys (member_count, member_list, timestamps, status, ...). Pass fields to
+    get only those keys per group, e.g. ["id", "name"]; legacy_aliases is ignored when fields is set.
+    
     Args:
         include_count (bool): Whether to include the number of users in each group (default: False)
         include_disabled (bool): Whether to include disabled user groups (default: False)
         include_users (bool): Whether to include the list of users in each group (default: False)
+        legacy_aliases (bool): Whether to add the older alias keys to each group (default: False)
+        fields (List[str]): Group fields to return, in any order (default: None, all fields)
         
     Returns:
         dict: Response with data, error, and successful fields
     """
+    # Requested fields in UserGroup order, so the same set always maps to one cache entry and projector
+    projected = None
+    if fields:
+        unknown = set(fields).difference(_USER_GROUP_FIELD_NAMES)
+        if unknown:
+            return ToolResponse(
+                {},
+                f"Invalid fields: {', '.join(sorted(unknown))}. Valid fields: {', '.join(_USER_GROUP_FIELD_NAMES)}",
+                False
+            )
+        requested = set(fields)
+        projected = tuple(name for name in _USER_GROUP_FIELD_NAMES if name in requested)
+        legacy_aliases = False
+    
+    cache_key = (include_count, include_disabled, include_users, legacy_aliases, projected)
+    cached = usergroups_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
     try:
-        client = get_slack_client()
+        # Bind the API method once; the cursor loop below may call it for several pages
+        usergroups_list = get_async_slack_client().usergroups_list
         
         # Prepare parameters for usergroups.list
         params = {
@@ -10979,206 +10307,105 @@ async def slack_list_user_groups_for_team_with_options(
             'include_users': include_users
         }
         
-        # Use the usergroups.list method
-        response = client.usergroups_list(**params)
-        
-        if not response.data.get("ok", False):
-            error = response.data.get('error', 'Unknown error')
-            if error == 'not_authed':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nAuthentication failed. Please check your SLACK_BOT_TOKEN.",
-                    "successful": False
-                }
-            elif error == 'invalid_auth':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nInvalid authentication token. Please check your SLACK_BOT_TOKEN.",
-                    "successful": False
-                }
-            elif error == 'account_inactive':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nThe authentication token belongs to a deactivated user.",
-                    "successful": False
-                }
-            elif error == 'token_revoked':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nThe authentication token has been revoked.",
-                    "successful": False
-                }
-            elif error == 'no_permission':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nInsufficient permissions to list user groups. The bot needs usergroups:read scope.",
-                    "successful": False
-                }
-            elif error == 'missing_scope':
-                return {
-                    "data": {},
-                    "error": f"Slack API Error: {error}\n\nMissing required OAuth scope. The bot needs usergroups:read scope to list user groups.",
-                    "successful": False
-                }
-            else:
-                return {
-                    "data": {},
-                    "error": f"Failed to list user groups: {error}",
-                    "successful": False
-                }
-        
-        usergroups = response.data.get("usergroups", [])
+        # Pick the group formatter for these options once, outside the loop; legacy and projected
+        # records are dicts, the lean ones UserGroup instances
+        if projected:
+            format_group = _user_group_projector(projected, bool(include_count), bool(include_users))
+        elif legacy_aliases:
+            format_group = partial(_format_user_group_legacy, include_count=include_count, include_users=include_users)
+        else:
+            format_group = _USER_GROUP_FORMATTERS[bool(include_count), bool(include_users)]
         
-        # Format user group information
+        # Format user group information, recording the group_types flags of the raw groups in
+        # the same pass (a projection may leave them out of the records) as parallel byte arrays
+        # that sum() counts in C, and keeping each group's name as its sort key
         user_group_list = []
-        for group in usergroups:
-            group_info = {
-                "id": group.get("id"),
-                "team_id": group.get("team_id"),
-                "name": group.get("name"),
-                "description": group.get("description", ""),
-                "handle": group.get("handle", ""),
-                "is_external": group.get("is_external", False),
-                "date_create": group.get("date_create", 0),
-                "date_update": group.get("date_update", 0),
-                "date_delete": group.get("date_delete", 0),
-                "auto_type": group.get("auto_type", ""),
-                "auto_value": group.get("auto_value", ""),
-                "created_by": group.get("created_by", ""),
-                "updated_by": group.get("updated_by", ""),
-                "deleted_by": group.get("deleted_by", ""),
-                "prefs": group.get("prefs", {}),
-                "user_count": group.get("user_count", 0) if include_count else None,
-                "users": group.get("users", []) if include_users else [],
-                "is_active": group.get("is_active", True),
-                "is_disabled": not group.get("is_active", True),
-                "is_external": group.get("is_external", False),
-                "is_auto_type": bool(group.get("auto_type")),
-                "auto_type_value": group.get("auto_value", ""),
-                "created_timestamp": group.get("date_create", 0),
-                "updated_timestamp": group.get("date_update", 0),
-                "deleted_timestamp": group.get("date_delete", 0),
-                "creator_user": group.get("created_by", ""),
-                "updater_user": group.get("updated_by", ""),
-                "deleter_user": group.get("deleted_by", ""),
-                "preferences": group.get("prefs", {}),
-                "member_count": group.get("user_count", 0) if include_count else None,
-                "member_list": group.get("users", []) if include_users else [],
-                "group_type": "external" if group.get("is_external") else "internal",
-                "status": "active" if group.get("is_active") else "disabled",
-                "auto_configuration": {
-                    "auto_type": group.get("auto_type", ""),
-                    "auto_value": group.get("auto_value", ""),
-                    "is_auto_configured": bool(group.get("auto_type"))
-                },
-                "timestamps": {
-                    "created": group.get("date_create", 0),
-                    "updated": group.get("date_update", 0),
-                    "deleted": group.get("date_delete", 0)
-                },
-                "users_info": {
-                    "created_by": group.get("created_by", ""),
-                    "updated_by": group.get("updated_by", ""),
-                    "deleted_by": group.get("deleted_by", "")
-                }
-            }
+        sort_names = []
+        active_flags = array('b')
+        external_flags = array('b')
+        auto_flags = array('b')
+        
+        # usergroups.list returns every group at once today; follow next_cursor anyway so a
+        # paginated reply is formatted page by page instead of being silently truncated
+        cursor = ""
+        while True:
+            if cursor:
+                params['cursor'] = cursor
             
-            # Add user-specific information if include_users is True
-            if include_users and group.get("users"):
-                users = group.get("users", [])
-                group_info.update({
-                    "user_ids": users,
-                    "user_count": len(users),
-                    "member_list": users,
-                    "has_members": len(users) > 0,
-                    "member_count": len(users)
-                })
+            # Use the usergroups.list method (awaited, so the event loop stays free during the request)
+            response = await usergroups_list(**params)
+            response_data = response.data
             
-            # Add count-specific information if include_count is True
-            if include_count:
-                user_count = group.get("user_count", 0)
-                group_info.update({
-                    "user_count": user_count,
-                    "member_count": user_count,
-                    "has_members": user_count > 0,
-                    "is_empty": user_count == 0
-                })
+            if not response_data.get("ok", False):
+                error = response_data.get('error', 'Unknown error')
+                return _handle_slack_api_error(error, "usergroups:read", "list user groups")
+            
+            # Grow the record and sort-key lists once per page, then fill the new slots by index
+            usergroups = response_data.get("usergroups", [])
+            offset = len(user_group_list)
+            padding = [None] * len(usergroups)
+            user_group_list += padding
+            sort_names += padding
+            for index, group in enumerate(usergroups, offset):
+                group_get = group.get
+                active_flags.append(bool(group_get("is_active", True)))
+                external_flags.append(bool(group_get("is_external", False)))
+                auto_flags.append(bool(group_get("auto_type")))
+                sort_names[index] = group_get("name")
+                user_group_list[index] = format_group(group)
             
-            user_group_list.append(group_info)
+            cursor = response_data.get("response_metadata", {}).get("next_cursor", "")
+            if not cursor:
+                break
         
-        # Sort user groups by name for consistent ordering
-        user_group_list.sort(key=lambda x: x["name"])
+        if user_group_list:
+            # Sort user groups by name for consistent ordering
+            order = sorted(range(len(sort_names)), key=sort_names.__getitem__)
+            user_group_list = [user_group_list[index] for index in order]
+            active_count = sum(active_flags)
+            external_count = sum(external_flags)
+            group_types = {
+                "active": active_count,
+                "disabled": len(user_group_list) - active_count,
+                "external": external_count,
+                "internal": len(user_group_list) - external_count,
+                "auto_configured": sum(auto_flags)
+            }
+        else:
+            # No groups (e.g. a new workspace): nothing to sort or count
+            group_types = _ZERO_GROUP_TYPES
         
-        return {
+        result = {
             "data": {
                 "user_groups": user_group_list,
                 "total_found": len(user_group_list),
                 "include_count": include_count,
                 "include_disabled": include_disabled,
                 "include_users": include_users,
-                "group_types": {
-                    "active": len([g for g in user_group_list if g["is_active"]]),
-                    "disabled": len([g for g in user_group_list if not g["is_active"]]),
-                    "external": len([g for g in user_group_list if g["is_external"]]),
-                    "internal": len([g for g in user_group_list if not g["is_external"]]),
-                    "auto_configured": len([g for g in user_group_list if g["is_auto_type"]])
-                },
+                "group_types": group_types,
                 "workspace_info": "User groups for the Slack workspace",
                 "pagination_note": "Results for large workspaces may be paginated"
             },
             "error": "",
             "successful": True
         }
+        # Cache the encoded result so repeat calls skip serialization entirely
+        usergroups_last_good[cache_key] = result
+        usergroups_cache[cache_key] = encoded = _orjson_tool_result(result)
+        return encoded
         
     except SlackApiError as e:
         error_code = e.response.get('error', 'unknown_error')
-        if error_code == 'not_authed':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nAuthentication failed. Please check your SLACK_BOT_TOKEN.",
-                "successful": False
-            }
-        elif error_code == 'invalid_auth':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInvalid authentication token. Please check your SLACK_BOT_TOKEN.",
-                "successful": False
-            }
-        elif error_code == 'account_inactive':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe authentication token belongs to a deactivated user.",
-                "successful": False
-            }
-        elif error_code == 'token_revoked':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nThe authentication token has been revoked.",
-                "successful": False
-            }
-        elif error_code == 'no_permission':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nInsufficient permissions to list user groups. The bot needs usergroups:read scope.",
-                "successful": False
-            }
-        elif error_code == 'missing_scope':
-            return {
-                "data": {},
-                "error": f"Slack API Error: {error_code}\n\nMissing required OAuth scope. The bot needs usergroups:read scope to list user groups.",
-                "successful": False
-            }
-        return {
-            "data": {},
-            "error": f"Slack API Error: {error_code}",
-            "successful": False
-        }
+        if error_code in _TRANSIENT_SLACK_ERRORS and cache_key in usergroups_last_good:
+            return _orjson_tool_result(_stale_usergroups(cache_key))
+        return _handle_slack_api_error(error_code, "usergroups:read", "list user groups")
+    except (OSError, aiohttp.ClientError) as e:
+        # Slack unreachable: fall back to the last good result if there is one
+        if cache_key in usergroups_last_good:
+            return _orjson_tool_result(_stale_usergroups(cache_key))
+        return ToolResponse({}, _ERR_NETWORK.format_map({"details": e}), False)
     except Exception as e:
-        return {
-            "data": {},
-            "error": f"Unexpected error: {str(e)}",
-            "successful": False
-        }
+        return ToolResponse({}, f"Unexpected error: {str(e)}", False)
 
 @mcp.tool()
 async def slack_list_user_reactions(
@@ -15845,7 +15072,7 @@ async def slack_rename_an_emoji(
     """
     try:
         # Use the provided token to create a client
-        client = WebClient(token=token)
+        client = get_slack_client_for_token(token)
         
         # Use the admin.emoji.rename method
         response = client.admin_emoji_rename(name=name, new_name=new_name)
@@ -18615,7 +17842,7 @@ def slack_schedules_a_message_to_a_channel_at_a_specified_time(
     """
     try:
         # Get Slack client
-        client = WebClient(token=os.getenv("SLACK_BOT_TOKEN"))
+        client = get_slack_client()
         
         # Prepare parameters
         params = {
@@ -18679,7 +17906,7 @@ def slack_search_for_messages_with_query(
     """
     try:
         # Get Slack client - search requires user token, not bot token
-        client = WebClient(token=os.getenv("SLACK_USER_TOKEN"))
+        client = get_slack_user_client()
         
         # Prepare parameters
         params = {
@@ -18728,7 +17955,7 @@ def slack_search_messages(
     """
     try:
         # Get Slack client - search requires user token, not bot token
-        client = WebClient(token=os.getenv("SLACK_USER_TOKEN"))
+        client = get_slack_user_client()
         
         # Prepare parameters
         params = {
@@ -18782,7 +18009,7 @@ def slack_send_ephemeral_message(
     """
     try:
         # Get Slack client
-        client = WebClient(token=os.getenv("SLACK_BOT_TOKEN"))
+        client = get_slack_client()
         
         # Prepare parameters
         params = {
@@ -18856,7 +18083,7 @@ def slack_sends_a_message_to_a_slack_channel(
     """
     try:
         # Get Slack client
-        client = WebClient(token=os.getenv("SLACK_BOT_TOKEN"))
+        client = get_slack_client()
         
         # Prepare parameters
         params = {
@@ -18931,7 +18158,7 @@ def slack_sends_ephemeral_messages_to_channel_users(
     """
     try:
         # Get Slack client
-        client = WebClient(token=os.getenv("SLACK_BOT_TOKEN"))
+        client = get_slack_client()
         
         # Prepare parameters
         params = {
@@ -18991,7 +18218,7 @@ def slack_set_a_conversation_s_purpose(
     """
     try:
         # Get Slack client
-        client = WebClient(token=os.getenv("SLACK_BOT_TOKEN"))
+        client = get_slack_client()
         
         # Set conversation purpose
         response = client.conversations_setPurpose(
@@ -19027,7 +18254,7 @@ def slack_set_dnd_duration(
     """
     try:
         # Get Slack client - DND requires user token, not bot token
-        client = WebClient(token=os.getenv("SLACK_USER_TOKEN"))
+        client = get_slack_user_client()
         
         # Set DND duration
         response = client.dnd_setSnooze(
@@ -19065,7 +18292,7 @@ def slack_set_profile_photo(
     """
     try:
         # Get Slack client - profile photo requires user token, not bot token
-        client = WebClient(token=os.getenv("SLACK_USER_TOKEN"))
+        client = get_slack_user_client()
         
         # Clean the image path - remove quotes and normalize path
         clean_image_path = image.strip().strip('"').strip("'")
@@ -19115,7 +18342,7 @@ def slack_set_read_cursor_in_a_conversation(
     """
     try:
         # Get Slack client
-        client = WebClient(token=os.getenv("SLACK_BOT_TOKEN"))
+        client = get_slack_client()
         
         # Set read cursor - convert timestamp to proper format
         # Slack expects timestamps as strings in format "1234567890.123456"
@@ -19162,7 +18389,7 @@ def slack_set_slack_user_profile_information(
     """
     try:
         # Get Slack client - profile updates require user token, not bot token
-        client = WebClient(token=os.getenv("SLACK_USER_TOKEN"))
+        client = get_slack_user_client()
         
         # Prepare parameters
         params = {
@@ -19175,7 +18402,6 @@ def slack_set_slack_user_profile_information(
         if profile is not None:
             # Parse profile JSON if provided
             try:
-                import json
                 params["profile"] = json.loads(profile)
             except json.JSONDecodeError:
                 return {
@@ -19218,7 +18444,7 @@ def slack_set_the_topic_of_a_conversation(
     """
     try:
         # Get Slack client
-        client = WebClient(token=os.getenv("SLACK_BOT_TOKEN"))
+        client = get_slack_client()
         
         # Set conversation topic
         response = client.conversations_setTopic(
@@ -19257,7 +18483,7 @@ def slack_set_user_profile_photo_with_cropping_options(
     """
     try:
         # Get Slack client with user token (required for profile operations)
-        client = WebClient(token=os.getenv("SLACK_USER_TOKEN"))
+        client = get_slack_user_client()
         
         # Clean the image path string to remove quotes and extra whitespace
         clean_image_path = image.strip().strip('"').strip("'")
@@ -19307,7 +18533,7 @@ def slack_share_a_me_message_in_a_channel(
     """
     try:
         # Get Slack client
-        client = WebClient(token=os.getenv("SLACK_BOT_TOKEN"))
+        client = get_slack_client()
         
         # Send me message to channel
         response = client.chat_meMessage(
@@ -19352,7 +18578,6 @@ async def slack_unarchive_a_public_or_private_channel(
     """
     try:
         # Test network connectivity first
-        import urllib.request
         try:
             urllib.request.urlopen('https://slack.com', timeout=10)
         except Exception as network_error:
@@ -19498,7 +18723,6 @@ async def slack_unarchive_channel(
     """
     try:
         # Test network connectivity first
-        import urllib.request
         try:
             urllib.request.urlopen('https://slack.com', timeout=10)
         except Exception as network_error:
@@ -19929,7 +19153,6 @@ async def slack_update_an_existing_slack_user_group(
     """
     try:
         # Test network connectivity first
-        import urllib.request
         try:
             urllib.request.urlopen('https://slack.com', timeout=10)
         except Exception as network_error:
@@ -19989,6 +19212,8 @@ async def slack_update_an_existing_slack_user_group(
         
         # Check if successful
         if response.data.get("ok", False):
+            # The cached usergroups.list results no longer reflect the workspace
+            _invalidate_usergroups_cache()
             return {
                 "data": response.data,
                 "error": "",
@@ -20127,7 +19352,6 @@ async def slack_updates_a_slack_message(
     """
     try:
         # Test network connectivity first
-        import urllib.request
         try:
             urllib.request.urlopen('https://slack.com', timeout=10)
         except Exception as network_error:
@@ -20183,7 +19407,6 @@ async def slack_updates_a_slack_message(
         
         if attachments and attachments.strip():
             try:
-                import json
                 if attachments.strip() == "[]":
                     # Clear attachments
                     message_params["attachments"] = []
@@ -20198,7 +19421,6 @@ async def slack_updates_a_slack_message(
         
         if blocks and blocks.strip():
             try:
-                import json
                 if blocks.strip() == "[]":
                     # Clear blocks
                     message_params["blocks"] = []
@@ -20364,7 +19586,6 @@ async def slack_update_slack_call_information(
     """
     try:
         # Test network connectivity first
-        import urllib.request
         try:
             urllib.request.urlopen('https://slack.com', timeout=10)
         except Exception as network_error:
@@ -20539,7 +19760,6 @@ async def slack_update_user_group_members(
     """
     try:
         # Test network connectivity first
-        import urllib.request
         try:
             urllib.request.urlopen('https://slack.com', timeout=10)
         except Exception as network_error:
@@ -20597,6 +19817,8 @@ async def slack_update_user_group_members(
         
         # Check if successful
         if response.data.get("ok", False):
+            # The cached usergroups.list results no longer reflect the workspace
+            _invalidate_usergroups_cache()
             return {
                 "data": response.data,
                 "error": "",